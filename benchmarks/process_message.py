@@ -0,0 +1,111 @@
+"""Per-message overhead of `SubscriberUsecase.process_message`.
+
+The handler does nothing, so the numbers are the framework cost only:
+context scopes, middlewares, acknowledgement watcher and handler dispatch.
+
+Usage:
+    python benchmarks/process_message.py [--count 50000]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Callable, Dict, List
+
+from pydantic import BaseModel
+
+from faststream import BaseMiddleware
+from faststream.redis import RedisBroker
+from faststream.redis.message import PubSubMessage
+from faststream.redis.testing import build_message
+
+
+class Payload(BaseModel):
+    id: int
+    name: str
+    tags: List[str]
+
+
+def _make_message(channel: str) -> PubSubMessage:
+    return PubSubMessage(
+        type="message",
+        data=build_message(
+            {"id": 1, "name": "hello", "tags": ["a", "b", "c"]},
+            correlation_id="1",
+        ),
+        channel=channel.encode(),
+        pattern=None,
+    )
+
+
+def _plain(broker: RedisBroker) -> None:
+    @broker.subscriber("bench")
+    async def handler(msg: Any) -> None:
+        pass
+
+
+def _no_ack(broker: RedisBroker) -> None:
+    @broker.subscriber("bench", no_ack=True)
+    async def handler(msg: Any) -> None:
+        pass
+
+
+def _middlewares(broker: RedisBroker) -> None:
+    for _ in range(4):
+        broker.add_middleware(BaseMiddleware)
+
+    @broker.subscriber("bench")
+    async def handler(msg: Any) -> None:
+        pass
+
+
+def _pydantic(broker: RedisBroker) -> None:
+    @broker.subscriber("bench")
+    async def handler(msg: Payload) -> None:
+        pass
+
+
+SCENARIOS: Dict[str, Callable[[RedisBroker], None]] = {
+    "plain": _plain,
+    "no_ack": _no_ack,
+    "4 middlewares": _middlewares,
+    "pydantic model": _pydantic,
+}
+
+
+async def run_scenario(
+    name: str,
+    build: Callable[[RedisBroker], None],
+    count: int,
+) -> float:
+    broker = RedisBroker(logger=None)
+    build(broker)
+
+    # setup subscribers without connection to measure the pipeline only
+    broker.setup()
+    subscriber = next(iter(broker._subscribers.values()))
+    message = _make_message("bench")
+
+    # warm up
+    for _ in range(min(count, 1000)):
+        await subscriber.process_message(message)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await subscriber.process_message(message)
+    elapsed = time.perf_counter() - start
+
+    return elapsed / count * 1_000_000
+
+
+async def main(count: int) -> None:
+    for name, build in SCENARIOS.items():
+        usec = await run_scenario(name, build, count)
+        print(f"{name:<16} {usec:8.2f} us/msg")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.count))
@@ -0,0 +1,74 @@
+"""Per-message overhead of `PublisherUsecase.publish` by ID generation strategy.
+
+Messages are sent to a connection stub, so the numbers are the framework cost
+only: correlation ID generation, publish middlewares and message encoding.
+
+Usage:
+    python benchmarks/publish.py [--count 50000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable, Dict
+
+from faststream import set_id_generator
+from faststream.redis import RedisBroker
+from faststream.redis.publisher.producer import RedisFastProducer
+from faststream.utils.ids import NuidGenerator, UlidGenerator, Uuid4Generator
+
+
+class _NullConnection:
+    async def publish(self, channel: str, msg: bytes) -> None:
+        pass
+
+
+GENERATORS: Dict[str, Callable[[], str]] = {
+    "uuid4": Uuid4Generator(),
+    "nuid": NuidGenerator(),
+    "ulid": UlidGenerator(),
+}
+
+
+async def run_scenario(
+    generator: Callable[[], str],
+    count: int,
+) -> float:
+    set_id_generator(generator)
+
+    broker = RedisBroker(logger=None)
+    publisher = broker.publisher("bench")
+
+    # setup publisher with the connection stub to measure the pipeline only
+    broker._producer = RedisFastProducer(
+        connection=_NullConnection(),  # type: ignore[arg-type]
+        parser=None,
+        decoder=None,
+    )
+    broker.setup()
+
+    # warm up
+    for _ in range(min(count, 1000)):
+        await publisher.publish(b"hello")
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await publisher.publish(b"hello")
+    elapsed = time.perf_counter() - start
+
+    return elapsed / count * 1_000_000
+
+
+async def main(count: int, repeat: int) -> None:
+    for name, generator in GENERATORS.items():
+        # best result is the least affected by the machine noise
+        usec = min([await run_scenario(generator, count) for _ in range(repeat)])
+        print(f"{name:<16} {usec:8.2f} us/msg")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.count, args.repeat))
@@ -1,11 +1,35 @@
 """A Python framework for building services interacting with Apache Kafka, RabbitMQ, NATS and Redis."""
 
+from typing import TYPE_CHECKING
+
 from faststream.annotations import ContextRepo, Logger, NoCast
 from faststream.app import FastStream
-from faststream.broker.middlewares import BaseMiddleware, ExceptionMiddleware
+from faststream.broker.acknowledgement_watcher import (
+    CounterWatcher,
+    DeliveryCountWatcher,
+    RetryPolicy,
+)
+from faststream.broker.message import set_id_generator
+from faststream.broker.middlewares import (
+    BaseMiddleware,
+    ExceptionMiddleware,
+    StatelessMiddleware,
+)
 from faststream.broker.response import Response
-from faststream.testing.app import TestApp
+from faststream.broker.subscriber.batching import MicroBatch
+from faststream.broker.subscriber.call_item import (
+    ContentTypeFilter,
+    HeaderFilter,
+    PathFilter,
+)
+from faststream.broker.subscriber.dedup import DedupStore
 from faststream.utils import Context, Depends, Header, Path, apply_types, context
+from faststream.utils.executor import ProcessExecutor, ThreadExecutor
+from faststream.utils.ids import NuidGenerator, UlidGenerator, Uuid4Generator
+from faststream.utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from faststream.testing.app import TestApp
 
 __all__ = (
     # app
@@ -18,13 +42,37 @@ __all__ = (
     "Header",
     "Path",
     "Depends",
+    "ThreadExecutor",
+    "ProcessExecutor",
+    "NuidGenerator",
+    "UlidGenerator",
+    "Uuid4Generator",
+    "set_id_generator",
     # annotations
     "Logger",
     "ContextRepo",
     "NoCast",
     # middlewares
     "BaseMiddleware",
+    "StatelessMiddleware",
     "ExceptionMiddleware",
+    # acknowledgement
+    "CounterWatcher",
+    "DeliveryCountWatcher",
+    "RetryPolicy",
+    # filters
+    "HeaderFilter",
+    "PathFilter",
+    "ContentTypeFilter",
     # basic
     "Response",
+    "MicroBatch",
+    "DedupStore",
+)
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "TestApp": "faststream.testing.app",
+    },
 )
@@ -1,12 +1,19 @@
 from faststream.asgi.app import AsgiFastStream
-from faststream.asgi.factories import make_asyncapi_asgi, make_ping_asgi
+from faststream.asgi.factories import (
+    make_asyncapi_asgi,
+    make_metrics_asgi,
+    make_ping_asgi,
+    make_ready_asgi,
+)
 from faststream.asgi.handlers import get
 from faststream.asgi.response import AsgiResponse
 
 __all__ = (
     "AsgiFastStream",
     "make_ping_asgi",
+    "make_ready_asgi",
     "make_asyncapi_asgi",
+    "make_metrics_asgi",
     "AsgiResponse",
     "get",
 )
@@ -1,3 +1,4 @@
+import os
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -6,7 +7,6 @@ from typing import (
 
 from faststream.asgi.handlers import get
 from faststream.asgi.response import AsgiResponse
-from faststream.asyncapi import get_app_schema
 from faststream.asyncapi.site import (
     ASYNCAPI_CSS_DEFAULT_URL,
     ASYNCAPI_JS_DEFAULT_URL,
@@ -14,6 +14,8 @@ from faststream.asyncapi.site import (
 )
 
 if TYPE_CHECKING:
+    from prometheus_client import CollectorRegistry
+
     from faststream.asgi.types import ASGIApp, Scope
     from faststream.asyncapi.proto import AsyncAPIApplication
     from faststream.broker.core.usecase import BrokerUsecase
@@ -37,6 +39,62 @@ def make_ping_asgi(
     return ping
 
 
+def make_ready_asgi(
+    broker: "BrokerUsecase[Any, Any]",
+    /,
+    timeout: Optional[float] = None,
+) -> "ASGIApp":
+    """Create readiness endpoint.
+
+    Unlike `make_ping_asgi`, it returns 500 until all broker subscribers are consuming.
+    """
+    ready_response = AsgiResponse(b"", 204)
+    not_ready_response = AsgiResponse(b"", 500)
+
+    @get
+    async def ready(scope: "Scope") -> AsgiResponse:
+        if broker.ready and await broker.ping(timeout):
+            return ready_response
+        else:
+            return not_ready_response
+
+    return ready
+
+
+def make_metrics_asgi(
+    registry: Optional["CollectorRegistry"] = None,
+) -> "ASGIApp":
+    """Create Prometheus metrics endpoint.
+
+    In prometheus_client multiprocess mode the endpoint aggregates metrics
+    of all workers from the shared directory, so any worker returns the same data.
+    """
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        generate_latest,
+        multiprocess,
+    )
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+
+    elif registry is None:
+        registry = REGISTRY
+
+    @get
+    async def metrics(scope: "Scope") -> AsgiResponse:
+        return AsgiResponse(
+            generate_latest(registry),
+            200,
+            {"Content-Type": CONTENT_TYPE_LATEST},
+        )
+
+    return metrics
+
+
 def make_asyncapi_asgi(
     app: "AsyncAPIApplication",
     sidebar: bool = True,
@@ -51,6 +109,8 @@ def make_asyncapi_asgi(
     asyncapi_js_url: str = ASYNCAPI_JS_DEFAULT_URL,
     asyncapi_css_url: str = ASYNCAPI_CSS_DEFAULT_URL,
 ) -> "ASGIApp":
+    from faststream.asyncapi.generate import get_app_schema
+
     return AsgiResponse(
         get_asyncapi_html(
             get_app_schema(app),
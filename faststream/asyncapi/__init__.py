@@ -1,9 +1,22 @@
 """AsyncAPI related functions."""
 
-from faststream.asyncapi.generate import get_app_schema
-from faststream.asyncapi.site import get_asyncapi_html
+from typing import TYPE_CHECKING
+
+from faststream.utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from faststream.asyncapi.generate import get_app_schema
+    from faststream.asyncapi.site import get_asyncapi_html
 
 __all__ = (
     "get_asyncapi_html",
     "get_app_schema",
 )
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "get_app_schema": "faststream.asyncapi.generate",
+        "get_asyncapi_html": "faststream.asyncapi.site",
+    },
+)
@@ -1,8 +1,10 @@
 from abc import abstractmethod
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from faststream.asyncapi.proto import AsyncAPIProto
-from faststream.asyncapi.schema.channels import Channel
+
+if TYPE_CHECKING:
+    from faststream.asyncapi.schema.channels import Channel
 
 
 class AsyncAPIOperation(AsyncAPIProto):
@@ -27,7 +29,7 @@ class AsyncAPIOperation(AsyncAPIProto):
         """Description property fallback."""
         return None
 
-    def schema(self) -> Dict[str, Channel]:
+    def schema(self) -> Dict[str, "Channel"]:
         """Returns the schema of the API operation as a dictionary of channel names and channel objects."""
         if self.include_in_schema:
             return self.get_schema()
@@ -35,7 +37,7 @@ class AsyncAPIOperation(AsyncAPIProto):
             return {}
 
     @abstractmethod
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
         """Generate AsyncAPI schema."""
         raise NotImplementedError()
 
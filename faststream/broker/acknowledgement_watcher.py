@@ -1,8 +1,20 @@
 import logging
 from abc import ABC, abstractmethod
-from collections import Counter
-from typing import TYPE_CHECKING, Any, Optional, Type, Union
-from typing import Counter as CounterType
+from collections import OrderedDict
+from contextlib import suppress
+from math import inf
+from random import random
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from typing_extensions import Annotated, Doc
 
 from faststream.exceptions import (
     AckMessage,
@@ -16,9 +28,15 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from faststream.broker.message import StreamMessage
-    from faststream.broker.types import MsgType
+    from faststream.broker.types import MsgType, RetryLaterCallable
     from faststream.types import LoggerProto
 
+RETRIES_HEADER = "x-faststream-retries"
+"""Header with the number of message attempts made before it was sent for retry."""
+
+RETRY_AT_HEADER = "x-faststream-retry-at"
+"""Header with the UNIX time a retried message should be processed at."""
+
 
 class BaseWatcher(ABC):
     """A base class for a watcher."""
@@ -34,17 +52,17 @@ class BaseWatcher(ABC):
         self.max_tries = max_tries
 
     @abstractmethod
-    def add(self, message_id: str) -> None:
+    def add(self, message: "StreamMessage[Any]") -> None:
         """Add a message."""
         raise NotImplementedError()
 
     @abstractmethod
-    def is_max(self, message_id: str) -> bool:
-        """Check if the given message ID is the maximum attempt."""
+    def is_max(self, message: "StreamMessage[Any]") -> bool:
+        """Check if the given message is the maximum attempt."""
         raise NotImplementedError()
 
     @abstractmethod
-    def remove(self, message_id: str) -> None:
+    def remove(self, message: "StreamMessage[Any]") -> None:
         """Remove a message."""
         raise NotImplementedError()
 
@@ -52,15 +70,15 @@ class BaseWatcher(ABC):
 class EndlessWatcher(BaseWatcher):
     """A class to watch and track messages."""
 
-    def add(self, message_id: str) -> None:
+    def add(self, message: "StreamMessage[Any]") -> None:
         """Add a message to the list."""
         pass
 
-    def is_max(self, message_id: str) -> bool:
-        """Check if the given message ID is the maximum attempt."""
+    def is_max(self, message: "StreamMessage[Any]") -> bool:
+        """Check if the given message is the maximum attempt."""
         return False
 
-    def remove(self, message_id: str) -> None:
+    def remove(self, message: "StreamMessage[Any]") -> None:
         """Remove a message."""
         pass
 
@@ -68,39 +86,63 @@ class EndlessWatcher(BaseWatcher):
 class OneTryWatcher(BaseWatcher):
     """A class to watch and track messages."""
 
-    def add(self, message_id: str) -> None:
+    def add(self, message: "StreamMessage[Any]") -> None:
         """Add a message."""
         pass
 
-    def is_max(self, message_id: str) -> bool:
-        """Check if the given message ID is the maximum attempt."""
+    def is_max(self, message: "StreamMessage[Any]") -> bool:
+        """Check if the given message is the maximum attempt."""
         return True
 
-    def remove(self, message_id: str) -> None:
+    def remove(self, message: "StreamMessage[Any]") -> None:
         """Remove a message."""
         pass
 
 
 class CounterWatcher(BaseWatcher):
-    """A class to watch and track the count of messages."""
+    """A class to watch and track the count of messages.
 
-    memory: CounterType[str]
+    Attempts are counted in memory by message ID. The memory is bounded by
+    `max_size` least recently failed messages and forgets the ones not seen
+    for `ttl` seconds. All operations are O(1).
+    """
+
+    memory: "OrderedDict[str, Tuple[int, float]]"
 
     def __init__(
         self,
         max_tries: int = 3,
         logger: Optional["LoggerProto"] = None,
+        *,
+        max_size: int = 10_000,
+        ttl: Optional[float] = 3600.0,
     ) -> None:
-        super().__init__(logger=logger, max_tries=max_tries)
-        self.memory = Counter()
+        if max_size < 1:
+            raise ValueError("`max_size` should be greater than 0")
 
-    def add(self, message_id: str) -> None:
-        """Check if the given message ID is the maximum attempt."""
-        self.memory[message_id] += 1
-
-    def is_max(self, message_id: str) -> bool:
+        super().__init__(logger=logger, max_tries=max_tries)
+        self.max_size = max_size
+        self.ttl = ttl
+        # message_id -> (attempts, expiration time), ordered by the last attempt
+        self.memory = OrderedDict()
+
+    def add(self, message: "StreamMessage[Any]") -> None:
+        """Count a new message attempt."""
+        now = monotonic()
+        self._evict(now)
+
+        attempts, _ = self.memory.pop(message.message_id, (0, 0.0))
+        self.memory[message.message_id] = (
+            attempts + 1,
+            now + self.ttl if self.ttl is not None else inf,
+        )
+
+        if len(self.memory) > self.max_size:
+            self.memory.popitem(last=False)
+
+    def is_max(self, message: "StreamMessage[Any]") -> bool:
         """Check if the number of tries for a message has exceeded the maximum allowed tries."""
-        is_max = self.memory[message_id] > self.max_tries
+        is_max = self.get_attempts(message) > self.max_tries
         if self.logger is not None:
             if is_max:
                 self.logger.log(
@@ -112,10 +154,132 @@ class CounterWatcher(BaseWatcher):
                 )
         return is_max
 
-    def remove(self, message_id: str) -> None:
+    def remove(self, message: "StreamMessage[Any]") -> None:
         """Remove a message from memory."""
-        self.memory[message_id] = 0
-        self.memory += Counter()
+        self.memory.pop(message.message_id, None)
+
+    def get_attempts(self, message: "StreamMessage[Any]") -> int:
+        """Return the number of message attempts including the current one."""
+        attempts, _ = self.memory.get(message.message_id, (0, 0.0))
+        return attempts
+
+    def _evict(self, now: float) -> None:
+        # the oldest entries expire first
+        memory = self.memory
+        while memory and next(iter(memory.values()))[1] <= now:
+            memory.popitem(last=False)
+
+
+class DeliveryCountWatcher(CounterWatcher):
+    """A class to track message attempts by the message itself.
+
+    Previous attempts number is taken from the `header` if it is set, or from
+    the broker native redelivery counter (NATS JetStream, RabbitMQ quorum
+    queues). So the count survives restarts and is shared between replicas.
+    Messages without any counter are counted in memory.
+
+    A plain redelivery does not change message headers, so in the `header`
+    mode attempts are counted in memory as well and the greater number is used.
+    """
+
+    def __init__(
+        self,
+        max_tries: int = 3,
+        logger: Optional["LoggerProto"] = None,
+        *,
+        header: Optional[str] = None,
+        max_size: int = 10_000,
+        ttl: Optional[float] = 3600.0,
+    ) -> None:
+        super().__init__(
+            max_tries=max_tries,
+            logger=logger,
+            max_size=max_size,
+            ttl=ttl,
+        )
+        self.header = header
+
+    def add(self, message: "StreamMessage[Any]") -> None:
+        """Count a new message attempt if the broker does not count it."""
+        if self.header is not None or self._get_delivery_count(message) is None:
+            super().add(message)
+
+    def get_attempts(self, message: "StreamMessage[Any]") -> int:
+        """Return the number of message attempts including the current one."""
+        counted = super().get_attempts(message)
+        if (delivered := self._get_delivery_count(message)) is None:
+            return counted
+        return max(delivered + 1, counted)
+
+    def _get_delivery_count(self, message: "StreamMessage[Any]") -> Optional[int]:
+        if (
+            self.header is not None
+            and (value := message.headers.get(self.header)) is not None
+        ):
+            with suppress(ValueError):
+                return int(value)
+
+        return message.delivery_count
+
+
+class RetryPolicy(DeliveryCountWatcher):
+    """A class to retry failed messages with exponential backoff.
+
+    Failed messages are redelivered after a delay by the broker native way:
+    NATS JetStream `nak(delay=...)`, a dead-lettering RabbitMQ delay queue,
+    a Redis sorted set or a Kafka retry topic. Retried messages don't block
+    the rest of the stream. The attempts number is carried in the
+    `RETRIES_HEADER` header or taken from the broker redelivery counter.
+    """
+
+    def __init__(
+        self,
+        max_tries: Annotated[
+            int,
+            Doc("Maximum number of retries before the message is rejected."),
+        ] = 3,
+        delay: Annotated[
+            float,
+            Doc("First retry delay in seconds."),
+        ] = 1.0,
+        multiplier: Annotated[
+            float,
+            Doc("Delay multiplier for every next retry."),
+        ] = 2.0,
+        max_delay: Annotated[
+            float,
+            Doc("Maximum retry delay in seconds."),
+        ] = 60.0,
+        jitter: Annotated[
+            float,
+            Doc("Part of the delay to randomize, from 0 to 1."),
+        ] = 0.1,
+        logger: Optional["LoggerProto"] = None,
+        *,
+        max_size: int = 10_000,
+        ttl: Optional[float] = 3600.0,
+    ) -> None:
+        if not 0 <= jitter <= 1:
+            raise ValueError("`jitter` should be between 0 and 1")
+
+        super().__init__(
+            max_tries=max_tries,
+            logger=logger,
+            header=RETRIES_HEADER,
+            max_size=max_size,
+            ttl=ttl,
+        )
+        self.delay = delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def get_delay(self, attempt: int) -> float:
+        """Return delay in seconds to retry the message after its failed attempt."""
+        # limit the exponent to not overflow float
+        exponent = min(attempt - 1, 64)
+        delay = min(self.delay * self.multiplier**exponent, self.max_delay)
+        return delay * (1 - self.jitter * random())  # nosec B311
 
 
 class WatcherContext:
@@ -126,15 +290,17 @@ class WatcherContext:
         message: "StreamMessage[MsgType]",
         watcher: BaseWatcher,
         logger: Optional["LoggerProto"] = None,
+        retry_later: Optional["RetryLaterCallable"] = None,
         **extra_options: Any,
     ) -> None:
         self.watcher = watcher
         self.message = message
         self.extra_options = extra_options
         self.logger = logger
+        self.retry_later = retry_later
 
     async def __aenter__(self) -> None:
-        self.watcher.add(self.message.message_id)
+        self.watcher.add(self.message)
 
     async def __aexit__(
         self,
@@ -148,7 +314,7 @@ class WatcherContext:
 
         elif isinstance(exc_val, HandlerException):
             if isinstance(exc_val, SkipMessage):
-                self.watcher.remove(self.message.message_id)
+                self.watcher.remove(self.message)
 
             elif isinstance(exc_val, AckMessage):
                 await self.__ack(**exc_val.extra_options)
@@ -162,9 +328,13 @@ class WatcherContext:
             # Exception was processed and suppressed
             return True
 
-        elif self.watcher.is_max(self.message.message_id):
+        elif self.watcher.is_max(self.message):
             await self.__reject()
 
+        elif isinstance(self.watcher, RetryPolicy) and self.retry_later is not None:
+            attempts = self.watcher.get_attempts(self.message)
+            await self.__retry(self.watcher.get_delay(attempts), attempts)
+
         else:
             await self.__nack()
 
@@ -178,7 +348,7 @@ class WatcherContext:
             if self.logger is not None:
                 self.logger.log(logging.ERROR, er, exc_info=er)
         else:
-            self.watcher.remove(self.message.message_id)
+            self.watcher.remove(self.message)
 
     async def __nack(self, **exc_extra_options: Any) -> None:
         try:
@@ -187,6 +357,18 @@ class WatcherContext:
             if self.logger is not None:
                 self.logger.log(logging.ERROR, er, exc_info=er)
 
+    async def __retry(self, delay: float, attempts: int) -> None:
+        assert self.retry_later  # nosec B101
+        try:
+            await self.retry_later(self.message, delay, attempts)
+        except Exception as er:
+            if self.logger is not None:
+                self.logger.log(logging.ERROR, er, exc_info=er)
+            # redeliver it at once rather than lose the message
+            await self.__nack()
+        else:
+            self.watcher.remove(self.message)
+
     async def __reject(self, **exc_extra_options: Any) -> None:
         try:
             await self.message.reject(**self.extra_options, **exc_extra_options)
@@ -194,12 +376,12 @@ class WatcherContext:
             if self.logger is not None:
                 self.logger.log(logging.ERROR, er, exc_info=er)
         else:
-            self.watcher.remove(self.message.message_id)
+            self.watcher.remove(self.message)
 
 
 def get_watcher(
     logger: Optional["LoggerProto"],
-    try_number: Union[bool, int],
+    try_number: Union[bool, int, BaseWatcher],
 ) -> BaseWatcher:
     """Get a watcher object based on the provided parameters.
 
@@ -209,9 +391,14 @@ def get_watcher(
             - If set to True, an EndlessWatcher object will be returned.
             - If set to False, a OneTryWatcher object will be returned.
             - If set to an integer, a CounterWatcher object with the specified maximum number of tries will be returned.
+            - If set to a watcher object, it will be returned as is.
     """
     watcher: Optional[BaseWatcher]
-    if try_number is True:
+    if isinstance(try_number, BaseWatcher):
+        watcher = try_number
+        if watcher.logger is None:
+            watcher.logger = logger
+    elif try_number is True:
         watcher = EndlessWatcher()
     elif try_number is False:
         watcher = OneTryWatcher()
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from abc import abstractmethod
 from contextlib import AsyncExitStack
@@ -5,17 +6,21 @@ from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
+    Dict,
     Generic,
     Iterable,
     List,
     Optional,
     Sequence,
+    Set,
     Type,
     Union,
     cast,
 )
 
+import anyio
 from typing_extensions import Annotated, Doc, Self
 
 from faststream._compat import is_test_env
@@ -31,9 +36,14 @@ from faststream.broker.types import (
     CustomCallable,
     MsgType,
 )
-from faststream.exceptions import NOT_CONNECTED_YET
+from faststream.exceptions import (
+    NOT_CONNECTED_YET,
+    SetupError,
+    SubscriberStartupError,
+)
 from faststream.log.logging import set_logger_fmt
 from faststream.utils.context.repository import context
+from faststream.utils.executor import ThreadExecutor
 from faststream.utils.functions import return_input, to_async
 
 if TYPE_CHECKING:
@@ -46,6 +56,7 @@ if TYPE_CHECKING:
     from faststream.broker.publisher.proto import ProducerProto, PublisherProto
     from faststream.security import BaseSecurity
     from faststream.types import AnyDict, Decorator, LoggerProto
+    from faststream.utils.executor import BaseExecutor
 
 
 class BrokerUsecase(
@@ -84,6 +95,14 @@ class BrokerUsecase(
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down."
             ),
         ],
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc("Pool to run synchronous broker subscribers calls."),
+        ],
+        startup_concurrency: Annotated[
+            int,
+            Doc("Max number of subscribers and declarations started concurrently."),
+        ],
         # Logging args
         default_logger: Annotated[
             logging.Logger,
@@ -147,16 +166,19 @@ class BrokerUsecase(
         ],
         **connection_kwargs: Any,
     ) -> None:
+        # parser and decoder work with raw broker objects, so only threads
+        parser_executor = executor if isinstance(executor, ThreadExecutor) else None
+
         super().__init__(
             middlewares=middlewares,
             dependencies=dependencies,
             decoder=cast(
                 Optional["AsyncCustomCallable"],
-                to_async(decoder) if decoder else None,
+                to_async(decoder, parser_executor) if decoder else None,
             ),
             parser=cast(
                 Optional["AsyncCustomCallable"],
-                to_async(parser) if parser else None,
+                to_async(parser, parser_executor) if parser else None,
             ),
             # Broker is a root router
             include_in_schema=True,
@@ -170,6 +192,13 @@ class BrokerUsecase(
 
         self.running = False
         self.graceful_timeout = graceful_timeout
+        self.executor = executor
+
+        if startup_concurrency < 1:
+            raise SetupError(
+                f"`startup_concurrency` should be positive, got {startup_concurrency}"
+            )
+        self._startup_concurrency = startup_concurrency
 
         self._connection_kwargs = connection_kwargs
         self._connection = None
@@ -218,6 +247,70 @@ class BrokerUsecase(
         self._abc_start()
         await self.connect()
 
+    @property
+    def ready(self) -> bool:
+        """Whether the broker is started and all its subscribers are consuming."""
+        return self.running and all(s.running for s in self._subscribers.values())
+
+    async def _declare(
+        self, declarations: Iterable[Callable[[], Awaitable[Any]]]
+    ) -> None:
+        """Run broker objects declarations concurrently."""
+        if errors := await self._run_concurrently(declarations):
+            raise errors[0]
+
+    async def _start_subscribers(self) -> None:
+        """Start all subscribers concurrently and report their failures separately."""
+        errors: Dict[str, BaseException] = {}
+
+        async def start(subscriber: SubscriberProto[MsgType]) -> None:
+            log_context = subscriber.get_log_context(None)
+
+            try:
+                await subscriber.start()
+            except Exception as e:
+                errors[subscriber.name] = e
+                self._log(
+                    f"`{subscriber.call_name}` failed to start: {e!r}",
+                    logging.ERROR,
+                    log_context,
+                    exc_info=e,
+                )
+
+            else:
+                self._log(
+                    f"`{subscriber.call_name}` waiting for messages",
+                    extra=log_context,
+                )
+
+        await self._run_concurrently(
+            partial(start, s) for s in self._subscribers.values()
+        )
+
+        if errors:
+            raise SubscriberStartupError(errors)
+
+    async def _run_concurrently(
+        self,
+        calls: Iterable[Callable[[], Awaitable[Any]]],
+    ) -> List[BaseException]:
+        """Run calls up to `startup_concurrency` at once and collect their errors."""
+        limiter = anyio.CapacityLimiter(self._startup_concurrency)
+        errors: List[BaseException] = []
+
+        async def run(call: Callable[[], Awaitable[Any]]) -> None:
+            async with limiter:
+                try:
+                    await call()
+                except Exception as e:
+                    errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            for call in calls:
+                tg.start_soon(run, call)
+
+        return errors
+
     async def connect(self, **kwargs: Any) -> ConnectionType:
         """Connect to a remote server."""
         if self._connection is None:
@@ -270,6 +363,7 @@ class BrokerUsecase(
             # broker options
             "broker_parser": self._parser,
             "broker_decoder": self._decoder,
+            "broker_executor": self.executor,
             # dependant args
             "apply_types": self._is_apply_types,
             "is_validate": self._is_validate,
@@ -313,12 +407,70 @@ class BrokerUsecase(
         """Closes the object."""
         self.running = False
 
+        await self.drain()
+
         for h in self._subscribers.values():
             await h.close()
 
+        for p in self._publishers.values():
+            await p.close()
+
+        # pools are created again at the next call, so the broker can be restarted
+        for executor in self._get_executors():
+            executor.shutdown(wait=False)
+
         if self._connection is not None:
             await self._close(exc_type, exc_val, exc_tb)
 
+    def _get_executors(self) -> Set["BaseExecutor"]:
+        executors = {
+            call.item_executor
+            for h in self._subscribers.values()
+            for call in h.calls
+            if call.item_executor is not None
+        }
+        if self.executor is not None:
+            executors.add(self.executor)
+        return executors
+
+    async def drain(
+        self,
+        timeout: Annotated[
+            Optional[float],
+            Doc(
+                "Seconds to wait for in-flight messages. `graceful_timeout` by default."
+            ),
+        ] = None,
+    ) -> None:
+        """Stop fetching new messages and wait for the processing ones.
+
+        All subscribers stop consuming at first and then wait for their messages
+        and buffered publishes together within one timeout.
+        """
+        if timeout is None:
+            timeout = self.graceful_timeout
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or 0)
+
+        # subscribers wait together, so the timeout is shared
+        await asyncio.gather(*(h.drain(timeout) for h in self._subscribers.values()))
+
+        # flushes are not cancelled by timeout to not lose messages,
+        # `close` waits for them anyway
+        if flushes := [
+            asyncio.create_task(p.close()) for p in self._publishers.values()
+        ]:
+            await asyncio.wait(
+                flushes,
+                timeout=max(deadline - loop.time(), 0) if timeout else None,
+            )
+
+    @property
+    def in_flight(self) -> Dict[str, int]:
+        """Number of messages in processing by each subscriber."""
+        return {h.name: h.in_flight for h in self._subscribers.values()}
+
     @abstractmethod
     async def _close(
         self,
@@ -1,7 +1,20 @@
-from faststream.broker.fastapi.route import StreamMessage
-from faststream.broker.fastapi.router import StreamRouter
+from typing import TYPE_CHECKING
+
+from faststream.utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from faststream.broker.fastapi.route import StreamMessage
+    from faststream.broker.fastapi.router import StreamRouter
 
 __all__ = (
     "StreamMessage",
     "StreamRouter",
 )
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "StreamMessage": "faststream.broker.fastapi.route",
+        "StreamRouter": "faststream.broker.fastapi.router",
+    },
+)
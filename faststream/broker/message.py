@@ -1,10 +1,13 @@
 import json
 from contextlib import suppress
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
     Generic,
     List,
     Optional,
@@ -14,15 +17,17 @@ from typing import (
     Union,
     cast,
 )
-from uuid import uuid4
 
 from typing_extensions import deprecated
 
 from faststream._compat import dump_json, json_loads
 from faststream.constants import ContentTypes
 from faststream.types import EMPTY
+from faststream.utils.ids import NuidGenerator
 
 if TYPE_CHECKING:
+    from faststream.broker.response import Response
+    from faststream.broker.types import AsyncCallable
     from faststream.types import AnyDict, DecodedMessage, SendableMessage
 
 # prevent circular imports
@@ -43,9 +48,43 @@ class SourceType(str, Enum):
     """RPC response consumed."""
 
 
+_id_generator: Callable[[], str] = NuidGenerator()
+
+
 def gen_cor_id() -> str:
-    """Generate random string to use as ID."""
-    return str(uuid4())
+    """Generate unique string to use as ID."""
+    return _id_generator()
+
+
+def set_id_generator(generator: Callable[[], str]) -> None:
+    """Set process-wide strategy to generate message and correlation IDs.
+
+    Parsers and messages have no broker reference, so the strategy is shared by
+    all brokers of the process. Call it before the brokers start.
+    """
+    global _id_generator
+    _id_generator = generator
+
+
+T = TypeVar("T")
+
+
+class _LazyValue:
+    __slots__ = ("factory",)
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self.factory = factory
+
+
+def lazy_value(factory: Callable[[], T]) -> T:
+    """Mark `StreamMessage` field value to be built at the first access.
+
+    Supported for `headers`, `batch_headers`, `message_id` and `correlation_id`.
+    """
+    return cast(T, _LazyValue(factory))
+
+
+_LAZY_FIELDS = ("headers", "batch_headers", "message_id", "correlation_id")
 
 
 @dataclass
@@ -61,15 +100,53 @@ class StreamMessage(Generic[MsgType]):
 
     content_type: Optional[str] = None
     reply_to: str = ""
-    message_id: str = field(default_factory=gen_cor_id)  # pragma: no cover
+    message_id: str = field(
+        default_factory=lambda: lazy_value(gen_cor_id)  # pragma: no cover
+    )
     correlation_id: str = field(
-        default_factory=gen_cor_id  # pragma: no cover
+        default_factory=lambda: lazy_value(gen_cor_id)  # pragma: no cover
     )
 
     processed: bool = field(default=False, init=False)
     committed: Optional[AckStatus] = field(default=None, init=False)
     _source_type: SourceType = field(default=SourceType.Consume)
     _decoded_body: Optional["DecodedMessage"] = field(default=None, init=False)
+    _lazy_decoder: Optional["AsyncCallable"] = field(default=None, init=False)
+    _lazy_fields: Optional[Dict[str, Callable[[], Any]]] = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        values = self.__dict__
+        for name in _LAZY_FIELDS:
+            if isinstance(v := values[name], _LazyValue):
+                # drop the attribute to build it by `__getattr__` at first access
+                del values[name]
+                if self._lazy_fields is None:
+                    self._lazy_fields = {}
+                self._lazy_fields[name] = v.factory
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            if (lazy := self.__dict__.get("_lazy_fields")) and (
+                factory := lazy.get(name)
+            ) is not None:
+                value = factory()
+                setattr(self, name, value)
+                return value
+
+            raise AttributeError(
+                f"`{self.__class__.__name__}` object has no attribute `{name}`"
+            )
+
+    @property
+    def delivery_count(self) -> Optional[int]:
+        """Number of previous message deliveries reported by the broker."""
+        return None
 
     async def ack(self) -> None:
         if not self.committed:
@@ -85,7 +162,9 @@ class StreamMessage(Generic[MsgType]):
 
     async def decode(self) -> Optional["DecodedMessage"]:
         """Serialize the message by lazy decoder."""
-        # TODO: make it lazy after `decoded_body` removed
+        if (decoder := self._lazy_decoder) is not None:
+            self._lazy_decoder = None
+            self._decoded_body = await decoder(self)
         return self._decoded_body
 
     @property
@@ -136,10 +215,28 @@ def decode_message(message: "StreamMessage[Any]") -> "DecodedMessage":
     return m
 
 
+# response sending to several publishers at the moment
+fanout_response: ContextVar[Optional["Response"]] = ContextVar(
+    "fanout_response",
+    default=None,
+)
+
+
 def encode_message(
     msg: Union[Sequence["SendableMessage"], "SendableMessage"],
 ) -> Tuple[bytes, Optional[str]]:
     """Encodes a message."""
+    if (response := fanout_response.get()) is not None and response.body is msg:
+        if response._encoded is None:
+            response._encoded = _encode_message(msg)
+        return response._encoded
+
+    return _encode_message(msg)
+
+
+def _encode_message(
+    msg: Union[Sequence["SendableMessage"], "SendableMessage"],
+) -> Tuple[bytes, Optional[str]]:
     if msg is None:
         return (
             b"",
@@ -1,4 +1,4 @@
-from faststream.broker.middlewares.base import BaseMiddleware
+from faststream.broker.middlewares.base import BaseMiddleware, StatelessMiddleware
 from faststream.broker.middlewares.exception import ExceptionMiddleware
 
-__all__ = ("BaseMiddleware", "ExceptionMiddleware")
+__all__ = ("BaseMiddleware", "ExceptionMiddleware", "StatelessMiddleware")
@@ -113,3 +113,20 @@ class BaseMiddleware:
 
         finally:
             await self.after_publish(err)
+
+
+class StatelessMiddleware(BaseMiddleware):
+    """A base class for middlewares shared between all messages.
+
+    `BaseMiddleware` is instantiated for every message. This one is created
+    by user once and used as is, so the broker allocates nothing per message.
+    Therefore it must not store any per-message state on `self`: use
+    `consume_scope` / `publish_scope` arguments or the context instead.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(msg=None)
+
+    def __call__(self, msg: Optional[Any]) -> Self:
+        """Return the same object for every message."""
+        return self
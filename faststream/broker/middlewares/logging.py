@@ -1,9 +1,7 @@
 import logging
 from typing import TYPE_CHECKING, Any, Optional, Type
 
-from typing_extensions import Self
-
-from faststream.broker.middlewares.base import BaseMiddleware
+from faststream.broker.middlewares.base import StatelessMiddleware
 from faststream.exceptions import IgnoredException
 from faststream.utils.context.repository import context
 
@@ -14,8 +12,15 @@ if TYPE_CHECKING:
     from faststream.types import LoggerProto
 
 
-class CriticalLogMiddleware(BaseMiddleware):
-    """A middleware class for logging critical errors."""
+LOG_SAMPLED_KEY = "log_sampled"
+
+
+class CriticalLogMiddleware(StatelessMiddleware):
+    """A middleware class for logging critical errors.
+
+    Success lines are logged for the messages sampled by the subscriber
+    `log_sampling` option only. Errors are always logged.
+    """
 
     def __init__(
         self,
@@ -23,19 +28,15 @@ class CriticalLogMiddleware(BaseMiddleware):
         log_level: int,
     ) -> None:
         """Initialize the class."""
+        super().__init__()
         self.logger = logger
         self.log_level = log_level
 
-    def __call__(self, msg: Optional[Any]) -> Self:
-        """Call the object with a message."""
-        self.msg = msg
-        return self
-
     async def on_consume(
         self,
         msg: "StreamMessage[Any]",
     ) -> "StreamMessage[Any]":
-        if self.logger is not None:
+        if self.logger is not None and _sample_message():
             c = context.get_local("log_context", {})
             self.logger.log(self.log_level, "Received", extra=c)
 
@@ -66,9 +67,19 @@ class CriticalLogMiddleware(BaseMiddleware):
                         extra=c,
                     )
 
-            self.logger.log(self.log_level, "Processed", extra=c)
+            if context.get_local(LOG_SAMPLED_KEY, True):
+                self.logger.log(self.log_level, "Processed", extra=c)
 
         await super().after_processed(exc_type, exc_val, exc_tb)
 
         # Exception was not processed
         return False
+
+
+def _sample_message() -> bool:
+    if (frame := context.frame) is None or frame.handler_.sample_log():
+        return True
+
+    # store the decision in the message scope for `after_processed`
+    frame.set(LOG_SAMPLED_KEY, False)
+    return False
@@ -0,0 +1,112 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from faststream.broker.publisher.proto import ProducerProto
+    from faststream.types import AnyDict, SendableMessage
+
+
+class PublishLinger:
+    """Buffer to send publisher messages together.
+
+    Publishes are collected until `max_batch` is reached or `linger_ms` passed
+    since the first one and then sent by the producer `publish_many` native bulk
+    path. Each publish call still waits for its own message result.
+    """
+
+    __slots__ = (
+        "linger",
+        "max_batch",
+        "_producer",
+        "_buffer",
+        "_timer",
+        "_tasks",
+    )
+
+    def __init__(
+        self,
+        linger_ms: float,
+        max_batch: int,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("`max_batch` should be greater than 0")
+
+        self.linger = linger_ms / 1000
+        self.max_batch = max_batch
+
+        self._producer: Optional[ProducerProto] = None
+        self._buffer: List[Tuple[SendableMessage, AnyDict, asyncio.Future[Any]]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    async def publish(
+        self,
+        producer: "ProducerProto",
+        message: "SendableMessage",
+        **kwargs: Any,
+    ) -> Any:
+        """Add message to the buffer and wait for it to be sent."""
+        loop = asyncio.get_running_loop()
+
+        future: asyncio.Future[Any] = loop.create_future()
+        self._producer = producer
+        self._buffer.append((message, kwargs, future))
+
+        if len(self._buffer) >= self.max_batch:
+            self._start_flush()
+
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self._start_flush)
+
+        return await future
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._buffer:
+            return
+
+        batch, self._buffer = self._buffer, []
+
+        task = asyncio.create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(
+        self,
+        batch: List[Tuple["SendableMessage", "AnyDict", "asyncio.Future[Any]"]],
+    ) -> None:
+        assert self._producer  # nosec B101
+
+        try:
+            results = await self._producer.publish_many(
+                [(message, kwargs) for message, kwargs, _ in batch]
+            )
+
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():  # publisher call was cancelled
+                continue
+
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Send buffered messages and wait for all sendings."""
+        self._start_flush()
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
@@ -1,5 +1,16 @@
+import asyncio
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Callable, Generic, Iterable, Optional, Protocol
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
 
 from typing_extensions import override
 
@@ -15,7 +26,7 @@ if TYPE_CHECKING:
         PublisherMiddleware,
         T_HandlerReturn,
     )
-    from faststream.types import SendableMessage
+    from faststream.types import AnyDict, SendableMessage
 
 
 class ProducerProto(Protocol):
@@ -44,6 +55,22 @@ class ProducerProto(Protocol):
         """Publishes a message synchronously."""
         ...
 
+    async def publish_many(
+        self,
+        requests: Sequence[Tuple["SendableMessage", "AnyDict"]],
+    ) -> Sequence[Any]:
+        """Publishes several messages together.
+
+        Returns each message `publish` result or raised exception in the requests order.
+        Sends are started concurrently by default, so client-side batching and
+        pipelining of the broker library are used.
+        """
+        results: Sequence[Any] = await asyncio.gather(
+            *(self.publish(message, **kwargs) for message, kwargs in requests),
+            return_exceptions=True,
+        )
+        return results
+
 
 class BasePublisherProto(Protocol):
     @abstractmethod
@@ -100,6 +127,9 @@ class PublisherProto(
         producer: Optional["ProducerProto"],
     ) -> None: ...
 
+    @abstractmethod
+    async def close(self) -> None: ...
+
     @abstractmethod
     def __call__(
         self,
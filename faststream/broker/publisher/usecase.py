@@ -1,4 +1,5 @@
 from abc import ABC
+from functools import partial
 from inspect import unwrap
 from typing import (
     TYPE_CHECKING,
@@ -18,6 +19,7 @@ from typing_extensions import Annotated, Doc, override
 from faststream.asyncapi.abc import AsyncAPIOperation
 from faststream.asyncapi.message import get_response_schema
 from faststream.asyncapi.utils import to_camelcase
+from faststream.broker.publisher.linger import PublishLinger
 from faststream.broker.publisher.proto import PublisherProto
 from faststream.broker.types import (
     MsgType,
@@ -25,6 +27,7 @@ from faststream.broker.types import (
     T_HandlerReturn,
 )
 from faststream.broker.wrapper.call import HandlerCallWrapper
+from faststream.exceptions import NOT_CONNECTED_YET
 
 if TYPE_CHECKING:
     from faststream.broker.publisher.proto import ProducerProto
@@ -32,7 +35,7 @@ if TYPE_CHECKING:
         BrokerMiddleware,
         PublisherMiddleware,
     )
-    from faststream.types import AnyDict
+    from faststream.types import AnyDict, AsyncFunc
 
 
 class PublisherUsecase(
@@ -56,6 +59,14 @@ class PublisherUsecase(
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares."),
         ],
+        linger_ms: Annotated[
+            Optional[float],
+            Doc("Time to collect messages before sending them together."),
+        ],
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together."),
+        ],
         # AsyncAPI args
         schema_: Annotated[
             Optional[Any],
@@ -82,6 +93,10 @@ class PublisherUsecase(
         self._broker_middlewares = broker_middlewares
         self._producer = None
 
+        self._linger = (
+            PublishLinger(linger_ms, max_batch) if linger_ms is not None else None
+        )
+
         self._fake_handler = False
         self.mock = None
 
@@ -102,6 +117,20 @@ class PublisherUsecase(
     ) -> None:
         self._producer = producer
 
+    async def close(self) -> None:
+        """Send all buffered messages."""
+        if self._linger is not None:
+            await self._linger.close()
+
+    def _get_publish_call(self, rpc: bool = False) -> "AsyncFunc":
+        """Return producer publish method or linger buffer to send message with."""
+        assert self._producer, NOT_CONNECTED_YET  # nosec B101
+
+        if self._linger is None or rpc:
+            return self._producer.publish
+
+        return partial(self._linger.publish, self._producer)
+
     def set_test(
         self,
         *,
@@ -1,4 +1,7 @@
-from typing import TYPE_CHECKING, Any, Optional, Union
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Tuple, Union
+
+from faststream.broker.message import fanout_response
 
 if TYPE_CHECKING:
     from faststream.types import AnyDict
@@ -17,6 +20,8 @@ class Response:
         self.headers = headers or {}
         self.correlation_id = correlation_id
 
+        self._encoded: Optional[Tuple[bytes, Optional[str]]] = None
+
     def add_headers(
         self,
         extra_headers: "AnyDict",
@@ -28,6 +33,15 @@ class Response:
         else:
             self.headers = {**extra_headers, **self.headers}
 
+    @contextmanager
+    def encode_once(self) -> Iterator[None]:
+        """Serialize the body only once for all publishers inside the scope."""
+        token = fanout_response.set(self)
+        try:
+            yield
+        finally:
+            fanout_response.reset(token)
+
     def as_publish_kwargs(self) -> "AnyDict":
         publish_options = {
             "headers": self.headers,
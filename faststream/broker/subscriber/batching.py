@@ -0,0 +1,193 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from faststream.broker.message import StreamMessage
+
+if TYPE_CHECKING:
+    from faststream.broker.types import AsyncCallable
+    from faststream.types import DecodedMessage
+
+
+class MicroBatch:
+    """A class to represent subscriber micro-batching options.
+
+    Messages are collected until `max_batch_size` is reached or `max_wait_ms`
+    passed since the first one, whichever comes first. Then the handler is
+    called once with a list of messages bodies, and every message is
+    acknowledged by the handler result.
+    """
+
+    __slots__ = ("max_batch_size", "max_wait_ms")
+
+    def __init__(
+        self,
+        max_batch_size: int = 100,
+        max_wait_ms: float = 100,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("`max_batch_size` should be greater than 0")
+
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+
+class RawBatch(List[Any]):
+    """Raw broker messages collected to a micro-batch."""
+
+
+@dataclass
+class MicroBatchMessage(StreamMessage[Any]):
+    """A class to represent a micro-batch of single messages.
+
+    Broker-specific fields (`raw_message`, `headers`, `message_id`, etc) are
+    taken from the first message, all parsed messages are in `messages`.
+    """
+
+    messages: Sequence[StreamMessage[Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_messages(
+        cls,
+        messages: Sequence[StreamMessage[Any]],
+    ) -> "MicroBatchMessage":
+        first = messages[0]
+        return cls(
+            raw_message=first.raw_message,
+            body=[m.body for m in messages],
+            headers=first.headers,
+            batch_headers=[m.headers for m in messages],
+            path=first.path,
+            content_type=first.content_type,
+            message_id=first.message_id,
+            correlation_id=first.correlation_id,
+            messages=messages,
+        )
+
+    async def ack(self, **kwargs: Any) -> None:
+        for m in self.messages:
+            await m.ack(**kwargs)
+        await super().ack()
+
+    async def nack(self, **kwargs: Any) -> None:
+        for m in self.messages:
+            await m.nack(**kwargs)
+        await super().nack()
+
+    async def reject(self, **kwargs: Any) -> None:
+        for m in self.messages:
+            await m.reject(**kwargs)
+        await super().reject()
+
+
+def batch_parser(parser: "AsyncCallable") -> "AsyncCallable":
+    """Make a micro-batch parser from the single message one."""
+
+    async def parse_batch(msg: Any) -> MicroBatchMessage:
+        # TestClient and direct `process_message` calls pass a single message
+        raw_messages = msg if isinstance(msg, RawBatch) else (msg,)
+        return MicroBatchMessage.from_messages([await parser(m) for m in raw_messages])
+
+    return parse_batch
+
+
+def batch_decoder(decoder: "AsyncCallable") -> "AsyncCallable":
+    """Make a micro-batch decoder from the single message one."""
+
+    async def decode_batch(msg: MicroBatchMessage) -> List["DecodedMessage"]:
+        return [await decoder(m) for m in msg.messages]
+
+    return decode_batch
+
+
+class MicroBatcher:
+    """Collects raw messages and processes them as a batch."""
+
+    __slots__ = (
+        "max_batch_size",
+        "max_wait",
+        "_process",
+        "_buffer",
+        "_timer",
+        "_lock",
+        "_owner",
+        "_tasks",
+    )
+
+    def __init__(
+        self,
+        options: MicroBatch,
+        process: Callable[[RawBatch], Awaitable[Any]],
+    ) -> None:
+        self.max_batch_size = options.max_batch_size
+        self.max_wait = options.max_wait_ms / 1000
+        self._process = process
+
+        self._buffer = RawBatch()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock = asyncio.Lock()
+        self._owner: Optional[asyncio.Task[Any]] = None
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    async def put(self, msg: Any) -> None:
+        """Add message to the current batch.
+
+        Blocks only if the batch is full and the previous one is still processing.
+        """
+        self._buffer.append(msg)
+
+        if len(self._buffer) >= self.max_batch_size:
+            await self.flush()
+
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.max_wait, self._flush_by_timer
+            )
+
+    def _flush_by_timer(self) -> None:
+        self._timer = None
+        task = asyncio.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        """Process collected messages."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._buffer:
+            return
+
+        batch, self._buffer = self._buffer, RawBatch()
+
+        current = asyncio.current_task()
+        if current is not None and current is self._owner:
+            # called from the batch processing itself, the lock is not reentrant
+            await self._process(batch)
+            return
+
+        # only one batch is processing at the time, the next one is collecting
+        async with self._lock:
+            self._owner = current
+            try:
+                await self._process(batch)
+            finally:
+                self._owner = None
+
+    async def close(self) -> None:
+        """Process rest messages and wait for all batches."""
+        await self.flush()
+
+        current = asyncio.current_task()
+        if tasks := [t for t in self._tasks if t is not current]:
+            await asyncio.gather(*tasks)
@@ -1,14 +1,19 @@
+from abc import ABC, abstractmethod
 from functools import partial
 from inspect import unwrap
-from itertools import chain
+from time import perf_counter_ns
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Generic,
+    Hashable,
     Iterable,
+    List,
     Optional,
+    Tuple,
     cast,
 )
 
@@ -16,12 +21,14 @@ from typing_extensions import override
 
 from faststream.broker.proto import SetupAble
 from faststream.broker.types import MsgType
+from faststream.broker.utils import default_filter
 from faststream.exceptions import IgnoredException, SetupError
 
 if TYPE_CHECKING:
     from fast_depends.dependencies import Depends
 
     from faststream.broker.message import StreamMessage
+    from faststream.broker.subscriber.timing import StageTimer
     from faststream.broker.types import (
         AsyncCallable,
         AsyncFilter,
@@ -30,6 +37,7 @@ if TYPE_CHECKING:
     )
     from faststream.broker.wrapper.call import HandlerCallWrapper
     from faststream.types import AsyncFuncAny, Decorator
+    from faststream.utils.executor import BaseExecutor
 
 
 class HandlerItem(SetupAble, Generic[MsgType]):
@@ -43,9 +51,16 @@ class HandlerItem(SetupAble, Generic[MsgType]):
         "item_parser",
         "item_decoder",
         "item_middlewares",
+        "item_executor",
+        "item_call",
+        "lazy_decoding",
+        "timer",
     )
 
     dependant: Optional[Any]
+    item_call: Optional["AsyncFuncAny"]
+    lazy_decoding: bool
+    timer: Optional["StageTimer"]
 
     def __init__(
         self,
@@ -56,14 +71,19 @@ class HandlerItem(SetupAble, Generic[MsgType]):
         item_decoder: Optional["CustomCallable"],
         item_middlewares: Iterable["SubscriberMiddleware[StreamMessage[MsgType]]"],
         dependencies: Iterable["Depends"],
+        item_executor: Optional["BaseExecutor"] = None,
     ) -> None:
         self.handler = handler
         self.filter = filter
         self.item_parser = item_parser
         self.item_decoder = item_decoder
         self.item_middlewares = item_middlewares
+        self.item_executor = item_executor
         self.dependencies = dependencies
         self.dependant = None
+        self.item_call = None
+        self.lazy_decoding = False
+        self.timer = None
 
     def __repr__(self) -> str:
         filter_call = unwrap(self.filter)
@@ -79,9 +99,14 @@ class HandlerItem(SetupAble, Generic[MsgType]):
         broker_dependencies: Iterable["Depends"],
         apply_types: bool,
         is_validate: bool,
+        is_default_decoder: bool,
+        executor: Optional["BaseExecutor"],
         _get_dependant: Optional[Callable[..., Any]],
         _call_decorators: Iterable["Decorator"],
+        timer: Optional["StageTimer"] = None,
     ) -> None:
+        self.timer = timer
+
         if self.dependant is None:
             self.item_parser = parser
             self.item_decoder = decoder
@@ -92,6 +117,7 @@ class HandlerItem(SetupAble, Generic[MsgType]):
                 apply_types=apply_types,
                 is_validate=is_validate,
                 dependencies=dependencies,
+                executor=executor,
                 _get_dependant=_get_dependant,
                 _call_decorators=_call_decorators,
             )
@@ -104,6 +130,29 @@ class HandlerItem(SetupAble, Generic[MsgType]):
                     dependencies,
                 )
 
+            # handler validates the body itself, so we can skip the default decoder
+            filter_call = unwrap(self.filter)
+            self.lazy_decoding = (
+                is_default_decoder
+                and self.handler.validates_raw_body
+                and (
+                    filter_call is default_filter
+                    or isinstance(filter_call, IndexedFilter)
+                )
+            )
+
+        if self.item_call is None:
+            self.item_call = self._compose_item_call()
+
+    def _compose_item_call(self) -> "AsyncFuncAny":
+        """Wrap the handler by static item middlewares once."""
+        call: AsyncFuncAny = self.handler.call_wrapped
+
+        for middleware in self.item_middlewares:
+            call = partial(cast("SubscriberMiddleware[Any]", middleware), call)
+
+        return call
+
     @property
     def call_name(self) -> str:
         """Returns the name of the original call."""
@@ -130,23 +179,53 @@ class HandlerItem(SetupAble, Generic[MsgType]):
         cache: Dict[Any, Any],
     ) -> Optional["StreamMessage[MsgType]"]:
         """Check is message suite for current filter."""
+        message = await self.parse(msg, cache)
+
+        timer = self.timer
+        started = perf_counter_ns() if timer is not None else 0
+
+        is_suitable = await self.filter(message)
+
+        if timer is not None:
+            timer.observe("filter", started)
+
+        return message if is_suitable else None
+
+    async def parse(
+        self,
+        msg: MsgType,
+        cache: Dict[Any, Any],
+    ) -> "StreamMessage[MsgType]":
+        """Parse and decode message reusing already cached results."""
         if not (parser := cast(Optional["AsyncCallable"], self.item_parser)) or not (
             decoder := cast(Optional["AsyncCallable"], self.item_decoder)
         ):
             raise SetupError("You should setup `HandlerItem` at first.")
 
-        message = cache[parser] = cast(
-            "StreamMessage[MsgType]", cache.get(parser) or await parser(msg)
-        )
+        timer = self.timer
 
-        message._decoded_body = cache[decoder] = cache.get(decoder) or await decoder(
-            message
-        )
+        if (message := cache.get(parser)) is None:
+            started = perf_counter_ns() if timer is not None else 0
+            message = cache[parser] = await parser(msg)
+            if timer is not None:
+                timer.observe("parse", started)
 
-        if await self.filter(message):
-            return message
+        if decoder in cache:
+            message._decoded_body = cache[decoder]
+            message._lazy_decoder = None
 
-        return None
+        elif self.lazy_decoding and not self.handler.is_test:
+            # decode on demand only: handler validates raw body by itself
+            message._lazy_decoder = decoder
+
+        else:
+            started = perf_counter_ns() if timer is not None else 0
+            message._decoded_body = cache[decoder] = await decoder(message)
+            message._lazy_decoder = None
+            if timer is not None:
+                timer.observe("decode", started)
+
+        return cast("StreamMessage[MsgType]", message)
 
     async def call(
         self,
@@ -155,10 +234,32 @@ class HandlerItem(SetupAble, Generic[MsgType]):
         _extra_middlewares: Iterable["SubscriberMiddleware[Any]"],
     ) -> Any:
         """Execute wrapped handler with consume middlewares."""
-        call: AsyncFuncAny = self.handler.call_wrapped
+        call: AsyncFuncAny = self.item_call or self._compose_item_call()
 
-        for middleware in chain(self.item_middlewares, _extra_middlewares):
+        timer = self.timer
+        handler_duration: Optional[int] = None
+
+        if timer is not None:
+            # time the handler only, consume middlewares scopes are reported separately
+            item_call = call
+
+            async def timed_call(message: "StreamMessage[MsgType]") -> Any:
+                nonlocal handler_duration
+                started = perf_counter_ns()
+                try:
+                    return await item_call(message)
+                finally:
+                    handler_duration = perf_counter_ns() - started
+
+            call = timed_call
+
+        # broker middlewares are created per message
+        has_middlewares = False
+        for middleware in _extra_middlewares:
             call = partial(middleware, call)
+            has_middlewares = True
+
+        started = perf_counter_ns() if timer is not None else 0
 
         try:
             result = await call(message)
@@ -174,3 +275,177 @@ class HandlerItem(SetupAble, Generic[MsgType]):
         else:
             self.handler.trigger(result=result)
             return result
+
+        finally:
+            if timer is not None:
+                duration = perf_counter_ns() - started
+
+                if handler_duration is not None:
+                    timer.report("handler", handler_duration)
+                    duration -= handler_duration
+
+                if has_middlewares:
+                    timer.report("middlewares_scope", duration)
+
+
+class IndexedFilter(ABC):
+    """A base class for declarative filters.
+
+    Such filter compares one message attribute with expected values, so
+    subscriber can compile sequential filters over the same attribute
+    into a hash table and find a suitable handler by a single lookup.
+    """
+
+    __slots__ = ("index_key", "values")
+
+    index_key: Hashable
+    values: FrozenSet[Hashable]
+
+    def __init__(self, index_key: Hashable, *values: Hashable) -> None:
+        self.index_key = index_key
+        self.values = frozenset(values)
+
+    @abstractmethod
+    def extract(self, message: "StreamMessage[Any]") -> Any:
+        """Get the message attribute to compare."""
+        raise NotImplementedError()
+
+    async def __call__(self, message: "StreamMessage[Any]") -> bool:
+        try:
+            return self.extract(message) in self.values
+        except TypeError:  # unhashable attribute value
+            return False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({sorted(self.values, key=repr)})"
+
+
+class HeaderFilter(IndexedFilter):
+    """Filter messages by a header value."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str, *values: Hashable) -> None:
+        super().__init__(("headers", name), *values)
+        self.name = name
+
+    def extract(self, message: "StreamMessage[Any]") -> Any:
+        return message.headers.get(self.name)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.name!r}, {sorted(self.values, key=repr)})"
+        )
+
+
+class PathFilter(IndexedFilter):
+    """Filter messages by a path parameter value."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str, *values: Hashable) -> None:
+        super().__init__(("path", name), *values)
+        self.name = name
+
+    def extract(self, message: "StreamMessage[Any]") -> Any:
+        return message.path.get(self.name)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.name!r}, {sorted(self.values, key=repr)})"
+        )
+
+
+class ContentTypeFilter(IndexedFilter):
+    """Filter messages by a content-type."""
+
+    __slots__ = ()
+
+    def __init__(self, *values: Optional[str]) -> None:
+        super().__init__(("content_type",), *values)
+
+    def extract(self, message: "StreamMessage[Any]") -> Any:
+        return message.content_type
+
+
+class _FilterIndex(Generic[MsgType]):
+    """Hash table over sequential handler items with the same indexed filter."""
+
+    __slots__ = ("first", "filter", "table")
+
+    def __init__(
+        self,
+        first: HandlerItem[MsgType],
+        filter: IndexedFilter,
+    ) -> None:
+        self.first = first
+        self.filter = filter
+        self.table: Dict[Hashable, HandlerItem[MsgType]] = {}
+
+    def accepts(self, item: HandlerItem[MsgType], filter: IndexedFilter) -> bool:
+        return (
+            filter.index_key == self.filter.index_key
+            and item.item_parser is self.first.item_parser
+            and item.item_decoder is self.first.item_decoder
+        )
+
+    def add(self, item: HandlerItem[MsgType], filter: IndexedFilter) -> None:
+        for value in filter.values:
+            # the first registered handler wins as in sequential check
+            self.table.setdefault(value, item)
+
+    def lookup(
+        self, message: "StreamMessage[MsgType]"
+    ) -> Optional[HandlerItem[MsgType]]:
+        try:
+            return self.table.get(self.filter.extract(message))
+        except TypeError:  # unhashable attribute value
+            return None
+
+
+class HandlerDispatcher(Generic[MsgType]):
+    """Compiled lookup of a suitable subscriber handler item.
+
+    Sequential items with `IndexedFilter` over the same message attribute are
+    merged into a hash table. Other filters are checked one by one in the
+    registration order, so the result is the same as a linear walk.
+    """
+
+    __slots__ = ("_segments",)
+
+    def __init__(self, calls: Iterable[HandlerItem[MsgType]]) -> None:
+        self._segments: List[
+            Tuple[HandlerItem[MsgType], Optional[_FilterIndex[MsgType]]]
+        ] = []
+
+        for call in calls:
+            filter_call = unwrap(call.filter)
+
+            if not isinstance(filter_call, IndexedFilter):
+                self._segments.append((call, None))
+                continue
+
+            index = self._segments[-1][1] if self._segments else None
+            if index is None or not index.accepts(call, filter_call):
+                index = _FilterIndex(call, filter_call)
+                self._segments.append((call, index))
+
+            index.add(call, filter_call)
+
+    async def find(
+        self,
+        msg: MsgType,
+        cache: Dict[Any, Any],
+    ) -> Optional[Tuple[HandlerItem[MsgType], "StreamMessage[MsgType]"]]:
+        """Find the first suitable handler item for the message."""
+        for item, index in self._segments:
+            if index is not None:
+                candidate = index.lookup(await item.parse(msg, cache))
+                if candidate is None:
+                    continue
+                item = candidate
+
+            if (message := await item.is_suitable(msg, cache)) is not None:
+                return item, message
+
+        return None
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from faststream.broker.message import StreamMessage
+
+
+class DedupStore:
+    """A class to skip already processed messages duplicates.
+
+    The message key (`message_id` by default) is remembered after the
+    successful processing, so failed messages are processed again at
+    redelivery. Keys are stored in process memory for `ttl` seconds,
+    up to `max_size` least recently processed ones.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600.0,
+        key: Optional[Callable[["StreamMessage[Any]"], str]] = None,
+        *,
+        max_size: int = 10_000,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("`max_size` should be greater than 0")
+
+        self.ttl = ttl
+        self.key = key
+        self.max_size = max_size
+        # key -> expiration time, ordered by the processing time
+        self.memory: OrderedDict[str, float] = OrderedDict()
+
+    def get_key(self, message: "StreamMessage[Any]") -> str:
+        """Return the message deduplication key."""
+        if self.key is None:
+            return message.message_id
+        return self.key(message)
+
+    async def seen(self, key: str) -> bool:
+        """Check if the message with the key was already processed."""
+        self._evict(monotonic())
+        return key in self.memory
+
+    async def add(self, key: str) -> None:
+        """Remember the processed message key."""
+        now = monotonic()
+        self._evict(now)
+
+        self.memory.pop(key, None)
+        self.memory[key] = now + self.ttl
+
+        if len(self.memory) > self.max_size:
+            self.memory.popitem(last=False)
+
+    def _evict(self, now: float) -> None:
+        # all keys have the same ttl, so the oldest expire first
+        memory = self.memory
+        while memory and next(iter(memory.values())) <= now:
+            memory.popitem(last=False)
@@ -1,9 +1,14 @@
 import asyncio
+import logging
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Coroutine,
+    Hashable,
     List,
+    Optional,
+    Tuple,
 )
 
 import anyio
@@ -14,10 +19,12 @@ if TYPE_CHECKING:
     from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
     from nats.aio.msg import Msg
 
+    from faststream.types import LoggerProto
+
 
 class TasksMixin(SubscriberUsecase[Any]):
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
         self.tasks: List[asyncio.Task[Any]] = []
 
     def add_task(self, coro: Coroutine[Any, Any, Any]) -> None:
@@ -37,36 +44,81 @@ class TasksMixin(SubscriberUsecase[Any]):
 class ConcurrentMixin(TasksMixin):
     send_stream: "MemoryObjectSendStream[Msg]"
     receive_stream: "MemoryObjectReceiveStream[Msg]"
+    ordering_key: Optional[Callable[[Any], Hashable]]
+    _lanes: Tuple[
+        Tuple["MemoryObjectSendStream[Msg]", "MemoryObjectReceiveStream[Msg]"], ...
+    ]
+    _logger: Optional["LoggerProto"]
 
     def __init__(
         self,
-        *,
+        *args: Any,
         max_workers: int,
+        ordering_key: Optional[Callable[[Any], Hashable]] = None,
         **kwargs: Any,
     ) -> None:
         self.max_workers = max_workers
+        self.ordering_key = ordering_key
+        self._logger = None
+
+        self.limiter = anyio.Semaphore(max_workers)
+        self._create_streams()
+
+        super().__init__(*args, **kwargs)
 
+    def setup(self, *, logger: Optional["LoggerProto"], **kwargs: Any) -> None:  # type: ignore[override]
+        self._logger = logger
+        super().setup(logger=logger, **kwargs)
+
+    def _create_streams(self) -> None:
         self.send_stream, self.receive_stream = anyio.create_memory_object_stream(
-            max_buffer_size=max_workers
+            max_buffer_size=self.max_workers
         )
-        self.limiter = anyio.Semaphore(max_workers)
 
-        super().__init__(**kwargs)
+        # serial lanes to keep messages with the same key ordered
+        self._lanes = ()
+        if self.ordering_key is not None:
+            self._lanes = tuple(
+                anyio.create_memory_object_stream(max_buffer_size=self.max_workers)
+                for _ in range(self.max_workers)
+            )
 
     def start_consume_task(self) -> None:
+        # streams are closed by the previous `close` call
+        self._create_streams()
         self.add_task(self._serve_consume_queue())
 
+    async def close(self) -> None:
+        """Clean up handler subscription, close in-memory queues."""
+        await super().close()
+
+        self.send_stream.close()
+        for send_stream, _ in self._lanes:
+            send_stream.close()
+
     async def _serve_consume_queue(
         self,
     ) -> None:
         """Endless task consuming messages from in-memory queue.
 
         Suitable to batch messages by amount, timestamps, etc and call `consume` for this batches.
+        Messages without ordering key are consumed concurrently.
         """
         async with anyio.create_task_group() as tg:
+            for _, receive_stream in self._lanes:
+                tg.start_soon(self._serve_lane, receive_stream)
+
             async for msg in self.receive_stream:
                 tg.start_soon(self._consume_msg, msg)
 
+    async def _serve_lane(
+        self,
+        receive_stream: "MemoryObjectReceiveStream[Msg]",
+    ) -> None:
+        """Consume lane messages one by one to keep their order."""
+        async for msg in receive_stream:
+            await self.consume(msg)
+
     async def _consume_msg(
         self,
         msg: "Msg",
@@ -77,5 +129,23 @@ class ConcurrentMixin(TasksMixin):
 
     async def _put_msg(self, msg: "Msg") -> None:
         """Proxy method to put msg into in-memory queue with semaphore block."""
+        if self.ordering_key is not None:
+            try:
+                lane = hash(self.ordering_key(msg)) % self.max_workers
+
+            except Exception as e:
+                # message is consumed out of order instead of being lost
+                if self._logger is not None:
+                    self._logger.log(
+                        logging.ERROR,
+                        f"Ordering key extraction failed: {e!r}",
+                        extra=self.get_log_context(None),
+                        exc_info=e,
+                    )
+
+            else:
+                await self._lanes[lane][0].send(msg)
+                return
+
         async with self.limiter:
             await self.send_stream.send(msg)
@@ -14,7 +14,9 @@ if TYPE_CHECKING:
     from faststream.broker.message import StreamMessage
     from faststream.broker.publisher.proto import BasePublisherProto, ProducerProto
     from faststream.broker.response import Response
+    from faststream.broker.subscriber.batching import MicroBatch
     from faststream.broker.subscriber.call_item import HandlerItem
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -22,6 +24,7 @@ if TYPE_CHECKING:
         SubscriberMiddleware,
     )
     from faststream.types import AnyDict, Decorator, LoggerProto
+    from faststream.utils.executor import BaseExecutor
 
 
 class SubscriberProto(
@@ -55,6 +58,7 @@ class SubscriberProto(
         graceful_timeout: Optional[float],
         broker_parser: Optional["CustomCallable"],
         broker_decoder: Optional["CustomCallable"],
+        broker_executor: Optional["BaseExecutor"],
         producer: Optional["ProducerProto"],
         extra_context: "AnyDict",
         # FastDepends options
@@ -80,6 +84,16 @@ class SubscriberProto(
     @abstractmethod
     async def close(self) -> None: ...
 
+    @abstractmethod
+    async def drain(self, timeout: Optional[float] = None) -> None: ...
+
+    @property
+    @abstractmethod
+    def in_flight(self) -> int: ...
+
+    @abstractmethod
+    def sample_log(self) -> bool: ...
+
     @abstractmethod
     async def consume(self, msg: MsgType) -> Any: ...
 
@@ -100,4 +114,8 @@ class SubscriberProto(
         decoder_: "CustomCallable",
         middlewares_: Iterable["SubscriberMiddleware[Any]"],
         dependencies_: Iterable["Depends"],
+        executor_: Optional["BaseExecutor"] = None,
+        micro_batch_: Optional["MicroBatch"] = None,
+        dedup_: Optional["DedupStore"] = None,
+        log_sampling_: int = 1,
     ) -> Self: ...
@@ -0,0 +1,48 @@
+from time import perf_counter_ns
+from typing import Callable, Iterable
+
+from typing_extensions import Literal, TypeAlias
+
+ProcessingStage: TypeAlias = Literal[
+    "parse",
+    "decode",
+    "filter",
+    "middlewares_enter",
+    "middlewares_scope",
+    "handler",
+    "publish",
+    "middlewares_exit",
+]
+"""Message processing stages.
+
+`handler` is the handler function call only, `middlewares_scope` is the
+consume middlewares scopes overhead around it. Lazily decoded messages
+(handlers validating the raw body) have no `decode` stage: the body is
+decoded inside the `handler` one if required.
+"""
+
+StageObserver: TypeAlias = Callable[[str, ProcessingStage, int], None]
+"""Receives the subscriber name, the processing stage and its duration in nanoseconds."""
+
+
+class StageTimer:
+    """Report message processing stages durations to observers.
+
+    Subscriber creates the timer only if any broker middleware provides
+    the `observe_stage` callback, so disabled timing costs a single `None` check.
+    """
+
+    __slots__ = ("name", "observers")
+
+    def __init__(self, name: str, observers: Iterable[StageObserver]) -> None:
+        self.name = name
+        self.observers = tuple(observers)
+
+    def observe(self, stage: ProcessingStage, started: int) -> None:
+        """Report the stage started at `perf_counter_ns()` time."""
+        self.report(stage, perf_counter_ns() - started)
+
+    def report(self, stage: ProcessingStage, duration: int) -> None:
+        """Report the stage duration in nanoseconds."""
+        for observer in self.observers:
+            observer(self.name, stage, duration)
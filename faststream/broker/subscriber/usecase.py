@@ -1,9 +1,10 @@
+import asyncio
 from abc import abstractmethod
-from contextlib import AsyncExitStack
-from itertools import chain
+from time import perf_counter_ns
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncContextManager,
     Callable,
     ContextManager,
     Dict,
@@ -20,9 +21,16 @@ from typing_extensions import Self, override
 from faststream.asyncapi.abc import AsyncAPIOperation
 from faststream.asyncapi.message import parse_handler_params
 from faststream.asyncapi.utils import to_camelcase
-from faststream.broker.response import ensure_response
-from faststream.broker.subscriber.call_item import HandlerItem
+from faststream.broker.response import Response, ensure_response
+from faststream.broker.subscriber.batching import (
+    MicroBatcher,
+    RawBatch,
+    batch_decoder,
+    batch_parser,
+)
+from faststream.broker.subscriber.call_item import HandlerDispatcher, HandlerItem
 from faststream.broker.subscriber.proto import SubscriberProto
+from faststream.broker.subscriber.timing import StageTimer
 from faststream.broker.types import (
     MsgType,
     P_HandlerParams,
@@ -31,16 +39,19 @@ from faststream.broker.types import (
 from faststream.broker.utils import MultiLock, get_watcher_context, resolve_custom_func
 from faststream.broker.wrapper.call import HandlerCallWrapper
 from faststream.exceptions import SetupError, StopConsume, SubscriberNotFound
-from faststream.utils.context.repository import context
+from faststream.utils.context.repository import MessageFrame, context
+from faststream.utils.executor import ThreadExecutor
 from faststream.utils.functions import sync_fake_context, to_async
 
 if TYPE_CHECKING:
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.message import StreamMessage
     from faststream.broker.middlewares import BaseMiddleware
     from faststream.broker.publisher.proto import BasePublisherProto, ProducerProto
-    from faststream.broker.response import Response
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         AsyncCallable,
         BrokerMiddleware,
@@ -49,6 +60,7 @@ if TYPE_CHECKING:
         SubscriberMiddleware,
     )
     from faststream.types import AnyDict, Decorator, LoggerProto
+    from faststream.utils.executor import BaseExecutor
 
 
 class _CallOptions:
@@ -58,6 +70,7 @@ class _CallOptions:
         "decoder",
         "middlewares",
         "dependencies",
+        "executor",
     )
 
     def __init__(
@@ -68,12 +81,14 @@ class _CallOptions:
         decoder: Optional["CustomCallable"],
         middlewares: Iterable["SubscriberMiddleware[Any]"],
         dependencies: Iterable["Depends"],
+        executor: Optional["BaseExecutor"],
     ) -> None:
         self.filter = filter
         self.parser = parser
         self.decoder = decoder
         self.middlewares = middlewares
         self.dependencies = dependencies
+        self.executor = executor
 
 
 class SubscriberUsecase(
@@ -90,13 +105,21 @@ class SubscriberUsecase(
     _broker_dependencies: Iterable["Depends"]
     _call_options: Optional["_CallOptions"]
     _call_decorators: Iterable["Decorator"]
+    _dispatcher: Optional[HandlerDispatcher[MsgType]]
+    _micro_batch: Optional["MicroBatch"]
+    _batcher: Optional[MicroBatcher]
+    _close_task: Optional["asyncio.Task[None]"]
+    _dedup: Optional["DedupStore"]
+    _timer: Optional[StageTimer]
+    _log_sampling: int
+    _log_counter: int
 
     def __init__(
         self,
         *,
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[MsgType]"],
         default_parser: "AsyncCallable",
@@ -110,7 +133,7 @@ class SubscriberUsecase(
         self.calls = []
 
         self._parser = default_parser
-        self._decoder = default_decoder
+        self._decoder = self._default_decoder = default_decoder
         self._no_reply = no_reply
         # Watcher args
         self._no_ack = no_ack
@@ -130,6 +153,14 @@ class SubscriberUsecase(
         self.graceful_timeout = None
         self.extra_context = {}
         self.extra_watcher_options = {}
+        self._dispatcher = None
+        self._micro_batch = None
+        self._batcher = None
+        self._close_task = None
+        self._dedup = None
+        self._timer = None
+        self._log_sampling = 1
+        self._log_counter = 0
 
         # AsyncAPI
         self.title_ = title_
@@ -150,6 +181,7 @@ class SubscriberUsecase(
         # broker options
         broker_parser: Optional["CustomCallable"],
         broker_decoder: Optional["CustomCallable"],
+        broker_executor: Optional["BaseExecutor"],
         # dependant args
         apply_types: bool,
         is_validate: bool,
@@ -162,48 +194,134 @@ class SubscriberUsecase(
         self.graceful_timeout = graceful_timeout
         self.extra_context = extra_context
 
-        self.watcher = get_watcher_context(logger, self._no_ack, self._retry)
+        self.watcher = get_watcher_context(
+            logger,
+            self._no_ack,
+            self._retry,
+            retry_later=self._retry_later,
+        )
+
+        if self._micro_batch is not None:
+            self._batcher = MicroBatcher(self._micro_batch, self._consume_message)
+        else:
+            self._batcher = None
 
+        stage_observers = tuple(
+            observer
+            for m in self._broker_middlewares
+            if (observer := getattr(m, "observe_stage", None)) is not None
+        )
+        self._timer = (
+            StageTimer(self.name, stage_observers) if stage_observers else None
+        )
+
+        executor_observers = tuple(
+            observer
+            for m in self._broker_middlewares
+            if (observer := getattr(m, "observe_executor", None)) is not None
+        )
+
+        batch_wrappers: Dict[AsyncCallable, AsyncCallable] = {}
         for call in self.calls:
+            executor = call.item_executor or broker_executor
+
+            if executor is not None:
+                for observe_executor in executor_observers:
+                    observe_executor(executor)
+            # parser and decoder work with raw broker objects, so only threads
+            parser_executor = executor if isinstance(executor, ThreadExecutor) else None
+
             if parser := call.item_parser or broker_parser:
-                async_parser = resolve_custom_func(to_async(parser), self._parser)
+                async_parser = resolve_custom_func(
+                    to_async(parser, parser_executor), self._parser
+                )
             else:
                 async_parser = self._parser
 
             if decoder := call.item_decoder or broker_decoder:
-                async_decoder = resolve_custom_func(to_async(decoder), self._decoder)
+                async_decoder = resolve_custom_func(
+                    to_async(decoder, parser_executor), self._decoder
+                )
             else:
                 async_decoder = self._decoder
 
             self._parser = async_parser
             self._decoder = async_decoder
 
+            if self._micro_batch is not None:
+                # reuse wrappers to share parsing cache between calls
+                if (call_parser := batch_wrappers.get(async_parser)) is None:
+                    call_parser = batch_wrappers[async_parser] = batch_parser(
+                        async_parser
+                    )
+                if (call_decoder := batch_wrappers.get(async_decoder)) is None:
+                    call_decoder = batch_wrappers[async_decoder] = batch_decoder(
+                        async_decoder
+                    )
+            else:
+                call_parser, call_decoder = async_parser, async_decoder
+
             call.setup(
-                parser=async_parser,
-                decoder=async_decoder,
+                parser=call_parser,
+                decoder=call_decoder,
                 apply_types=apply_types,
                 is_validate=is_validate,
+                is_default_decoder=call_decoder is self._default_decoder,
+                executor=executor,
                 _get_dependant=_get_dependant,
                 _call_decorators=(*self._call_decorators, *_call_decorators),
                 broker_dependencies=self._broker_dependencies,
+                timer=self._timer,
             )
 
             call.handler.refresh(with_mock=False)
 
+        self._dispatcher = HandlerDispatcher(self.calls)
+
     @abstractmethod
     async def start(self) -> None:
         """Start the handler."""
         self.running = True
+        self._close_task = None
 
     @abstractmethod
     async def close(self) -> None:
         """Close the handler.
 
-        Blocks event loop up to graceful_timeout seconds.
+        Blocks event loop up to graceful_timeout seconds if it was not drained before.
         """
-        self.running = False
+        if self.running:
+            await self.drain(self.graceful_timeout)
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Stop fetching new messages and wait for in-flight ones up to `timeout` seconds."""
+        if self.running:
+            self.running = False
+            await self._stop_fetching()
+
+        if self._batcher is not None:
+            await self._batcher.close()
+
         if isinstance(self.lock, MultiLock):
-            await self.lock.wait_release(self.graceful_timeout)
+            await self.lock.wait_release(timeout)
+
+    async def _stop_fetching(self) -> None:
+        """Stop receiving messages from the broker. Consume loops check `running` flag by default."""
+
+    @property
+    def in_flight(self) -> int:
+        """Number of messages in processing."""
+        if isinstance(self.lock, MultiLock):
+            return self.lock.qsize
+        return 0
+
+    def sample_log(self) -> bool:
+        """Decide whether to log the message success lines by `log_sampling` option."""
+        if (rate := self._log_sampling) == 1:
+            return True
+
+        self._log_counter += 1
+        return self._log_counter % rate == 1
 
     def add_call(
         self,
@@ -213,13 +331,28 @@ class SubscriberUsecase(
         decoder_: Optional["CustomCallable"],
         middlewares_: Iterable["SubscriberMiddleware[Any]"],
         dependencies_: Iterable["Depends"],
+        executor_: Optional["BaseExecutor"] = None,
+        micro_batch_: Optional["MicroBatch"] = None,
+        dedup_: Optional["DedupStore"] = None,
+        log_sampling_: int = 1,
     ) -> Self:
+        if micro_batch_ is not None:
+            self._micro_batch = micro_batch_
+
+        if dedup_ is not None:
+            self._dedup = dedup_
+
+        if log_sampling_ < 1:
+            raise SetupError(f"`log_sampling` should be positive, got {log_sampling_}")
+        self._log_sampling = log_sampling_
+
         self._call_options = _CallOptions(
             filter=filter_,
             parser=parser_,
             decoder=decoder_,
             middlewares=middlewares_,
             dependencies=dependencies_,
+            executor=executor_,
         )
         return self
 
@@ -233,6 +366,7 @@ class SubscriberUsecase(
         decoder: Optional["CustomCallable"] = None,
         middlewares: Iterable["SubscriberMiddleware[Any]"] = (),
         dependencies: Iterable["Depends"] = (),
+        executor: Optional["BaseExecutor"] = None,
     ) -> Callable[
         [Callable[P_HandlerParams, T_HandlerReturn]],
         "HandlerCallWrapper[MsgType, P_HandlerParams, T_HandlerReturn]",
@@ -248,6 +382,7 @@ class SubscriberUsecase(
         decoder: Optional["CustomCallable"] = None,
         middlewares: Iterable["SubscriberMiddleware[Any]"] = (),
         dependencies: Iterable["Depends"] = (),
+        executor: Optional["BaseExecutor"] = None,
     ) -> "HandlerCallWrapper[MsgType, P_HandlerParams, T_HandlerReturn]": ...
 
     def __call__(
@@ -259,6 +394,7 @@ class SubscriberUsecase(
         decoder: Optional["CustomCallable"] = None,
         middlewares: Iterable["SubscriberMiddleware[Any]"] = (),
         dependencies: Iterable["Depends"] = (),
+        executor: Optional["BaseExecutor"] = None,
     ) -> Any:
         if (options := self._call_options) is None:
             raise SetupError(
@@ -275,6 +411,7 @@ class SubscriberUsecase(
                 func
             )
 
+            self._dispatcher = None
             self.calls.append(
                 HandlerItem[MsgType](
                     handler=handler,
@@ -283,6 +420,7 @@ class SubscriberUsecase(
                     item_decoder=decoder or options.decoder,
                     item_middlewares=total_middlewares,
                     dependencies=total_deps,
+                    item_executor=executor or options.executor,
                 )
             )
 
@@ -299,16 +437,23 @@ class SubscriberUsecase(
         if not self.running:
             return None
 
+        if (batcher := self._batcher) is not None:
+            await batcher.put(msg)
+            return None
+
+        return await self._consume_message(msg)
+
+    async def _consume_message(self, msg: Any) -> Any:
         try:
             return await self.process_message(msg)
 
         except StopConsume:
             # Stop handler at StopConsume exception
-            await self.close()
+            await self._stop_consume()
 
         except SystemExit:
             # Stop handler at `exit()` call
-            await self.close()
+            await self._stop_consume()
 
             if app := context.get("app"):
                 app.exit()
@@ -317,67 +462,128 @@ class SubscriberUsecase(
             # All other exceptions were logged by CriticalLogMiddleware
             pass
 
+    async def _stop_consume(self) -> None:
+        if self._batcher is None:
+            await self.close()
+
+        elif self._close_task is None:
+            # micro-batch is processed by the batcher task and `close` waits for it,
+            # so the subscriber should be closed outside of the batch
+            self._close_task = asyncio.create_task(self.close())
+
     async def process_message(self, msg: MsgType) -> "Response":
         """Execute all message processing stages."""
-        async with AsyncExitStack() as stack:
-            stack.enter_context(self.lock)
-
+        with self.lock:
             # Enter context before middlewares
-            for k, v in self.extra_context.items():
-                stack.enter_context(context.scope(k, v))
+            token = context.set_frame(MessageFrame(self, self.extra_context))
+
+            try:
+                return await self._process_with_middlewares(msg)
 
-            stack.enter_context(context.scope("handler_", self))
+            finally:
+                context.reset_frame(token)
 
-            # enter all middlewares
-            middlewares: List[BaseMiddleware] = []
-            for base_m in self._broker_middlewares:
-                middleware = base_m(msg)
-                middlewares.append(middleware)
+    async def _process_with_middlewares(self, msg: MsgType) -> "Response":
+        # enter all middlewares
+        middlewares: Tuple[BaseMiddleware, ...] = ()
+        if broker_middlewares := self._broker_middlewares:
+            started = perf_counter_ns() if self._timer is not None else 0
+
+            # micro-batch is represented by the first message for middlewares
+            raw_msg = msg[0] if isinstance(msg, RawBatch) else msg
+            middlewares = tuple(base_m(raw_msg) for base_m in broker_middlewares)
+            for middleware in middlewares:
                 await middleware.__aenter__()
 
-            cache: Dict[Any, Any] = {}
-            parsing_error: Optional[Exception] = None
-            for h in self.calls:
-                try:
-                    message = await h.is_suitable(msg, cache)
-                except Exception as e:
-                    parsing_error = e
-                    break
-
-                if message is not None:
-                    # Acknowledgement scope
-                    # TODO: move it to scope enter at `retry` option deprecation
-                    await stack.enter_async_context(
-                        self.watcher(
-                            message,
-                            **self.extra_watcher_options,
-                        )
-                    )
+            if self._timer is not None:
+                self._timer.observe("middlewares_enter", started)
 
-                    stack.enter_context(
-                        context.scope("log_context", self.get_log_context(message))
-                    )
-                    stack.enter_context(context.scope("message", message))
+        dispatcher = self._dispatcher or HandlerDispatcher(self.calls)
+        self._dispatcher = dispatcher
 
-                    # Middlewares should be exited before scope release
-                    for m in middlewares:
-                        stack.push_async_exit(m.__aexit__)
+        parsing_error: Optional[Exception] = None
+        try:
+            suitable = await dispatcher.find(msg, cache={})
+        except Exception as e:
+            parsing_error = e
+        else:
+            if suitable is not None:
+                h, message = suitable
+                return await self._process_handler(h, message, middlewares)
+
+        # Suitable handler was not found or
+        # parsing/decoding exception occurred
+        error: Optional[BaseException] = parsing_error or SubscriberNotFound(
+            f"There is no suitable handler for {msg=}"
+        )
 
-                    result_msg = ensure_response(
-                        await h.call(
-                            message=message,
-                            # consumer middlewares
-                            _extra_middlewares=(m.consume_scope for m in middlewares),
-                        )
+        if (error := await _exit_middlewares(middlewares, error)) is not None:
+            raise error
+
+        # An error was raised and processed by some middleware
+        return ensure_response(None)
+
+    async def _process_handler(
+        self,
+        h: "HandlerItem[MsgType]",
+        message: "StreamMessage[MsgType]",
+        middlewares: Tuple["BaseMiddleware", ...],
+    ) -> "Response":
+        # Acknowledgement scope
+        # TODO: move it to scope enter at `retry` option deprecation
+        watcher: Optional[AsyncContextManager[None]] = None
+        if not self._no_ack:
+            watcher = self.watcher(message, **self.extra_watcher_options)
+            await watcher.__aenter__()
+
+        frame = context.frame
+        assert frame, "`_process_handler` should be called in message scope"  # nosec B101
+        frame.log_context = self.get_log_context(message)
+        frame.message = message
+
+        response: Optional[Response] = None
+        error: Optional[BaseException] = None
+        try:
+            publishers: Tuple[BasePublisherProto, ...] = ()
+
+            dedup = self._dedup
+            dedup_key = dedup.get_key(message) if dedup is not None else ""
+            is_duplicate = dedup is not None and await dedup.seen(dedup_key)
+
+            if is_duplicate:
+                # already processed message is acknowledged without the handler call
+                result_msg = ensure_response(None)
+
+            else:
+                result_msg = ensure_response(
+                    await h.call(
+                        message=message,
+                        # consumer middlewares
+                        _extra_middlewares=(m.consume_scope for m in middlewares),
                     )
+                )
+
+                publishers = (
+                    *self.__get_response_publisher(message),
+                    *h.handler._publishers,
+                )
 
-                    if not result_msg.correlation_id:
-                        result_msg.correlation_id = message.correlation_id
+            if publishers:
+                started = perf_counter_ns() if self._timer is not None else 0
 
-                    for p in chain(
-                        self.__get_response_publisher(message),
-                        h.handler._publishers,
-                    ):
+                # resolve the lazy correlation id only if the result is published
+                if not result_msg.correlation_id:
+                    result_msg.correlation_id = message.correlation_id
+
+                # serialize the result once for the whole fan-out
+                encode_scope = (
+                    result_msg.encode_once()
+                    if len(publishers) > 1
+                    else sync_fake_context()
+                )
+
+                with encode_scope:
+                    for p in publishers:
                         await p.publish(
                             result_msg.body,
                             **result_msg.as_publish_kwargs(),
@@ -385,22 +591,40 @@ class SubscriberUsecase(
                             _extra_middlewares=(m.publish_scope for m in middlewares),
                         )
 
-                    # Return data for tests
-                    return result_msg
+                if self._timer is not None:
+                    self._timer.observe("publish", started)
 
-            # Suitable handler was not found or
-            # parsing/decoding exception occurred
-            for m in middlewares:
-                stack.push_async_exit(m.__aexit__)
+            if dedup is not None and not is_duplicate:
+                await dedup.add(dedup_key)
 
-            if parsing_error:
-                raise parsing_error
+        except BaseException as e:
+            error = e
 
-            else:
-                raise SubscriberNotFound(f"There is no suitable handler for {msg=}")
+        else:
+            response = result_msg
 
-        # An error was raised and processed by some middleware
-        return ensure_response(None)
+        # Middlewares should be exited before scope release
+        if middlewares:
+            started = perf_counter_ns() if self._timer is not None else 0
+            error = await _exit_middlewares(middlewares, error)
+            if self._timer is not None:
+                self._timer.observe("middlewares_exit", started)
+
+        if watcher is not None:
+            if error is None:
+                await watcher.__aexit__(None, None, None)
+            elif await watcher.__aexit__(type(error), error, error.__traceback__):
+                error = None
+
+        if error is not None:
+            raise error
+
+        if response is None:
+            # An error was raised and processed by some middleware
+            return ensure_response(None)
+
+        # Return data for tests
+        return response
 
     def __get_response_publisher(
         self,
@@ -412,6 +636,18 @@ class SubscriberUsecase(
         else:
             return self._make_response_publisher(message)
 
+    async def _retry_later(
+        self,
+        message: "StreamMessage[Any]",
+        delay: float,
+        attempts: int,
+    ) -> None:
+        """Redeliver failed message after the delay by `RetryPolicy`.
+
+        Subscribers without native delayed redelivery nack the message at once.
+        """
+        await message.nack(**self.extra_watcher_options)
+
     def get_log_context(
         self,
         message: Optional["StreamMessage[MsgType]"],
@@ -465,3 +701,25 @@ class SubscriberUsecase(
             )
 
         return payloads
+
+
+async def _exit_middlewares(
+    middlewares: Tuple["BaseMiddleware", ...],
+    error: Optional[BaseException],
+) -> Optional[BaseException]:
+    """Exit middlewares in reversed order the same way `AsyncExitStack` does.
+
+    Returns an exception to raise or `None` if it was suppressed.
+    """
+    for m in reversed(middlewares):
+        try:
+            if error is None:
+                await m.__aexit__(None, None, None)
+
+            elif await m.__aexit__(type(error), error, error.__traceback__):
+                error = None
+
+        except BaseException as e:  # noqa: PERF203
+            error = e
+
+    return error
@@ -46,6 +46,11 @@ CustomCallable: TypeAlias = Union[
     SyncCallable,
 ]
 
+RetryLaterCallable: TypeAlias = Callable[
+    [StreamMessage[Any], float, int],
+    Awaitable[None],
+]
+
 P_HandlerParams = ParamSpec("P_HandlerParams")
 T_HandlerReturn = TypeVar("T_HandlerReturn")
 
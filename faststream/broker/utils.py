@@ -1,6 +1,6 @@
 import asyncio
 import inspect
-from contextlib import AsyncExitStack, suppress
+from contextlib import AsyncExitStack
 from functools import partial
 from typing import (
     TYPE_CHECKING,
@@ -25,11 +25,13 @@ from faststream.utils.functions import fake_context, return_input, to_async
 if TYPE_CHECKING:
     from types import TracebackType
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.message import StreamMessage
     from faststream.broker.types import (
         AsyncCallable,
         BrokerMiddleware,
         CustomCallable,
+        RetryLaterCallable,
         SyncCallable,
     )
     from faststream.types import LoggerProto
@@ -88,7 +90,8 @@ async def default_filter(msg: "StreamMessage[Any]") -> bool:
 def get_watcher_context(
     logger: Optional["LoggerProto"],
     no_ack: bool,
-    retry: Union[bool, int],
+    retry: Union[bool, int, "BaseWatcher"],
+    retry_later: Optional["RetryLaterCallable"] = None,
     **extra_options: Any,
 ) -> Callable[..., AsyncContextManager[None]]:
     """Create Acknowledgement scope."""
@@ -100,16 +103,19 @@ def get_watcher_context(
             WatcherContext,
             watcher=get_watcher(logger, retry),
             logger=logger,
+            retry_later=retry_later,
             **extra_options,
         )
 
 
 class MultiLock:
-    """A class representing a multi lock."""
+    """A counter of messages in processing to wait for them at shutdown."""
 
     def __init__(self) -> None:
         """Initialize a new instance of the class."""
-        self.queue: asyncio.Queue[None] = asyncio.Queue()
+        self._count = 0
+        self._released = asyncio.Event()
+        self._released.set()
 
     def __enter__(self) -> Self:
         """Enter the context."""
@@ -127,32 +133,34 @@ class MultiLock:
 
     def acquire(self) -> None:
         """Acquire lock."""
-        self.queue.put_nowait(None)
+        self._count += 1
+        self._released.clear()
 
     def release(self) -> None:
         """Release lock."""
-        with suppress(asyncio.QueueEmpty, ValueError):
-            self.queue.get_nowait()
-            self.queue.task_done()
+        if self._count:
+            self._count -= 1
+            if not self._count:
+                self._released.set()
 
     @property
     def qsize(self) -> int:
-        """Return the size of the queue."""
-        return self.queue.qsize()
+        """Return the number of acquired locks."""
+        return self._count
 
     @property
     def empty(self) -> bool:
-        """Return whether the queue is empty."""
-        return self.queue.empty()
+        """Return whether the lock is released."""
+        return not self._count
 
     async def wait_release(self, timeout: Optional[float] = None) -> None:
-        """Wait for the queue to be released.
+        """Wait for the lock to be released.
 
         Using for graceful shutdown.
         """
         if timeout:
             with anyio.move_on_after(timeout):
-                await self.queue.join()
+                await self._released.wait()
 
 
 def resolve_custom_func(
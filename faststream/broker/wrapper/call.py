@@ -1,4 +1,5 @@
 import asyncio
+import inspect
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -10,6 +11,7 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Type,
     Union,
 )
 from unittest.mock import MagicMock
@@ -17,12 +19,15 @@ from unittest.mock import MagicMock
 import anyio
 from fast_depends.core import CallModel, build_call_model
 from fast_depends.use import _InjectWrapper, inject
+from pydantic import BaseModel
 
+from faststream._compat import model_parse
 from faststream.broker.types import (
     MsgType,
     P_HandlerParams,
     T_HandlerReturn,
 )
+from faststream.constants import ContentTypes
 from faststream.exceptions import SetupError
 from faststream.utils.functions import to_async
 
@@ -32,6 +37,7 @@ if TYPE_CHECKING:
     from faststream.broker.message import StreamMessage
     from faststream.broker.publisher.proto import PublisherProto
     from faststream.types import Decorator
+    from faststream.utils.executor import BaseExecutor
 
 
 class HandlerCallWrapper(Generic[MsgType, P_HandlerParams, T_HandlerReturn]):
@@ -40,6 +46,7 @@ class HandlerCallWrapper(Generic[MsgType, P_HandlerParams, T_HandlerReturn]):
     mock: Optional[MagicMock]
     future: Optional["asyncio.Future[Any]"]
     is_test: bool
+    validates_raw_body: bool
 
     _wrapped_call: Optional[Callable[..., Awaitable[Any]]]
     _original_call: Callable[P_HandlerParams, T_HandlerReturn]
@@ -49,6 +56,7 @@ class HandlerCallWrapper(Generic[MsgType, P_HandlerParams, T_HandlerReturn]):
         "mock",
         "future",
         "is_test",
+        "validates_raw_body",
         "_wrapped_call",
         "_original_call",
         "_publishers",
@@ -80,6 +88,7 @@ class HandlerCallWrapper(Generic[MsgType, P_HandlerParams, T_HandlerReturn]):
             self.mock = None
             self.future = None
             self.is_test = False
+            self.validates_raw_body = False
 
     def __call__(
         self,
@@ -153,15 +162,22 @@ class HandlerCallWrapper(Generic[MsgType, P_HandlerParams, T_HandlerReturn]):
         dependencies: Iterable["Depends"],
         _get_dependant: Optional[Callable[..., Any]],
         _call_decorators: Iterable["Decorator"],
+        executor: Optional["BaseExecutor"] = None,
     ) -> Optional["CallModel[..., Any]"]:
         call = self._original_call
-        for decor in _call_decorators:
+
+        decorators = tuple(_call_decorators)
+        if executor is not None:
+            executor.prepare(call, decorated=bool(decorators))
+
+        for decor in decorators:
             call = decor(call)
         self._original_call = call
 
-        f: Callable[..., Awaitable[Any]] = to_async(call)
+        f: Callable[..., Awaitable[Any]] = to_async(call, executor)
 
         dependent: Optional[CallModel[..., Any]] = None
+        body_model: Optional[Type[BaseModel]] = None
         if _get_dependant is None:
             dependent = build_call_model(
                 f,
@@ -173,23 +189,56 @@ class HandlerCallWrapper(Generic[MsgType, P_HandlerParams, T_HandlerReturn]):
                 wrapper: _InjectWrapper[Any, Any] = inject(func=None)
                 f = wrapper(func=f, model=dependent)
 
+                if is_validate:
+                    body_model = _get_body_model(dependent)
+
             f = _wrap_decode_message(
                 func=f,
                 params_ln=len(dependent.flat_params),
+                body_model=body_model,
             )
 
+        self.validates_raw_body = body_model is not None
         self._wrapped_call = f
         return dependent
 
 
+def _get_body_model(dependent: "CallModel[..., Any]") -> Optional[Type[BaseModel]]:
+    """Return the pydantic model if it is the only handler body argument."""
+    if len(dependent.flat_params) != 1:
+        return None
+
+    ((annotation, _),) = dependent.flat_params.values()
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return annotation
+
+    return None
+
+
+def _is_raw_json(message: "StreamMessage[Any]") -> bool:
+    """Check if the message body is still not decoded JSON bytes."""
+    return (
+        message._lazy_decoder is not None
+        and isinstance(message.body, bytes)
+        and (
+            not message.content_type or ContentTypes.json.value in message.content_type
+        )
+    )
+
+
 def _wrap_decode_message(
     func: Callable[..., Awaitable[T_HandlerReturn]],
     params_ln: int,
+    body_model: Optional[Type[BaseModel]] = None,
 ) -> Callable[["StreamMessage[MsgType]"], Awaitable[T_HandlerReturn]]:
     """Wraps a function to decode a message and pass it as an argument to the wrapped function."""
 
     async def decode_wrapper(message: "StreamMessage[MsgType]") -> T_HandlerReturn:
         """A wrapper function to decode and handle a message."""
+        if body_model is not None and _is_raw_json(message):
+            # validate the model straight from bytes without intermediate dict
+            return await func(model_parse(body_model, message.body))
+
         msg = await message.decode()
 
         if params_ln > 1:
@@ -0,0 +1,331 @@
+import asyncio
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from importlib import import_module
+from pathlib import Path
+from statistics import median
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+import anyio
+
+from faststream.broker.middlewares import BaseMiddleware
+
+if TYPE_CHECKING:
+    from faststream.broker.core.usecase import BrokerUsecase
+    from faststream.testing.broker import TestBroker
+
+BATCH_SIZE = 100
+ALLOC_SAMPLES = 200
+CONNECT_TIMEOUT = 5.0
+CONSUME_TIMEOUT = 10.0
+MIDDLEWARES_NUMBER = 3
+
+Operation = Callable[[], Awaitable[Any]]
+Decorator = Callable[[Callable[..., Any]], Any]
+
+
+@dataclass
+class BenchResult:
+    """A single scenario measurement."""
+
+    broker: str
+    mode: str
+    scenario: str
+    rate: float
+    """Messages per second."""
+    p50: float
+    """Median operation latency in microseconds."""
+    p99: float
+    """99th percentile operation latency in microseconds."""
+    alloc: Optional[float]
+    """Peak memory allocated per message in bytes."""
+
+    @property
+    def key(self) -> str:
+        return f"{self.broker}/{self.mode}/{self.scenario}"
+
+
+@dataclass
+class _BrokerSpec:
+    module: str
+    broker_cls: str
+    test_cls: str
+    destination: str
+    """Publish method argument name for the destination."""
+    batch: Optional[Callable[[Any, str], Tuple[Decorator, Dict[str, Any]]]] = None
+    """Return batch subscriber and `publish_batch` destination options."""
+
+
+def _subscriber(broker: Any, *args: Any, **kwargs: Any) -> Decorator:
+    return broker.subscriber(*args, **kwargs)  # type: ignore[no-any-return]
+
+
+def _kafka_batch(broker: Any, name: str) -> Tuple[Decorator, Dict[str, Any]]:
+    return _subscriber(broker, name, batch=True), {"topic": name}
+
+
+def _redis_batch(broker: Any, name: str) -> Tuple[Decorator, Dict[str, Any]]:
+    from faststream.redis import ListSub
+
+    return _subscriber(broker, list=ListSub(name, batch=True)), {"list": name}
+
+
+BROKERS: Dict[str, _BrokerSpec] = {
+    "kafka": _BrokerSpec(
+        "faststream.kafka", "KafkaBroker", "TestKafkaBroker", "topic", _kafka_batch
+    ),
+    "confluent": _BrokerSpec(
+        "faststream.confluent", "KafkaBroker", "TestKafkaBroker", "topic", _kafka_batch
+    ),
+    "rabbit": _BrokerSpec(
+        "faststream.rabbit", "RabbitBroker", "TestRabbitBroker", "queue"
+    ),
+    "nats": _BrokerSpec("faststream.nats", "NatsBroker", "TestNatsBroker", "subject"),
+    "redis": _BrokerSpec(
+        "faststream.redis", "RedisBroker", "TestRedisBroker", "channel", _redis_batch
+    ),
+}
+
+SCENARIOS = ("publish", "consume", "consume-middlewares", "batch-consume", "request")
+
+
+class _Waiter:
+    """Wait for the handler to receive all published messages."""
+
+    def __init__(self) -> None:
+        self.event = asyncio.Event()
+        self.left = 0
+
+    def expect(self, number: int) -> None:
+        self.left = number
+        self.event.clear()
+
+    def feed(self, number: int = 1) -> None:
+        self.left -= number
+        if self.left <= 0:
+            self.event.set()
+
+    async def wait(self) -> None:
+        """Wait for the messages, the scenario is skipped if they are lost."""
+        try:
+            with anyio.fail_after(CONSUME_TIMEOUT):
+                await self.event.wait()
+        except TimeoutError as e:
+            raise TimeoutError(
+                f"{self.left} messages were not consumed in {CONSUME_TIMEOUT}s"
+            ) from e
+
+
+async def _measure(
+    operation: Operation,
+    count: int,
+    per_operation: int,
+) -> Tuple[float, float, float, Optional[float]]:
+    for _ in range(min(count // 10, 100)):  # warm up
+        await operation()
+
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(count):
+        op_started = time.perf_counter()
+        await operation()
+        latencies.append(time.perf_counter() - op_started)
+    total = time.perf_counter() - started
+
+    latencies.sort()
+    p50 = latencies[int(0.5 * (len(latencies) - 1))] * 1_000_000
+    p99 = latencies[int(0.99 * (len(latencies) - 1))] * 1_000_000
+
+    # separate pass, tracing slows everything down
+    alloc: Optional[float] = None
+    if hasattr(tracemalloc, "reset_peak"):  # pragma: no branch
+        tracemalloc.start()
+        try:
+            sizes: List[int] = []
+            for _ in range(min(count, ALLOC_SAMPLES)):
+                current, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                await operation()
+                sizes.append(tracemalloc.get_traced_memory()[1] - current)
+        finally:
+            tracemalloc.stop()
+        alloc = median(sizes) / per_operation
+
+    return count * per_operation / total, p50, p99, alloc
+
+
+async def _run_scenario(
+    name: str,
+    spec: _BrokerSpec,
+    scenario: str,
+    count: int,
+    real: bool,
+) -> Optional[BenchResult]:
+    module = import_module(spec.module)
+
+    broker: BrokerUsecase[Any, Any] = getattr(module, spec.broker_cls)(
+        logger=None,
+        middlewares=(BaseMiddleware,) * MIDDLEWARES_NUMBER
+        if scenario == "consume-middlewares"
+        else (),
+    )
+    test_client: TestBroker[Any] = getattr(module, spec.test_cls)(
+        broker, with_real=real
+    )
+
+    destination = f"bench-{scenario}"
+    publish_options: Dict[str, Any] = {spec.destination: destination}
+    waiter = _Waiter()
+    per_operation = 1
+
+    operation: Operation
+
+    if scenario == "publish":
+
+        async def operation() -> None:
+            await broker.publish(b"hello", **publish_options)
+
+    elif scenario in {"consume", "consume-middlewares"}:
+
+        @_subscriber(broker, destination)
+        async def handler(msg: bytes) -> None:
+            waiter.feed()
+
+        async def operation() -> None:
+            waiter.expect(1)
+            await broker.publish(b"hello", **publish_options)
+            await waiter.wait()
+
+    elif scenario == "batch-consume":
+        if spec.batch is None:
+            return None
+
+        subscriber, batch_options = spec.batch(broker, destination)
+        per_operation = BATCH_SIZE
+        messages = [b"hello"] * BATCH_SIZE
+
+        @subscriber
+        async def batch_handler(msgs: List[bytes]) -> None:
+            waiter.feed(len(msgs))
+
+        async def operation() -> None:
+            waiter.expect(BATCH_SIZE)
+            await broker.publish_batch(*messages, **batch_options)  # type: ignore[attr-defined]
+            await waiter.wait()
+
+    else:
+
+        @_subscriber(broker, destination)
+        async def reply_handler(msg: bytes) -> bytes:
+            return msg
+
+        async def operation() -> None:
+            await broker.request(b"hello", **publish_options)
+
+    with anyio.fail_after(CONNECT_TIMEOUT):
+        await test_client.__aenter__()
+
+    try:
+        rate, p50, p99, alloc = await _measure(operation, count, per_operation)
+    finally:
+        await test_client.__aexit__(None, None, None)
+
+    return BenchResult(
+        broker=name,
+        mode="real" if real else "test",
+        scenario=scenario,
+        rate=rate,
+        p50=p50,
+        p99=p99,
+        alloc=alloc,
+    )
+
+
+async def run_suite(
+    brokers: Iterable[str],
+    *,
+    count: int,
+    real: bool,
+    echo: Callable[[str], None],
+) -> List[BenchResult]:
+    """Run all scenarios for the brokers by TestBroker and, optionally, the real ones."""
+    results: List[BenchResult] = []
+
+    for name in brokers:
+        spec = BROKERS[name]
+
+        try:
+            import_module(spec.module)
+        except ImportError:
+            echo(f"{name}: skipped, the broker client is not installed")
+            continue
+
+        for is_real in (False, True) if real else (False,):
+            for scenario in SCENARIOS:
+                try:
+                    result = await _run_scenario(name, spec, scenario, count, is_real)
+                except Exception as e:
+                    mode = "real" if is_real else "test"
+                    echo(f"{name}/{mode}/{scenario}: skipped, {e!r}")
+
+                    if is_real and scenario == SCENARIOS[0]:
+                        break  # the broker is not available
+                    continue
+
+                if result is not None:
+                    results.append(result)
+
+    return results
+
+
+def format_results(
+    results: Iterable[BenchResult],
+    baseline: Optional[Dict[str, BenchResult]] = None,
+) -> str:
+    """Format results table with the throughput change against the baseline."""
+    lines = [
+        f"{'scenario':<40} {'msg/s':>12} {'p50 us':>10} {'p99 us':>10} {'alloc B/msg':>12}"
+        + (f" {'vs baseline':>12}" if baseline is not None else "")
+    ]
+
+    for r in results:
+        alloc = f"{r.alloc:.0f}" if r.alloc is not None else "-"
+        line = f"{r.key:<40} {r.rate:>12.0f} {r.p50:>10.1f} {r.p99:>10.1f} {alloc:>12}"
+
+        if baseline is not None:
+            if (base := baseline.get(r.key)) is not None:
+                line += f" {get_change(r, base):>+11.1f}%"
+            else:
+                line += f" {'new':>12}"
+
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+def get_change(result: BenchResult, base: BenchResult) -> float:
+    """Throughput change against the baseline in percents."""
+    return (result.rate / base.rate - 1) * 100
+
+
+def save_results(results: Iterable[BenchResult], path: Path) -> None:
+    """Save results to JSON file to compare with them later."""
+    path.write_text(json.dumps([asdict(r) for r in results], indent=2))
+
+
+def load_results(path: Path) -> Dict[str, BenchResult]:
+    """Load baseline results saved by `save_results`."""
+    results = (BenchResult(**r) for r in json.loads(path.read_text()))
+    return {r.key: r for r in results}
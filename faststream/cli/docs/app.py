@@ -6,10 +6,6 @@ from typing import Optional, Sequence
 
 import typer
 
-from faststream._compat import json_dumps, model_parse
-from faststream.asyncapi.generate import get_app_schema
-from faststream.asyncapi.schema import Schema
-from faststream.asyncapi.site import serve_app
 from faststream.cli.utils.imports import import_from_string
 from faststream.exceptions import INSTALL_WATCHFILES, INSTALL_YAML
 
@@ -123,6 +119,8 @@ def gen(
 
     _, app_obj = import_from_string(app, is_factory=is_factory)
 
+    from faststream.asyncapi.generate import get_app_schema
+
     raw_schema = get_app_schema(app_obj)
 
     if yaml:
@@ -153,6 +151,12 @@ def _parse_and_serve(
     port: int = 8000,
     is_factory: bool = False,
 ) -> None:
+    # AsyncAPI schema models are heavy, so they are not imported by CLI itself
+    from faststream._compat import json_dumps, model_parse
+    from faststream.asyncapi.generate import get_app_schema
+    from faststream.asyncapi.schema import Schema
+    from faststream.asyncapi.site import serve_app
+
     if ":" in app:
         _, app_obj = import_from_string(app, is_factory=is_factory)
 
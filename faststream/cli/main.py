@@ -2,6 +2,8 @@ import logging
 import sys
 import warnings
 from contextlib import suppress
+from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import anyio
@@ -103,6 +105,22 @@ def run(
         is_flag=True,
         help="Treat APP as an application factory.",
     ),
+    metrics_dir: Optional[str] = typer.Option(
+        None,
+        "--metrics-dir",
+        help=(
+            "Directory to aggregate Prometheus metrics of all [workers]"
+            " by prometheus_client multiprocess mode."
+        ),
+        envvar="PROMETHEUS_MULTIPROC_DIR",
+        show_default=False,
+    ),
+    profile_import: bool = typer.Option(
+        False,
+        "--profile-import",
+        is_flag=True,
+        help="Report the application import time by packages before running.",
+    ),
 ) -> None:
     """Run [MODULE:APP] FastStream application."""
     if watch_extensions and not reload:
@@ -117,6 +135,19 @@ def run(
     if app_dir:  # pragma: no branch
         sys.path.insert(0, app_dir)
 
+    if profile_import:
+        from faststream.cli.utils.import_time import (
+            format_import_report,
+            get_import_times,
+        )
+
+        try:
+            times = get_import_times(app, is_factory=is_factory, app_dir=app_dir)
+        except RuntimeError as e:
+            typer.echo(f"Import profiling failed:\n{e}", err=True)
+        else:
+            typer.echo(format_import_report(times), err=True)
+
     # Should be imported after sys.path changes
     module_path, app_obj = import_from_string(app, is_factory=is_factory)
 
@@ -153,8 +184,15 @@ def run(
                 target=_run,
                 args=(*args, logging.DEBUG),
                 workers=workers,
+                metrics_dir=metrics_dir,
             ).run()
         else:
+            if metrics_dir is not None:
+                # ASGI app workers are spawned by the ASGI server, not by the supervisor
+                raise SetupError(
+                    "You can't use metrics dir option with ASGI application workers"
+                )
+
             args[1]["workers"] = workers
             _run(*args)
 
@@ -213,6 +251,81 @@ def _run(
         sys.exit(1)
 
 
+@cli.command()
+def bench(
+    brokers: Optional[List[str]] = typer.Argument(
+        None,
+        help="Brokers to benchmark: kafka, confluent, rabbit, nats, redis. All by default.",
+        show_default=False,
+    ),
+    count: int = typer.Option(
+        2000,
+        help="Operations number for every scenario.",
+    ),
+    real: bool = typer.Option(
+        False,
+        "--real",
+        is_flag=True,
+        help="Run the suite against local brokers as well, if they are available.",
+    ),
+    save: Optional[Path] = typer.Option(
+        None,
+        help="Save results to JSON file to use it as a baseline.",
+        show_default=False,
+    ),
+    compare: Optional[Path] = typer.Option(
+        None,
+        help="Compare results with the JSON baseline.",
+        show_default=False,
+    ),
+    threshold: float = typer.Option(
+        10.0,
+        help="Allowed throughput regression against the baseline in percents.",
+    ),
+) -> None:
+    """Measure messages processing throughput, latency and memory allocations.
+
+    Every broker runs publish, consume, batch consume and request/reply scenarios
+    with and without middlewares by its TestBroker client. The exit code is 1
+    if any scenario throughput regressed against the baseline more than threshold.
+    """
+    from faststream.cli.bench.suite import (
+        BROKERS,
+        format_results,
+        get_change,
+        load_results,
+        run_suite,
+        save_results,
+    )
+
+    if unknown := set(brokers or ()) - set(BROKERS):
+        raise typer.BadParameter(f"Unknown brokers: {', '.join(sorted(unknown))}")
+
+    results = anyio.run(
+        partial(
+            run_suite,
+            brokers or BROKERS,
+            count=count,
+            real=real,
+            echo=typer.echo,
+        )
+    )
+
+    baseline = load_results(compare) if compare is not None else None
+    typer.echo(format_results(results, baseline))
+
+    if save is not None:
+        save_results(results, save)
+
+    if baseline is not None and any(
+        get_change(r, base) < -threshold
+        for r in results
+        if (base := baseline.get(r.key)) is not None
+    ):
+        typer.echo(f"Throughput regressed more than {threshold}%")
+        sys.exit(1)
+
+
 @cli.command(
     context_settings={"allow_extra_args": True, "ignore_unknown_options": True}
 )
@@ -1,5 +1,8 @@
+import os
 import signal
-from typing import TYPE_CHECKING, Any, List, Tuple
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from faststream.cli.supervisors.basereload import BaseReload
 from faststream.log import logger
@@ -19,15 +22,20 @@ class Multiprocess(BaseReload):
         args: Tuple[Any, ...],
         workers: int,
         reload_delay: float = 0.5,
+        metrics_dir: Optional[str] = None,
     ) -> None:
         super().__init__(target, args, reload_delay)
 
         self.workers = workers
         self.processes: List[SpawnProcess] = []
+        self.metrics_dir = metrics_dir
 
     def startup(self) -> None:
         logger.info(f"Started parent process [{self.pid}]")
 
+        if self.metrics_dir is not None:
+            self._setup_metrics_dir(self.metrics_dir)
+
         for _ in range(self.workers):
             process = self._start_process()
             logger.info(f"Started child process [{process.pid}]")
@@ -38,6 +46,7 @@ class Multiprocess(BaseReload):
             process.terminate()
             logger.info(f"Stopping child process [{process.pid}]")
             process.join()
+            self._mark_process_dead(process.pid)
 
         logger.info(f"Stopping parent process [{self.pid}]")
 
@@ -58,6 +67,7 @@ class Multiprocess(BaseReload):
             logger.error(log_msg, pid, exitcode)
 
             process.kill()
+            self._mark_process_dead(pid)
 
             new_process = self._start_process()
             logger.info(f"Started child process [{new_process.pid}]")
@@ -67,3 +77,26 @@ class Multiprocess(BaseReload):
 
     def should_restart(self) -> bool:
         return not all(p.is_alive() for p in self.processes)
+
+    @staticmethod
+    def _setup_metrics_dir(metrics_dir: str) -> None:
+        """Prepare `prometheus_client` multiprocess mode directory shared by workers."""
+        path = Path(metrics_dir)
+        path.mkdir(parents=True, exist_ok=True)
+
+        # metrics of the previous run
+        for f in path.glob("*.db"):
+            f.unlink()
+
+        # spawned workers inherit the parent environment
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = str(path)
+
+    def _mark_process_dead(self, pid: Optional[int]) -> None:
+        """Remove dead worker live gauges from the aggregated metrics."""
+        if self.metrics_dir is None or pid is None:
+            return
+
+        with suppress(ImportError):
+            from prometheus_client import multiprocess
+
+            multiprocess.mark_process_dead(pid, self.metrics_dir)  # type: ignore[no-untyped-call]
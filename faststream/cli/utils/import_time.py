@@ -0,0 +1,77 @@
+import re
+import subprocess  # nosec B404
+import sys
+from collections import defaultdict
+from typing import Dict, Iterable, Tuple
+
+IMPORT_TIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \| *(\S+)$")
+
+_PROFILE_SCRIPT = """
+import sys
+sys.path.insert(0, {app_dir!r})
+from faststream.cli.utils.imports import import_from_string
+import_from_string({app!r}, is_factory={is_factory!r})
+"""
+
+
+def get_import_times(
+    app: str,
+    *,
+    is_factory: bool,
+    app_dir: str,
+) -> Dict[str, int]:
+    """Import the application by a fresh interpreter and collect modules self import time in microseconds."""
+    result = subprocess.run(  # nosec B603
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _PROFILE_SCRIPT.format(app=app, is_factory=is_factory, app_dir=app_dir),
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        errors = [x for x in result.stderr.splitlines() if not IMPORT_TIME_RE.match(x)]
+        raise RuntimeError("\n".join(errors))
+
+    return parse_import_times(result.stderr.splitlines())
+
+
+def parse_import_times(lines: Iterable[str]) -> Dict[str, int]:
+    """Parse `python -X importtime` output to module self time mapping."""
+    times: Dict[str, int] = {}
+    for line in lines:
+        if match := IMPORT_TIME_RE.match(line):
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+def format_import_report(times: Dict[str, int], top: int = 15) -> str:
+    """Format import time grouped by top-level packages.
+
+    FastStream subpackages are reported separately to show which of them the application uses.
+    """
+    packages: Dict[str, int] = defaultdict(int)
+    for module, self_time in times.items():
+        packages[_get_package(module)] += self_time
+
+    biggest: Iterable[Tuple[str, int]] = sorted(
+        packages.items(), key=lambda x: x[1], reverse=True
+    )[:top]
+
+    lines = [
+        f"Import time: {sum(times.values()) / 1000:.1f} ms, {len(times)} modules",
+        *(f"  {name:<40} {t / 1000:>8.1f} ms" for name, t in biggest),
+    ]
+    return "\n".join(lines)
+
+
+def _get_package(module: str) -> str:
+    parts = module.split(".")
+    if parts[0] == "faststream" and len(parts) > 1:
+        return ".".join(parts[:2])
+    return parts[0]
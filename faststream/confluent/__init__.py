@@ -1,10 +1,15 @@
+from typing import TYPE_CHECKING
+
 from faststream.confluent.annotations import KafkaMessage
 from faststream.confluent.broker import KafkaBroker
 from faststream.confluent.response import KafkaResponse
 from faststream.confluent.router import KafkaPublisher, KafkaRoute, KafkaRouter
 from faststream.confluent.schemas import TopicPartition
-from faststream.confluent.testing import TestKafkaBroker
-from faststream.testing.app import TestApp
+from faststream.utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from faststream.confluent.testing import TestKafkaBroker
+    from faststream.testing.app import TestApp
 
 __all__ = (
     "KafkaBroker",
@@ -17,3 +22,11 @@ __all__ = (
     "TestKafkaBroker",
     "TestApp",
 )
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "TestKafkaBroker": "faststream.confluent.testing",
+        "TestApp": "faststream.testing.app",
+    },
+)
@@ -30,6 +30,7 @@ from faststream.confluent.config import ConfluentFastConfig
 from faststream.confluent.publisher.producer import AsyncConfluentFastProducer
 from faststream.confluent.schemas.params import ConsumerConnectionParams
 from faststream.confluent.security import parse_security
+from faststream.constants import DEFAULT_STARTUP_CONCURRENCY
 from faststream.exceptions import NOT_CONNECTED_YET
 from faststream.types import EMPTY
 from faststream.utils.data import filter_by_dict
@@ -54,6 +55,7 @@ if TYPE_CHECKING:
         LoggerProto,
         SendableMessage,
     )
+    from faststream.utils.executor import BaseExecutor
 
 Partition = TypeVar("Partition")
 
@@ -253,6 +255,20 @@ class KafkaBroker(
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down."
             ),
         ] = 15.0,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handlers (and parsers and decoders for `ThreadExecutor`) of all broker subscribers. "
+                "Anyio default threadpool is used if not set."
+            ),
+        ] = None,
+        startup_concurrency: Annotated[
+            int,
+            Doc(
+                "Max number of subscribers and declarations started concurrently. "
+                "Use `1` to start them one by one."
+            ),
+        ] = DEFAULT_STARTUP_CONCURRENCY,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -372,6 +388,8 @@ class KafkaBroker(
             transaction_timeout_ms=transaction_timeout_ms,
             # Basic args
             graceful_timeout=graceful_timeout,
+            executor=executor,
+            startup_concurrency=startup_concurrency,
             dependencies=dependencies,
             decoder=decoder,
             parser=parser,
@@ -455,12 +473,7 @@ class KafkaBroker(
     async def start(self) -> None:
         await super().start()
 
-        for handler in self._subscribers.values():
-            self._log(
-                f"`{handler.call_name}` waiting for messages",
-                extra=handler.get_log_context(None),
-            )
-            await handler.start()
+        await self._start_subscribers()
 
     @property
     def _subscriber_setup_extra(self) -> "AnyDict":
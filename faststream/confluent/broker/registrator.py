@@ -18,12 +18,15 @@ from faststream.broker.core.abc import ABCBroker
 from faststream.broker.utils import default_filter
 from faststream.confluent.publisher.asyncapi import AsyncAPIPublisher
 from faststream.confluent.subscriber.factory import create_subscriber
-from faststream.exceptions import SetupError
+from faststream.exceptions import MICRO_BATCH_WITH_BATCH, SetupError
 
 if TYPE_CHECKING:
     from confluent_kafka import Message
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         CustomCallable,
         Filter,
@@ -40,6 +43,7 @@ if TYPE_CHECKING:
         AsyncAPIBatchSubscriber,
         AsyncAPIDefaultSubscriber,
     )
+    from faststream.utils.executor import BaseExecutor
 
 
 class KafkaRegistrator(
@@ -308,8 +312,12 @@ class KafkaRegistrator(
             ),
         ] = default_filter,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -321,6 +329,34 @@ class KafkaRegistrator(
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -590,8 +626,12 @@ class KafkaRegistrator(
             ),
         ] = default_filter,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -603,6 +643,34 @@ class KafkaRegistrator(
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -872,8 +940,12 @@ class KafkaRegistrator(
             ),
         ] = default_filter,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -885,6 +957,34 @@ class KafkaRegistrator(
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1157,8 +1257,12 @@ class KafkaRegistrator(
             ),
         ] = default_filter,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -1170,6 +1274,34 @@ class KafkaRegistrator(
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1193,6 +1325,9 @@ class KafkaRegistrator(
         if not auto_commit and not group_id:
             raise SetupError("You should install `group_id` with manual commit mode")
 
+        if batch and micro_batch is not None:
+            raise MICRO_BATCH_WITH_BATCH
+
         subscriber = super().subscriber(
             create_subscriber(
                 *topics,
@@ -1238,6 +1373,10 @@ class KafkaRegistrator(
                 decoder_=decoder or self._decoder,
                 dependencies_=dependencies,
                 middlewares_=middlewares,
+                executor_=executor,
+                micro_batch_=micro_batch,
+                dedup_=dedup,
+                log_sampling_=log_sampling,
             )
         else:
             return cast("AsyncAPIDefaultSubscriber", subscriber).add_call(
@@ -1246,6 +1385,10 @@ class KafkaRegistrator(
                 decoder_=decoder or self._decoder,
                 dependencies_=dependencies,
                 middlewares_=middlewares,
+                executor_=executor,
+                micro_batch_=micro_batch,
+                dedup_=dedup,
+                log_sampling_=log_sampling,
             )
 
     @overload  # type: ignore[override]
@@ -1300,6 +1443,18 @@ class KafkaRegistrator(
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1374,6 +1529,18 @@ class KafkaRegistrator(
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1448,6 +1615,18 @@ class KafkaRegistrator(
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1525,6 +1704,18 @@ class KafkaRegistrator(
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1569,6 +1760,8 @@ class KafkaRegistrator(
             # publisher-specific
             broker_middlewares=self._middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI
             title_=title,
             description_=description,
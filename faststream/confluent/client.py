@@ -395,6 +395,21 @@ class AsyncConfluentConsumer:
         )
         await call_or_await(self.consumer.seek, topic_partition.to_confluent())
 
+    async def pause(self, topic: str, partition: int) -> None:
+        """Suspends fetching from the specified topic and partition."""
+        topic_partition = TopicPartition(topic=topic, partition=partition)
+        await call_or_await(self.consumer.pause, [topic_partition.to_confluent()])
+
+    async def pause_all(self) -> None:
+        """Suspends fetching from all assigned partitions."""
+        assignment = await call_or_await(self.consumer.assignment)
+        await call_or_await(self.consumer.pause, assignment)
+
+    async def resume(self, topic: str, partition: int) -> None:
+        """Resumes fetching from the specified topic and partition."""
+        topic_partition = TopicPartition(topic=topic, partition=partition)
+        await call_or_await(self.consumer.resume, [topic_partition.to_confluent()])
+
 
 def check_msg_error(msg: Optional[Message]) -> Optional[Message]:
     """Checks for errors in the consumed message."""
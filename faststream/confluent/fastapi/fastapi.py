@@ -39,6 +39,9 @@ if TYPE_CHECKING:
     from starlette.types import ASGIApp, Lifespan
 
     from faststream.asyncapi import schema as asyncapi
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -59,6 +62,7 @@ if TYPE_CHECKING:
     )
     from faststream.security import BaseSecurity
     from faststream.types import AnyDict, LoggerProto
+    from faststream.utils.executor import BaseExecutor
 
 
 Partition = TypeVar("Partition")
@@ -849,8 +853,12 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             ),
         ] = default_filter,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -862,6 +870,34 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1253,6 +1289,34 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1645,8 +1709,12 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             ),
         ] = default_filter,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -1658,6 +1726,34 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -2053,8 +2149,12 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             ),
         ] = default_filter,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -2066,6 +2166,34 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -2239,6 +2367,10 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             retry=retry,
             no_ack=no_ack,
             no_reply=no_reply,
+            executor=executor,
+            micro_batch=micro_batch,
+            dedup=dedup,
+            log_sampling=log_sampling,
             title=title,
             description=description,
             include_in_schema=include_in_schema,
@@ -2309,6 +2441,18 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -2383,6 +2527,18 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -2457,6 +2613,18 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -2534,6 +2702,18 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -2567,6 +2747,8 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             reply_to=reply_to,
             # broker options
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI options
             title=title,
             description=description,
@@ -7,6 +7,7 @@ from faststream.confluent.opentelemetry.provider import (
     telemetry_attributes_provider_factory,
 )
 from faststream.opentelemetry.middleware import TelemetryMiddleware
+from faststream.opentelemetry.sampling import TelemetrySampler
 
 
 class KafkaTelemetryMiddleware(TelemetryMiddleware):
@@ -16,6 +17,8 @@ class KafkaTelemetryMiddleware(TelemetryMiddleware):
         tracer_provider: Optional[TracerProvider] = None,
         meter_provider: Optional[MeterProvider] = None,
         meter: Optional[Meter] = None,
+        stage_timings: bool = False,
+        sampler: Optional[TelemetrySampler] = None,
     ) -> None:
         super().__init__(
             settings_provider_factory=telemetry_attributes_provider_factory,
@@ -23,4 +26,6 @@ class KafkaTelemetryMiddleware(TelemetryMiddleware):
             meter_provider=meter_provider,
             meter=meter,
             include_messages_counters=True,
+            stage_timings=stage_timings,
+            sampler=sampler,
         )
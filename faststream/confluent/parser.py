@@ -1,6 +1,16 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
-
-from faststream.broker.message import decode_message, gen_cor_id
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from faststream.broker.message import decode_message, gen_cor_id, lazy_value
 from faststream.confluent.message import FAKE_CONSUMER, KafkaMessage
 from faststream.utils.context.repository import context
 
@@ -11,6 +21,8 @@ if TYPE_CHECKING:
     from faststream.confluent.subscriber.usecase import LogicSubscriber
     from faststream.types import DecodedMessage
 
+_RawHeaders = Sequence[Tuple[str, Union[bytes, str]]]
+
 
 class AsyncConfluentParser:
     """A class to parse Kafka messages."""
@@ -20,7 +32,7 @@ class AsyncConfluentParser:
         message: "Message",
     ) -> KafkaMessage:
         """Parses a Kafka message."""
-        headers = _parse_msg_headers(message.headers() or ())
+        raw_headers = cast(_RawHeaders, message.headers() or ())
 
         body = message.value()
         offset = message.offset()
@@ -30,11 +42,12 @@ class AsyncConfluentParser:
 
         return KafkaMessage(
             body=body,
-            headers=headers,
-            reply_to=headers.get("reply_to", ""),
-            content_type=headers.get("content-type"),
+            # headers are decoded only if they are used
+            headers=lazy_value(lambda: _parse_msg_headers(raw_headers)),
+            reply_to=find_header(raw_headers, "reply_to") or "",
+            content_type=find_header(raw_headers, "content-type"),
             message_id=f"{offset}-{timestamp}",
-            correlation_id=headers.get("correlation_id", gen_cor_id()),
+            correlation_id=lazy_value(lambda: _get_correlation_id(raw_headers)),
             raw_message=message,
             consumer=getattr(handler, "consumer", None) or FAKE_CONSUMER,
             is_manual=getattr(handler, "is_manual", True),
@@ -45,17 +58,11 @@ class AsyncConfluentParser:
         message: Tuple["Message", ...],
     ) -> KafkaMessage:
         """Parses a batch of messages from a Kafka consumer."""
-        body: List[Any] = []
-        batch_headers: List[Dict[str, str]] = []
+        body: List[Any] = [m.value() for m in message]
 
         first = message[0]
         last = message[-1]
-
-        for m in message:
-            body.append(m.value())
-            batch_headers.append(_parse_msg_headers(m.headers() or ()))
-
-        headers = next(iter(batch_headers), {})
+        raw_headers = cast(_RawHeaders, first.headers() or ())
 
         _, first_timestamp = first.timestamp()
 
@@ -63,12 +70,17 @@ class AsyncConfluentParser:
 
         return KafkaMessage(
             body=body,
-            headers=headers,
-            batch_headers=batch_headers,
-            reply_to=headers.get("reply_to", ""),
-            content_type=headers.get("content-type"),
+            headers=lazy_value(lambda: _parse_msg_headers(raw_headers)),
+            batch_headers=lazy_value(
+                lambda: [
+                    _parse_msg_headers(cast(_RawHeaders, m.headers() or ()))
+                    for m in message
+                ]
+            ),
+            reply_to=find_header(raw_headers, "reply_to") or "",
+            content_type=find_header(raw_headers, "content-type"),
             message_id=f"{first.offset()}-{last.offset()}-{first_timestamp}",
-            correlation_id=headers.get("correlation_id", gen_cor_id()),
+            correlation_id=lazy_value(lambda: _get_correlation_id(raw_headers)),
             raw_message=message,
             consumer=getattr(handler, "consumer", None) or FAKE_CONSUMER,
             is_manual=getattr(handler, "is_manual", True),
@@ -91,6 +103,23 @@ class AsyncConfluentParser:
 
 
 def _parse_msg_headers(
-    headers: Sequence[Tuple[str, Union[bytes, str]]],
+    headers: _RawHeaders,
 ) -> Dict[str, str]:
     return {i: j if isinstance(j, str) else j.decode() for i, j in headers}
+
+
+def find_header(
+    headers: _RawHeaders,
+    key: str,
+) -> Optional[str]:
+    # the last one wins, the same way as in parsed headers dict
+    for i, j in reversed(headers):
+        if i == key:
+            return j if isinstance(j, str) else j.decode()
+    return None
+
+
+def _get_correlation_id(headers: _RawHeaders) -> str:
+    if (correlation_id := find_header(headers, "correlation_id")) is None:
+        return gen_cor_id()
+    return correlation_id
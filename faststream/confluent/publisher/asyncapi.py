@@ -12,14 +12,6 @@ from typing import (
 
 from typing_extensions import override
 
-from faststream.asyncapi.schema import (
-    Channel,
-    ChannelBinding,
-    CorrelationId,
-    Message,
-    Operation,
-)
-from faststream.asyncapi.schema.bindings import kafka
 from faststream.asyncapi.utils import resolve_payloads
 from faststream.broker.types import MsgType
 from faststream.confluent.publisher.usecase import (
@@ -32,6 +24,7 @@ from faststream.exceptions import SetupError
 if TYPE_CHECKING:
     from confluent_kafka import Message as ConfluentMsg
 
+    from faststream.asyncapi.schema import Channel
     from faststream.broker.types import BrokerMiddleware, PublisherMiddleware
 
 
@@ -41,7 +34,16 @@ class AsyncAPIPublisher(LogicPublisher[MsgType]):
     def get_name(self) -> str:
         return f"{self.topic}:Publisher"
 
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
+        from faststream.asyncapi.schema import (
+            Channel,
+            ChannelBinding,
+            CorrelationId,
+            Message,
+            Operation,
+        )
+        from faststream.asyncapi.schema.bindings import kafka
+
         payloads = self.get_payloads()
 
         return {
@@ -73,6 +75,8 @@ class AsyncAPIPublisher(LogicPublisher[MsgType]):
         # Publisher args
         broker_middlewares: Iterable["BrokerMiddleware[Tuple[ConfluentMsg, ...]]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -93,6 +97,8 @@ class AsyncAPIPublisher(LogicPublisher[MsgType]):
         # Publisher args
         broker_middlewares: Iterable["BrokerMiddleware[ConfluentMsg]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -115,6 +121,8 @@ class AsyncAPIPublisher(LogicPublisher[MsgType]):
             "BrokerMiddleware[Union[Tuple[ConfluentMsg, ...], ConfluentMsg]]"
         ],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -140,6 +148,8 @@ class AsyncAPIPublisher(LogicPublisher[MsgType]):
             "BrokerMiddleware[Union[Tuple[ConfluentMsg, ...], ConfluentMsg]]"
         ],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -153,6 +163,9 @@ class AsyncAPIPublisher(LogicPublisher[MsgType]):
             if key:
                 raise SetupError("You can't setup `key` with batch publisher")
 
+            if linger_ms is not None:
+                raise SetupError("You can't setup `linger_ms` with batch publisher")
+
             return AsyncAPIBatchPublisher(
                 topic=topic,
                 partition=partition,
@@ -160,6 +173,8 @@ class AsyncAPIPublisher(LogicPublisher[MsgType]):
                 reply_to=reply_to,
                 broker_middlewares=broker_middlewares,
                 middlewares=middlewares,
+                linger_ms=linger_ms,
+                max_batch=max_batch,
                 schema_=schema_,
                 title_=title_,
                 description_=description_,
@@ -175,6 +190,8 @@ class AsyncAPIPublisher(LogicPublisher[MsgType]):
                 reply_to=reply_to,
                 broker_middlewares=broker_middlewares,
                 middlewares=middlewares,
+                linger_ms=linger_ms,
+                max_batch=max_batch,
                 schema_=schema_,
                 title_=title_,
                 description_=description_,
@@ -22,6 +22,9 @@ if TYPE_CHECKING:
     from confluent_kafka import Message
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -32,6 +35,7 @@ if TYPE_CHECKING:
     from faststream.confluent.message import KafkaMessage
     from faststream.confluent.schemas import TopicPartition
     from faststream.types import SendableMessage
+    from faststream.utils.executor import BaseExecutor
 
 
 class KafkaPublisher(ArgsContainer):
@@ -91,6 +95,18 @@ class KafkaPublisher(ArgsContainer):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -121,6 +137,8 @@ class KafkaPublisher(ArgsContainer):
             reply_to=reply_to,
             # basic args
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI args
             title=title,
             description=description,
@@ -393,8 +411,12 @@ class KafkaRoute(SubscriberRoute):
             ),
         ] = default_filter,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -406,6 +428,34 @@ class KafkaRoute(SubscriberRoute):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -453,6 +503,10 @@ class KafkaRoute(SubscriberRoute):
             middlewares=middlewares,
             filter=filter,
             no_reply=no_reply,
+            executor=executor,
+            micro_batch=micro_batch,
+            dedup=dedup,
+            log_sampling=log_sampling,
             # AsyncAPI args
             title=title,
             description=description,
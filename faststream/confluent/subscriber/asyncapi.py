@@ -4,14 +4,6 @@ from typing import (
     Tuple,
 )
 
-from faststream.asyncapi.schema import (
-    Channel,
-    ChannelBinding,
-    CorrelationId,
-    Message,
-    Operation,
-)
-from faststream.asyncapi.schema.bindings import kafka
 from faststream.asyncapi.utils import resolve_payloads
 from faststream.broker.types import MsgType
 from faststream.confluent.subscriber.usecase import (
@@ -23,6 +15,8 @@ from faststream.confluent.subscriber.usecase import (
 if TYPE_CHECKING:
     from confluent_kafka import Message as ConfluentMsg
 
+    from faststream.asyncapi.schema import Channel
+
 
 class AsyncAPISubscriber(LogicSubscriber[MsgType]):
     """A class to handle logic and async API operations."""
@@ -30,7 +24,16 @@ class AsyncAPISubscriber(LogicSubscriber[MsgType]):
     def get_name(self) -> str:
         return f'{",".join(self.topics)}:{self.call_name}'
 
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
+        from faststream.asyncapi.schema import (
+            Channel,
+            ChannelBinding,
+            CorrelationId,
+            Message,
+            Operation,
+        )
+        from faststream.asyncapi.schema.bindings import kafka
+
         channels = {}
 
         payloads = self.get_payloads()
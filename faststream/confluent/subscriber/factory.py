@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from confluent_kafka import Message as ConfluentMsg
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.types import BrokerMiddleware
     from faststream.confluent.schemas import TopicPartition
     from faststream.types import AnyDict
@@ -37,7 +38,7 @@ def create_subscriber(
     # Subscriber args
     no_ack: bool,
     no_reply: bool,
-    retry: bool,
+    retry: Union[bool, int, "BaseWatcher"],
     broker_dependencies: Iterable["Depends"],
     broker_middlewares: Iterable["BrokerMiddleware[Tuple[ConfluentMsg, ...]]"],
     # AsyncAPI args
@@ -61,7 +62,7 @@ def create_subscriber(
     # Subscriber args
     no_ack: bool,
     no_reply: bool,
-    retry: bool,
+    retry: Union[bool, int, "BaseWatcher"],
     broker_dependencies: Iterable["Depends"],
     broker_middlewares: Iterable["BrokerMiddleware[ConfluentMsg]"],
     # AsyncAPI args
@@ -85,7 +86,7 @@ def create_subscriber(
     # Subscriber args
     no_ack: bool,
     no_reply: bool,
-    retry: bool,
+    retry: Union[bool, int, "BaseWatcher"],
     broker_dependencies: Iterable["Depends"],
     broker_middlewares: Iterable[
         "BrokerMiddleware[Union[ConfluentMsg, Tuple[ConfluentMsg, ...]]]"
@@ -113,7 +114,7 @@ def create_subscriber(
     # Subscriber args
     no_ack: bool,
     no_reply: bool,
-    retry: bool,
+    retry: Union[bool, int, "BaseWatcher"],
     broker_dependencies: Iterable["Depends"],
     broker_middlewares: Iterable[
         "BrokerMiddleware[Union[ConfluentMsg, Tuple[ConfluentMsg, ...]]]"
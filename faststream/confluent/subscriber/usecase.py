@@ -1,5 +1,7 @@
 import asyncio
+import time
 from abc import ABC, abstractmethod
+from contextlib import suppress
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -9,23 +11,32 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
+    Union,
+    cast,
 )
 
 import anyio
 from confluent_kafka import KafkaException, Message
 from typing_extensions import override
 
+from faststream.broker.acknowledgement_watcher import (
+    RETRIES_HEADER,
+    RETRY_AT_HEADER,
+    RetryPolicy,
+)
 from faststream.broker.publisher.fake import FakePublisher
 from faststream.broker.subscriber.usecase import SubscriberUsecase
 from faststream.broker.types import MsgType
 from faststream.broker.utils import process_msg
-from faststream.confluent.parser import AsyncConfluentParser
+from faststream.confluent.parser import AsyncConfluentParser, find_header
 from faststream.confluent.schemas import TopicPartition
 
 if TYPE_CHECKING:
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.message import StreamMessage
     from faststream.broker.publisher.proto import ProducerProto
     from faststream.broker.types import (
@@ -34,7 +45,11 @@ if TYPE_CHECKING:
         CustomCallable,
     )
     from faststream.confluent.client import AsyncConfluentConsumer
+    from faststream.confluent.publisher.producer import AsyncConfluentFastProducer
     from faststream.types import AnyDict, Decorator, LoggerProto
+    from faststream.utils.executor import BaseExecutor
+
+RETRY_TOPIC_SUFFIX = ".retry"
 
 
 class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
@@ -63,7 +78,7 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
         default_decoder: "AsyncCallable",
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[MsgType]"],
         # AsyncAPI args
@@ -96,6 +111,8 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
         self.consumer = None
         self.task = None
         self.polling_interval = polling_interval
+        self._retry_topics: Tuple[str, ...] = ()
+        self._resume_tasks: Set[asyncio.Task[None]] = set()
 
         # Setup it later
         self.client_id = ""
@@ -115,6 +132,7 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
         # broker options
         broker_parser: Optional["CustomCallable"],
         broker_decoder: Optional["CustomCallable"],
+        broker_executor: Optional["BaseExecutor"],
         # dependant args
         apply_types: bool,
         is_validate: bool,
@@ -131,6 +149,7 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
             extra_context=extra_context,
             broker_parser=broker_parser,
             broker_decoder=broker_decoder,
+            broker_executor=broker_executor,
             apply_types=apply_types,
             is_validate=is_validate,
             _get_dependant=_get_dependant,
@@ -142,8 +161,11 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
         """Start the consumer."""
         assert self.builder, "You should setup subscriber at first."  # nosec B101
 
+        self._retry_topics = self._get_retry_topics()
+
         self.consumer = consumer = self.builder(
             *self.topics,
+            *self._retry_topics,
             partitions=self.partitions,
             group_id=self.group_id,
             client_id=self.client_id,
@@ -168,6 +190,15 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
 
         self.task = None
 
+        for task in self._resume_tasks:
+            task.cancel()
+        self._resume_tasks.clear()
+
+    async def _stop_fetching(self) -> None:
+        if self.consumer is not None:
+            # already fetched messages are still processed
+            await self.consumer.pause_all()
+
     @override
     async def get_one(
         self,
@@ -209,6 +240,10 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
     async def get_msg(self) -> Optional[MsgType]:
         raise NotImplementedError()
 
+    def _get_retry_topics(self) -> Tuple[str, ...]:
+        """Topics to send messages to retry by `RetryPolicy`."""
+        return ()
+
     async def _consume(self) -> None:
         assert self.consumer, "You should start subscriber at first."  # nosec B101
 
@@ -285,7 +320,7 @@ class DefaultSubscriber(LogicSubscriber[Message]):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[Message]"],
         # AsyncAPI args
@@ -317,7 +352,85 @@ class DefaultSubscriber(LogicSubscriber[Message]):
 
     async def get_msg(self) -> Optional["Message"]:
         assert self.consumer, "You should setup subscriber at first."  # nosec B101
-        return await self.consumer.getone(timeout=self.polling_interval)
+
+        msg = await self.consumer.getone(timeout=self.polling_interval)
+
+        if (
+            msg is not None
+            and msg.topic() in self._retry_topics
+            and await self._postpone(msg)
+        ):
+            return None
+
+        return msg
+
+    def _get_retry_topics(self) -> Tuple[str, ...]:
+        if not isinstance(self._retry, RetryPolicy):
+            return ()
+        return tuple(f"{t}{RETRY_TOPIC_SUFFIX}" for t in self.topics)
+
+    async def _retry_later(
+        self,
+        message: "StreamMessage[Any]",
+        delay: float,
+        attempts: int,
+    ) -> None:
+        if not self._retry_topics or self._producer is None:
+            await super()._retry_later(message, delay, attempts)
+            return
+
+        raw_message = cast(Message, message.raw_message)
+
+        topic = raw_message.topic() or ""
+        if topic not in self._retry_topics:
+            topic = f"{topic}{RETRY_TOPIC_SUFFIX}"
+
+        producer = cast("AsyncConfluentFastProducer", self._producer)
+        await producer.publish(
+            raw_message.value(),
+            topic=topic,
+            key=raw_message.key(),
+            correlation_id=message.correlation_id,
+            headers={
+                **message.headers,
+                RETRIES_HEADER: str(attempts),
+                RETRY_AT_HEADER: str(time.time() + delay),
+            },
+        )
+        await message.ack()
+
+    async def _postpone(self, msg: "Message") -> bool:
+        """Pause retry topic partition until the message is due."""
+        assert self.consumer  # nosec B101
+
+        retry_at = find_header(
+            cast("Sequence[Tuple[str, Union[bytes, str]]]", msg.headers() or ()),
+            RETRY_AT_HEADER,
+        )
+        try:
+            delay = float(retry_at or 0) - time.time()
+        except ValueError:
+            return False
+
+        if delay <= 0:
+            return False
+
+        # the message is fetched again after resume, other partitions are not blocked
+        topic, partition = msg.topic() or "", msg.partition() or 0
+        await self.consumer.pause(topic, partition)
+        await self.consumer.seek(topic, partition, msg.offset() or 0)
+
+        task = asyncio.create_task(self._resume(delay, topic, partition))
+        self._resume_tasks.add(task)
+        task.add_done_callback(self._resume_tasks.discard)
+        return True
+
+    async def _resume(self, delay: float, topic: str, partition: int) -> None:
+        await anyio.sleep(delay)
+        if self.consumer is not None:
+            # partition can be revoked by rebalance already
+            with suppress(KafkaException):
+                await self.consumer.resume(topic, partition)
 
     def get_log_context(
         self,
@@ -349,7 +462,7 @@ class BatchSubscriber(LogicSubscriber[Tuple[Message, ...]]):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[Tuple[Message, ...]]"],
         # AsyncAPI args
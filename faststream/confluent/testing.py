@@ -107,6 +107,8 @@ class FakeProducer(AsyncConfluentFastProducer):
         raise_timeout: bool = False,
     ) -> Optional[Any]:
         """Publish a message to the Kafka broker."""
+        correlation_id = correlation_id or gen_cor_id()
+
         incoming = build_message(
             message=message,
             topic=topic,
@@ -114,7 +116,7 @@ class FakeProducer(AsyncConfluentFastProducer):
             partition=partition,
             timestamp_ms=timestamp_ms,
             headers=headers,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id,
             reply_to=reply_to,
         )
 
@@ -130,7 +132,7 @@ class FakeProducer(AsyncConfluentFastProducer):
 
                 with timeout_scope(rpc_timeout, raise_timeout):
                     response_msg = await self._execute_handler(
-                        msg_to_send, topic, handler
+                        msg_to_send, topic, handler, correlation_id
                     )
                     if rpc:
                         return_value = return_value or await self._decoder(
@@ -188,6 +190,8 @@ class FakeProducer(AsyncConfluentFastProducer):
         *,
         timeout: Optional[float] = 0.5,
     ) -> "MockConfluentMessage":
+        correlation_id = correlation_id or gen_cor_id()
+
         incoming = build_message(
             message=message,
             topic=topic,
@@ -195,7 +199,7 @@ class FakeProducer(AsyncConfluentFastProducer):
             partition=partition,
             timestamp_ms=timestamp_ms,
             headers=headers,
-            correlation_id=correlation_id or gen_cor_id(),
+            correlation_id=correlation_id,
         )
 
         for handler in self.broker._subscribers.values():  # pragma: no branch
@@ -207,7 +211,9 @@ class FakeProducer(AsyncConfluentFastProducer):
                 )
 
                 with anyio.fail_after(timeout):
-                    return await self._execute_handler(msg_to_send, topic, handler)
+                    return await self._execute_handler(
+                        msg_to_send, topic, handler, correlation_id
+                    )
 
         raise SubscriberNotFound
 
@@ -216,6 +222,7 @@ class FakeProducer(AsyncConfluentFastProducer):
         msg: Any,
         topic: str,
         handler: "LogicSubscriber[Any]",
+        correlation_id: Optional[str] = None,
     ) -> "MockConfluentMessage":
         result = await handler.process_message(msg)
 
@@ -223,7 +230,7 @@ class FakeProducer(AsyncConfluentFastProducer):
             topic=topic,
             message=result.body,
             headers=result.headers,
-            correlation_id=result.correlation_id or gen_cor_id(),
+            correlation_id=result.correlation_id or correlation_id or gen_cor_id(),
         )
 
 
@@ -8,3 +8,6 @@ class ContentTypes(str, Enum):
 
     text = "text/plain"
     json = "application/json"
+
+
+DEFAULT_STARTUP_CONCURRENCY = 16
@@ -1,4 +1,4 @@
-from typing import Any, Iterable
+from typing import Any, Iterable, Mapping
 
 
 class FastStreamException(Exception):  # noqa: N818
@@ -110,12 +110,31 @@ class SubscriberNotFound(FastStreamException):
     """Raises as a service message or in tests."""
 
 
+class SubscriberStartupError(FastStreamException):
+    """Raises if some broker subscribers failed to start."""
+
+    def __init__(self, errors: Mapping[str, BaseException]) -> None:
+        super().__init__()
+        self.errors = errors
+
+    def __str__(self) -> str:
+        return "Subscribers failed to start: " + ", ".join(
+            f"`{name}` - {e!r}" for name, e in self.errors.items()
+        )
+
+
 WRONG_PUBLISH_ARGS = SetupError(
     "You should use `reply_to` to send response to long-living queue "
     "and `rpc` to get response in sync mode."
 )
 
 
+MICRO_BATCH_WITH_BATCH = SetupError(
+    "`micro_batch` can't be used with a batch subscriber: "
+    "it already receives messages by batches."
+)
+
+
 NOT_CONNECTED_YET = "Please, `connect()` the broker first."
 
 
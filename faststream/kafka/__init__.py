@@ -1,11 +1,16 @@
+from typing import TYPE_CHECKING
+
 from aiokafka import TopicPartition
 
 from faststream.kafka.annotations import KafkaMessage
 from faststream.kafka.broker import KafkaBroker
 from faststream.kafka.response import KafkaResponse
 from faststream.kafka.router import KafkaPublisher, KafkaRoute, KafkaRouter
-from faststream.kafka.testing import TestKafkaBroker
-from faststream.testing.app import TestApp
+from faststream.utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from faststream.kafka.testing import TestKafkaBroker
+    from faststream.testing.app import TestApp
 
 __all__ = (
     "KafkaBroker",
@@ -18,3 +23,11 @@ __all__ = (
     "TestApp",
     "TopicPartition",
 )
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "TestKafkaBroker": "faststream.kafka.testing",
+        "TestApp": "faststream.testing.app",
+    },
+)
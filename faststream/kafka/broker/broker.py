@@ -23,6 +23,7 @@ from typing_extensions import Annotated, Doc, override
 
 from faststream.__about__ import SERVICE_NAME
 from faststream.broker.message import gen_cor_id
+from faststream.constants import DEFAULT_STARTUP_CONCURRENCY
 from faststream.exceptions import NOT_CONNECTED_YET
 from faststream.kafka.broker.logging import KafkaLoggingBroker
 from faststream.kafka.broker.registrator import KafkaRegistrator
@@ -56,6 +57,7 @@ if TYPE_CHECKING:
         LoggerProto,
         SendableMessage,
     )
+    from faststream.utils.executor import BaseExecutor
 
     class KafkaInitKwargs(TypedDict, total=False):
         request_timeout_ms: Annotated[
@@ -427,6 +429,20 @@ class KafkaBroker(
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down."
             ),
         ] = 15.0,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handlers (and parsers and decoders for `ThreadExecutor`) of all broker subscribers. "
+                "Anyio default threadpool is used if not set."
+            ),
+        ] = None,
+        startup_concurrency: Annotated[
+            int,
+            Doc(
+                "Max number of subscribers and declarations started concurrently. "
+                "Use `1` to start them one by one."
+            ),
+        ] = DEFAULT_STARTUP_CONCURRENCY,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -553,6 +569,8 @@ class KafkaBroker(
             transaction_timeout_ms=transaction_timeout_ms,
             # Basic args
             graceful_timeout=graceful_timeout,
+            executor=executor,
+            startup_concurrency=startup_concurrency,
             dependencies=dependencies,
             decoder=decoder,
             parser=parser,
@@ -645,12 +663,7 @@ class KafkaBroker(
         """Connect broker to Kafka and startup all subscribers."""
         await super().start()
 
-        for handler in self._subscribers.values():
-            self._log(
-                f"`{handler.call_name}` waiting for messages",
-                extra=handler.get_log_context(None),
-            )
-            await handler.start()
+        await self._start_subscribers()
 
     @property
     def _subscriber_setup_extra(self) -> "AnyDict":
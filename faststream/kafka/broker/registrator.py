@@ -3,6 +3,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     Literal,
     Optional,
@@ -19,6 +20,7 @@ from typing_extensions import Annotated, Doc, deprecated, override
 
 from faststream.broker.core.abc import ABCBroker
 from faststream.broker.utils import default_filter
+from faststream.exceptions import MICRO_BATCH_WITH_BATCH
 from faststream.kafka.publisher.asyncapi import AsyncAPIPublisher
 from faststream.kafka.subscriber.factory import create_subscriber
 
@@ -28,6 +30,9 @@ if TYPE_CHECKING:
     from aiokafka.coordinator.assignors.abstract import AbstractPartitionAssignor
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         CustomCallable,
         Filter,
@@ -43,6 +48,7 @@ if TYPE_CHECKING:
         AsyncAPIBatchSubscriber,
         AsyncAPIDefaultSubscriber,
     )
+    from faststream.utils.executor import BaseExecutor
 
 
 class KafkaRegistrator(
@@ -413,9 +419,24 @@ class KafkaRegistrator(
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        max_workers: Annotated[
+            int,
+            Doc("Number of workers to process messages concurrently."),
+        ] = 1,
+        ordering_key: Annotated[
+            Optional[Callable[["ConsumerRecord"], Hashable]],
+            Doc(
+                "Extract a key from the raw message to process messages with the same key "
+                "in order. Messages are routed to `max_workers` serial lanes by the key hash."
+            ),
+        ] = None,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -427,6 +448,34 @@ class KafkaRegistrator(
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -794,9 +843,24 @@ class KafkaRegistrator(
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        max_workers: Annotated[
+            int,
+            Doc("Number of workers to process messages concurrently."),
+        ] = 1,
+        ordering_key: Annotated[
+            Optional[Callable[["ConsumerRecord"], Hashable]],
+            Doc(
+                "Extract a key from the raw message to process messages with the same key "
+                "in order. Messages are routed to `max_workers` serial lanes by the key hash."
+            ),
+        ] = None,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -808,6 +872,34 @@ class KafkaRegistrator(
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1175,9 +1267,24 @@ class KafkaRegistrator(
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        max_workers: Annotated[
+            int,
+            Doc("Number of workers to process messages concurrently."),
+        ] = 1,
+        ordering_key: Annotated[
+            Optional[Callable[["ConsumerRecord"], Hashable]],
+            Doc(
+                "Extract a key from the raw message to process messages with the same key "
+                "in order. Messages are routed to `max_workers` serial lanes by the key hash."
+            ),
+        ] = None,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -1189,6 +1296,34 @@ class KafkaRegistrator(
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1559,9 +1694,24 @@ class KafkaRegistrator(
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        max_workers: Annotated[
+            int,
+            Doc("Number of workers to process messages concurrently."),
+        ] = 1,
+        ordering_key: Annotated[
+            Optional[Callable[["ConsumerRecord"], Hashable]],
+            Doc(
+                "Extract a key from the raw message to process messages with the same key "
+                "in order. Messages are routed to `max_workers` serial lanes by the key hash."
+            ),
+        ] = None,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -1573,6 +1723,34 @@ class KafkaRegistrator(
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1593,6 +1771,9 @@ class KafkaRegistrator(
         "AsyncAPIDefaultSubscriber",
         "AsyncAPIBatchSubscriber",
     ]:
+        if batch and micro_batch is not None:
+            raise MICRO_BATCH_WITH_BATCH
+
         subscriber = super().subscriber(
             create_subscriber(
                 *topics,
@@ -1625,6 +1806,8 @@ class KafkaRegistrator(
                 },
                 partitions=partitions,
                 is_manual=not auto_commit,
+                max_workers=max_workers,
+                ordering_key=ordering_key,
                 # subscriber args
                 no_ack=no_ack,
                 no_reply=no_reply,
@@ -1645,6 +1828,10 @@ class KafkaRegistrator(
                 decoder_=decoder or self._decoder,
                 dependencies_=dependencies,
                 middlewares_=middlewares,
+                executor_=executor,
+                micro_batch_=micro_batch,
+                dedup_=dedup,
+                log_sampling_=log_sampling,
             )
 
         else:
@@ -1654,6 +1841,10 @@ class KafkaRegistrator(
                 decoder_=decoder or self._decoder,
                 dependencies_=dependencies,
                 middlewares_=middlewares,
+                executor_=executor,
+                micro_batch_=micro_batch,
+                dedup_=dedup,
+                log_sampling_=log_sampling,
             )
 
     @overload  # type: ignore[override]
@@ -1708,6 +1899,18 @@ class KafkaRegistrator(
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1782,6 +1985,18 @@ class KafkaRegistrator(
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1856,6 +2071,18 @@ class KafkaRegistrator(
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1933,6 +2160,18 @@ class KafkaRegistrator(
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -1977,6 +2216,8 @@ class KafkaRegistrator(
             # publisher-specific
             broker_middlewares=self._middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI
             title_=title,
             description_=description,
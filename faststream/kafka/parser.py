@@ -1,6 +1,16 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, cast
-
-from faststream.broker.message import decode_message, gen_cor_id
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
+
+from faststream.broker.message import decode_message, gen_cor_id, lazy_value
 from faststream.kafka.message import FAKE_CONSUMER, KafkaMessage
 from faststream.utils.context.repository import context
 
@@ -30,16 +40,17 @@ class AioKafkaParser:
         message: "ConsumerRecord",
     ) -> "StreamMessage[ConsumerRecord]":
         """Parses a Kafka message."""
-        headers = {i: j.decode() for i, j in message.headers}
+        raw_headers = message.headers
         handler: Optional[LogicSubscriber[Any]] = context.get_local("handler_")
 
         return self.msg_class(
             body=message.value,
-            headers=headers,
-            reply_to=headers.get("reply_to", ""),
-            content_type=headers.get("content-type"),
+            # headers are decoded only if they are used
+            headers=lazy_value(lambda: _decode_headers(raw_headers)),
+            reply_to=find_header(raw_headers, "reply_to") or "",
+            content_type=find_header(raw_headers, "content-type"),
             message_id=f"{message.offset}-{message.timestamp}",
-            correlation_id=headers.get("correlation_id", gen_cor_id()),
+            correlation_id=lazy_value(lambda: _get_correlation_id(raw_headers)),
             raw_message=message,
             path=self.get_path(message.topic),
             consumer=getattr(handler, "consumer", None) or FAKE_CONSUMER,
@@ -65,28 +76,24 @@ class AioKafkaBatchParser(AioKafkaParser):
         message: Tuple["ConsumerRecord", ...],
     ) -> "StreamMessage[Tuple[ConsumerRecord, ...]]":
         """Parses a batch of messages from a Kafka consumer."""
-        body: List[Any] = []
-        batch_headers: List[Dict[str, str]] = []
+        body: List[Any] = [m.value for m in message]
 
         first = message[0]
         last = message[-1]
-
-        for m in message:
-            body.append(m.value)
-            batch_headers.append({i: j.decode() for i, j in m.headers})
-
-        headers = next(iter(batch_headers), {})
+        raw_headers = first.headers
 
         handler: Optional[LogicSubscriber[Any]] = context.get_local("handler_")
 
         return self.msg_class(
             body=body,
-            headers=headers,
-            batch_headers=batch_headers,
-            reply_to=headers.get("reply_to", ""),
-            content_type=headers.get("content-type"),
+            headers=lazy_value(lambda: _decode_headers(raw_headers)),
+            batch_headers=lazy_value(
+                lambda: [_decode_headers(m.headers) for m in message]
+            ),
+            reply_to=find_header(raw_headers, "reply_to") or "",
+            content_type=find_header(raw_headers, "content-type"),
             message_id=f"{first.offset}-{last.offset}-{first.timestamp}",
-            correlation_id=headers.get("correlation_id", gen_cor_id()),
+            correlation_id=lazy_value(lambda: _get_correlation_id(raw_headers)),
             raw_message=message,
             path=self.get_path(first.topic),
             consumer=getattr(handler, "consumer", None) or FAKE_CONSUMER,
@@ -103,3 +110,21 @@ class AioKafkaBatchParser(AioKafkaParser):
         return [
             decode_message(await super_obj.parse_message(m)) for m in msg.raw_message
         ]
+
+
+def _decode_headers(headers: Sequence[Tuple[str, bytes]]) -> Dict[str, str]:
+    return {i: j.decode() for i, j in headers}
+
+
+def find_header(headers: Sequence[Tuple[str, bytes]], key: str) -> Optional[str]:
+    # the last one wins, the same way as in decoded headers dict
+    for i, j in reversed(headers):
+        if i == key:
+            return j.decode()
+    return None
+
+
+def _get_correlation_id(headers: Sequence[Tuple[str, bytes]]) -> str:
+    if (correlation_id := find_header(headers, "correlation_id")) is None:
+        return gen_cor_id()
+    return correlation_id
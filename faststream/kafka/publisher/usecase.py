@@ -45,6 +45,8 @@ class LogicPublisher(PublisherUsecase[MsgType]):
         # Publisher args
         broker_middlewares: Iterable["BrokerMiddleware[MsgType]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -54,6 +56,8 @@ class LogicPublisher(PublisherUsecase[MsgType]):
         super().__init__(
             broker_middlewares=broker_middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI args
             schema_=schema_,
             title_=title_,
@@ -195,6 +199,8 @@ class DefaultPublisher(LogicPublisher[ConsumerRecord]):
         # Publisher args
         broker_middlewares: Iterable["BrokerMiddleware[ConsumerRecord]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -209,6 +215,8 @@ class DefaultPublisher(LogicPublisher[ConsumerRecord]):
             # publisher args
             broker_middlewares=broker_middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI args
             schema_=schema_,
             title_=title_,
@@ -296,7 +304,7 @@ class DefaultPublisher(LogicPublisher[ConsumerRecord]):
         reply_to = reply_to or self.reply_to
         correlation_id = correlation_id or gen_cor_id()
 
-        call: AsyncFunc = self._producer.publish
+        call: AsyncFunc = self._get_publish_call()
 
         for m in chain(
             (
@@ -4,6 +4,7 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     Literal,
     Optional,
@@ -25,6 +26,9 @@ if TYPE_CHECKING:
     from aiokafka.coordinator.assignors.abstract import AbstractPartitionAssignor
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -34,6 +38,7 @@ if TYPE_CHECKING:
     )
     from faststream.kafka.message import KafkaMessage
     from faststream.types import SendableMessage
+    from faststream.utils.executor import BaseExecutor
 
 
 class KafkaPublisher(ArgsContainer):
@@ -93,6 +98,18 @@ class KafkaPublisher(ArgsContainer):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -123,6 +140,8 @@ class KafkaPublisher(ArgsContainer):
             reply_to=reply_to,
             # basic args
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI args
             title=title,
             description=description,
@@ -495,9 +514,24 @@ class KafkaRoute(SubscriberRoute):
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        max_workers: Annotated[
+            int,
+            Doc("Number of workers to process messages concurrently."),
+        ] = 1,
+        ordering_key: Annotated[
+            Optional[Callable[["ConsumerRecord"], Hashable]],
+            Doc(
+                "Extract a key from the raw message to process messages with the same key "
+                "in order. Messages are routed to `max_workers` serial lanes by the key hash."
+            ),
+        ] = None,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -509,6 +543,34 @@ class KafkaRoute(SubscriberRoute):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI args
         title: Annotated[
             Optional[str],
@@ -562,7 +624,13 @@ class KafkaRoute(SubscriberRoute):
             decoder=decoder,
             middlewares=middlewares,
             filter=filter,
+            max_workers=max_workers,
+            ordering_key=ordering_key,
             no_reply=no_reply,
+            executor=executor,
+            micro_batch=micro_batch,
+            dedup=dedup,
+            log_sampling=log_sampling,
             # AsyncAPI args
             title=title,
             description=description,
@@ -4,18 +4,11 @@ from typing import (
     Tuple,
 )
 
-from faststream.asyncapi.schema import (
-    Channel,
-    ChannelBinding,
-    CorrelationId,
-    Message,
-    Operation,
-)
-from faststream.asyncapi.schema.bindings import kafka
 from faststream.asyncapi.utils import resolve_payloads
 from faststream.broker.types import MsgType
 from faststream.kafka.subscriber.usecase import (
     BatchSubscriber,
+    ConcurrentDefaultSubscriber,
     DefaultSubscriber,
     LogicSubscriber,
 )
@@ -23,6 +16,8 @@ from faststream.kafka.subscriber.usecase import (
 if TYPE_CHECKING:
     from aiokafka import ConsumerRecord
 
+    from faststream.asyncapi.schema import Channel
+
 
 class AsyncAPISubscriber(LogicSubscriber[MsgType]):
     """A class to handle logic and async API operations."""
@@ -30,7 +25,16 @@ class AsyncAPISubscriber(LogicSubscriber[MsgType]):
     def get_name(self) -> str:
         return f'{",".join(self.topics)}:{self.call_name}'
 
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
+        from faststream.asyncapi.schema import (
+            Channel,
+            ChannelBinding,
+            CorrelationId,
+            Message,
+            Operation,
+        )
+        from faststream.asyncapi.schema.bindings import kafka
+
         channels = {}
 
         payloads = self.get_payloads()
@@ -64,6 +68,13 @@ class AsyncAPIDefaultSubscriber(
     pass
 
 
+class AsyncAPIConcurrentDefaultSubscriber(
+    ConcurrentDefaultSubscriber,
+    AsyncAPIDefaultSubscriber,
+):
+    pass
+
+
 class AsyncAPIBatchSubscriber(
     BatchSubscriber,
     AsyncAPISubscriber[Tuple["ConsumerRecord", ...]],
@@ -1,5 +1,7 @@
 from typing import (
     TYPE_CHECKING,
+    Callable,
+    Hashable,
     Iterable,
     Literal,
     Optional,
@@ -11,6 +13,7 @@ from typing import (
 from faststream.exceptions import SetupError
 from faststream.kafka.subscriber.asyncapi import (
     AsyncAPIBatchSubscriber,
+    AsyncAPIConcurrentDefaultSubscriber,
     AsyncAPIDefaultSubscriber,
 )
 
@@ -19,6 +22,7 @@ if TYPE_CHECKING:
     from aiokafka.abc import ConsumerRebalanceListener
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.types import BrokerMiddleware
     from faststream.types import AnyDict
 
@@ -36,10 +40,12 @@ def create_subscriber(
     connection_args: "AnyDict",
     partitions: Iterable["TopicPartition"],
     is_manual: bool,
+    max_workers: int,
+    ordering_key: Optional[Callable[["ConsumerRecord"], Hashable]],
     # Subscriber args
     no_ack: bool,
     no_reply: bool,
-    retry: bool,
+    retry: Union[bool, int, "BaseWatcher"],
     broker_dependencies: Iterable["Depends"],
     broker_middlewares: Iterable["BrokerMiddleware[Tuple[ConsumerRecord, ...]]"],
     # AsyncAPI args
@@ -62,10 +68,12 @@ def create_subscriber(
     connection_args: "AnyDict",
     partitions: Iterable["TopicPartition"],
     is_manual: bool,
+    max_workers: int,
+    ordering_key: Optional[Callable[["ConsumerRecord"], Hashable]],
     # Subscriber args
     no_ack: bool,
     no_reply: bool,
-    retry: bool,
+    retry: Union[bool, int, "BaseWatcher"],
     broker_dependencies: Iterable["Depends"],
     broker_middlewares: Iterable["BrokerMiddleware[ConsumerRecord]"],
     # AsyncAPI args
@@ -88,10 +96,12 @@ def create_subscriber(
     connection_args: "AnyDict",
     partitions: Iterable["TopicPartition"],
     is_manual: bool,
+    max_workers: int,
+    ordering_key: Optional[Callable[["ConsumerRecord"], Hashable]],
     # Subscriber args
     no_ack: bool,
     no_reply: bool,
-    retry: bool,
+    retry: Union[bool, int, "BaseWatcher"],
     broker_dependencies: Iterable["Depends"],
     broker_middlewares: Iterable[
         "BrokerMiddleware[Union[ConsumerRecord, Tuple[ConsumerRecord, ...]]]"
@@ -118,10 +128,12 @@ def create_subscriber(
     connection_args: "AnyDict",
     partitions: Iterable["TopicPartition"],
     is_manual: bool,
+    max_workers: int,
+    ordering_key: Optional[Callable[["ConsumerRecord"], Hashable]],
     # Subscriber args
     no_ack: bool,
     no_reply: bool,
-    retry: bool,
+    retry: Union[bool, int, "BaseWatcher"],
     broker_dependencies: Iterable["Depends"],
     broker_middlewares: Iterable[
         "BrokerMiddleware[Union[ConsumerRecord, Tuple[ConsumerRecord, ...]]]"
@@ -134,6 +146,12 @@ def create_subscriber(
     "AsyncAPIDefaultSubscriber",
     "AsyncAPIBatchSubscriber",
 ]:
+    if max_workers > 1 and batch:
+        raise SetupError("You can't use `max_workers` with batch subscriber.")
+
+    if max_workers > 1 and is_manual:
+        raise SetupError("You can't use `max_workers` with manual commit mode.")
+
     if is_manual and not group_id:
         raise SetupError("You must use `group_id` with manual commit mode.")
 
@@ -169,6 +187,27 @@ def create_subscriber(
             include_in_schema=include_in_schema,
         )
 
+    elif max_workers > 1:
+        return AsyncAPIConcurrentDefaultSubscriber(
+            *topics,
+            max_workers=max_workers,
+            ordering_key=ordering_key,
+            group_id=group_id,
+            listener=listener,
+            pattern=pattern,
+            connection_args=connection_args,
+            partitions=partitions,
+            is_manual=is_manual,
+            no_ack=no_ack,
+            no_reply=no_reply,
+            retry=retry,
+            broker_dependencies=broker_dependencies,
+            broker_middlewares=broker_middlewares,
+            title_=title_,
+            description_=description_,
+            include_in_schema=include_in_schema,
+        )
+
     else:
         return AsyncAPIDefaultSubscriber(
             *topics,
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from abc import ABC, abstractmethod
 from itertools import chain
 from typing import (
@@ -6,11 +7,14 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
     Sequence,
     Tuple,
+    Union,
+    cast,
 )
 
 import anyio
@@ -18,7 +22,13 @@ from aiokafka import TopicPartition
 from aiokafka.errors import ConsumerStoppedError, KafkaError
 from typing_extensions import override
 
+from faststream.broker.acknowledgement_watcher import (
+    RETRIES_HEADER,
+    RETRY_AT_HEADER,
+    RetryPolicy,
+)
 from faststream.broker.publisher.fake import FakePublisher
+from faststream.broker.subscriber.mixins import ConcurrentMixin
 from faststream.broker.subscriber.usecase import SubscriberUsecase
 from faststream.broker.types import (
     AsyncCallable,
@@ -28,7 +38,7 @@ from faststream.broker.types import (
 )
 from faststream.broker.utils import process_msg
 from faststream.kafka.message import KafkaAckableMessage, KafkaMessage
-from faststream.kafka.parser import AioKafkaBatchParser, AioKafkaParser
+from faststream.kafka.parser import AioKafkaBatchParser, AioKafkaParser, find_header
 from faststream.utils.path import compile_path
 
 if TYPE_CHECKING:
@@ -36,9 +46,14 @@ if TYPE_CHECKING:
     from aiokafka.abc import ConsumerRebalanceListener
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.message import StreamMessage
     from faststream.broker.publisher.proto import ProducerProto
+    from faststream.kafka.publisher.producer import AioKafkaFastProducer
     from faststream.types import AnyDict, Decorator, LoggerProto
+    from faststream.utils.executor import BaseExecutor
+
+RETRY_TOPIC_SUFFIX = ".retry"
 
 
 class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
@@ -68,7 +83,7 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
         default_decoder: "AsyncCallable",
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[MsgType]"],
         # AsyncAPI args
@@ -105,6 +120,7 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
 
         self.consumer = None
         self.task = None
+        self._retry_topics: Tuple[str, ...] = ()
 
     @override
     def setup(  # type: ignore[override]
@@ -120,6 +136,7 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
         # broker options
         broker_parser: Optional["CustomCallable"],
         broker_decoder: Optional["CustomCallable"],
+        broker_executor: Optional["BaseExecutor"],
         # dependant args
         apply_types: bool,
         is_validate: bool,
@@ -136,6 +153,7 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
             extra_context=extra_context,
             broker_parser=broker_parser,
             broker_decoder=broker_decoder,
+            broker_executor=broker_executor,
             apply_types=apply_types,
             is_validate=is_validate,
             _get_dependant=_get_dependant,
@@ -152,9 +170,11 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
             **self.__connection_args,
         )
 
+        self._retry_topics = self._get_retry_topics()
+
         if self.topics or self._pattern:
             consumer.subscribe(
-                topics=self.topics,
+                topics=(*self.topics, *self._retry_topics),
                 pattern=self._pattern,
                 listener=self.__listener,
             )
@@ -180,6 +200,11 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
 
         self.task = None
 
+    async def _stop_fetching(self) -> None:
+        if self.consumer is not None:
+            # already fetched messages are still processed
+            self.consumer.pause(*self.consumer.assignment())
+
     @override
     async def get_one(
         self,
@@ -225,9 +250,13 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
         )
 
     @abstractmethod
-    async def get_msg(self) -> MsgType:
+    async def get_msg(self) -> Optional[MsgType]:
         raise NotImplementedError()
 
+    def _get_retry_topics(self) -> Tuple[str, ...]:
+        """Topics to send messages to retry by `RetryPolicy`."""
+        return ()
+
     async def _consume(self) -> None:
         assert self.consumer, "You should start subscriber at first."  # nosec B101
 
@@ -250,7 +279,10 @@ class LogicSubscriber(ABC, SubscriberUsecase[MsgType]):
                     connected = True
 
                 if msg:
-                    await self.consume(msg)
+                    await self.consume_one(msg)
+
+    async def consume_one(self, msg: MsgType) -> None:
+        await self.consume(msg)
 
     @staticmethod
     def get_routing_hash(
@@ -312,7 +344,7 @@ class DefaultSubscriber(LogicSubscriber["ConsumerRecord"]):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[ConsumerRecord]"],
         # AsyncAPI args
@@ -357,9 +389,75 @@ class DefaultSubscriber(LogicSubscriber["ConsumerRecord"]):
             include_in_schema=include_in_schema,
         )
 
-    async def get_msg(self) -> "ConsumerRecord":
+    async def get_msg(self) -> Optional["ConsumerRecord"]:
         assert self.consumer, "You should setup subscriber at first."  # nosec B101
-        return await self.consumer.getone()
+
+        msg = await self.consumer.getone()
+
+        if msg.topic in self._retry_topics and self._postpone(msg):
+            return None
+
+        return msg
+
+    def _get_retry_topics(self) -> Tuple[str, ...]:
+        # pattern subscription can't be combined with other topics
+        if not isinstance(self._retry, RetryPolicy) or self._pattern:
+            return ()
+        return tuple(f"{t}{RETRY_TOPIC_SUFFIX}" for t in self.topics)
+
+    async def _retry_later(
+        self,
+        message: "StreamMessage[Any]",
+        delay: float,
+        attempts: int,
+    ) -> None:
+        if not self._retry_topics or self._producer is None:
+            await super()._retry_later(message, delay, attempts)
+            return
+
+        raw_message = cast("ConsumerRecord", message.raw_message)
+
+        topic = raw_message.topic
+        if topic not in self._retry_topics:
+            topic = f"{topic}{RETRY_TOPIC_SUFFIX}"
+
+        producer = cast("AioKafkaFastProducer", self._producer)
+        await producer.publish(
+            raw_message.value,
+            topic=topic,
+            key=raw_message.key,
+            correlation_id=message.correlation_id,
+            headers={
+                **message.headers,
+                RETRIES_HEADER: str(attempts),
+                RETRY_AT_HEADER: str(time.time() + delay),
+            },
+        )
+        await message.ack()
+
+    def _postpone(self, msg: "ConsumerRecord") -> bool:
+        """Pause retry topic partition until the message is due."""
+        assert self.consumer  # nosec B101
+
+        retry_at = find_header(msg.headers, RETRY_AT_HEADER)
+        try:
+            delay = float(retry_at or 0) - time.time()
+        except ValueError:
+            return False
+
+        if delay <= 0:
+            return False
+
+        # the message is fetched again after resume, other partitions are not blocked
+        partition = TopicPartition(msg.topic, msg.partition)
+        self.consumer.pause(partition)
+        self.consumer.seek(partition, msg.offset)
+        asyncio.get_running_loop().call_later(delay, self._resume, partition)
+        return True
+
+    def _resume(self, partition: TopicPartition) -> None:
+        if self.consumer is not None and partition in self.consumer.assignment():
+            self.consumer.resume(partition)
 
     def get_log_context(
         self,
@@ -377,6 +475,60 @@ class DefaultSubscriber(LogicSubscriber["ConsumerRecord"]):
         )
 
 
+class ConcurrentDefaultSubscriber(ConcurrentMixin, DefaultSubscriber):
+    def __init__(
+        self,
+        *topics: str,
+        max_workers: int,
+        ordering_key: Optional[Callable[["ConsumerRecord"], Hashable]],
+        # Kafka information
+        group_id: Optional[str],
+        listener: Optional["ConsumerRebalanceListener"],
+        pattern: Optional[str],
+        connection_args: "AnyDict",
+        partitions: Iterable["TopicPartition"],
+        is_manual: bool,
+        # Subscriber args
+        no_ack: bool,
+        no_reply: bool,
+        retry: Union[bool, int, "BaseWatcher"],
+        broker_dependencies: Iterable["Depends"],
+        broker_middlewares: Iterable["BrokerMiddleware[ConsumerRecord]"],
+        # AsyncAPI args
+        title_: Optional[str],
+        description_: Optional[str],
+        include_in_schema: bool,
+    ) -> None:
+        super().__init__(
+            *topics,
+            max_workers=max_workers,
+            ordering_key=ordering_key,
+            group_id=group_id,
+            listener=listener,
+            pattern=pattern,
+            connection_args=connection_args,
+            partitions=partitions,
+            is_manual=is_manual,
+            # Propagated args
+            no_ack=no_ack,
+            no_reply=no_reply,
+            retry=retry,
+            broker_middlewares=broker_middlewares,
+            broker_dependencies=broker_dependencies,
+            # AsyncAPI args
+            title_=title_,
+            description_=description_,
+            include_in_schema=include_in_schema,
+        )
+
+    async def _consume(self) -> None:
+        self.start_consume_task()
+        await super()._consume()
+
+    async def consume_one(self, msg: "ConsumerRecord") -> None:
+        await self._put_msg(msg)
+
+
 class BatchSubscriber(LogicSubscriber[Tuple["ConsumerRecord", ...]]):
     def __init__(
         self,
@@ -393,7 +545,7 @@ class BatchSubscriber(LogicSubscriber[Tuple["ConsumerRecord", ...]]):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable[
             "BrokerMiddleware[Sequence[Tuple[ConsumerRecord, ...]]]"
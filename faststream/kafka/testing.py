@@ -108,6 +108,8 @@ class FakeProducer(AioKafkaFastProducer):
         no_confirm: bool = False,
     ) -> Optional[Any]:
         """Publish a message to the Kafka broker."""
+        correlation_id = correlation_id or gen_cor_id()
+
         incoming = build_message(
             message=message,
             topic=topic,
@@ -131,7 +133,7 @@ class FakeProducer(AioKafkaFastProducer):
 
                 with timeout_scope(rpc_timeout, raise_timeout):
                     response_msg = await self._execute_handler(
-                        msg_to_send, topic, handler
+                        msg_to_send, topic, handler, correlation_id
                     )
                     if rpc:
                         return_value = return_value or await self._decoder(
@@ -153,6 +155,8 @@ class FakeProducer(AioKafkaFastProducer):
         *,
         timeout: Optional[float] = 0.5,
     ) -> "ConsumerRecord":
+        correlation_id = correlation_id or gen_cor_id()
+
         incoming = build_message(
             message=message,
             topic=topic,
@@ -172,7 +176,9 @@ class FakeProducer(AioKafkaFastProducer):
                 )
 
                 with anyio.fail_after(timeout):
-                    return await self._execute_handler(msg_to_send, topic, handler)
+                    return await self._execute_handler(
+                        msg_to_send, topic, handler, correlation_id
+                    )
 
         raise SubscriberNotFound
 
@@ -216,6 +222,7 @@ class FakeProducer(AioKafkaFastProducer):
         msg: Any,
         topic: str,
         handler: "LogicSubscriber[Any]",
+        correlation_id: Optional[str] = None,
     ) -> "ConsumerRecord":
         result = await handler.process_message(msg)
 
@@ -223,7 +230,7 @@ class FakeProducer(AioKafkaFastProducer):
             topic=topic,
             message=result.body,
             headers=result.headers,
-            correlation_id=result.correlation_id,
+            correlation_id=result.correlation_id or correlation_id,
         )
 
 
@@ -271,6 +278,8 @@ def _fake_connection(*args: Any, **kwargs: Any) -> AsyncMock:
     mock = AsyncMock()
     mock.subscribe = MagicMock
     mock.assign = MagicMock
+    mock.assignment = MagicMock
+    mock.pause = MagicMock
     return mock
 
 
@@ -1,3 +1,7 @@
 from faststream.log.logging import logger
+from faststream.log.queue import QueueLogging
 
-__all__ = ("logger",)
+__all__ = (
+    "QueueLogging",
+    "logger",
+)
@@ -4,6 +4,7 @@ from logging import LogRecord
 from typing import Mapping
 
 from faststream.log.formatter import ColourizedFormatter
+from faststream.log.queue import get_background_handler
 from faststream.utils.context.repository import context
 
 logger = logging.getLogger("faststream")
@@ -69,4 +70,7 @@ def set_logger_fmt(
     )
     handler.setFormatter(formatter)
 
-    logger.addHandler(handler)
+    if (background := get_background_handler(logger)) is not None:
+        background.add_handler(handler)
+    else:
+        logger.addHandler(handler)
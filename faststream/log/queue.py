@@ -0,0 +1,78 @@
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Any, Dict, Iterable, Optional
+
+
+class BackgroundHandler(QueueHandler):
+    """Put records to the queue processed by the listener thread.
+
+    Records are passed as is, so formatting and I/O are made by the
+    original handlers at the background thread.
+    """
+
+    def __init__(self, handlers: Iterable[logging.Handler]) -> None:
+        queue: SimpleQueue[Any] = SimpleQueue()
+        super().__init__(queue)
+        self.listener = QueueListener(queue, *handlers, respect_handler_level=True)
+
+    def add_handler(self, handler: logging.Handler) -> None:
+        """Add the handler to the background thread ones."""
+        # tuple replacement is atomic for the listener thread
+        self.listener.handlers = (*self.listener.handlers, handler)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # logger filters were already applied by the caller thread
+        return record
+
+
+class QueueLogging:
+    """Logging mode with records formatting and I/O at background threads.
+
+    `start` moves the loggers handlers behind the queues and `stop` flushes them
+    and restores the handlers back.
+
+    ```python
+    queue_logging = QueueLogging(logger, broker.logger)
+
+    app = FastStream(
+        broker,
+        on_startup=[queue_logging.start],
+        after_shutdown=[queue_logging.stop],
+    )
+    ```
+    """
+
+    def __init__(self, *loggers: Optional[Any]) -> None:
+        self.loggers = tuple(lg for lg in loggers if isinstance(lg, logging.Logger))
+        self._handlers: Dict[logging.Logger, BackgroundHandler] = {}
+
+    def start(self) -> None:
+        for lg in self.loggers:
+            if lg in self._handlers:
+                continue
+
+            handler = BackgroundHandler(lg.handlers)
+            for h in tuple(lg.handlers):
+                lg.removeHandler(h)
+            lg.addHandler(handler)
+
+            self._handlers[lg] = handler
+            handler.listener.start()
+
+    def stop(self) -> None:
+        for lg, handler in self._handlers.items():
+            handler.listener.stop()
+
+            lg.removeHandler(handler)
+            for h in handler.listener.handlers:
+                lg.addHandler(h)
+
+        self._handlers.clear()
+
+
+def get_background_handler(logger: logging.Logger) -> Optional[BackgroundHandler]:
+    for h in logger.handlers:
+        if isinstance(h, BackgroundHandler):
+            return h
+    return None
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from nats.js.api import (
     AckPolicy,
     ConsumerConfig,
@@ -18,8 +20,11 @@ from faststream.nats.broker.broker import NatsBroker
 from faststream.nats.response import NatsResponse
 from faststream.nats.router import NatsPublisher, NatsRoute, NatsRouter
 from faststream.nats.schemas import JStream, KvWatch, ObjWatch, PullSub
-from faststream.nats.testing import TestNatsBroker
-from faststream.testing.app import TestApp
+from faststream.utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from faststream.nats.testing import TestNatsBroker
+    from faststream.testing.app import TestApp
 
 __all__ = (
     "TestApp",
@@ -48,3 +53,11 @@ __all__ = (
     "StreamConfig",
     "StreamSource",
 )
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "TestNatsBroker": "faststream.nats.testing",
+        "TestApp": "faststream.testing.app",
+    },
+)
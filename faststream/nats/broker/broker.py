@@ -1,5 +1,6 @@
 import logging
 import warnings
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -31,6 +32,7 @@ from typing_extensions import Annotated, Doc, deprecated, override
 
 from faststream.__about__ import SERVICE_NAME
 from faststream.broker.message import gen_cor_id
+from faststream.constants import DEFAULT_STARTUP_CONCURRENCY
 from faststream.nats.broker.logging import NatsLoggingBroker
 from faststream.nats.broker.registrator import NatsRegistrator
 from faststream.nats.helpers import KVBucketDeclarer, OSBucketDeclarer
@@ -67,6 +69,7 @@ if TYPE_CHECKING:
     )
     from faststream.nats.message import NatsMessage
     from faststream.nats.publisher.asyncapi import AsyncAPIPublisher
+    from faststream.nats.schemas import JStream
     from faststream.security import BaseSecurity
     from faststream.types import (
         AnyDict,
@@ -75,6 +78,7 @@ if TYPE_CHECKING:
         LoggerProto,
         SendableMessage,
     )
+    from faststream.utils.executor import BaseExecutor
 
     class NatsInitKwargs(TypedDict, total=False):
         """NatsBroker.connect() method type hints."""
@@ -373,6 +377,20 @@ class NatsBroker(
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down."
             ),
         ] = None,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handlers (and parsers and decoders for `ThreadExecutor`) of all broker subscribers. "
+                "Anyio default threadpool is used if not set."
+            ),
+        ] = None,
+        startup_concurrency: Annotated[
+            int,
+            Doc(
+                "Max number of subscribers and declarations started concurrently. "
+                "Use `1` to start them one by one."
+            ),
+        ] = DEFAULT_STARTUP_CONCURRENCY,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -521,6 +539,8 @@ class NatsBroker(
             # Basic args
             # broker base
             graceful_timeout=graceful_timeout,
+            executor=executor,
+            startup_concurrency=startup_concurrency,
             dependencies=dependencies,
             decoder=decoder,
             parser=parser,
@@ -622,52 +642,52 @@ class NatsBroker(
         assert self.stream, "Broker should be started already"  # nosec B101
         assert self._producer, "Broker should be started already"  # nosec B101
 
-        for stream in filter(
-            lambda x: x.declare,
-            self._stream_builder.objects.values(),
-        ):
-            try:
-                await self.stream.add_stream(
-                    config=stream.config,
-                    subjects=stream.subjects,
-                )
+        await self._declare(
+            partial(self._declare_stream, stream)
+            for stream in self._stream_builder.objects.values()
+            if stream.declare
+        )
 
-            except BadRequestError as e:  # noqa: PERF203
-                log_context = AsyncAPISubscriber.build_log_context(
-                    message=None,
-                    subject="",
-                    queue="",
-                    stream=stream.name,
-                )
+        # TODO: filter by already running handlers after TestClient refactor
+        await self._start_subscribers()
 
-                if (
-                    e.description
-                    == "stream name already in use with a different configuration"
-                ):
-                    old_config = (await self.stream.stream_info(stream.name)).config
+    async def _declare_stream(self, stream: "JStream") -> None:
+        assert self.stream, "Broker should be started already"  # nosec B101
 
-                    self._log(str(e), logging.WARNING, log_context)
-                    await self.stream.update_stream(
-                        config=stream.config,
-                        subjects=tuple(
-                            set(old_config.subjects or ()).union(stream.subjects)
-                        ),
-                    )
+        try:
+            await self.stream.add_stream(
+                config=stream.config,
+                subjects=stream.subjects,
+            )
 
-                else:  # pragma: no cover
-                    self._log(str(e), logging.ERROR, log_context, exc_info=e)
+        except BadRequestError as e:
+            log_context = AsyncAPISubscriber.build_log_context(
+                message=None,
+                subject="",
+                queue="",
+                stream=stream.name,
+            )
 
-            finally:
-                # prevent from double declaration
-                stream.declare = False
+            if (
+                e.description
+                == "stream name already in use with a different configuration"
+            ):
+                old_config = (await self.stream.stream_info(stream.name)).config
 
-        # TODO: filter by already running handlers after TestClient refactor
-        for handler in self._subscribers.values():
-            self._log(
-                f"`{handler.call_name}` waiting for messages",
-                extra=handler.get_log_context(None),
-            )
-            await handler.start()
+                self._log(str(e), logging.WARNING, log_context)
+                await self.stream.update_stream(
+                    config=stream.config,
+                    subjects=tuple(
+                        set(old_config.subjects or ()).union(stream.subjects)
+                    ),
+                )
+
+            else:  # pragma: no cover
+                self._log(str(e), logging.ERROR, log_context, exc_info=e)
+
+        finally:
+            # prevent from double declaration
+            stream.declare = False
 
     @override
     async def publish(  # type: ignore[override]
@@ -1,10 +1,21 @@
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Union,
+    cast,
+)
 
 from nats.js import api
 from typing_extensions import Annotated, Doc, deprecated, override
 
 from faststream.broker.core.abc import ABCBroker
 from faststream.broker.utils import default_filter
+from faststream.exceptions import MICRO_BATCH_WITH_BATCH
 from faststream.nats.helpers import StreamBuilder
 from faststream.nats.publisher.asyncapi import AsyncAPIPublisher
 from faststream.nats.schemas import JStream, KvWatch, ObjWatch, PullSub
@@ -15,6 +26,9 @@ if TYPE_CHECKING:
     from fast_depends.dependencies import Depends
     from nats.aio.msg import Msg
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -23,6 +37,7 @@ if TYPE_CHECKING:
         SubscriberMiddleware,
     )
     from faststream.nats.message import NatsBatchMessage, NatsMessage
+    from faststream.utils.executor import BaseExecutor
 
 
 class NatsRegistrator(ABCBroker["Msg"]):
@@ -174,9 +189,20 @@ class NatsRegistrator(ABCBroker["Msg"]):
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        ordering_key: Annotated[
+            Optional[Callable[["Msg"], Hashable]],
+            Doc(
+                "Extract a key from the raw message to process messages with the same key "
+                "in order. Messages are routed to `max_workers` serial lanes by the key hash."
+            ),
+        ] = None,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -188,6 +214,34 @@ class NatsRegistrator(ABCBroker["Msg"]):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -209,6 +263,10 @@ class NatsRegistrator(ABCBroker["Msg"]):
 
         You can use it as a handler decorator `@broker.subscriber(...)`.
         """
+        pull = PullSub.validate(pull_sub)
+        if pull is not None and pull.batch and micro_batch is not None:
+            raise MICRO_BATCH_WITH_BATCH
+
         stream = self._stream_builder.create(stream)
 
         subscriber = cast(
@@ -218,10 +276,11 @@ class NatsRegistrator(ABCBroker["Msg"]):
                     subject=subject,
                     queue=queue,
                     stream=stream,
-                    pull_sub=PullSub.validate(pull_sub),
+                    pull_sub=pull,
                     kv_watch=KvWatch.validate(kv_watch),
                     obj_watch=ObjWatch.validate(obj_watch),
                     max_workers=max_workers,
+                    ordering_key=ordering_key,
                     # extra args
                     pending_msgs_limit=pending_msgs_limit,
                     pending_bytes_limit=pending_bytes_limit,
@@ -258,6 +317,10 @@ class NatsRegistrator(ABCBroker["Msg"]):
             decoder_=decoder or self._decoder,
             dependencies_=dependencies,
             middlewares_=middlewares,
+            executor_=executor,
+            micro_batch_=micro_batch,
+            dedup_=dedup,
+            log_sampling_=log_sampling,
         )
 
     @override
@@ -297,6 +360,18 @@ class NatsRegistrator(ABCBroker["Msg"]):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -341,6 +416,8 @@ class NatsRegistrator(ABCBroker["Msg"]):
                     # Specific
                     broker_middlewares=self._middlewares,
                     middlewares=middlewares,
+                    linger_ms=linger_ms,
+                    max_batch=max_batch,
                     # AsyncAPI
                     title_=title,
                     description_=description,
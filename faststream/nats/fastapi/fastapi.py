@@ -4,6 +4,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
@@ -58,6 +59,9 @@ if TYPE_CHECKING:
     from starlette.types import ASGIApp, Lifespan
 
     from faststream.asyncapi import schema as asyncapi
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -69,6 +73,7 @@ if TYPE_CHECKING:
     from faststream.nats.schemas import JStream, KvWatch, ObjWatch, PullSub
     from faststream.security import BaseSecurity
     from faststream.types import AnyDict, LoggerProto
+    from faststream.utils.executor import BaseExecutor
 
 
 class NatsRouter(StreamRouter["Msg"]):
@@ -709,9 +714,20 @@ class NatsRouter(StreamRouter["Msg"]):
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        ordering_key: Annotated[
+            Optional[Callable[["Msg"], Hashable]],
+            Doc(
+                "Extract a key from the raw message to process messages with the same key "
+                "in order. Messages are routed to `max_workers` serial lanes by the key hash."
+            ),
+        ] = None,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -723,6 +739,34 @@ class NatsRouter(StreamRouter["Msg"]):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -889,9 +933,14 @@ class NatsRouter(StreamRouter["Msg"]):
                 middlewares=middlewares,
                 filter=filter,
                 max_workers=max_workers,
+                ordering_key=ordering_key,
                 retry=retry,
                 no_ack=no_ack,
                 no_reply=no_reply,
+                executor=executor,
+                micro_batch=micro_batch,
+                dedup=dedup,
+                log_sampling=log_sampling,
                 title=title,
                 description=description,
                 include_in_schema=include_in_schema,
@@ -943,6 +992,18 @@ class NatsRouter(StreamRouter["Msg"]):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -971,6 +1032,8 @@ class NatsRouter(StreamRouter["Msg"]):
             stream=stream,
             timeout=timeout,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             title=title,
             description=description,
             schema=schema,
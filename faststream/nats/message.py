@@ -1,6 +1,7 @@
-from typing import List, Union
+from typing import List, Optional, Union
 
 from nats.aio.msg import Msg
+from nats.errors import NotJSMessageError
 from nats.js.api import ObjectInfo
 from nats.js.kv import KeyValue
 
@@ -10,6 +11,14 @@ from faststream.broker.message import StreamMessage
 class NatsMessage(StreamMessage[Msg]):
     """A class to represent a NATS message."""
 
+    @property
+    def delivery_count(self) -> Optional[int]:
+        """Number of previous JetStream message deliveries."""
+        try:
+            return self.raw_message.metadata.num_delivered - 1
+        except NotJSMessageError:  # core NATS message
+            return None
+
     async def ack(self) -> None:
         # Check `self.raw_message._ackd` instead of `self.committed`
         # to be compatible with `self.raw_message.ack()`
@@ -5,6 +5,7 @@ from opentelemetry.trace import TracerProvider
 
 from faststream.nats.opentelemetry.provider import telemetry_attributes_provider_factory
 from faststream.opentelemetry.middleware import TelemetryMiddleware
+from faststream.opentelemetry.sampling import TelemetrySampler
 
 
 class NatsTelemetryMiddleware(TelemetryMiddleware):
@@ -14,6 +15,8 @@ class NatsTelemetryMiddleware(TelemetryMiddleware):
         tracer_provider: Optional[TracerProvider] = None,
         meter_provider: Optional[MeterProvider] = None,
         meter: Optional[Meter] = None,
+        stage_timings: bool = False,
+        sampler: Optional[TelemetrySampler] = None,
     ) -> None:
         super().__init__(
             settings_provider_factory=telemetry_attributes_provider_factory,
@@ -21,4 +24,6 @@ class NatsTelemetryMiddleware(TelemetryMiddleware):
             meter_provider=meter_provider,
             meter=meter,
             include_messages_counters=True,
+            stage_timings=stage_timings,
+            sampler=sampler,
         )
@@ -1,6 +1,11 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from faststream.broker.message import StreamMessage, decode_message, gen_cor_id
+from faststream.broker.message import (
+    StreamMessage,
+    decode_message,
+    gen_cor_id,
+    lazy_value,
+)
 from faststream.nats.message import (
     NatsBatchMessage,
     NatsKvMessage,
@@ -76,8 +81,8 @@ class NatsParser(NatsBaseParser):
             reply_to=message.reply,
             headers=headers,
             content_type=headers.get("content-type", ""),
-            message_id=headers.get("message_id", gen_cor_id()),
-            correlation_id=headers.get("correlation_id", gen_cor_id()),
+            message_id=headers.get("message_id") or lazy_value(gen_cor_id),
+            correlation_id=headers.get("correlation_id") or lazy_value(gen_cor_id),
         )
 
 
@@ -102,8 +107,8 @@ class JsParser(NatsBaseParser):
             reply_to=headers.get("reply_to", ""),  # differ from core
             headers=headers,
             content_type=headers.get("content-type", ""),
-            message_id=headers.get("message_id", gen_cor_id()),
-            correlation_id=headers.get("correlation_id", gen_cor_id()),
+            message_id=headers.get("message_id") or lazy_value(gen_cor_id),
+            correlation_id=headers.get("correlation_id") or lazy_value(gen_cor_id),
         )
 
 
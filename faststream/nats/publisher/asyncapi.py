@@ -2,20 +2,13 @@ from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 from typing_extensions import override
 
-from faststream.asyncapi.schema import (
-    Channel,
-    ChannelBinding,
-    CorrelationId,
-    Message,
-    Operation,
-)
-from faststream.asyncapi.schema.bindings import nats
 from faststream.asyncapi.utils import resolve_payloads
 from faststream.nats.publisher.usecase import LogicPublisher
 
 if TYPE_CHECKING:
     from nats.aio.msg import Msg
 
+    from faststream.asyncapi.schema import Channel
     from faststream.broker.types import BrokerMiddleware, PublisherMiddleware
     from faststream.nats.schemas.js_stream import JStream
 
@@ -26,7 +19,16 @@ class AsyncAPIPublisher(LogicPublisher):
     def get_name(self) -> str:
         return f"{self.subject}:Publisher"
 
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
+        from faststream.asyncapi.schema import (
+            Channel,
+            ChannelBinding,
+            CorrelationId,
+            Message,
+            Operation,
+        )
+        from faststream.asyncapi.schema.bindings import nats
+
         payloads = self.get_payloads()
 
         return {
@@ -62,6 +64,8 @@ class AsyncAPIPublisher(LogicPublisher):
         # Publisher args
         broker_middlewares: Iterable["BrokerMiddleware[Msg]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -77,6 +81,8 @@ class AsyncAPIPublisher(LogicPublisher):
             # Publisher args
             broker_middlewares=broker_middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI args
             schema_=schema_,
             title_=title_,
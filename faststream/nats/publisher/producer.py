@@ -1,5 +1,5 @@
 import asyncio
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
 
 import anyio
 import nats
@@ -21,7 +21,7 @@ if TYPE_CHECKING:
         AsyncCallable,
         CustomCallable,
     )
-    from faststream.types import SendableMessage
+    from faststream.types import AnyDict, SendableMessage
 
 
 class NatsFastProducer(ProducerProto):
@@ -100,6 +100,16 @@ class NatsFastProducer(ProducerProto):
 
         return None
 
+    @override
+    async def publish_many(
+        self,
+        requests: Sequence[Tuple["SendableMessage", "AnyDict"]],
+    ) -> Sequence[Any]:
+        """Write messages to the client buffer and flush it once."""
+        results = await super().publish_many(requests)
+        await self._connection.flush()
+        return results
+
     @override
     async def request(  # type: ignore[override]
         self,
@@ -44,6 +44,8 @@ class LogicPublisher(PublisherUsecase[Msg]):
         # Publisher args
         broker_middlewares: Iterable["BrokerMiddleware[Msg]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -54,6 +56,8 @@ class LogicPublisher(PublisherUsecase[Msg]):
         super().__init__(
             broker_middlewares=broker_middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI args
             schema_=schema_,
             title_=title_,
@@ -126,7 +130,7 @@ class LogicPublisher(PublisherUsecase[Msg]):
         if stream := stream or getattr(self.stream, "name", None):
             kwargs.update({"stream": stream, "timeout": timeout or self.timeout})
 
-        call: AsyncFunc = self._producer.publish
+        call: AsyncFunc = self._get_publish_call(rpc)
 
         for m in chain(
             (
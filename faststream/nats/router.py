@@ -4,6 +4,7 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     Optional,
     Union,
@@ -20,6 +21,9 @@ if TYPE_CHECKING:
     from fast_depends.dependencies import Depends
     from nats.aio.msg import Msg
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -30,6 +34,7 @@ if TYPE_CHECKING:
     from faststream.nats.message import NatsBatchMessage, NatsMessage
     from faststream.nats.schemas import JStream, KvWatch, ObjWatch, PullSub
     from faststream.types import SendableMessage
+    from faststream.utils.executor import BaseExecutor
 
 
 class NatsPublisher(ArgsContainer):
@@ -74,6 +79,18 @@ class NatsPublisher(ArgsContainer):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -102,6 +119,8 @@ class NatsPublisher(ArgsContainer):
             stream=stream,
             timeout=timeout,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             title=title,
             description=description,
             schema=schema,
@@ -263,9 +282,20 @@ class NatsRoute(SubscriberRoute):
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        ordering_key: Annotated[
+            Optional[Callable[["Msg"], Hashable]],
+            Doc(
+                "Extract a key from the raw message to process messages with the same key "
+                "in order. Messages are routed to `max_workers` serial lanes by the key hash."
+            ),
+        ] = None,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -277,6 +307,34 @@ class NatsRoute(SubscriberRoute):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -315,6 +373,7 @@ class NatsRoute(SubscriberRoute):
             ack_first=ack_first,
             stream=stream,
             max_workers=max_workers,
+            ordering_key=ordering_key,
             queue=queue,
             dependencies=dependencies,
             parser=parser,
@@ -324,6 +383,10 @@ class NatsRoute(SubscriberRoute):
             retry=retry,
             no_ack=no_ack,
             no_reply=no_reply,
+            executor=executor,
+            micro_batch=micro_batch,
+            dedup=dedup,
+            log_sampling=log_sampling,
             title=title,
             description=description,
             include_in_schema=include_in_schema,
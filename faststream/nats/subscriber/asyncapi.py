@@ -1,15 +1,7 @@
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
 from typing_extensions import override
 
-from faststream.asyncapi.schema import (
-    Channel,
-    ChannelBinding,
-    CorrelationId,
-    Message,
-    Operation,
-)
-from faststream.asyncapi.schema.bindings import nats
 from faststream.asyncapi.utils import resolve_payloads
 from faststream.nats.subscriber.usecase import (
     BatchPullStreamSubscriber,
@@ -24,6 +16,9 @@ from faststream.nats.subscriber.usecase import (
     PushStreamSubscription,
 )
 
+if TYPE_CHECKING:
+    from faststream.asyncapi.schema import Channel
+
 
 class AsyncAPISubscriber(LogicSubscriber[Any, Any]):
     """A class to represent a NATS handler."""
@@ -31,7 +26,16 @@ class AsyncAPISubscriber(LogicSubscriber[Any, Any]):
     def get_name(self) -> str:
         return f"{self.subject}:{self.call_name}"
 
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
+        from faststream.asyncapi.schema import (
+            Channel,
+            ChannelBinding,
+            CorrelationId,
+            Message,
+            Operation,
+        )
+        from faststream.asyncapi.schema.bindings import nats
+
         payloads = self.get_payloads()
 
         return {
@@ -96,7 +100,7 @@ class AsyncAPIKeyValueWatchSubscriber(AsyncAPISubscriber, KeyValueWatchSubscribe
         return ""
 
     @override
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
         return {}
 
 
@@ -108,5 +112,5 @@ class AsyncAPIObjStoreWatchSubscriber(AsyncAPISubscriber, ObjStoreWatchSubscribe
         return ""
 
     @override
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
         return {}
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Optional, Union
 
 from nats.aio.subscription import (
     DEFAULT_SUB_PENDING_BYTES_LIMIT,
@@ -25,8 +25,10 @@ from faststream.nats.subscriber.asyncapi import (
 
 if TYPE_CHECKING:
     from fast_depends.dependencies import Depends
+    from nats.aio.msg import Msg
     from nats.js import api
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.types import BrokerMiddleware
     from faststream.nats.schemas import JStream, KvWatch, ObjWatch, PullSub
     from faststream.types import AnyDict
@@ -56,11 +58,12 @@ def create_subscriber(
     # custom args
     ack_first: bool,
     max_workers: int,
+    ordering_key: Optional[Callable[["Msg"], Hashable]],
     stream: Optional["JStream"],
     # Subscriber args
     no_ack: bool,
     no_reply: bool,
-    retry: Union[bool, int],
+    retry: Union[bool, int, "BaseWatcher"],
     broker_dependencies: Iterable["Depends"],
     broker_middlewares: Iterable["BrokerMiddleware[Any]"],
     # AsyncAPI information
@@ -150,6 +153,7 @@ def create_subscriber(
         if max_workers > 1:
             return AsyncAPIConcurrentCoreSubscriber(
                 max_workers=max_workers,
+                ordering_key=ordering_key,
                 subject=subject,
                 config=config,
                 queue=queue,
@@ -191,6 +195,7 @@ def create_subscriber(
             if pull_sub is not None:
                 return AsyncAPIConcurrentPullStreamSubscriber(
                     max_workers=max_workers,
+                    ordering_key=ordering_key,
                     pull_sub=pull_sub,
                     stream=stream,
                     subject=subject,
@@ -212,6 +217,7 @@ def create_subscriber(
             else:
                 return AsyncAPIConcurrentPushStreamSubscriber(
                     max_workers=max_workers,
+                    ordering_key=ordering_key,
                     stream=stream,
                     subject=subject,
                     config=config,
@@ -7,6 +7,7 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Hashable,
     Iterable,
     List,
     Optional,
@@ -28,7 +29,7 @@ from faststream.broker.subscriber.usecase import SubscriberUsecase
 from faststream.broker.types import MsgType
 from faststream.broker.utils import process_msg
 from faststream.exceptions import NOT_CONNECTED_YET
-from faststream.nats.message import NatsMessage
+from faststream.nats.message import NatsBatchMessage, NatsMessage
 from faststream.nats.parser import (
     BatchParser,
     JsParser,
@@ -51,6 +52,7 @@ if TYPE_CHECKING:
     from nats.js.kv import KeyValue
     from nats.js.object_store import ObjectStore
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.message import StreamMessage
     from faststream.broker.publisher.proto import ProducerProto
     from faststream.broker.types import (
@@ -62,6 +64,7 @@ if TYPE_CHECKING:
     from faststream.nats.message import NatsKvMessage, NatsObjMessage
     from faststream.nats.schemas import JStream, KvWatch, ObjWatch, PullSub
     from faststream.types import AnyDict, Decorator, LoggerProto, SendableMessage
+    from faststream.utils.executor import BaseExecutor
 
 
 ConnectionType = TypeVar("ConnectionType")
@@ -86,7 +89,7 @@ class LogicSubscriber(Generic[ConnectionType, MsgType], SubscriberUsecase[MsgTyp
         default_decoder: "AsyncCallable",
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable[Depends],
         broker_middlewares: Iterable["BrokerMiddleware[MsgType]"],
         # AsyncAPI args
@@ -132,6 +135,7 @@ class LogicSubscriber(Generic[ConnectionType, MsgType], SubscriberUsecase[MsgTyp
         # broker options
         broker_parser: Optional["CustomCallable"],
         broker_decoder: Optional["CustomCallable"],
+        broker_executor: Optional["BaseExecutor"],
         # dependant args
         apply_types: bool,
         is_validate: bool,
@@ -147,6 +151,7 @@ class LogicSubscriber(Generic[ConnectionType, MsgType], SubscriberUsecase[MsgTyp
             extra_context=extra_context,
             broker_parser=broker_parser,
             broker_decoder=broker_decoder,
+            broker_executor=broker_executor,
             apply_types=apply_types,
             is_validate=is_validate,
             _get_dependant=_get_dependant,
@@ -261,7 +266,7 @@ class _DefaultSubscriber(LogicSubscriber[ConnectionType, MsgType]):
         default_decoder: "AsyncCallable",
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable[Depends],
         broker_middlewares: Iterable["BrokerMiddleware[MsgType]"],
         # AsyncAPI args
@@ -334,7 +339,7 @@ class CoreSubscriber(_DefaultSubscriber["Client", "Msg"]):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable[Depends],
         broker_middlewares: Iterable["BrokerMiddleware[Msg]"],
         # AsyncAPI args
@@ -438,6 +443,7 @@ class ConcurrentCoreSubscriber(
         self,
         *,
         max_workers: int,
+        ordering_key: Optional[Callable[["Msg"], Hashable]],
         # default args
         subject: str,
         config: "ConsumerConfig",
@@ -446,7 +452,7 @@ class ConcurrentCoreSubscriber(
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable[Depends],
         broker_middlewares: Iterable["BrokerMiddleware[Msg]"],
         # AsyncAPI args
@@ -456,6 +462,7 @@ class ConcurrentCoreSubscriber(
     ) -> None:
         super().__init__(
             max_workers=max_workers,
+            ordering_key=ordering_key,
             # basic args
             subject=subject,
             config=config,
@@ -508,7 +515,7 @@ class _StreamSubscriber(_DefaultSubscriber["JetStreamContext", "Msg"]):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable[Depends],
         broker_middlewares: Iterable["BrokerMiddleware[Msg]"],
         # AsyncAPI args
@@ -540,6 +547,14 @@ class _StreamSubscriber(_DefaultSubscriber["JetStreamContext", "Msg"]):
             include_in_schema=include_in_schema,
         )
 
+    async def _retry_later(
+        self,
+        message: "StreamMessage[Any]",
+        delay: float,
+        attempts: int,
+    ) -> None:
+        await cast(NatsMessage, message).nack(delay=delay)
+
     def get_log_context(
         self,
         message: Annotated[
@@ -633,6 +648,7 @@ class ConcurrentPushStreamSubscriber(
         self,
         *,
         max_workers: int,
+        ordering_key: Optional[Callable[["Msg"], Hashable]],
         stream: "JStream",
         # default args
         subject: str,
@@ -642,7 +658,7 @@ class ConcurrentPushStreamSubscriber(
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable[Depends],
         broker_middlewares: Iterable["BrokerMiddleware[Msg]"],
         # AsyncAPI args
@@ -652,6 +668,7 @@ class ConcurrentPushStreamSubscriber(
     ) -> None:
         super().__init__(
             max_workers=max_workers,
+            ordering_key=ordering_key,
             # basic args
             stream=stream,
             subject=subject,
@@ -709,7 +726,7 @@ class PullStreamSubscriber(
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable[Depends],
         broker_middlewares: Iterable["BrokerMiddleware[Msg]"],
         # AsyncAPI args
@@ -784,6 +801,7 @@ class ConcurrentPullStreamSubscriber(
         self,
         *,
         max_workers: int,
+        ordering_key: Optional[Callable[["Msg"], Hashable]],
         # default args
         pull_sub: "PullSub",
         stream: "JStream",
@@ -793,7 +811,7 @@ class ConcurrentPullStreamSubscriber(
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable[Depends],
         broker_middlewares: Iterable["BrokerMiddleware[Msg]"],
         # AsyncAPI args
@@ -803,6 +821,7 @@ class ConcurrentPullStreamSubscriber(
     ) -> None:
         super().__init__(
             max_workers=max_workers,
+            ordering_key=ordering_key,
             # basic args
             pull_sub=pull_sub,
             stream=stream,
@@ -862,7 +881,7 @@ class BatchPullStreamSubscriber(
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable[Depends],
         broker_middlewares: Iterable["BrokerMiddleware[List[Msg]]"],
         # AsyncAPI args
@@ -964,6 +983,14 @@ class BatchPullStreamSubscriber(
                 if messages:
                     await self.consume(messages)
 
+    async def _retry_later(
+        self,
+        message: "StreamMessage[Any]",
+        delay: float,
+        attempts: int,
+    ) -> None:
+        await cast(NatsBatchMessage, message).nack(delay=delay)
+
 
 class KeyValueWatchSubscriber(
     TasksMixin,
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 from unittest.mock import AsyncMock
 
 import anyio
@@ -6,6 +6,7 @@ from nats.aio.msg import Msg
 from typing_extensions import override
 
 from faststream.broker.message import encode_message, gen_cor_id
+from faststream.broker.publisher.proto import ProducerProto
 from faststream.broker.utils import resolve_custom_func
 from faststream.exceptions import WRONG_PUBLISH_ARGS, SubscriberNotFound
 from faststream.nats.broker import NatsBroker
@@ -18,7 +19,7 @@ from faststream.utils.functions import timeout_scope
 if TYPE_CHECKING:
     from faststream.nats.publisher.asyncapi import AsyncAPIPublisher
     from faststream.nats.subscriber.usecase import LogicSubscriber
-    from faststream.types import SendableMessage
+    from faststream.types import AnyDict, SendableMessage
 
 __all__ = ("TestNatsBroker",)
 
@@ -86,6 +87,8 @@ class FakeProducer(NatsFastProducer):
         if rpc and reply_to:
             raise WRONG_PUBLISH_ARGS
 
+        correlation_id = correlation_id or gen_cor_id()
+
         incoming = build_message(
             message=message,
             subject=subject,
@@ -104,12 +107,21 @@ class FakeProducer(NatsFastProducer):
                     msg = incoming
 
                 with timeout_scope(rpc_timeout, raise_timeout):
-                    response = await self._execute_handler(msg, subject, handler)
+                    response = await self._execute_handler(
+                        msg, subject, handler, correlation_id
+                    )
                     if rpc:
                         return await self._decoder(await self._parser(response))
 
         return None
 
+    @override
+    async def publish_many(
+        self,
+        requests: Sequence[Tuple["SendableMessage", "AnyDict"]],
+    ) -> Sequence[Any]:
+        return await ProducerProto.publish_many(self, requests)
+
     @override
     async def request(  # type: ignore[override]
         self,
@@ -122,6 +134,8 @@ class FakeProducer(NatsFastProducer):
         # NatsJSFastProducer compatibility
         stream: Optional[str] = None,
     ) -> "PatchedMessage":
+        correlation_id = correlation_id or gen_cor_id()
+
         incoming = build_message(
             message=message,
             subject=subject,
@@ -139,7 +153,9 @@ class FakeProducer(NatsFastProducer):
                     msg = incoming
 
                 with anyio.fail_after(timeout):
-                    return await self._execute_handler(msg, subject, handler)
+                    return await self._execute_handler(
+                        msg, subject, handler, correlation_id
+                    )
 
         raise SubscriberNotFound
 
@@ -148,6 +164,7 @@ class FakeProducer(NatsFastProducer):
         msg: Any,
         subject: str,
         handler: "LogicSubscriber[Any, Any]",
+        correlation_id: Optional[str] = None,
     ) -> "PatchedMessage":
         result = await handler.process_message(msg)
 
@@ -155,7 +172,7 @@ class FakeProducer(NatsFastProducer):
             subject=subject,
             message=result.body,
             headers=result.headers,
-            correlation_id=result.correlation_id,
+            correlation_id=result.correlation_id or correlation_id,
         )
 
 
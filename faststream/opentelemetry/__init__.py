@@ -1,12 +1,31 @@
-from faststream.opentelemetry.annotations import CurrentBaggage, CurrentSpan
-from faststream.opentelemetry.baggage import Baggage
-from faststream.opentelemetry.middleware import TelemetryMiddleware
-from faststream.opentelemetry.provider import TelemetrySettingsProvider
+from typing import TYPE_CHECKING
+
+from faststream.utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from faststream.opentelemetry.annotations import CurrentBaggage, CurrentSpan
+    from faststream.opentelemetry.baggage import Baggage
+    from faststream.opentelemetry.middleware import TelemetryMiddleware
+    from faststream.opentelemetry.provider import TelemetrySettingsProvider
+    from faststream.opentelemetry.sampling import TelemetrySampler
 
 __all__ = (
     "Baggage",
     "CurrentBaggage",
     "CurrentSpan",
     "TelemetryMiddleware",
+    "TelemetrySampler",
     "TelemetrySettingsProvider",
 )
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "Baggage": "faststream.opentelemetry.baggage",
+        "CurrentBaggage": "faststream.opentelemetry.annotations",
+        "CurrentSpan": "faststream.opentelemetry.annotations",
+        "TelemetryMiddleware": "faststream.opentelemetry.middleware",
+        "TelemetrySampler": "faststream.opentelemetry.sampling",
+        "TelemetrySettingsProvider": "faststream.opentelemetry.provider",
+    },
+)
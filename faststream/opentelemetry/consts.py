@@ -9,3 +9,6 @@ OTEL_SCHEMA = "https://opentelemetry.io/schemas/1.11.0"
 ERROR_TYPE = "error.type"
 MESSAGING_DESTINATION_PUBLISH_NAME = "messaging.destination_publish.name"
 WITH_BATCH = "with_batch"
+MESSAGING_HANDLER_NAME = "messaging.faststream.handler"
+MESSAGING_PROCESS_STAGE = "messaging.faststream.stage"
+MESSAGING_EXECUTOR_NAME = "messaging.faststream.executor"
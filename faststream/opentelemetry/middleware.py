@@ -1,13 +1,31 @@
+import random
 import time
 from collections import defaultdict
 from copy import copy
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    cast,
+)
 
 from opentelemetry import baggage, context, metrics, trace
 from opentelemetry.baggage.propagation import W3CBaggagePropagator
 from opentelemetry.context import Context
+from opentelemetry.metrics import Observation
 from opentelemetry.semconv.trace import SpanAttributes
-from opentelemetry.trace import Link, Span
+from opentelemetry.trace import (
+    Link,
+    NonRecordingSpan,
+    Span,
+    SpanContext,
+    TraceFlags,
+)
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 from faststream import BaseMiddleware
@@ -16,22 +34,27 @@ from faststream.opentelemetry.baggage import Baggage
 from faststream.opentelemetry.consts import (
     ERROR_TYPE,
     MESSAGING_DESTINATION_PUBLISH_NAME,
+    MESSAGING_EXECUTOR_NAME,
+    MESSAGING_HANDLER_NAME,
+    MESSAGING_PROCESS_STAGE,
     OTEL_SCHEMA,
     WITH_BATCH,
     MessageAction,
 )
 from faststream.opentelemetry.provider import TelemetrySettingsProvider
+from faststream.opentelemetry.sampling import TelemetrySampler, get_parent_sampled
 
 if TYPE_CHECKING:
-    from contextvars import Token
     from types import TracebackType
 
-    from opentelemetry.metrics import Meter, MeterProvider
+    from opentelemetry.metrics import CallbackOptions, Meter, MeterProvider
     from opentelemetry.trace import Tracer, TracerProvider
     from opentelemetry.util.types import Attributes
 
     from faststream.broker.message import StreamMessage
+    from faststream.broker.subscriber.timing import ProcessingStage, StageObserver
     from faststream.types import AnyDict, AsyncFunc, AsyncFuncAny
+    from faststream.utils.executor import BaseExecutor, ExecutorStats
 
 
 _BAGGAGE_PROPAGATOR = W3CBaggagePropagator()
@@ -40,14 +63,24 @@ _TRACE_PROPAGATOR = TraceContextTextMapPropagator()
 
 class _MetricsContainer:
     __slots__ = (
+        "meter",
+        "executors",
         "include_messages_counters",
         "publish_duration",
         "publish_counter",
         "process_duration",
         "process_counter",
+        "stage_duration",
     )
 
-    def __init__(self, meter: "Meter", include_messages_counters: bool) -> None:
+    def __init__(
+        self,
+        meter: "Meter",
+        include_messages_counters: bool,
+        stage_timings: bool = False,
+    ) -> None:
+        self.meter = meter
+        self.executors: Dict[BaseExecutor, None] = {}
         self.include_messages_counters = include_messages_counters
 
         self.publish_duration = meter.create_histogram(
@@ -73,6 +106,13 @@ class _MetricsContainer:
                 description="Measures the number of published messages.",
             )
 
+        if stage_timings:
+            self.stage_duration = meter.create_histogram(
+                name="messaging.process.stage.duration",
+                unit="s",
+                description="Measures the duration of message processing stages.",
+            )
+
     def observe_publish(
         self, attrs: "AnyDict", duration: float, msg_count: int
     ) -> None:
@@ -103,6 +143,57 @@ class _MetricsContainer:
                 attributes=counter_attrs,
             )
 
+    def observe_stage(self, attrs: "AnyDict", duration: float) -> None:
+        self.stage_duration.record(
+            amount=duration,
+            attributes=attrs,
+        )
+
+    def observe_executor(self, executor: "BaseExecutor") -> None:
+        if not self.executors:
+            # instruments are created with the first executor only
+            self._create_executor_instruments()
+        self.executors[executor] = None
+
+    def _create_executor_instruments(self) -> None:
+        def observe(
+            get_value: Callable[["ExecutorStats"], float],
+        ) -> Callable[["CallbackOptions"], Iterable[Observation]]:
+            def callback(options: "CallbackOptions") -> Iterable[Observation]:
+                for executor in tuple(self.executors):
+                    stats = executor.stats()
+                    yield Observation(
+                        get_value(stats),
+                        {MESSAGING_EXECUTOR_NAME: stats.name},
+                    )
+
+            return callback
+
+        self.meter.create_observable_up_down_counter(
+            name="messaging.faststream.executor.queued_calls",
+            callbacks=[observe(lambda s: s.queued)],
+            unit="{call}",
+            description="Measures the number of calls waiting for a free executor worker.",
+        )
+        self.meter.create_observable_up_down_counter(
+            name="messaging.faststream.executor.running_calls",
+            callbacks=[observe(lambda s: s.running)],
+            unit="{call}",
+            description="Measures the number of calls running by executor workers.",
+        )
+        self.meter.create_observable_counter(
+            name="messaging.faststream.executor.completed_calls",
+            callbacks=[observe(lambda s: s.completed)],
+            unit="{call}",
+            description="Measures the number of calls completed by executor.",
+        )
+        self.meter.create_observable_counter(
+            name="messaging.faststream.executor.wait_time",
+            callbacks=[observe(lambda s: s.wait_time_total)],
+            unit="s",
+            description="Measures the total time calls waited for a free executor worker.",
+        )
+
 
 class BaseTelemetryMiddleware(BaseMiddleware):
     def __init__(
@@ -114,14 +205,16 @@ class BaseTelemetryMiddleware(BaseMiddleware):
         ],
         metrics_container: _MetricsContainer,
         msg: Optional[Any] = None,
+        sampler: Optional[TelemetrySampler] = None,
     ) -> None:
         self.msg = msg
 
         self._tracer = tracer
         self._metrics = metrics_container
+        self._sampler = sampler
+        self._sampled: Optional[bool] = None
         self._current_span: Optional[Span] = None
         self._origin_context: Optional[Context] = None
-        self._scope_tokens: List[Tuple[str, Token[Any]]] = []
         self.__settings_provider = settings_provider_factory(msg)
 
     async def publish_scope(
@@ -142,14 +235,36 @@ class BaseTelemetryMiddleware(BaseMiddleware):
         if current_baggage:
             headers.update(current_baggage.to_headers())
 
-        trace_attributes = provider.get_publish_attrs_from_kwargs(kwargs)
         metrics_attributes = {
             SpanAttributes.MESSAGING_SYSTEM: provider.messaging_system,
             SpanAttributes.MESSAGING_DESTINATION_NAME: destination_name,
         }
+        msg_count = len((msg, *args))
+
+        if not self._should_sample_publish(destination_name):
+            # propagate not sampled decision to consumers
+            _TRACE_PROPAGATOR.inject(
+                headers,
+                context=self._origin_context or _create_not_sampled_context(),
+            )
+
+            start_time = time.perf_counter()
+
+            try:
+                return await call_next(msg, *args, headers=headers, **kwargs)
+
+            except Exception as e:
+                metrics_attributes[ERROR_TYPE] = type(e).__name__
+                raise
+
+            finally:
+                duration = time.perf_counter() - start_time
+                self._metrics.observe_publish(metrics_attributes, duration, msg_count)
+
+        trace_attributes = provider.get_publish_attrs_from_kwargs(kwargs)
 
         # NOTE: if batch with single message?
-        if (msg_count := len((msg, *args))) > 1:
+        if msg_count > 1:
             trace_attributes[SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT] = msg_count
             current_context = _BAGGAGE_PROPAGATOR.extract(headers, current_context)
             _BAGGAGE_PROPAGATOR.inject(
@@ -194,9 +309,6 @@ class BaseTelemetryMiddleware(BaseMiddleware):
             duration = time.perf_counter() - start_time
             self._metrics.observe_publish(metrics_attributes, duration, msg_count)
 
-        for key, token in self._scope_tokens:
-            fs_context.reset_local(key, token)
-
         return result
 
     async def consume_scope(
@@ -207,19 +319,36 @@ class BaseTelemetryMiddleware(BaseMiddleware):
         if (provider := self.__settings_provider) is None:
             return await call_next(msg)
 
+        destination_name = provider.get_consume_destination_name(msg)
+        metrics_attributes = {
+            SpanAttributes.MESSAGING_SYSTEM: provider.messaging_system,
+            MESSAGING_DESTINATION_PUBLISH_NAME: destination_name,
+        }
+
+        if (sampler := self._sampler) is not None:
+            parent_sampled = get_parent_sampled(msg.headers)
+            self._sampled = sampler.should_sample(destination_name, parent_sampled)
+
+            if not self._sampled:
+                self._origin_context = (
+                    _create_not_sampled_context()
+                    if parent_sampled is None
+                    else _TRACE_PROPAGATOR.extract(msg.headers)
+                )
+
+                return await self._consume_not_sampled(
+                    call_next, msg, provider, metrics_attributes
+                )
+
         if _is_batch_message(msg):
+            # the whole batch is processed by a single span linked to the messages ones
             links = _get_msg_links(msg)
             current_context = Context()
         else:
             links = None
             current_context = _TRACE_PROPAGATOR.extract(msg.headers)
 
-        destination_name = provider.get_consume_destination_name(msg)
         trace_attributes = provider.get_consume_attrs_from_message(msg)
-        metrics_attributes = {
-            SpanAttributes.MESSAGING_SYSTEM: provider.messaging_system,
-            MESSAGING_DESTINATION_PUBLISH_NAME: destination_name,
-        }
 
         if not len(current_context):
             create_span = self._tracer.start_span(
@@ -247,10 +376,8 @@ class BaseTelemetryMiddleware(BaseMiddleware):
                 )
                 self._current_span = span
 
-                self._scope_tokens.append(("span", fs_context.set_local("span", span)))
-                self._scope_tokens.append(
-                    ("baggage", fs_context.set_local("baggage", Baggage.from_msg(msg)))
-                )
+                fs_context.set_message_local("span", span)
+                fs_context.set_message_local("baggage", Baggage.from_msg(msg))
 
                 new_context = trace.set_span_in_context(span, current_context)
                 token = context.attach(new_context)
@@ -270,6 +397,52 @@ class BaseTelemetryMiddleware(BaseMiddleware):
 
         return result
 
+    async def _consume_not_sampled(
+        self,
+        call_next: "AsyncFuncAny",
+        msg: "StreamMessage[Any]",
+        provider: TelemetrySettingsProvider[Any],
+        metrics_attributes: "AnyDict",
+    ) -> Any:
+        fs_context.set_message_local("baggage", Baggage.from_msg(msg))
+
+        # the handler publications follow the not sampled decision by the current span
+        token = context.attach(self._origin_context or _create_not_sampled_context())
+        start_time = time.perf_counter()
+
+        try:
+            return await call_next(msg)
+
+        except Exception as e:
+            metrics_attributes[ERROR_TYPE] = type(e).__name__
+            raise
+
+        finally:
+            context.detach(token)
+            duration = time.perf_counter() - start_time
+
+            msg_count = 1
+            if self._metrics.include_messages_counters:
+                msg_count = provider.get_consume_attrs_from_message(msg).get(
+                    SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT, 1
+                )
+
+            self._metrics.observe_consume(metrics_attributes, duration, msg_count)
+
+    def _should_sample_publish(self, destination: str) -> bool:
+        if (sampler := self._sampler) is None:
+            return True
+
+        if self._sampled is not None:
+            # follow the consumed message decision
+            return self._sampled
+
+        span_context = trace.get_current_span().get_span_context()
+        return sampler.should_sample(
+            destination,
+            span_context.trace_flags.sampled if span_context.is_valid else None,
+        )
+
     async def after_processed(
         self,
         exc_type: Optional[Type[BaseException]] = None,
@@ -288,8 +461,13 @@ class TelemetryMiddleware:
         "_meter",
         "_metrics",
         "_settings_provider_factory",
+        "_messaging_system",
+        "_sampler",
+        "observe_stage",
     )
 
+    observe_stage: Optional["StageObserver"]
+
     def __init__(
         self,
         *,
@@ -300,18 +478,51 @@ class TelemetryMiddleware:
         meter_provider: Optional["MeterProvider"] = None,
         meter: Optional["Meter"] = None,
         include_messages_counters: bool = False,
+        stage_timings: bool = False,
+        sampler: Optional[TelemetrySampler] = None,
     ) -> None:
         self._tracer = _get_tracer(tracer_provider)
+        self._sampler = sampler
         self._meter = _get_meter(meter_provider, meter)
-        self._metrics = _MetricsContainer(self._meter, include_messages_counters)
+        self._metrics = _MetricsContainer(
+            self._meter,
+            include_messages_counters,
+            stage_timings,
+        )
         self._settings_provider_factory = settings_provider_factory
 
+        provider = settings_provider_factory(None)
+        self._messaging_system = provider.messaging_system if provider else ""
+
+        # subscribers time processing stages only if the callback is set
+        self.observe_stage = self._observe_stage if stage_timings else None
+
     def __call__(self, msg: Optional[Any]) -> BaseMiddleware:
         return BaseTelemetryMiddleware(
             tracer=self._tracer,
             metrics_container=self._metrics,
             settings_provider_factory=self._settings_provider_factory,
             msg=msg,
+            sampler=self._sampler,
+        )
+
+    def observe_executor(self, executor: "BaseExecutor") -> None:
+        """Export statistics of the executor used by a subscriber."""
+        self._metrics.observe_executor(executor)
+
+    def _observe_stage(
+        self,
+        handler: str,
+        stage: "ProcessingStage",
+        duration_ns: int,
+    ) -> None:
+        self._metrics.observe_stage(
+            {
+                SpanAttributes.MESSAGING_SYSTEM: self._messaging_system,
+                MESSAGING_HANDLER_NAME: handler,
+                MESSAGING_PROCESS_STAGE: stage,
+            },
+            duration_ns / 1_000_000_000,
         )
 
 
@@ -336,6 +547,16 @@ def _get_tracer(tracer_provider: Optional["TracerProvider"] = None) -> "Tracer":
     )
 
 
+def _create_not_sampled_context() -> Context:
+    span_context = SpanContext(
+        trace_id=random.getrandbits(128),  # nosec B311
+        span_id=random.getrandbits(64),  # nosec B311
+        is_remote=False,
+        trace_flags=TraceFlags(TraceFlags.DEFAULT),
+    )
+    return trace.set_span_in_context(NonRecordingSpan(span_context))
+
+
 def _create_span_name(destination: str, action: str) -> str:
     return f"{destination} {action}"
 
@@ -0,0 +1,68 @@
+import random
+from typing import TYPE_CHECKING, Mapping, Optional
+
+if TYPE_CHECKING:
+    from faststream.types import AnyDict
+
+TRACEPARENT_HEADER = "traceparent"
+
+
+class TelemetrySampler:
+    """Head sampling decision made before any span or attribute work.
+
+    Messages with a propagated trace context follow the parent decision if
+    `parent_based` is set. Others are sampled by the destination rule or
+    the default `ratio`.
+    """
+
+    __slots__ = ("ratio", "rules", "parent_based")
+
+    def __init__(
+        self,
+        ratio: float = 1.0,
+        *,
+        rules: Optional[Mapping[str, float]] = None,
+        parent_based: bool = True,
+    ) -> None:
+        rules = dict(rules or {})
+
+        for r in (ratio, *rules.values()):
+            if not 0.0 <= r <= 1.0:
+                raise ValueError(f"Sampling ratio should be in [0, 1] range, got {r}")
+
+        self.ratio = ratio
+        self.rules = rules
+        self.parent_based = parent_based
+
+    def should_sample(
+        self,
+        destination: str,
+        parent_sampled: Optional[bool] = None,
+    ) -> bool:
+        """Decide whether to trace the message.
+
+        Args:
+            destination: the message destination name
+            parent_sampled: the propagated parent decision or `None` if there is no parent
+        """
+        if self.parent_based and parent_sampled is not None:
+            return parent_sampled
+
+        ratio = self.rules.get(destination, self.ratio)
+        return ratio >= 1.0 or (ratio > 0.0 and random.random() < ratio)  # nosec B311
+
+
+def get_parent_sampled(headers: "AnyDict") -> Optional[bool]:
+    """Get the sampled flag from W3C `traceparent` header without context extraction."""
+    if not (traceparent := headers.get(TRACEPARENT_HEADER)):
+        return None
+
+    # version-trace_id-parent_id-flags
+    parts = str(traceparent).split("-")
+    if len(parts) < 4 or len(parts[3]) != 2:
+        return None
+
+    try:
+        return bool(int(parts[3], 16) & 0x01)
+    except ValueError:
+        return None
@@ -1,12 +1,97 @@
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence
 
 from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.metrics_core import (
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    Metric,
+)
+
+if TYPE_CHECKING:
+    from faststream.utils.executor import BaseExecutor
+
+
+class _CollectCallbacks:
+    """Collector without metrics to run callbacks before the registry scrape."""
+
+    __slots__ = ("callbacks",)
+
+    def __init__(self) -> None:
+        self.callbacks: List[Callable[[], None]] = []
+
+    def describe(self) -> Iterable[Metric]:
+        return ()
+
+    def collect(self) -> Iterable[Metric]:
+        for callback in self.callbacks:
+            callback()
+        return ()
+
+
+class _ExecutorsCollector:
+    """Collector to export executors statistics at the registry scrape."""
+
+    __slots__ = ("metrics_prefix", "executors")
+
+    def __init__(self, metrics_prefix: str) -> None:
+        self.metrics_prefix = metrics_prefix
+        # executor -> app name
+        self.executors: Dict[BaseExecutor, str] = {}
+
+    def describe(self) -> Iterable[Metric]:
+        return ()
+
+    def collect(self) -> Iterable[Metric]:
+        if not self.executors:
+            return ()
+
+        prefix = self.metrics_prefix
+        labels = ["app_name", "executor"]
+
+        queued = GaugeMetricFamily(
+            f"{prefix}_executor_queued_calls",
+            "Gauge of calls waiting for a free executor worker",
+            labels=labels,
+        )
+        running = GaugeMetricFamily(
+            f"{prefix}_executor_running_calls",
+            "Gauge of calls running by executor workers",
+            labels=labels,
+        )
+        completed = CounterMetricFamily(
+            f"{prefix}_executor_completed_calls",
+            "Count of calls completed by executor",
+            labels=labels,
+        )
+        wait_time = CounterMetricFamily(
+            f"{prefix}_executor_wait_time_seconds",
+            "Total time calls waited for a free executor worker in seconds",
+            labels=labels,
+        )
+        wait_time_max = GaugeMetricFamily(
+            f"{prefix}_executor_wait_time_max_seconds",
+            "Maximum time a call waited for a free executor worker in seconds",
+            labels=labels,
+        )
+
+        for executor, app_name in self.executors.items():
+            stats = executor.stats()
+            values = [app_name, stats.name]
+            queued.add_metric(values, stats.queued)
+            running.add_metric(values, stats.running)
+            completed.add_metric(values, stats.completed)
+            wait_time.add_metric(values, stats.wait_time_total)
+            wait_time_max.add_metric(values, stats.wait_time_max)
+
+        return (queued, running, completed, wait_time, wait_time_max)
 
 
 class MetricsContainer:
     __slots__ = (
         "_registry",
         "_metrics_prefix",
+        "_collect_callbacks",
+        "_executors",
         "received_messages_total",
         "received_messages_size_bytes",
         "received_processed_messages_duration_seconds",
@@ -16,6 +101,7 @@ class MetricsContainer:
         "published_messages_total",
         "published_messages_duration_seconds",
         "published_messages_exceptions_total",
+        "received_messages_stage_duration_seconds",
     )
 
     DEFAULT_SIZE_BUCKETS = (
@@ -33,16 +119,41 @@ class MetricsContainer:
         float("inf"),
     )
 
+    DEFAULT_STAGE_BUCKETS = (
+        0.000_001,
+        0.000_005,
+        0.000_01,
+        0.000_05,
+        0.000_1,
+        0.000_5,
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+        0.5,
+        1.0,
+        float("inf"),
+    )
+
     def __init__(
         self,
         registry: "CollectorRegistry",
         *,
         metrics_prefix: str = "faststream",
         received_messages_size_buckets: Optional[Sequence[float]] = None,
+        stage_timings: bool = False,
     ):
         self._registry = registry
         self._metrics_prefix = metrics_prefix
 
+        # registered before metrics to be collected first
+        self._collect_callbacks = _CollectCallbacks()
+        registry.register(self._collect_callbacks)
+
+        self._executors = _ExecutorsCollector(metrics_prefix)
+        registry.register(self._executors)
+
         self.received_messages_total = Counter(
             name=f"{metrics_prefix}_received_messages_total",
             documentation="Count of received messages by broker and handler",
@@ -61,6 +172,8 @@ class MetricsContainer:
             documentation="Gauge of received messages in process by broker and handler",
             labelnames=["app_name", "broker", "handler"],
             registry=registry,
+            # sum of alive workers values in multiprocess mode
+            multiprocess_mode="livesum",
         )
         self.received_processed_messages_total = Counter(
             name=f"{metrics_prefix}_received_processed_messages_total",
@@ -98,3 +211,21 @@ class MetricsContainer:
             labelnames=["app_name", "broker", "destination", "exception_type"],
             registry=registry,
         )
+
+        self.received_messages_stage_duration_seconds: Optional[Histogram] = None
+        if stage_timings:
+            self.received_messages_stage_duration_seconds = Histogram(
+                name=f"{metrics_prefix}_received_messages_stage_duration_seconds",
+                documentation="Histogram of received messages processing stages duration in seconds by broker, handler and stage",
+                labelnames=["app_name", "broker", "handler", "stage"],
+                registry=registry,
+                buckets=self.DEFAULT_STAGE_BUCKETS,
+            )
+
+    def add_collect_callback(self, callback: Callable[[], None]) -> None:
+        """Call the function at every registry scrape before metrics collecting."""
+        self._collect_callbacks.callbacks.append(callback)
+
+    def add_executor(self, executor: "BaseExecutor", app_name: str) -> None:
+        """Export the executor statistics at every registry scrape."""
+        self._executors.executors.setdefault(executor, app_name)
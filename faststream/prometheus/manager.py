@@ -1,20 +1,79 @@
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
 from faststream.prometheus.container import MetricsContainer
 from faststream.prometheus.types import ProcessingStatus, PublishingStatus
 
+if TYPE_CHECKING:
+    from prometheus_client.metrics import MetricWrapperBase
+
+    from faststream.utils.executor import BaseExecutor
+
 
 class MetricsManager:
-    __slots__ = ("_container", "_app_name")
+    """Metrics updates facade.
 
-    def __init__(self, container: MetricsContainer, *, app_name: str = "faststream"):
+    Label children are resolved once per labels combination. With `flush_on_scrape`
+    counters and gauges are accumulated in local totals without any locks and
+    flushed to `prometheus_client` metrics at the registry scrape.
+    """
+
+    __slots__ = ("_container", "_app_name", "_children", "_totals", "_flushed")
+
+    def __init__(
+        self,
+        container: MetricsContainer,
+        *,
+        app_name: str = "faststream",
+        flush_on_scrape: bool = False,
+    ):
         self._container = container
         self._app_name = app_name
 
+        self._children: Dict[Tuple[Any, ...], Any] = {}
+
+        # child -> total amount, written by the event loop thread only
+        self._totals: Optional[Dict[Any, float]] = None
+        # child -> amount already passed to the metric, used by scrape thread only
+        self._flushed: Dict[Any, float] = {}
+
+        if flush_on_scrape:
+            self._totals = {}
+            container.add_collect_callback(self.flush)
+
+    def flush(self) -> None:
+        """Pass accumulated totals to metrics."""
+        if self._totals is None:
+            return
+
+        # dict copy is atomic, so the scrape thread does not race with updates
+        for child, total in self._totals.copy().items():
+            if delta := total - self._flushed.get(child, 0):
+                child.inc(delta)
+                self._flushed[child] = total
+
+    def _child(self, metric: "MetricWrapperBase", *labels: str) -> Any:
+        key = (metric, *labels)
+
+        if (child := self._children.get(key)) is None:
+            child = self._children[key] = metric.labels(self._app_name, *labels)
+
+        return child
+
+    def _inc(self, metric: "MetricWrapperBase", amount: float, *labels: str) -> None:
+        child = self._child(metric, *labels)
+
+        if (totals := self._totals) is None:
+            child.inc(amount)
+        else:
+            totals[child] = totals.get(child, 0) + amount
+
     def add_received_message(self, broker: str, handler: str, amount: int = 1) -> None:
-        self._container.received_messages_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-        ).inc(amount)
+        self._inc(
+            self._container.received_messages_total,
+            amount,
+            broker,
+            handler,
+        )
 
     def observe_received_messages_size(
         self,
@@ -22,10 +81,10 @@ class MetricsManager:
         handler: str,
         size: int,
     ) -> None:
-        self._container.received_messages_size_bytes.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
+        self._child(
+            self._container.received_messages_size_bytes,
+            broker,
+            handler,
         ).observe(size)
 
     def add_received_message_in_process(
@@ -34,11 +93,12 @@ class MetricsManager:
         handler: str,
         amount: int = 1,
     ) -> None:
-        self._container.received_messages_in_process.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-        ).inc(amount)
+        self._inc(
+            self._container.received_messages_in_process,
+            amount,
+            broker,
+            handler,
+        )
 
     def remove_received_message_in_process(
         self,
@@ -46,11 +106,12 @@ class MetricsManager:
         handler: str,
         amount: int = 1,
     ) -> None:
-        self._container.received_messages_in_process.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-        ).dec(amount)
+        self._inc(
+            self._container.received_messages_in_process,
+            -amount,
+            broker,
+            handler,
+        )
 
     def add_received_processed_message(
         self,
@@ -59,12 +120,13 @@ class MetricsManager:
         status: ProcessingStatus,
         amount: int = 1,
     ) -> None:
-        self._container.received_processed_messages_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-            status=status.value,
-        ).inc(amount)
+        self._inc(
+            self._container.received_processed_messages_total,
+            amount,
+            broker,
+            handler,
+            status.value,
+        )
 
     def observe_received_processed_message_duration(
         self,
@@ -72,10 +134,10 @@ class MetricsManager:
         broker: str,
         handler: str,
     ) -> None:
-        self._container.received_processed_messages_duration_seconds.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
+        self._child(
+            self._container.received_processed_messages_duration_seconds,
+            broker,
+            handler,
         ).observe(duration)
 
     def add_received_processed_message_exception(
@@ -84,12 +146,13 @@ class MetricsManager:
         handler: str,
         exception_type: str,
     ) -> None:
-        self._container.received_processed_messages_exceptions_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-            exception_type=exception_type,
-        ).inc()
+        self._inc(
+            self._container.received_processed_messages_exceptions_total,
+            1,
+            broker,
+            handler,
+            exception_type,
+        )
 
     def add_published_message(
         self,
@@ -98,12 +161,13 @@ class MetricsManager:
         status: PublishingStatus,
         amount: int = 1,
     ) -> None:
-        self._container.published_messages_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            destination=destination,
-            status=status.value,
-        ).inc(amount)
+        self._inc(
+            self._container.published_messages_total,
+            amount,
+            broker,
+            destination,
+            status.value,
+        )
 
     def observe_published_message_duration(
         self,
@@ -111,10 +175,10 @@ class MetricsManager:
         broker: str,
         destination: str,
     ) -> None:
-        self._container.published_messages_duration_seconds.labels(
-            app_name=self._app_name,
-            broker=broker,
-            destination=destination,
+        self._child(
+            self._container.published_messages_duration_seconds,
+            broker,
+            destination,
         ).observe(duration)
 
     def add_published_message_exception(
@@ -123,9 +187,27 @@ class MetricsManager:
         destination: str,
         exception_type: str,
     ) -> None:
-        self._container.published_messages_exceptions_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            destination=destination,
-            exception_type=exception_type,
-        ).inc()
+        self._inc(
+            self._container.published_messages_exceptions_total,
+            1,
+            broker,
+            destination,
+            exception_type,
+        )
+
+    def observe_received_message_stage_duration(
+        self,
+        duration: float,
+        broker: str,
+        handler: str,
+        stage: str,
+    ) -> None:
+        if (
+            histogram := self._container.received_messages_stage_duration_seconds
+        ) is None:
+            return
+
+        self._child(histogram, broker, handler, stage).observe(duration)
+
+    def add_executor(self, executor: "BaseExecutor") -> None:
+        self._container.add_executor(executor, app_name=self._app_name)
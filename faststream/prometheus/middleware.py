@@ -1,7 +1,9 @@
+import os
 import time
 from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
 
-from faststream import BaseMiddleware
+from faststream.broker.middlewares.base import StatelessMiddleware
+from faststream.exceptions import SetupError
 from faststream.prometheus.consts import (
     PROCESSING_STATUS_BY_ACK_STATUS,
     PROCESSING_STATUS_BY_HANDLER_EXCEPTION_MAP,
@@ -16,33 +18,42 @@ if TYPE_CHECKING:
     from prometheus_client import CollectorRegistry
 
     from faststream.broker.message import StreamMessage
+    from faststream.broker.subscriber.timing import ProcessingStage, StageObserver
     from faststream.types import AsyncFunc, AsyncFuncAny
+    from faststream.utils.executor import BaseExecutor
 
 
-class PrometheusMiddleware(BaseMiddleware):
+class PrometheusMiddleware(StatelessMiddleware):
+    """Metrics middleware shared between all messages.
+
+    The consumed message settings provider is selected by its raw message
+    inside `consume_scope`, so the broker creates no middleware per message.
+    """
+
     def __init__(
         self,
-        msg: Optional[Any] = None,
         *,
         settings_provider_factory: Callable[
             [Any], Optional[MetricsSettingsProvider[Any]]
         ],
         metrics_manager: MetricsManager,
     ) -> None:
+        super().__init__()
         self._metrics_manager = metrics_manager
-        self._settings_provider = settings_provider_factory(msg)
-        super().__init__(msg)
+        self._settings_provider_factory = settings_provider_factory
+        self._publish_settings_provider = settings_provider_factory(None)
 
     async def consume_scope(
         self,
         call_next: "AsyncFuncAny",
         msg: "StreamMessage[Any]",
     ) -> Any:
-        if self._settings_provider is None:
+        settings_provider = self._settings_provider_factory(msg.raw_message)
+        if settings_provider is None:
             return await call_next(msg)
 
-        messaging_system = self._settings_provider.messaging_system
-        consume_attrs = self._settings_provider.get_consume_attrs_from_message(msg)
+        messaging_system = settings_provider.messaging_system
+        consume_attrs = settings_provider.get_consume_attrs_from_message(msg)
         destination_name = consume_attrs["destination_name"]
 
         self._metrics_manager.add_received_message(
@@ -117,13 +128,13 @@ class PrometheusMiddleware(BaseMiddleware):
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        if self._settings_provider is None:
+        if (settings_provider := self._publish_settings_provider) is None:
             return await call_next(msg, *args, **kwargs)
 
-        destination_name = (
-            self._settings_provider.get_publish_destination_name_from_kwargs(kwargs)
+        destination_name = settings_provider.get_publish_destination_name_from_kwargs(
+            kwargs
         )
-        messaging_system = self._settings_provider.messaging_system
+        messaging_system = settings_provider.messaging_system
 
         err: Optional[Exception] = None
         start_time = time.perf_counter()
@@ -166,8 +177,8 @@ class PrometheusMiddleware(BaseMiddleware):
         return result
 
 
-class BasePrometheusMiddleware:
-    __slots__ = ("_metrics_container", "_metrics_manager", "_settings_provider_factory")
+class BasePrometheusMiddleware(PrometheusMiddleware):
+    observe_stage: Optional["StageObserver"]
 
     def __init__(
         self,
@@ -179,24 +190,52 @@ class BasePrometheusMiddleware:
         app_name: str = EMPTY,
         metrics_prefix: str = "faststream",
         received_messages_size_buckets: Optional[Sequence[float]] = None,
+        stage_timings: bool = False,
+        flush_on_scrape: bool = False,
     ):
         if app_name is EMPTY:
             app_name = metrics_prefix
 
-        self._settings_provider_factory = settings_provider_factory
+        if flush_on_scrape and os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            raise SetupError(
+                "`flush_on_scrape` can't be used in prometheus_client multiprocess mode: "
+                "workers metrics are scraped from the shared directory."
+            )
+
         self._metrics_container = MetricsContainer(
             registry,
             metrics_prefix=metrics_prefix,
             received_messages_size_buckets=received_messages_size_buckets,
+            stage_timings=stage_timings,
         )
-        self._metrics_manager = MetricsManager(
-            self._metrics_container,
-            app_name=app_name,
+        super().__init__(
+            settings_provider_factory=settings_provider_factory,
+            metrics_manager=MetricsManager(
+                self._metrics_container,
+                app_name=app_name,
+                flush_on_scrape=flush_on_scrape,
+            ),
         )
 
-    def __call__(self, msg: Optional[Any]) -> BaseMiddleware:
-        return PrometheusMiddleware(
-            msg=msg,
-            metrics_manager=self._metrics_manager,
-            settings_provider_factory=self._settings_provider_factory,
+        provider = self._publish_settings_provider
+        self._messaging_system = provider.messaging_system if provider else ""
+
+        # subscribers time processing stages only if the callback is set
+        self.observe_stage = self._observe_stage if stage_timings else None
+
+    def observe_executor(self, executor: "BaseExecutor") -> None:
+        """Export statistics of the executor used by a subscriber."""
+        self._metrics_manager.add_executor(executor)
+
+    def _observe_stage(
+        self,
+        handler: str,
+        stage: "ProcessingStage",
+        duration_ns: int,
+    ) -> None:
+        self._metrics_manager.observe_received_message_stage_duration(
+            duration=duration_ns / 1_000_000_000,
+            broker=self._messaging_system,
+            handler=handler,
+            stage=stage,
         )
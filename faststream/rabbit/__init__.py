@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from faststream.rabbit.annotations import RabbitMessage
 from faststream.rabbit.broker import RabbitBroker
 from faststream.rabbit.response import RabbitResponse
@@ -8,8 +10,11 @@ from faststream.rabbit.schemas import (
     RabbitQueue,
     ReplyConfig,
 )
-from faststream.rabbit.testing import TestRabbitBroker
-from faststream.testing.app import TestApp
+from faststream.utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from faststream.rabbit.testing import TestRabbitBroker
+    from faststream.testing.app import TestApp
 
 __all__ = (
     "RabbitBroker",
@@ -26,3 +31,11 @@ __all__ = (
     # Annotations
     "RabbitMessage",
 )
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "TestRabbitBroker": "faststream.rabbit.testing",
+        "TestApp": "faststream.testing.app",
+    },
+)
@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -17,6 +18,7 @@ from typing_extensions import Annotated, Doc, deprecated, override
 
 from faststream.__about__ import SERVICE_NAME
 from faststream.broker.message import gen_cor_id
+from faststream.constants import DEFAULT_STARTUP_CONCURRENCY
 from faststream.exceptions import NOT_CONNECTED_YET
 from faststream.rabbit.broker.logging import RabbitLoggingBroker
 from faststream.rabbit.broker.registrator import RabbitRegistrator
@@ -57,6 +59,7 @@ if TYPE_CHECKING:
     from faststream.rabbit.types import AioPikaSendableMessage
     from faststream.security import BaseSecurity
     from faststream.types import AnyDict, Decorator, LoggerProto
+    from faststream.utils.executor import BaseExecutor
 
 
 class RabbitBroker(
@@ -152,6 +155,20 @@ class RabbitBroker(
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down."
             ),
         ] = None,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handlers (and parsers and decoders for `ThreadExecutor`) of all broker subscribers. "
+                "Anyio default threadpool is used if not set."
+            ),
+        ] = None,
+        startup_concurrency: Annotated[
+            int,
+            Doc(
+                "Max number of subscribers and declarations started concurrently. "
+                "Use `1` to start them one by one."
+            ),
+        ] = DEFAULT_STARTUP_CONCURRENCY,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -261,6 +278,8 @@ class RabbitBroker(
             on_return_raises=on_return_raises,
             # Basic args
             graceful_timeout=graceful_timeout,
+            executor=executor,
+            startup_concurrency=startup_concurrency,
             dependencies=dependencies,
             decoder=decoder,
             parser=parser,
@@ -508,16 +527,13 @@ class RabbitBroker(
 
         assert self.declarer, NOT_CONNECTED_YET  # nosec B101
 
-        for publisher in self._publishers.values():
-            if publisher.exchange is not None:
-                await self.declare_exchange(publisher.exchange)
+        await self._declare(
+            partial(self.declare_exchange, publisher.exchange)
+            for publisher in self._publishers.values()
+            if publisher.exchange is not None
+        )
 
-        for subscriber in self._subscribers.values():
-            self._log(
-                f"`{subscriber.call_name}` waiting for messages",
-                extra=subscriber.get_log_context(None),
-            )
-            await subscriber.start()
+        await self._start_subscribers()
 
     @override
     async def publish(  # type: ignore[override]
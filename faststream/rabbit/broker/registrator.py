@@ -18,6 +18,9 @@ if TYPE_CHECKING:
     from aio_pika.abc import DateType, HeadersType, TimeoutType
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         CustomCallable,
         Filter,
@@ -27,6 +30,7 @@ if TYPE_CHECKING:
     from faststream.rabbit.message import RabbitMessage
     from faststream.rabbit.schemas.reply import ReplyConfig
     from faststream.types import AnyDict
+    from faststream.utils.executor import BaseExecutor
 
 
 class RabbitRegistrator(ABCBroker["IncomingMessage"]):
@@ -96,8 +100,12 @@ class RabbitRegistrator(ABCBroker["IncomingMessage"]):
             ),
         ] = default_filter,
         retry: Annotated[
-            Union[bool, int],
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -109,6 +117,34 @@ class RabbitRegistrator(ABCBroker["IncomingMessage"]):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -154,6 +190,10 @@ class RabbitRegistrator(ABCBroker["IncomingMessage"]):
             decoder_=decoder or self._decoder,
             dependencies_=dependencies,
             middlewares_=middlewares,
+            executor_=executor,
+            micro_batch_=micro_batch,
+            dedup_=dedup,
+            log_sampling_=log_sampling,
         )
 
     @override
@@ -212,6 +252,18 @@ class RabbitRegistrator(ABCBroker["IncomingMessage"]):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -298,6 +350,8 @@ class RabbitRegistrator(ABCBroker["IncomingMessage"]):
                     # Specific
                     broker_middlewares=self._middlewares,
                     middlewares=middlewares,
+                    linger_ms=linger_ms,
+                    max_batch=max_batch,
                     # AsyncAPI
                     title_=title,
                     description_=description,
@@ -45,6 +45,9 @@ if TYPE_CHECKING:
     from yarl import URL
 
     from faststream.asyncapi import schema as asyncapi
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -56,6 +59,7 @@ if TYPE_CHECKING:
     from faststream.rabbit.schemas.reply import ReplyConfig
     from faststream.security import BaseSecurity
     from faststream.types import AnyDict, LoggerProto
+    from faststream.utils.executor import BaseExecutor
 
 
 class RabbitRouter(StreamRouter["IncomingMessage"]):
@@ -538,8 +542,12 @@ class RabbitRouter(StreamRouter["IncomingMessage"]):
             ),
         ] = default_filter,
         retry: Annotated[
-            Union[bool, int],
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -551,6 +559,34 @@ class RabbitRouter(StreamRouter["IncomingMessage"]):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -706,6 +742,10 @@ class RabbitRouter(StreamRouter["IncomingMessage"]):
                 retry=retry,
                 no_ack=no_ack,
                 no_reply=no_reply,
+                executor=executor,
+                micro_batch=micro_batch,
+                dedup=dedup,
+                log_sampling=log_sampling,
                 title=title,
                 description=description,
                 include_in_schema=include_in_schema,
@@ -776,6 +816,18 @@ class RabbitRouter(StreamRouter["IncomingMessage"]):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -840,6 +892,8 @@ class RabbitRouter(StreamRouter["IncomingMessage"]):
             reply_to=reply_to,
             priority=priority,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             title=title,
             description=description,
             schema=schema,
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from aio_pika import IncomingMessage
 
 from faststream.broker.message import StreamMessage
@@ -10,6 +12,13 @@ class RabbitMessage(StreamMessage[IncomingMessage]):
     or nack-ing RabbitMQ messages.
     """
 
+    @property
+    def delivery_count(self) -> Optional[int]:
+        """Number of previous message deliveries. Set by quorum queues only."""
+        if (count := self.raw_message.headers.get("x-delivery-count")) is None:
+            return None
+        return int(count)  # type: ignore[arg-type]
+
     async def ack(
         self,
         multiple: bool = False,
@@ -4,6 +4,7 @@ from opentelemetry.metrics import Meter, MeterProvider
 from opentelemetry.trace import TracerProvider
 
 from faststream.opentelemetry.middleware import TelemetryMiddleware
+from faststream.opentelemetry.sampling import TelemetrySampler
 from faststream.rabbit.opentelemetry.provider import RabbitTelemetrySettingsProvider
 
 
@@ -14,6 +15,8 @@ class RabbitTelemetryMiddleware(TelemetryMiddleware):
         tracer_provider: Optional[TracerProvider] = None,
         meter_provider: Optional[MeterProvider] = None,
         meter: Optional[Meter] = None,
+        stage_timings: bool = False,
+        sampler: Optional[TelemetrySampler] = None,
     ) -> None:
         super().__init__(
             settings_provider_factory=lambda _: RabbitTelemetrySettingsProvider(),
@@ -21,4 +24,6 @@ class RabbitTelemetryMiddleware(TelemetryMiddleware):
             meter_provider=meter_provider,
             meter=meter,
             include_messages_counters=False,
+            stage_timings=stage_timings,
+            sampler=sampler,
         )
@@ -8,6 +8,7 @@ from faststream.broker.message import (
     decode_message,
     encode_message,
     gen_cor_id,
+    lazy_value,
 )
 from faststream.rabbit.message import RabbitMessage
 
@@ -44,8 +45,8 @@ class AioPikaParser:
             headers=message.headers,
             reply_to=message.reply_to or "",
             content_type=message.content_type,
-            message_id=message.message_id or gen_cor_id(),
-            correlation_id=message.correlation_id or gen_cor_id(),
+            message_id=message.message_id or lazy_value(gen_cor_id),
+            correlation_id=message.correlation_id or lazy_value(gen_cor_id),
             path=path,
             raw_message=message,
         )
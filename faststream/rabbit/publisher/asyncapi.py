@@ -2,15 +2,6 @@ from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 from typing_extensions import override
 
-from faststream.asyncapi.schema import (
-    Channel,
-    ChannelBinding,
-    CorrelationId,
-    Message,
-    Operation,
-    OperationBinding,
-)
-from faststream.asyncapi.schema.bindings import amqp
 from faststream.asyncapi.utils import resolve_payloads
 from faststream.rabbit.publisher.usecase import LogicPublisher, PublishKwargs
 from faststream.rabbit.utils import is_routing_exchange
@@ -18,6 +9,7 @@ from faststream.rabbit.utils import is_routing_exchange
 if TYPE_CHECKING:
     from aio_pika import IncomingMessage
 
+    from faststream.asyncapi.schema import Channel
     from faststream.broker.types import BrokerMiddleware, PublisherMiddleware
     from faststream.rabbit.schemas import RabbitExchange, RabbitQueue
 
@@ -43,7 +35,17 @@ class AsyncAPIPublisher(LogicPublisher):
 
         return f"{routing}:{getattr(self.exchange, 'name', None) or '_'}:Publisher"
 
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
+        from faststream.asyncapi.schema import (
+            Channel,
+            ChannelBinding,
+            CorrelationId,
+            Message,
+            Operation,
+            OperationBinding,
+        )
+        from faststream.asyncapi.schema.bindings import amqp
+
         payloads = self.get_payloads()
 
         return {
@@ -115,6 +117,8 @@ class AsyncAPIPublisher(LogicPublisher):
         # Publisher args
         broker_middlewares: Iterable["BrokerMiddleware[IncomingMessage]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -129,6 +133,8 @@ class AsyncAPIPublisher(LogicPublisher):
             # Publisher args
             broker_middlewares=broker_middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI args
             schema_=schema_,
             title_=title_,
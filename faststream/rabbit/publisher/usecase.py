@@ -128,6 +128,8 @@ class LogicPublisher(
         # Publisher args
         broker_middlewares: Iterable["BrokerMiddleware[IncomingMessage]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -137,6 +139,8 @@ class LogicPublisher(
         super().__init__(
             broker_middlewares=broker_middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI args
             schema_=schema_,
             title_=title_,
@@ -274,7 +278,7 @@ class LogicPublisher(
             **publish_kwargs,
         }
 
-        call: AsyncFunc = self._producer.publish
+        call: AsyncFunc = self._get_publish_call(rpc)
 
         for m in chain(
             (
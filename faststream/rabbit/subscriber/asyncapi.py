@@ -1,18 +1,12 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-from faststream.asyncapi.schema import (
-    Channel,
-    ChannelBinding,
-    CorrelationId,
-    Message,
-    Operation,
-    OperationBinding,
-)
-from faststream.asyncapi.schema.bindings import amqp
 from faststream.asyncapi.utils import resolve_payloads
 from faststream.rabbit.subscriber.usecase import LogicSubscriber
 from faststream.rabbit.utils import is_routing_exchange
 
+if TYPE_CHECKING:
+    from faststream.asyncapi.schema import Channel
+
 
 class AsyncAPISubscriber(LogicSubscriber):
     """AsyncAPI-compatible Rabbit Subscriber class."""
@@ -20,7 +14,17 @@ class AsyncAPISubscriber(LogicSubscriber):
     def get_name(self) -> str:
         return f"{self.queue.name}:{getattr(self.exchange, 'name', None) or '_'}:{self.call_name}"
 
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
+        from faststream.asyncapi.schema import (
+            Channel,
+            ChannelBinding,
+            CorrelationId,
+            Message,
+            Operation,
+            OperationBinding,
+        )
+        from faststream.asyncapi.schema.bindings import amqp
+
         payloads = self.get_payloads()
 
         return {
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from aio_pika import IncomingMessage
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.types import BrokerMiddleware
     from faststream.rabbit.schemas import RabbitExchange, RabbitQueue, ReplyConfig
     from faststream.types import AnyDict
@@ -21,7 +22,7 @@ def create_subscriber(
     # Subscriber args
     no_ack: bool,
     no_reply: bool,
-    retry: Union[bool, int],
+    retry: Union[bool, int, "BaseWatcher"],
     broker_dependencies: Iterable["Depends"],
     broker_middlewares: Iterable["BrokerMiddleware[IncomingMessage]"],
     # AsyncAPI args
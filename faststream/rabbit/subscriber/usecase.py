@@ -7,18 +7,21 @@ from typing import (
     Optional,
     Sequence,
     Union,
+    cast,
 )
 
 import anyio
+from aio_pika import DeliveryMode
 from typing_extensions import override
 
+from faststream.broker.acknowledgement_watcher import RETRIES_HEADER, BaseWatcher
 from faststream.broker.publisher.fake import FakePublisher
 from faststream.broker.subscriber.usecase import SubscriberUsecase
 from faststream.broker.utils import process_msg
 from faststream.exceptions import SetupError
 from faststream.rabbit.helpers.declarer import RabbitDeclarer
 from faststream.rabbit.parser import AioPikaParser
-from faststream.rabbit.schemas import BaseRMQInformation
+from faststream.rabbit.schemas import BaseRMQInformation, RabbitQueue
 
 if TYPE_CHECKING:
     from aio_pika import IncomingMessage, RobustQueue
@@ -31,10 +34,10 @@ if TYPE_CHECKING:
     from faststream.rabbit.publisher.producer import AioPikaFastProducer
     from faststream.rabbit.schemas import (
         RabbitExchange,
-        RabbitQueue,
         ReplyConfig,
     )
     from faststream.types import AnyDict, Decorator, LoggerProto
+    from faststream.utils.executor import BaseExecutor
 
 
 class LogicSubscriber(
@@ -48,6 +51,7 @@ class LogicSubscriber(
 
     _consumer_tag: Optional[str]
     _queue_obj: Optional["RobustQueue"]
+    _retry_queues: Dict[int, "RabbitQueue"]
     _producer: Optional["AioPikaFastProducer"]
 
     def __init__(
@@ -60,7 +64,7 @@ class LogicSubscriber(
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: Union[bool, int],
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[IncomingMessage]"],
         # AsyncAPI args
@@ -90,6 +94,7 @@ class LogicSubscriber(
 
         self._consumer_tag = None
         self._queue_obj = None
+        self._retry_queues = {}
 
         # BaseRMQInformation
         self.queue = queue
@@ -114,6 +119,7 @@ class LogicSubscriber(
         # broker options
         broker_parser: Optional["CustomCallable"],
         broker_decoder: Optional["CustomCallable"],
+        broker_executor: Optional["BaseExecutor"],
         # dependant args
         apply_types: bool,
         is_validate: bool,
@@ -123,6 +129,7 @@ class LogicSubscriber(
         self.app_id = app_id
         self.virtual_host = virtual_host
         self.declarer = declarer
+        self._retry_queues = {}
 
         super().setup(
             logger=logger,
@@ -131,6 +138,7 @@ class LogicSubscriber(
             extra_context=extra_context,
             broker_parser=broker_parser,
             broker_decoder=broker_decoder,
+            broker_executor=broker_executor,
             apply_types=apply_types,
             is_validate=is_validate,
             _get_dependant=_get_dependant,
@@ -180,6 +188,13 @@ class LogicSubscriber(
 
             self._queue_obj = None
 
+    async def _stop_fetching(self) -> None:
+        if self._queue_obj is not None and self._consumer_tag is not None:
+            # prefetched unacknowledged messages are requeued at the channel close
+            if not self._queue_obj.channel.is_closed:
+                await self._queue_obj.cancel(self._consumer_tag)
+            self._consumer_tag = None
+
     @override
     async def get_one(
         self,
@@ -231,6 +246,54 @@ class LogicSubscriber(
             ),
         )
 
+    async def _retry_later(
+        self,
+        message: "StreamMessage[Any]",
+        delay: float,
+        attempts: int,
+    ) -> None:
+        if self._producer is None or self.declarer is None:
+            await super()._retry_later(message, delay, attempts)
+            return
+
+        # a queue per attempt keeps the same delay for all its messages,
+        # the queues number is bounded by the retry policy max tries
+        n = attempts
+        if isinstance(self._retry, BaseWatcher):
+            n = min(n, max(self._retry.max_tries, 1))
+
+        if (retry_queue := self._retry_queues.get(n)) is None:
+            # expired messages are dead-lettered back to the subscriber queue
+            retry_queue = RabbitQueue(
+                f"{self.queue.name}.retry.{n}",
+                durable=self.queue.durable,
+                arguments={
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self.queue.name,
+                },
+            )
+            await self.declarer.declare_queue(retry_queue)
+            self._retry_queues[n] = retry_queue
+
+        raw_message = cast("IncomingMessage", message.raw_message)
+        await self._producer.publish(
+            raw_message.body,
+            routing_key=retry_queue.name,
+            persist=raw_message.delivery_mode == DeliveryMode.PERSISTENT,
+            headers={**raw_message.headers, RETRIES_HEADER: attempts},
+            content_type=raw_message.content_type,
+            content_encoding=raw_message.content_encoding,
+            priority=raw_message.priority,
+            correlation_id=raw_message.correlation_id or message.correlation_id,
+            reply_to=raw_message.reply_to,
+            message_id=raw_message.message_id,
+            timestamp=raw_message.timestamp,
+            message_type=raw_message.type,
+            app_id=raw_message.app_id,
+            expiration=delay,
+        )
+        await message.ack()
+
     def __hash__(self) -> int:
         return self.get_routing_hash(self.queue, self.exchange)
 
@@ -314,7 +314,7 @@ class FakeProducer(AioPikaFastProducer):
             routing_key=msg.routing_key,
             message=result.body,
             headers=result.headers,
-            correlation_id=result.correlation_id,
+            correlation_id=result.correlation_id or msg.correlation_id,
         )
 
 
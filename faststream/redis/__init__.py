@@ -1,10 +1,16 @@
+from typing import TYPE_CHECKING
+
 from faststream.redis.annotations import Redis, RedisMessage
 from faststream.redis.broker.broker import RedisBroker
 from faststream.redis.response import RedisResponse
 from faststream.redis.router import RedisPublisher, RedisRoute, RedisRouter
 from faststream.redis.schemas import ListSub, PubSub, StreamSub
-from faststream.redis.testing import TestRedisBroker
-from faststream.testing.app import TestApp
+from faststream.redis.subscriber.dedup import RedisDedupStore
+from faststream.utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from faststream.redis.testing import TestRedisBroker
+    from faststream.testing.app import TestApp
 
 __all__ = (
     "Redis",
@@ -14,9 +20,18 @@ __all__ = (
     "RedisRouter",
     "RedisPublisher",
     "RedisResponse",
+    "RedisDedupStore",
     "TestRedisBroker",
     "TestApp",
     "PubSub",
     "ListSub",
     "StreamSub",
 )
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "TestRedisBroker": "faststream.redis.testing",
+        "TestApp": "faststream.testing.app",
+    },
+)
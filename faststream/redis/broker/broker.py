@@ -27,6 +27,7 @@ from typing_extensions import Annotated, Doc, TypeAlias, deprecated, override
 
 from faststream.__about__ import __version__
 from faststream.broker.message import gen_cor_id
+from faststream.constants import DEFAULT_STARTUP_CONCURRENCY
 from faststream.exceptions import NOT_CONNECTED_YET
 from faststream.redis.broker.logging import RedisLoggingBroker
 from faststream.redis.broker.registrator import RedisRegistrator
@@ -56,6 +57,7 @@ if TYPE_CHECKING:
         LoggerProto,
         SendableMessage,
     )
+    from faststream.utils.executor import BaseExecutor
 
     class RedisInitKwargs(TypedDict, total=False):
         host: Optional[str]
@@ -121,6 +123,20 @@ class RedisBroker(
                 "Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down."
             ),
         ] = 15.0,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handlers (and parsers and decoders for `ThreadExecutor`) of all broker subscribers. "
+                "Anyio default threadpool is used if not set."
+            ),
+        ] = None,
+        startup_concurrency: Annotated[
+            int,
+            Doc(
+                "Max number of subscribers and declarations started concurrently. "
+                "Use `1` to start them one by one."
+            ),
+        ] = DEFAULT_STARTUP_CONCURRENCY,
         decoder: Annotated[
             Optional["CustomCallable"],
             Doc("Custom decoder object."),
@@ -228,6 +244,8 @@ class RedisBroker(
             # Basic args
             # broker base
             graceful_timeout=graceful_timeout,
+            executor=executor,
+            startup_concurrency=startup_concurrency,
             dependencies=dependencies,
             decoder=decoder,
             parser=parser,
@@ -349,12 +367,7 @@ class RedisBroker(
     async def start(self) -> None:
         await super().start()
 
-        for handler in self._subscribers.values():
-            self._log(
-                f"`{handler.call_name}` waiting for messages",
-                extra=handler.get_log_context(None),
-            )
-            await handler.start()
+        await self._start_subscribers()
 
     @property
     def _subscriber_setup_extra(self) -> "AnyDict":
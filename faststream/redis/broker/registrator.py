@@ -1,17 +1,32 @@
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Union,
+    cast,
+)
 
 from typing_extensions import Annotated, Doc, deprecated, override
 
 from faststream.broker.core.abc import ABCBroker
 from faststream.broker.utils import default_filter
+from faststream.exceptions import MICRO_BATCH_WITH_BATCH
 from faststream.redis.message import UnifyRedisDict
 from faststream.redis.publisher.asyncapi import AsyncAPIPublisher
+from faststream.redis.schemas import ListSub, StreamSub
 from faststream.redis.subscriber.asyncapi import AsyncAPISubscriber
 from faststream.redis.subscriber.factory import SubsciberType, create_subscriber
 
 if TYPE_CHECKING:
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         CustomCallable,
         Filter,
@@ -20,8 +35,9 @@ if TYPE_CHECKING:
     )
     from faststream.redis.message import UnifyRedisMessage
     from faststream.redis.publisher.asyncapi import PublisherType
-    from faststream.redis.schemas import ListSub, PubSub, StreamSub
+    from faststream.redis.schemas import PubSub
     from faststream.types import AnyDict
+    from faststream.utils.executor import BaseExecutor
 
 
 class RedisRegistrator(ABCBroker[UnifyRedisDict]):
@@ -76,9 +92,24 @@ class RedisRegistrator(ABCBroker[UnifyRedisDict]):
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        max_workers: Annotated[
+            int,
+            Doc("Number of workers to process messages concurrently."),
+        ] = 1,
+        ordering_key: Annotated[
+            Optional[Callable[["UnifyRedisDict"], Hashable]],
+            Doc(
+                "Extract a key from the raw message to process messages with the same key "
+                "in order. Messages are routed to `max_workers` serial lanes by the key hash."
+            ),
+        ] = None,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -90,6 +121,34 @@ class RedisRegistrator(ABCBroker[UnifyRedisDict]):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -107,6 +166,12 @@ class RedisRegistrator(ABCBroker[UnifyRedisDict]):
             Doc("Whetever to include operation in AsyncAPI schema or not."),
         ] = True,
     ) -> AsyncAPISubscriber:
+        if micro_batch is not None and any(
+            sub is not None and sub.batch
+            for sub in (ListSub.validate(list), StreamSub.validate(stream))
+        ):
+            raise MICRO_BATCH_WITH_BATCH
+
         subscriber = cast(
             AsyncAPISubscriber,
             super().subscriber(
@@ -114,6 +179,8 @@ class RedisRegistrator(ABCBroker[UnifyRedisDict]):
                     channel=channel,
                     list=list,
                     stream=stream,
+                    max_workers=max_workers,
+                    ordering_key=ordering_key,
                     # subscriber args
                     no_ack=no_ack,
                     no_reply=no_reply,
@@ -134,6 +201,10 @@ class RedisRegistrator(ABCBroker[UnifyRedisDict]):
             decoder_=decoder or self._decoder,
             dependencies_=dependencies,
             middlewares_=middlewares,
+            executor_=executor,
+            micro_batch_=micro_batch,
+            dedup_=dedup,
+            log_sampling_=log_sampling,
         )
 
     @override
@@ -167,6 +238,18 @@ class RedisRegistrator(ABCBroker[UnifyRedisDict]):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -207,6 +290,8 @@ class RedisRegistrator(ABCBroker[UnifyRedisDict]):
                     # Specific
                     broker_middlewares=self._middlewares,
                     middlewares=middlewares,
+                    linger_ms=linger_ms,
+                    max_batch=max_batch,
                     # AsyncAPI
                     title_=title,
                     description_=description,
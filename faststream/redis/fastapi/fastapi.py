@@ -4,6 +4,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     List,
     Mapping,
@@ -46,6 +47,9 @@ if TYPE_CHECKING:
     from starlette.types import ASGIApp, Lifespan
 
     from faststream.asyncapi import schema as asyncapi
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
+    from faststream.broker.subscriber.batching import MicroBatch
+    from faststream.broker.subscriber.dedup import DedupStore
     from faststream.broker.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -56,6 +60,7 @@ if TYPE_CHECKING:
     from faststream.redis.message import UnifyRedisMessage
     from faststream.security import BaseSecurity
     from faststream.types import AnyDict, LoggerProto
+    from faststream.utils.executor import BaseExecutor
 
 
 class RedisRouter(StreamRouter[UnifyRedisDict]):
@@ -478,9 +483,24 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        max_workers: Annotated[
+            int,
+            Doc("Number of workers to process messages concurrently."),
+        ] = 1,
+        ordering_key: Annotated[
+            Optional[Callable[["UnifyRedisDict"], Hashable]],
+            Doc(
+                "Extract a key from the raw message to process messages with the same key "
+                "in order. Messages are routed to `max_workers` serial lanes by the key hash."
+            ),
+        ] = None,
         retry: Annotated[
-            bool,
-            Doc("Whether to `nack` message at processing exception."),
+            Union[bool, int, "BaseWatcher"],
+            Doc(
+                "Whether to `nack` message at processing exception. "
+                "Pass a number or a watcher object (`CounterWatcher`, `DeliveryCountWatcher`) to limit attempts "
+                "or `RetryPolicy` to redeliver the message with a delay."
+            ),
         ] = False,
         no_ack: Annotated[
             bool,
@@ -492,6 +512,34 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
                 "Whether to disable **FastStream** RPC and Reply To auto responses or not."
             ),
         ] = False,
+        executor: Annotated[
+            Optional["BaseExecutor"],
+            Doc(
+                "Pool to run synchronous handler (and parser and decoder for `ThreadExecutor`). "
+                "Broker `executor` is used if not set."
+            ),
+        ] = None,
+        micro_batch: Annotated[
+            Optional["MicroBatch"],
+            Doc(
+                "Collect messages to call the handler once with a list of them. "
+                "All messages of the batch are acknowledged by the handler result."
+            ),
+        ] = None,
+        dedup: Annotated[
+            Optional["DedupStore"],
+            Doc(
+                "Skip messages already processed by the subscriber. "
+                "Duplicates are acknowledged without the handler call."
+            ),
+        ] = None,
+        log_sampling: Annotated[
+            int,
+            Doc(
+                "Log only every N-th message `Received` and `Processed` lines. "
+                "Errors are always logged."
+            ),
+        ] = 1,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -643,9 +691,15 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
                 decoder=decoder,
                 middlewares=middlewares,
                 filter=filter,
+                max_workers=max_workers,
+                ordering_key=ordering_key,
                 retry=retry,
                 no_ack=no_ack,
                 no_reply=no_reply,
+                executor=executor,
+                micro_batch=micro_batch,
+                dedup=dedup,
+                log_sampling=log_sampling,
                 title=title,
                 description=description,
                 include_in_schema=include_in_schema,
@@ -690,6 +744,18 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
             Iterable["PublisherMiddleware"],
             Doc("Publisher middlewares to wrap outgoing messages."),
         ] = (),
+        linger_ms: Annotated[
+            Optional[float],
+            Doc(
+                "Time in milliseconds to collect published messages and send them together. "
+                "Each `publish` call waits for its own message to be sent. "
+                "Messages are sent one by one if not set."
+            ),
+        ] = None,
+        max_batch: Annotated[
+            int,
+            Doc("Maximum number of messages to send together with `linger_ms`."),
+        ] = 500,
         # AsyncAPI information
         title: Annotated[
             Optional[str],
@@ -719,6 +785,8 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
             reply_to=reply_to,
             # broker options
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI options
             title=title,
             description=description,
@@ -4,6 +4,7 @@ from opentelemetry.metrics import Meter, MeterProvider
 from opentelemetry.trace import TracerProvider
 
 from faststream.opentelemetry.middleware import TelemetryMiddleware
+from faststream.opentelemetry.sampling import TelemetrySampler
 from faststream.redis.opentelemetry.provider import RedisTelemetrySettingsProvider
 
 
@@ -14,6 +15,8 @@ class RedisTelemetryMiddleware(TelemetryMiddleware):
         tracer_provider: Optional[TracerProvider] = None,
         meter_provider: Optional[MeterProvider] = None,
         meter: Optional[Meter] = None,
+        stage_timings: bool = False,
+        sampler: Optional[TelemetrySampler] = None,
     ) -> None:
         super().__init__(
             settings_provider_factory=lambda _: RedisTelemetrySettingsProvider(),
@@ -21,4 +24,6 @@ class RedisTelemetryMiddleware(TelemetryMiddleware):
             meter_provider=meter_provider,
             meter=meter,
             include_messages_counters=True,
+            stage_timings=stage_timings,
+            sampler=sampler,
         )
@@ -16,6 +16,7 @@ from faststream.broker.message import (
     decode_message,
     encode_message,
     gen_cor_id,
+    lazy_value,
 )
 from faststream.constants import ContentTypes
 from faststream.redis.message import (
@@ -138,7 +139,11 @@ class SimpleParser:
     ) -> "StreamMessage[Mapping[str, Any]]":
         data, headers, batch_headers = self._parse_data(message)
 
-        id_ = gen_cor_id()
+        message_id = headers.get("message_id")
+        correlation_id = headers.get("correlation_id")
+        if message_id is None and correlation_id is None:
+            # foreign message without any ids
+            message_id = correlation_id = gen_cor_id()
 
         return self.msg_class(
             raw_message=message,
@@ -148,8 +153,12 @@ class SimpleParser:
             batch_headers=batch_headers,
             reply_to=headers.get("reply_to", ""),
             content_type=headers.get("content-type"),
-            message_id=headers.get("message_id", id_),
-            correlation_id=headers.get("correlation_id", id_),
+            message_id=(
+                message_id if message_id is not None else lazy_value(gen_cor_id)
+            ),
+            correlation_id=(
+                correlation_id if correlation_id is not None else lazy_value(gen_cor_id)
+            ),
         )
 
     def _parse_data(
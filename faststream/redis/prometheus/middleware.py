@@ -16,6 +16,8 @@ class RedisPrometheusMiddleware(BasePrometheusMiddleware):
         app_name: str = EMPTY,
         metrics_prefix: str = "faststream",
         received_messages_size_buckets: Optional[Sequence[float]] = None,
+        stage_timings: bool = False,
+        flush_on_scrape: bool = False,
     ) -> None:
         super().__init__(
             settings_provider_factory=settings_provider_factory,
@@ -23,4 +25,6 @@ class RedisPrometheusMiddleware(BasePrometheusMiddleware):
             app_name=app_name,
             metrics_prefix=metrics_prefix,
             received_messages_size_buckets=received_messages_size_buckets,
+            stage_timings=stage_timings,
+            flush_on_scrape=flush_on_scrape,
         )
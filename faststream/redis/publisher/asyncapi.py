@@ -2,14 +2,6 @@ from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
 
 from typing_extensions import TypeAlias, override
 
-from faststream.asyncapi.schema import (
-    Channel,
-    ChannelBinding,
-    CorrelationId,
-    Message,
-    Operation,
-)
-from faststream.asyncapi.schema.bindings import redis
 from faststream.asyncapi.utils import resolve_payloads
 from faststream.exceptions import SetupError
 from faststream.redis.publisher.usecase import (
@@ -23,6 +15,8 @@ from faststream.redis.schemas import INCORRECT_SETUP_MSG, ListSub, PubSub, Strea
 from faststream.redis.schemas.proto import RedisAsyncAPIProtocol, validate_options
 
 if TYPE_CHECKING:
+    from faststream.asyncapi.schema import Channel
+    from faststream.asyncapi.schema.bindings import redis
     from faststream.broker.types import BrokerMiddleware, PublisherMiddleware
     from faststream.redis.message import UnifyRedisDict
     from faststream.types import AnyDict
@@ -38,7 +32,15 @@ PublisherType: TypeAlias = Union[
 class AsyncAPIPublisher(LogicPublisher, RedisAsyncAPIProtocol):
     """A class to represent a Redis publisher."""
 
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
+        from faststream.asyncapi.schema import (
+            Channel,
+            ChannelBinding,
+            CorrelationId,
+            Message,
+            Operation,
+        )
+
         payloads = self.get_payloads()
 
         return {
@@ -70,6 +72,8 @@ class AsyncAPIPublisher(LogicPublisher, RedisAsyncAPIProtocol):
         reply_to: str,
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         title_: Optional[str],
         description_: Optional[str],
@@ -86,6 +90,8 @@ class AsyncAPIPublisher(LogicPublisher, RedisAsyncAPIProtocol):
                 reply_to=reply_to,
                 broker_middlewares=broker_middlewares,
                 middlewares=middlewares,
+                linger_ms=linger_ms,
+                max_batch=max_batch,
                 # AsyncAPI args
                 title_=title_,
                 description_=description_,
@@ -101,6 +107,8 @@ class AsyncAPIPublisher(LogicPublisher, RedisAsyncAPIProtocol):
                 reply_to=reply_to,
                 broker_middlewares=broker_middlewares,
                 middlewares=middlewares,
+                linger_ms=linger_ms,
+                max_batch=max_batch,
                 # AsyncAPI args
                 title_=title_,
                 description_=description_,
@@ -110,6 +118,9 @@ class AsyncAPIPublisher(LogicPublisher, RedisAsyncAPIProtocol):
 
         elif (list := ListSub.validate(list)) is not None:
             if list.batch:
+                if linger_ms is not None:
+                    raise SetupError("You can't setup `linger_ms` with batch publisher")
+
                 return AsyncAPIListBatchPublisher(
                     list=list,
                     # basic args
@@ -117,6 +128,8 @@ class AsyncAPIPublisher(LogicPublisher, RedisAsyncAPIProtocol):
                     reply_to=reply_to,
                     broker_middlewares=broker_middlewares,
                     middlewares=middlewares,
+                    linger_ms=linger_ms,
+                    max_batch=max_batch,
                     # AsyncAPI args
                     title_=title_,
                     description_=description_,
@@ -131,6 +144,8 @@ class AsyncAPIPublisher(LogicPublisher, RedisAsyncAPIProtocol):
                     reply_to=reply_to,
                     broker_middlewares=broker_middlewares,
                     middlewares=middlewares,
+                    linger_ms=linger_ms,
+                    max_batch=max_batch,
                     # AsyncAPI args
                     title_=title_,
                     description_=description_,
@@ -148,6 +163,8 @@ class AsyncAPIChannelPublisher(ChannelPublisher, AsyncAPIPublisher):
 
     @property
     def channel_binding(self) -> "redis.ChannelBinding":
+        from faststream.asyncapi.schema.bindings import redis
+
         return redis.ChannelBinding(
             channel=self.channel.name,
             method="publish",
@@ -162,6 +179,8 @@ class _ListPublisherMixin(AsyncAPIPublisher):
 
     @property
     def channel_binding(self) -> "redis.ChannelBinding":
+        from faststream.asyncapi.schema.bindings import redis
+
         return redis.ChannelBinding(
             channel=self.list.name,
             method="rpush",
@@ -182,6 +201,8 @@ class AsyncAPIStreamPublisher(StreamPublisher, AsyncAPIPublisher):
 
     @property
     def channel_binding(self) -> "redis.ChannelBinding":
+        from faststream.asyncapi.schema.bindings import redis
+
         return redis.ChannelBinding(
             channel=self.stream.name,
             method="xadd",
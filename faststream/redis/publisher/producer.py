@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple
 
 import anyio
 from typing_extensions import override
@@ -125,6 +125,44 @@ class RedisFastProducer(ProducerProto):
             else:
                 return await self._decoder(await self._parser(m))
 
+    @override
+    async def publish_many(
+        self,
+        requests: Sequence[Tuple["SendableMessage", "AnyDict"]],
+    ) -> Sequence[Any]:
+        """Send messages by a single pipeline round trip."""
+        async with self._connection.pipeline(transaction=False) as pipe:
+            for message, kwargs in requests:
+                channel, list, stream = (
+                    kwargs.get("channel"),
+                    kwargs.get("list"),
+                    kwargs.get("stream"),
+                )
+
+                msg = RawMessage.encode(
+                    message=message,
+                    reply_to=kwargs.get("reply_to"),
+                    headers=kwargs.get("headers"),
+                    correlation_id=kwargs["correlation_id"],
+                )
+
+                if channel is not None:
+                    pipe.publish(channel, msg)
+                elif list is not None:
+                    pipe.rpush(list, msg)
+                elif stream is not None:
+                    pipe.xadd(
+                        name=stream,
+                        fields={DATA_KEY: msg},
+                        maxlen=kwargs.get("maxlen"),
+                    )
+                else:
+                    raise SetupError(INCORRECT_SETUP_MSG)
+
+            results = await pipe.execute(raise_on_error=False)
+
+        return [r if isinstance(r, Exception) else None for r in results]
+
     @override
     async def request(  # type: ignore[override]
         self,
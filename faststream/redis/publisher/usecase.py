@@ -34,6 +34,8 @@ class LogicPublisher(PublisherUsecase[UnifyRedisDict]):
         # Publisher args
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI args
         schema_: Optional[Any],
         title_: Optional[str],
@@ -43,6 +45,8 @@ class LogicPublisher(PublisherUsecase[UnifyRedisDict]):
         super().__init__(
             broker_middlewares=broker_middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             # AsyncAPI args
             schema_=schema_,
             title_=title_,
@@ -70,6 +74,8 @@ class ChannelPublisher(LogicPublisher):
         # Regular publisher options
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI options
         schema_: Optional[Any],
         title_: Optional[str],
@@ -81,6 +87,8 @@ class ChannelPublisher(LogicPublisher):
             headers=headers,
             broker_middlewares=broker_middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             schema_=schema_,
             title_=title_,
             description_=description_,
@@ -177,7 +185,7 @@ class ChannelPublisher(LogicPublisher):
         headers = headers or self.headers
         correlation_id = correlation_id or gen_cor_id()
 
-        call: AsyncFunc = self._producer.publish
+        call: AsyncFunc = self._get_publish_call(rpc)
 
         for m in chain(
             (
@@ -284,6 +292,8 @@ class ListPublisher(LogicPublisher):
         # Regular publisher options
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI options
         schema_: Optional[Any],
         title_: Optional[str],
@@ -295,6 +305,8 @@ class ListPublisher(LogicPublisher):
             headers=headers,
             broker_middlewares=broker_middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             schema_=schema_,
             title_=title_,
             description_=description_,
@@ -390,7 +402,7 @@ class ListPublisher(LogicPublisher):
         reply_to = reply_to or self.reply_to
         correlation_id = correlation_id or gen_cor_id()
 
-        call: AsyncFunc = self._producer.publish
+        call: AsyncFunc = self._get_publish_call(rpc)
 
         for m in chain(
             (
@@ -550,6 +562,8 @@ class StreamPublisher(LogicPublisher):
         # Regular publisher options
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         middlewares: Iterable["PublisherMiddleware"],
+        linger_ms: Optional[float],
+        max_batch: int,
         # AsyncAPI options
         schema_: Optional[Any],
         title_: Optional[str],
@@ -561,6 +575,8 @@ class StreamPublisher(LogicPublisher):
             headers=headers,
             broker_middlewares=broker_middlewares,
             middlewares=middlewares,
+            linger_ms=linger_ms,
+            max_batch=max_batch,
             schema_=schema_,
             title_=title_,
             description_=description_,
@@ -664,7 +680,7 @@ class StreamPublisher(LogicPublisher):
         headers = headers or self.headers
         correlation_id = correlation_id or gen_cor_id()
 
-        call: AsyncFunc = self._producer.publish
+        call: AsyncFunc = self._get_publish_call(rpc)
 
         for m in chain(
             (
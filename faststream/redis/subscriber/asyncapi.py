@@ -1,13 +1,5 @@
-from typing import Dict
-
-from faststream.asyncapi.schema import (
-    Channel,
-    ChannelBinding,
-    CorrelationId,
-    Message,
-    Operation,
-)
-from faststream.asyncapi.schema.bindings import redis
+from typing import TYPE_CHECKING, Dict
+
 from faststream.asyncapi.utils import resolve_payloads
 from faststream.redis.schemas import ListSub, StreamSub
 from faststream.redis.schemas.proto import RedisAsyncAPIProtocol
@@ -15,16 +7,31 @@ from faststream.redis.subscriber.usecase import (
     BatchListSubscriber,
     BatchStreamSubscriber,
     ChannelSubscriber,
+    ConcurrentChannelSubscriber,
+    ConcurrentListSubscriber,
+    ConcurrentStreamSubscriber,
     ListSubscriber,
     LogicSubscriber,
     StreamSubscriber,
 )
 
+if TYPE_CHECKING:
+    from faststream.asyncapi.schema import Channel
+    from faststream.asyncapi.schema.bindings import redis
+
 
 class AsyncAPISubscriber(LogicSubscriber, RedisAsyncAPIProtocol):
     """A class to represent a Redis handler."""
 
-    def get_schema(self) -> Dict[str, Channel]:
+    def get_schema(self) -> Dict[str, "Channel"]:
+        from faststream.asyncapi.schema import (
+            Channel,
+            ChannelBinding,
+            CorrelationId,
+            Message,
+            Operation,
+        )
+
         payloads = self.get_payloads()
 
         return {
@@ -52,12 +59,20 @@ class AsyncAPIChannelSubscriber(ChannelSubscriber, AsyncAPISubscriber):
 
     @property
     def channel_binding(self) -> "redis.ChannelBinding":
+        from faststream.asyncapi.schema.bindings import redis
+
         return redis.ChannelBinding(
             channel=self.channel.name,
             method="psubscribe" if self.channel.pattern else "subscribe",
         )
 
 
+class AsyncAPIConcurrentChannelSubscriber(
+    ConcurrentChannelSubscriber, AsyncAPIChannelSubscriber
+):
+    pass
+
+
 class _StreamSubscriberMixin(AsyncAPISubscriber):
     stream_sub: StreamSub
 
@@ -66,6 +81,8 @@ class _StreamSubscriberMixin(AsyncAPISubscriber):
 
     @property
     def channel_binding(self) -> "redis.ChannelBinding":
+        from faststream.asyncapi.schema.bindings import redis
+
         return redis.ChannelBinding(
             channel=self.stream_sub.name,
             group_name=self.stream_sub.group,
@@ -78,6 +95,12 @@ class AsyncAPIStreamSubscriber(StreamSubscriber, _StreamSubscriberMixin):
     pass
 
 
+class AsyncAPIConcurrentStreamSubscriber(
+    ConcurrentStreamSubscriber, AsyncAPIStreamSubscriber
+):
+    pass
+
+
 class AsyncAPIStreamBatchSubscriber(BatchStreamSubscriber, _StreamSubscriberMixin):
     pass
 
@@ -90,6 +113,8 @@ class _ListSubscriberMixin(AsyncAPISubscriber):
 
     @property
     def channel_binding(self) -> "redis.ChannelBinding":
+        from faststream.asyncapi.schema.bindings import redis
+
         return redis.ChannelBinding(
             channel=self.list_sub.name,
             method="lpop",
@@ -100,5 +125,11 @@ class AsyncAPIListSubscriber(ListSubscriber, _ListSubscriberMixin):
     pass
 
 
+class AsyncAPIConcurrentListSubscriber(
+    ConcurrentListSubscriber, AsyncAPIListSubscriber
+):
+    pass
+
+
 class AsyncAPIListBatchSubscriber(BatchListSubscriber, _ListSubscriberMixin):
     pass
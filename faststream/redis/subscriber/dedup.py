@@ -0,0 +1,44 @@
+import math
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from faststream.broker.subscriber.dedup import DedupStore
+from faststream.exceptions import NOT_CONNECTED_YET
+
+if TYPE_CHECKING:
+    from faststream.broker.message import StreamMessage
+    from faststream.redis.broker.broker import RedisBroker
+
+
+class RedisDedupStore(DedupStore):
+    """A class to skip already processed messages duplicates by Redis keys.
+
+    Keys are shared between all service replicas and expire by Redis itself.
+    The store uses the broker connection, so the broker should be connected
+    before messages consuming.
+    """
+
+    def __init__(
+        self,
+        broker: "RedisBroker",
+        ttl: float = 3600.0,
+        key: Optional[Callable[["StreamMessage[Any]"], str]] = None,
+        *,
+        prefix: str = "faststream:dedup:",
+    ) -> None:
+        super().__init__(ttl=ttl, key=key)
+        self.broker = broker
+        self.prefix = prefix
+
+    async def seen(self, key: str) -> bool:
+        connection = self.broker._connection
+        assert connection, NOT_CONNECTED_YET  # nosec B101
+        return bool(await connection.exists(f"{self.prefix}{key}"))
+
+    async def add(self, key: str) -> None:
+        connection = self.broker._connection
+        assert connection, NOT_CONNECTED_YET  # nosec B101
+        await connection.set(
+            f"{self.prefix}{key}",
+            1,
+            px=max(math.ceil(self.ttl * 1000), 1),
+        )
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Optional, Union
 
 from typing_extensions import TypeAlias
 
@@ -7,6 +7,9 @@ from faststream.redis.schemas import INCORRECT_SETUP_MSG, ListSub, PubSub, Strea
 from faststream.redis.schemas.proto import validate_options
 from faststream.redis.subscriber.asyncapi import (
     AsyncAPIChannelSubscriber,
+    AsyncAPIConcurrentChannelSubscriber,
+    AsyncAPIConcurrentListSubscriber,
+    AsyncAPIConcurrentStreamSubscriber,
     AsyncAPIListBatchSubscriber,
     AsyncAPIListSubscriber,
     AsyncAPIStreamBatchSubscriber,
@@ -16,6 +19,7 @@ from faststream.redis.subscriber.asyncapi import (
 if TYPE_CHECKING:
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.types import BrokerMiddleware
     from faststream.redis.message import UnifyRedisDict
 
@@ -33,10 +37,12 @@ def create_subscriber(
     channel: Union["PubSub", str, None],
     list: Union["ListSub", str, None],
     stream: Union["StreamSub", str, None],
+    max_workers: int = 1,
+    ordering_key: Optional[Callable[["UnifyRedisDict"], Hashable]] = None,
     # Subscriber args
     no_ack: bool = False,
     no_reply: bool = False,
-    retry: bool = False,
+    retry: Union[bool, int, "BaseWatcher"] = False,
     broker_dependencies: Iterable["Depends"] = (),
     broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"] = (),
     # AsyncAPI args
@@ -46,20 +52,43 @@ def create_subscriber(
 ) -> SubsciberType:
     validate_options(channel=channel, list=list, stream=stream)
 
+    if max_workers > 1 and any(
+        sub is not None and sub.batch
+        for sub in (ListSub.validate(list), StreamSub.validate(stream))
+    ):
+        raise SetupError("You can't use `max_workers` with batch subscriber.")
+
     if (channel_sub := PubSub.validate(channel)) is not None:
-        return AsyncAPIChannelSubscriber(
-            channel=channel_sub,
-            # basic args
-            no_ack=no_ack,
-            no_reply=no_reply,
-            retry=retry,
-            broker_dependencies=broker_dependencies,
-            broker_middlewares=broker_middlewares,
-            # AsyncAPI args
-            title_=title_,
-            description_=description_,
-            include_in_schema=include_in_schema,
-        )
+        if max_workers > 1:
+            return AsyncAPIConcurrentChannelSubscriber(
+                max_workers=max_workers,
+                ordering_key=ordering_key,
+                channel=channel_sub,
+                # basic args
+                no_ack=no_ack,
+                no_reply=no_reply,
+                retry=retry,
+                broker_dependencies=broker_dependencies,
+                broker_middlewares=broker_middlewares,
+                # AsyncAPI args
+                title_=title_,
+                description_=description_,
+                include_in_schema=include_in_schema,
+            )
+        else:
+            return AsyncAPIChannelSubscriber(
+                channel=channel_sub,
+                # basic args
+                no_ack=no_ack,
+                no_reply=no_reply,
+                retry=retry,
+                broker_dependencies=broker_dependencies,
+                broker_middlewares=broker_middlewares,
+                # AsyncAPI args
+                title_=title_,
+                description_=description_,
+                include_in_schema=include_in_schema,
+            )
 
     elif (stream_sub := StreamSub.validate(stream)) is not None:
         if stream_sub.batch:
@@ -76,6 +105,22 @@ def create_subscriber(
                 description_=description_,
                 include_in_schema=include_in_schema,
             )
+        elif max_workers > 1:
+            return AsyncAPIConcurrentStreamSubscriber(
+                max_workers=max_workers,
+                ordering_key=ordering_key,
+                stream=stream_sub,
+                # basic args
+                no_ack=no_ack,
+                no_reply=no_reply,
+                retry=retry,
+                broker_dependencies=broker_dependencies,
+                broker_middlewares=broker_middlewares,
+                # AsyncAPI args
+                title_=title_,
+                description_=description_,
+                include_in_schema=include_in_schema,
+            )
         else:
             return AsyncAPIStreamSubscriber(
                 stream=stream_sub,
@@ -106,6 +151,22 @@ def create_subscriber(
                 description_=description_,
                 include_in_schema=include_in_schema,
             )
+        elif max_workers > 1:
+            return AsyncAPIConcurrentListSubscriber(
+                max_workers=max_workers,
+                ordering_key=ordering_key,
+                list=list_sub,
+                # basic args
+                no_ack=no_ack,
+                no_reply=no_reply,
+                retry=retry,
+                broker_dependencies=broker_dependencies,
+                broker_middlewares=broker_middlewares,
+                # AsyncAPI args
+                title_=title_,
+                description_=description_,
+                include_in_schema=include_in_schema,
+            )
         else:
             return AsyncAPIListSubscriber(
                 list=list_sub,
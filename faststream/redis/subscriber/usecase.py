@@ -1,5 +1,7 @@
 import asyncio
+import logging
 import math
+import time
 from abc import abstractmethod
 from contextlib import suppress
 from copy import deepcopy
@@ -9,11 +11,13 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
     Sequence,
     Tuple,
+    Union,
 )
 
 import anyio
@@ -22,10 +26,13 @@ from redis.asyncio.client import Redis
 from redis.exceptions import ResponseError
 from typing_extensions import TypeAlias, override
 
+from faststream.broker.acknowledgement_watcher import RETRIES_HEADER, RetryPolicy
 from faststream.broker.publisher.fake import FakePublisher
+from faststream.broker.subscriber.mixins import ConcurrentMixin
 from faststream.broker.subscriber.usecase import SubscriberUsecase
 from faststream.broker.utils import process_msg
 from faststream.redis.message import (
+    DATA_KEY,
     BatchListMessage,
     BatchStreamMessage,
     DefaultListMessage,
@@ -37,6 +44,7 @@ from faststream.redis.message import (
     UnifyRedisDict,
 )
 from faststream.redis.parser import (
+    RawMessage,
     RedisBatchListParser,
     RedisBatchStreamParser,
     RedisListParser,
@@ -48,6 +56,7 @@ from faststream.redis.schemas import ListSub, PubSub, StreamSub
 if TYPE_CHECKING:
     from fast_depends.dependencies import Depends
 
+    from faststream.broker.acknowledgement_watcher import BaseWatcher
     from faststream.broker.message import StreamMessage as BrokerStreamMessage
     from faststream.broker.publisher.proto import ProducerProto
     from faststream.broker.types import (
@@ -56,16 +65,41 @@ if TYPE_CHECKING:
         CustomCallable,
     )
     from faststream.types import AnyDict, Decorator, LoggerProto
+    from faststream.utils.executor import BaseExecutor
 
 
 TopicName: TypeAlias = bytes
 Offset: TypeAlias = bytes
 
+RETRY_KEY_SUFFIX = ":retry"
+REDELIVER_INTERVAL = 0.25
+REDELIVER_BATCH = 100
+
+# Atomically move due messages from the retry sorted set back to the source
+_LIST_REDELIVER_SCRIPT = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, item in ipairs(items) do
+    redis.call('ZREM', KEYS[1], item)
+    redis.call('RPUSH', KEYS[2], item)
+end
+return #items
+"""
+
+_STREAM_REDELIVER_SCRIPT = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, item in ipairs(items) do
+    redis.call('ZREM', KEYS[1], item)
+    redis.call('XADD', KEYS[2], '*', ARGV[3], item)
+end
+return #items
+"""
+
 
 class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
     """A class to represent a Redis handler."""
 
     _client: Optional["Redis[bytes]"]
+    _logger: Optional["LoggerProto"]
 
     def __init__(
         self,
@@ -75,7 +109,7 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         # AsyncAPI args
@@ -99,7 +133,9 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
         )
 
         self._client = None
+        self._logger = None
         self.task: Optional[asyncio.Task[None]] = None
+        self.retry_task: Optional[asyncio.Task[None]] = None
 
     @override
     def setup(  # type: ignore[override]
@@ -114,6 +150,7 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
         # broker options
         broker_parser: Optional["CustomCallable"],
         broker_decoder: Optional["CustomCallable"],
+        broker_executor: Optional["BaseExecutor"],
         # dependant args
         apply_types: bool,
         is_validate: bool,
@@ -121,6 +158,7 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
         _call_decorators: Iterable["Decorator"],
     ) -> None:
         self._client = connection
+        self._logger = logger
 
         super().setup(
             logger=logger,
@@ -129,6 +167,7 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
             extra_context=extra_context,
             broker_parser=broker_parser,
             broker_decoder=broker_decoder,
+            broker_executor=broker_executor,
             apply_types=apply_types,
             is_validate=is_validate,
             _get_dependant=_get_dependant,
@@ -171,6 +210,15 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
             with anyio.fail_after(3.0):
                 await start_signal.wait()
 
+            if (
+                isinstance(self._retry, RetryPolicy)
+                and self._client is not None
+                and (target := self._get_retry_target()) is not None
+            ):
+                self.retry_task = asyncio.create_task(
+                    self._redeliver(self._client, *target)
+                )
+
         else:
             start_signal.set()
 
@@ -199,6 +247,61 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
     async def _get_msgs(self, *args: Any) -> None:
         raise NotImplementedError()
 
+    async def consume_one(self, msg: Any) -> None:
+        await self.consume(msg)
+
+    def _get_retry_target(self) -> Optional[Tuple[str, str]]:
+        """Redis key and Lua script to redeliver messages delayed by `RetryPolicy`."""
+        return None
+
+    async def _retry_later(
+        self,
+        message: "BrokerStreamMessage[Any]",
+        delay: float,
+        attempts: int,
+    ) -> None:
+        target = self._get_retry_target()
+
+        if target is None or self._client is None:
+            await super()._retry_later(message, delay, attempts)
+            return
+
+        key, _ = target
+        raw = RawMessage.encode(
+            message=message.body,
+            reply_to=message.reply_to,
+            headers={**message.headers, RETRIES_HEADER: str(attempts)},
+            correlation_id=message.correlation_id,
+        )
+
+        await self._client.zadd(f"{key}{RETRY_KEY_SUFFIX}", {raw: time.time() + delay})
+        await message.ack(**self.extra_watcher_options)
+
+    async def _redeliver(self, client: "Redis[bytes]", key: str, script: str) -> None:
+        redeliver = client.register_script(script)
+
+        while self.running:
+            try:
+                moved = await redeliver(
+                    keys=[f"{key}{RETRY_KEY_SUFFIX}", key],
+                    args=[time.time(), REDELIVER_BATCH, DATA_KEY],
+                )
+
+            except Exception as e:  # noqa: PERF203
+                # messages are kept in the retry key until the next attempt
+                if self._logger is not None:
+                    self._logger.log(
+                        logging.ERROR,
+                        f"Retried messages redelivery failed: {e!r}",
+                        extra=self.get_log_context(None),
+                        exc_info=e,
+                    )
+                await anyio.sleep(5)
+
+            else:
+                if not moved:
+                    await anyio.sleep(REDELIVER_INTERVAL)
+
     async def close(self) -> None:
         await super().close()
 
@@ -206,6 +309,10 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
             self.task.cancel()
         self.task = None
 
+        if self.retry_task is not None and not self.retry_task.done():
+            self.retry_task.cancel()
+        self.retry_task = None
+
     @staticmethod
     def build_log_context(
         message: Optional["BrokerStreamMessage[Any]"],
@@ -227,7 +334,7 @@ class ChannelSubscriber(LogicSubscriber):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         # AsyncAPI args
@@ -335,7 +442,7 @@ class ChannelSubscriber(LogicSubscriber):
 
     async def _get_msgs(self, psub: RPubSub) -> None:
         if msg := await self._get_message(psub):
-            await self.consume(msg)  # type: ignore[arg-type]
+            await self.consume_one(msg)
 
     def add_prefix(self, prefix: str) -> None:
         new_ch = deepcopy(self.channel)
@@ -343,6 +450,52 @@ class ChannelSubscriber(LogicSubscriber):
         self.channel = new_ch
 
 
+class _ConcurrentHandlerMixin(ConcurrentMixin, LogicSubscriber):
+    @override
+    async def _consume(self, *args: Any, start_signal: anyio.Event) -> None:
+        self.start_consume_task()
+        await super()._consume(*args, start_signal=start_signal)
+
+    @override
+    async def consume_one(self, msg: Any) -> None:
+        await self._put_msg(msg)
+
+
+class ConcurrentChannelSubscriber(_ConcurrentHandlerMixin, ChannelSubscriber):
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        ordering_key: Optional[Callable[["UnifyRedisDict"], Hashable]],
+        channel: "PubSub",
+        # Subscriber args
+        no_ack: bool,
+        no_reply: bool,
+        retry: Union[bool, int, "BaseWatcher"],
+        broker_dependencies: Iterable["Depends"],
+        broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
+        # AsyncAPI args
+        title_: Optional[str],
+        description_: Optional[str],
+        include_in_schema: bool,
+    ) -> None:
+        super().__init__(
+            max_workers=max_workers,
+            ordering_key=ordering_key,
+            channel=channel,
+            # Propagated options
+            no_ack=no_ack,
+            no_reply=no_reply,
+            retry=retry,
+            broker_middlewares=broker_middlewares,
+            broker_dependencies=broker_dependencies,
+            # AsyncAPI
+            title_=title_,
+            description_=description_,
+            include_in_schema=include_in_schema,
+        )
+
+
 class _ListHandlerMixin(LogicSubscriber):
     def __init__(
         self,
@@ -353,7 +506,7 @@ class _ListHandlerMixin(LogicSubscriber):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         # AsyncAPI args
@@ -458,7 +611,7 @@ class ListSubscriber(_ListHandlerMixin):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         # AsyncAPI args
@@ -483,6 +636,9 @@ class ListSubscriber(_ListHandlerMixin):
             include_in_schema=include_in_schema,
         )
 
+    def _get_retry_target(self) -> Optional[Tuple[str, str]]:
+        return self.list_sub.name, _LIST_REDELIVER_SCRIPT
+
     async def _get_msgs(self, client: "Redis[bytes]") -> None:
         raw_msg = await client.lpop(name=self.list_sub.name)
 
@@ -493,12 +649,47 @@ class ListSubscriber(_ListHandlerMixin):
                 channel=self.list_sub.name,
             )
 
-            await self.consume(msg)  # type: ignore[arg-type]
+            await self.consume_one(msg)
 
         else:
             await anyio.sleep(self.list_sub.polling_interval)
 
 
+class ConcurrentListSubscriber(_ConcurrentHandlerMixin, ListSubscriber):
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        ordering_key: Optional[Callable[["UnifyRedisDict"], Hashable]],
+        list: ListSub,
+        # Subscriber args
+        no_ack: bool,
+        no_reply: bool,
+        retry: Union[bool, int, "BaseWatcher"],
+        broker_dependencies: Iterable["Depends"],
+        broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
+        # AsyncAPI args
+        title_: Optional[str],
+        description_: Optional[str],
+        include_in_schema: bool,
+    ) -> None:
+        super().__init__(
+            max_workers=max_workers,
+            ordering_key=ordering_key,
+            list=list,
+            # Propagated options
+            no_ack=no_ack,
+            no_reply=no_reply,
+            retry=retry,
+            broker_middlewares=broker_middlewares,
+            broker_dependencies=broker_dependencies,
+            # AsyncAPI
+            title_=title_,
+            description_=description_,
+            include_in_schema=include_in_schema,
+        )
+
+
 class BatchListSubscriber(_ListHandlerMixin):
     def __init__(
         self,
@@ -507,7 +698,7 @@ class BatchListSubscriber(_ListHandlerMixin):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         # AsyncAPI args
@@ -561,7 +752,7 @@ class _StreamHandlerMixin(LogicSubscriber):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         # AsyncAPI args
@@ -750,7 +941,7 @@ class StreamSubscriber(_StreamHandlerMixin):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         # AsyncAPI args
@@ -775,6 +966,9 @@ class StreamSubscriber(_StreamHandlerMixin):
             include_in_schema=include_in_schema,
         )
 
+    def _get_retry_target(self) -> Optional[Tuple[str, str]]:
+        return self.stream_sub.name, _STREAM_REDELIVER_SCRIPT
+
     async def _get_msgs(
         self,
         read: Callable[
@@ -808,7 +1002,42 @@ class StreamSubscriber(_StreamHandlerMixin):
                         data=raw_msg,
                     )
 
-                    await self.consume(msg)  # type: ignore[arg-type]
+                    await self.consume_one(msg)
+
+
+class ConcurrentStreamSubscriber(_ConcurrentHandlerMixin, StreamSubscriber):
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        ordering_key: Optional[Callable[["UnifyRedisDict"], Hashable]],
+        stream: StreamSub,
+        # Subscriber args
+        no_ack: bool,
+        no_reply: bool,
+        retry: Union[bool, int, "BaseWatcher"],
+        broker_dependencies: Iterable["Depends"],
+        broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
+        # AsyncAPI args
+        title_: Optional[str],
+        description_: Optional[str],
+        include_in_schema: bool,
+    ) -> None:
+        super().__init__(
+            max_workers=max_workers,
+            ordering_key=ordering_key,
+            stream=stream,
+            # Propagated options
+            no_ack=no_ack,
+            no_reply=no_reply,
+            retry=retry,
+            broker_middlewares=broker_middlewares,
+            broker_dependencies=broker_dependencies,
+            # AsyncAPI
+            title_=title_,
+            description_=description_,
+            include_in_schema=include_in_schema,
+        )
 
 
 class BatchStreamSubscriber(_StreamHandlerMixin):
@@ -819,7 +1048,7 @@ class BatchStreamSubscriber(_StreamHandlerMixin):
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
-        retry: bool,
+        retry: Union[bool, int, "BaseWatcher"],
         broker_dependencies: Iterable["Depends"],
         broker_middlewares: Iterable["BrokerMiddleware[UnifyRedisDict]"],
         # AsyncAPI args
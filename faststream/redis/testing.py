@@ -16,6 +16,7 @@ import anyio
 from typing_extensions import TypedDict, override
 
 from faststream.broker.message import gen_cor_id
+from faststream.broker.publisher.proto import ProducerProto
 from faststream.broker.utils import resolve_custom_func
 from faststream.exceptions import WRONG_PUBLISH_ARGS, SetupError, SubscriberNotFound
 from faststream.redis.broker.broker import RedisBroker
@@ -150,12 +151,21 @@ class FakeProducer(RedisFastProducer):
                     )
 
                     with timeout_scope(rpc_timeout, raise_timeout):
-                        response_msg = await self._execute_handler(msg, handler)
+                        response_msg = await self._execute_handler(
+                            msg, handler, correlation_id
+                        )
                         if rpc:
                             return await self._decoder(await self._parser(response_msg))
 
         return None
 
+    @override
+    async def publish_many(
+        self,
+        requests: Sequence[Tuple["SendableMessage", "AnyDict"]],
+    ) -> Sequence[Any]:
+        return await ProducerProto.publish_many(self, requests)
+
     @override
     async def request(  # type: ignore[override]
         self,
@@ -190,7 +200,7 @@ class FakeProducer(RedisFastProducer):
                     )
 
                     with anyio.fail_after(timeout):
-                        return await self._execute_handler(msg, handler)
+                        return await self._execute_handler(msg, handler, correlation_id)
 
         raise SubscriberNotFound
 
@@ -223,7 +233,10 @@ class FakeProducer(RedisFastProducer):
         return None
 
     async def _execute_handler(
-        self, msg: Any, handler: "LogicSubscriber"
+        self,
+        msg: Any,
+        handler: "LogicSubscriber",
+        correlation_id: str = "",
     ) -> "PubSubMessage":
         result = await handler.process_message(msg)
 
@@ -232,7 +245,7 @@ class FakeProducer(RedisFastProducer):
             data=build_message(
                 message=result.body,
                 headers=result.headers,
-                correlation_id=result.correlation_id or "",
+                correlation_id=result.correlation_id or correlation_id,
             ),
             channel="",
             pattern=None,
@@ -1,11 +1,68 @@
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
-from typing import Any, Dict, Iterator, Mapping
+from typing import Any, Dict, Iterator, Mapping, Optional
 
 from faststream.types import EMPTY, AnyDict
 from faststream.utils.classes import Singleton
 
-__all__ = ("ContextRepo", "context")
+__all__ = ("ContextRepo", "MessageFrame", "context")
+
+
+class MessageFrame:
+    """Message processing scope values.
+
+    The whole frame is stored by a single ContextVar, so entering the message
+    scope costs one `set` / `reset` pair regardless of the keys number.
+    """
+
+    __slots__ = ("handler_", "message", "log_context", "extra", "values")
+
+    def __init__(
+        self,
+        handler_: Any,
+        extra: AnyDict,
+    ) -> None:
+        self.handler_ = handler_
+        self.message: Any = EMPTY
+        self.log_context: Any = EMPTY
+        # subscriber static context, shared between frames
+        self.extra = extra
+        # values set by the message scope, e.g. by middlewares
+        self.values: Optional[AnyDict] = None
+
+    def get(self, key: str) -> Any:
+        if key in _FRAME_FIELDS:
+            return getattr(self, key)
+
+        if self.values is not None and (v := self.values.get(key, EMPTY)) is not EMPTY:
+            return v
+
+        return self.extra.get(key, EMPTY)
+
+    def set(self, key: str, value: Any) -> None:
+        if key in _FRAME_FIELDS:
+            setattr(self, key, value)
+
+        elif self.values is None:
+            self.values = {key: value}
+
+        else:
+            self.values[key] = value
+
+    def as_dict(self) -> AnyDict:
+        data = {**self.extra, **(self.values or {})}
+        for key in _FRAME_FIELDS:
+            if (v := getattr(self, key)) is not EMPTY:
+                data[key] = v
+        return data
+
+
+_FRAME_FIELDS = frozenset(("handler_", "message", "log_context"))
+
+_message_frame: ContextVar[Optional[MessageFrame]] = ContextVar(
+    "message_frame",
+    default=None,
+)
 
 
 class ContextRepo(Singleton):
@@ -26,10 +83,51 @@ class ContextRepo(Singleton):
 
     @property
     def context(self) -> AnyDict:
-        return {
-            **self._global_context,
-            **{i: j.get() for i, j in self._scope_context.items()},
-        }
+        local = frame.as_dict() if (frame := _message_frame.get()) else {}
+
+        for i, j in self._scope_context.items():
+            if (v := j.get()) is not EMPTY or i not in local:
+                local[i] = v
+
+        return {**self._global_context, **local}
+
+    @property
+    def frame(self) -> Optional[MessageFrame]:
+        """Current message scope frame."""
+        return _message_frame.get()
+
+    def set_frame(self, frame: MessageFrame) -> "Token[Optional[MessageFrame]]":
+        """Enter the message scope.
+
+        Args:
+            frame: The message scope values.
+
+        Returns:
+            Token[Optional[MessageFrame]]: A token to reset the frame with.
+        """
+        return _message_frame.set(frame)
+
+    def reset_frame(self, tag: "Token[Optional[MessageFrame]]") -> None:
+        """Exit the message scope.
+
+        Args:
+            tag: The token returned by `set_frame`.
+        """
+        _message_frame.reset(tag)
+
+    def set_message_local(self, key: str, value: Any) -> None:
+        """Set a local value until the current message processing end.
+
+        Falls back to `set_local` if called outside of the message scope.
+
+        Args:
+            key: The key for the value.
+            value: The value to set.
+        """
+        if (frame := _message_frame.get()) is None:
+            self.set_local(key, value)
+        else:
+            frame.set(key, value)
 
     def set_global(self, key: str, v: Any) -> None:
         """Sets a value in the global context.
@@ -92,12 +190,18 @@ class ContextRepo(Singleton):
         Returns:
             The value of the local variable.
         """
-        value = default
+        # explicit scopes override the message frame values
         if (context_var := self._scope_context.get(key)) is not None and (
             context_value := context_var.get()
         ) is not EMPTY:
-            value = context_value
-        return value
+            return context_value
+
+        if (frame := _message_frame.get()) is not None and (
+            context_value := frame.get(key)
+        ) is not EMPTY:
+            return context_value
+
+        return default
 
     @contextmanager
     def scope(self, key: str, value: Any) -> Iterator[None]:
@@ -0,0 +1,379 @@
+import asyncio
+import importlib
+import os
+import threading
+import time
+from abc import abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from functools import partial
+from inspect import unwrap
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from fast_depends.utils import is_coroutine_callable
+from typing_extensions import Annotated, Doc
+
+from faststream.exceptions import SetupError
+from faststream.types import F_Return, F_Spec
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+    from faststream.types import AnyDict
+
+__all__ = (
+    "BaseExecutor",
+    "ExecutorStats",
+    "ProcessExecutor",
+    "ThreadExecutor",
+)
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    """Snapshot of the executor state."""
+
+    name: str
+    max_workers: int
+    queued: int
+    running: int
+    completed: int
+    wait_time_total: float
+    wait_time_max: float
+
+    @property
+    def wait_time_avg(self) -> float:
+        """Average time a call waited for a free worker."""
+        if not (started := self.completed + self.running):
+            return 0.0
+        return self.wait_time_total / started
+
+
+class BaseExecutor:
+    """Base class for pools to run synchronous subscriber calls."""
+
+    __slots__ = (
+        "name",
+        "max_workers",
+        "_pool",
+        "_lock",
+        "_queued",
+        "_running",
+        "_completed",
+        "_wait_total",
+        "_wait_max",
+    )
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        if max_workers < 1:
+            raise ValueError("`max_workers` should be greater than 0")
+
+        self.name = name
+        self.max_workers = max_workers
+
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r}, max_workers={self.max_workers})"
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a free worker."""
+        return self.stats().queued
+
+    def stats(self) -> ExecutorStats:
+        """Return the current executor statistics."""
+        with self._lock:
+            return ExecutorStats(
+                name=self.name,
+                max_workers=self.max_workers,
+                queued=self._queued,
+                running=self._running,
+                completed=self._completed,
+                wait_time_total=self._wait_total,
+                wait_time_max=self._wait_max,
+            )
+
+    @abstractmethod
+    async def run(
+        self,
+        func: Callable[F_Spec, F_Return],
+        *args: F_Spec.args,
+        **kwargs: F_Spec.kwargs,
+    ) -> F_Return:
+        """Run synchronous function in the executor."""
+        raise NotImplementedError()
+
+    def prepare(self, func: Callable[..., Any], *, decorated: bool = False) -> None:
+        """Check the subscriber handler can be run by the executor at setup time.
+
+        Args:
+            func: the original handler function
+            decorated: the handler has call decorators
+        """
+
+    @abstractmethod
+    def _create_pool(self) -> Executor:
+        raise NotImplementedError()
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            self._pool = self._create_pool()
+        return self._pool
+
+    def _record_wait(self, wait_time: float) -> None:
+        self._wait_total += wait_time
+        self._wait_max = max(self._wait_max, wait_time)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop executor workers. Pool restarts at the next call."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+
+class ThreadExecutor(BaseExecutor):
+    """Named thread pool to run synchronous handlers, parsers and decoders.
+
+    Each executor has its own workers, so a slow synchronous handler can only
+    exhaust the pool it is bound to.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        name: Annotated[
+            str,
+            Doc("Executor name. Used as workers thread names prefix."),
+        ] = "faststream",
+        max_workers: Annotated[
+            int,
+            Doc("Maximum number of simultaneously running calls."),
+        ] = 40,
+    ) -> None:
+        super().__init__(name=name, max_workers=max_workers)
+
+    def _create_pool(self) -> Executor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=self.name,
+        )
+
+    async def run(
+        self,
+        func: Callable[F_Spec, F_Return],
+        *args: F_Spec.args,
+        **kwargs: F_Spec.kwargs,
+    ) -> F_Return:
+        """Run synchronous function in the executor with the current context."""
+        pool = self._get_pool()
+
+        with self._lock:
+            self._queued += 1
+
+        # `[started]` flag shared with the worker to keep counters consistent
+        # if the call was cancelled before a worker took it
+        state = [False]
+        ctx = copy_context()
+        call = partial(
+            self._execute,
+            perf_counter(),
+            state,
+            partial(ctx.run, func, *args, **kwargs),
+        )
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, call)
+
+        finally:
+            with self._lock:
+                if not state[0]:
+                    state[0] = True
+                    self._queued -= 1
+
+    def _execute(
+        self,
+        submitted: float,
+        state: List[bool],
+        call: Callable[[], F_Return],
+    ) -> F_Return:
+        wait_time = perf_counter() - submitted
+
+        with self._lock:
+            if not state[0]:
+                state[0] = True
+                self._queued -= 1
+            self._running += 1
+            self._record_wait(wait_time)
+
+        try:
+            return call()
+
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+
+class ProcessExecutor(BaseExecutor):
+    """Process pool to run CPU-bound synchronous handlers.
+
+    Only the handler call is shipped to a worker: the function is passed by its
+    import path and the arguments are already decoded message fields, so they
+    should be picklable. Parsing, acknowledgement and response publishing stay
+    in the main process event loop.
+    """
+
+    __slots__ = ("mp_context", "_targets")
+
+    def __init__(
+        self,
+        name: Annotated[
+            str,
+            Doc("Executor name."),
+        ] = "faststream",
+        max_workers: Annotated[
+            Optional[int],
+            Doc("Number of worker processes. CPU count is used if not set."),
+        ] = None,
+        mp_context: Annotated[
+            Optional["BaseContext"],
+            Doc("Multiprocessing context to start worker processes with."),
+        ] = None,
+    ) -> None:
+        super().__init__(
+            name=name,
+            max_workers=max_workers or os.cpu_count() or 1,
+        )
+        self.mp_context = mp_context
+        self._targets: Dict[Callable[..., Any], Tuple[str, str]] = {}
+
+    def prepare(self, func: Callable[..., Any], *, decorated: bool = False) -> None:
+        """Check the handler can be imported and called by a worker process."""
+        name = getattr(func, "__qualname__", repr(func))
+
+        if is_coroutine_callable(func):
+            raise SetupError(
+                f"`{name}` is a coroutine function. "
+                "`ProcessExecutor` can run synchronous handlers only."
+            )
+
+        if decorated:
+            # worker process imports the original handler without decorators
+            raise SetupError(
+                f"`{name}` has call decorators, "
+                "so it can't be executed by `ProcessExecutor`."
+            )
+
+        self._get_target(func)
+
+    def _create_pool(self) -> Executor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self.mp_context,
+        )
+
+    def stats(self) -> ExecutorStats:
+        """Return the current executor statistics.
+
+        Workers state is not shared with the main process, so calls over
+        `max_workers` are considered queued.
+        """
+        with self._lock:
+            in_flight = self._queued
+            running = min(in_flight, self.max_workers)
+            return ExecutorStats(
+                name=self.name,
+                max_workers=self.max_workers,
+                queued=in_flight - running,
+                running=running,
+                completed=self._completed,
+                wait_time_total=self._wait_total,
+                wait_time_max=self._wait_max,
+            )
+
+    async def run(
+        self,
+        func: Callable[F_Spec, F_Return],
+        *args: F_Spec.args,
+        **kwargs: F_Spec.kwargs,
+    ) -> F_Return:
+        """Run synchronous function in a worker process."""
+        target = self._get_target(func)
+        pool = self._get_pool()
+
+        with self._lock:
+            self._queued += 1
+
+        try:
+            wait_time, result = await asyncio.get_running_loop().run_in_executor(
+                pool,
+                partial(_call_target, target, time.time(), args, kwargs),
+            )
+
+        finally:
+            with self._lock:
+                self._queued -= 1
+
+        with self._lock:
+            self._completed += 1
+            self._record_wait(wait_time)
+
+        return result  # type: ignore[no-any-return]
+
+    def _get_target(self, func: Callable[..., Any]) -> Tuple[str, str]:
+        if (target := self._targets.get(func)) is None:
+            original = unwrap(func)
+            module = getattr(original, "__module__", None)
+            qualname = getattr(original, "__qualname__", "")
+
+            if not module or "<" in qualname:
+                raise SetupError(
+                    f"`{qualname or original!r}` can't be executed by `ProcessExecutor`. "
+                    "Please, define it at the module level."
+                )
+
+            target = self._targets[func] = (module, qualname)
+
+        return target
+
+
+def _call_target(
+    target: Tuple[str, str],
+    submitted: float,
+    args: Tuple[Any, ...],
+    kwargs: "AnyDict",
+) -> Tuple[float, Any]:
+    """Import and call the function in a worker process.
+
+    Returns time the call waited for a worker and the call result.
+    """
+    wait_time = time.time() - submitted
+
+    module, qualname = target
+    func: Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        func = getattr(func, name)
+
+    # decorated handlers are stored in the module as `HandlerCallWrapper`
+    func = getattr(func, "_original_call", func)
+
+    return wait_time, func(*args, **kwargs)
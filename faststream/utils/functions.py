@@ -1,6 +1,7 @@
 from contextlib import asynccontextmanager, contextmanager
 from functools import wraps
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Awaitable,
@@ -9,15 +10,20 @@ from typing import (
     Iterator,
     Optional,
     Union,
+    cast,
     overload,
 )
 
 import anyio
 from fast_depends.core import CallModel
+from fast_depends.utils import is_coroutine_callable
 from fast_depends.utils import run_async as call_or_await
 
 from faststream.types import F_Return, F_Spec
 
+if TYPE_CHECKING:
+    from faststream.utils.executor import BaseExecutor
+
 __all__ = (
     "call_or_await",
     "to_async",
@@ -30,12 +36,14 @@ __all__ = (
 @overload
 def to_async(
     func: Callable[F_Spec, Awaitable[F_Return]],
+    executor: Optional["BaseExecutor"] = None,
 ) -> Callable[F_Spec, Awaitable[F_Return]]: ...
 
 
 @overload
 def to_async(
     func: Callable[F_Spec, F_Return],
+    executor: Optional["BaseExecutor"] = None,
 ) -> Callable[F_Spec, Awaitable[F_Return]]: ...
 
 
@@ -44,8 +52,25 @@ def to_async(
         Callable[F_Spec, F_Return],
         Callable[F_Spec, Awaitable[F_Return]],
     ],
+    executor: Optional["BaseExecutor"] = None,
 ) -> Callable[F_Spec, Awaitable[F_Return]]:
-    """Converts a synchronous function to an asynchronous function."""
+    """Converts a synchronous function to an asynchronous function.
+
+    Synchronous calls are running in the `executor` if it is passed,
+    in the shared anyio threadpool otherwise. Coroutine functions are awaited
+    directly, so subscribers check them by `BaseExecutor.prepare` at setup.
+    """
+    if executor is not None and not is_coroutine_callable(func):
+        sync_func = cast(Callable[F_Spec, F_Return], func)
+
+        @wraps(func)
+        async def executor_wrapper(
+            *args: F_Spec.args, **kwargs: F_Spec.kwargs
+        ) -> F_Return:
+            """Wraps a function to run it in the executor."""
+            return await executor.run(sync_func, *args, **kwargs)
+
+        return executor_wrapper
 
     @wraps(func)
     async def to_async_wrapper(*args: F_Spec.args, **kwargs: F_Spec.kwargs) -> F_Return:
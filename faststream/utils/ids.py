@@ -0,0 +1,153 @@
+import os
+import threading
+import time
+from abc import abstractmethod
+from secrets import randbits
+from uuid import uuid4
+
+from faststream.utils.nuid import DIGITS, MAX_SEQ, NUID
+
+__all__ = (
+    "IdGenerator",
+    "NuidGenerator",
+    "UlidGenerator",
+    "Uuid4Generator",
+)
+
+
+class IdGenerator:
+    """Base class for message and correlation IDs generation strategies."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __call__(self) -> str:
+        """Return a new unique ID."""
+        raise NotImplementedError()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class Uuid4Generator(IdGenerator):
+    """Random UUID4 strings. Reads `os.urandom` for every ID."""
+
+    __slots__ = ()
+
+    def __call__(self) -> str:
+        return str(uuid4())
+
+
+_BASE62 = DIGITS.decode()
+_BASE62_PAIRS = tuple(a + b for a in _BASE62 for b in _BASE62)
+_PAIR_BASE = len(_BASE62_PAIRS)
+
+
+class _FastNUID(NUID):
+    """NUID producing the same sequence as a string, two digits per step."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._str_prefix = self._prefix.decode()
+
+    def next_str(self) -> str:
+        self._seq += self._inc
+        if self._seq >= MAX_SEQ:
+            self.randomize_prefix()
+            self.reset_sequential()
+            self._str_prefix = self._prefix.decode()
+
+        seq, d5 = divmod(self._seq, _PAIR_BASE)
+        seq, d4 = divmod(seq, _PAIR_BASE)
+        seq, d3 = divmod(seq, _PAIR_BASE)
+        d1, d2 = divmod(seq, _PAIR_BASE)
+
+        pairs = _BASE62_PAIRS
+        return "".join(
+            (
+                self._str_prefix,
+                pairs[d1],
+                pairs[d2],
+                pairs[d3],
+                pairs[d4],
+                pairs[d5],
+            )
+        )
+
+
+class NuidGenerator(IdGenerator):
+    """NATS NUID strings: a random prefix with a pseudo-random sequence.
+
+    Only the prefix is taken from the OS random source, once per ~10^16 IDs.
+    Every thread has its own sequence and the state is renewed in forked
+    processes, so workers never share IDs.
+    """
+
+    __slots__ = ("_local",)
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+        if hasattr(os, "register_at_fork"):  # pragma: no branch
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._local = threading.local()
+
+    def __call__(self) -> str:
+        try:
+            nuid: _FastNUID = self._local.nuid
+        except AttributeError:
+            nuid = self._local.nuid = _FastNUID()
+        return nuid.next_str()
+
+
+_CROCKFORD32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_CROCKFORD32_PAIRS = tuple(a + b for a in _CROCKFORD32 for b in _CROCKFORD32)
+_RANDOM_BITS = 80
+
+
+class UlidGenerator(IdGenerator):
+    """Monotonic ULID strings sortable by generation time.
+
+    IDs generated in the same millisecond increment the random part of the
+    previous one, so they keep the generation order within the process.
+    """
+
+    __slots__ = ("_lock", "_last_ms", "_last_random")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._last_random = 0
+
+        if hasattr(os, "register_at_fork"):  # pragma: no branch
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = 0
+
+    def __call__(self) -> str:
+        now = time.time_ns() // 1_000_000
+
+        with self._lock:
+            if now <= self._last_ms:
+                now = self._last_ms
+                random = self._last_random + 1
+                if random >> _RANDOM_BITS:  # random part overflow
+                    now += 1
+                    random = randbits(_RANDOM_BITS)
+            else:
+                random = randbits(_RANDOM_BITS)
+
+            self._last_ms = now
+            self._last_random = random
+
+        value = (now << _RANDOM_BITS) | random
+
+        # 26 chars: 3 leading bits, one 5-bit digit and 12 pairs of them
+        pairs = _CROCKFORD32_PAIRS
+        chars = [_CROCKFORD32[value >> 125], _CROCKFORD32[(value >> 120) & 0x1F]]
+        chars.extend(pairs[(value >> shift) & 0x3FF] for shift in range(110, -1, -10))
+        return "".join(chars)
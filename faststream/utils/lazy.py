@@ -0,0 +1,25 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Mapping
+
+
+def lazy_getattr(module_name: str, attrs: Mapping[str, str]) -> Callable[[str], Any]:
+    """Make the module `__getattr__` importing attributes at the first access.
+
+    Args:
+        module_name: the module `__name__`
+        attrs: attribute name to the source module path mapping
+
+    Imported values are cached in the module namespace, so `__getattr__`
+    is called once per attribute.
+    """
+
+    def load(name: str) -> Any:
+        if (path := attrs.get(name)) is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(import_module(path), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return load
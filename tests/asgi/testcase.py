@@ -4,7 +4,13 @@ import pytest
 from starlette.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
-from faststream.asgi import AsgiFastStream, AsgiResponse, get, make_ping_asgi
+from faststream.asgi import (
+    AsgiFastStream,
+    AsgiResponse,
+    get,
+    make_ping_asgi,
+    make_ready_asgi,
+)
 
 
 class AsgiTestcase:
@@ -56,6 +62,43 @@ class AsgiTestcase:
                 response = client.get("/health")
                 assert response.status_code == 204
 
+    @pytest.mark.asyncio
+    async def test_asgi_ping_healthy_with_stopped_subscriber(self):
+        broker = self.get_broker()
+
+        subscriber = broker.subscriber("test")
+
+        @subscriber
+        async def handler(): ...
+
+        app = AsgiFastStream(
+            broker,
+            asgi_routes=[
+                ("/health", make_ping_asgi(broker, timeout=5.0)),
+                ("/ready", make_ready_asgi(broker, timeout=5.0)),
+            ],
+        )
+
+        async with self.get_test_broker(broker):
+            with TestClient(app) as client:
+                assert client.get("/ready").status_code == 204
+
+                subscriber.running = False
+
+                assert client.get("/health").status_code == 204
+                assert client.get("/ready").status_code == 500
+
+    def test_asgi_ready_unhealthy(self):
+        broker = self.get_broker()
+
+        app = AsgiFastStream(
+            asgi_routes=[("/ready", make_ready_asgi(broker, timeout=5.0))],
+        )
+
+        with TestClient(app) as client:
+            response = client.get("/ready")
+            assert response.status_code == 500
+
     @pytest.mark.asyncio
     async def test_asyncapi_asgi(self):
         broker = self.get_broker()
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from abc import abstractmethod
 from typing import Any
 from unittest.mock import MagicMock
@@ -7,7 +8,7 @@ import anyio
 import pytest
 from pydantic import BaseModel
 
-from faststream import Context, Depends
+from faststream import Context, Depends, HeaderFilter, ThreadExecutor
 from faststream.broker.core.usecase import BrokerUsecase
 from faststream.exceptions import StopConsume
 
@@ -48,6 +49,38 @@ class BrokerConsumeTestcase(BaseTestcaseConfig):
 
         assert event.is_set()
 
+    async def test_consume_sync_in_executor(
+        self,
+        queue: str,
+        event: asyncio.Event,
+        mock: MagicMock,
+    ):
+        executor = ThreadExecutor("test-executor", max_workers=1)
+        consume_broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue, executor=executor)
+
+        @consume_broker.subscriber(*args, **kwargs)
+        def subscriber(m):
+            mock(threading.current_thread().name)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish("hello", queue)),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=self.timeout,
+            )
+
+        executor.shutdown()
+
+        assert event.is_set()
+        assert mock.call_args[0][0].startswith("test-executor")
+        assert executor.stats().completed == 1
+
     async def test_consume_from_multi(
         self,
         queue: str,
@@ -207,6 +240,58 @@ class BrokerConsumeTestcase(BaseTestcaseConfig):
         mock.handler.assert_called_once_with({"msg": "hello"})
         mock.handler2.assert_called_once_with("hello")
 
+    async def test_consume_with_indexed_filter(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ):
+        consume_broker = self.get_broker()
+
+        consume = asyncio.Event()
+        consume2 = asyncio.Event()
+        consume3 = asyncio.Event()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        sub = consume_broker.subscriber(*args, **kwargs)
+
+        @sub(filter=HeaderFilter("type", "first"))
+        async def handler(m):
+            mock.handler(m)
+            consume.set()
+
+        @sub(filter=HeaderFilter("type", "second", "third"))
+        async def handler2(m):
+            mock.handler2(m)
+            consume2.set()
+
+        @sub
+        async def handler3(m):
+            mock.handler3(m)
+            consume3.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+            await asyncio.wait(
+                (
+                    asyncio.create_task(
+                        br.publish("1", queue, headers={"type": "first"})
+                    ),
+                    asyncio.create_task(
+                        br.publish("2", queue, headers={"type": "third"})
+                    ),
+                    asyncio.create_task(br.publish("3", queue)),
+                    asyncio.create_task(consume.wait()),
+                    asyncio.create_task(consume2.wait()),
+                    asyncio.create_task(consume3.wait()),
+                ),
+                timeout=self.timeout,
+            )
+
+        mock.handler.assert_called_once_with("1")
+        mock.handler2.assert_called_once_with("2")
+        mock.handler3.assert_called_once_with("3")
+
     async def test_consume_validate_false(
         self,
         queue: str,
@@ -1,6 +1,7 @@
 import asyncio
+import logging
 from contextlib import asynccontextmanager
-from typing import Any, Callable, Type, TypeVar
+from typing import Any, Callable, List, Type, TypeVar
 from unittest.mock import Mock
 
 import pytest
@@ -8,10 +9,11 @@ from fastapi import BackgroundTasks, Depends, FastAPI, Header
 from fastapi.exceptions import RequestValidationError
 from fastapi.testclient import TestClient
 
-from faststream import Response, context
+from faststream import DedupStore, MicroBatch, Response, ThreadExecutor, context
 from faststream.broker.core.usecase import BrokerUsecase
 from faststream.broker.fastapi.context import Context
 from faststream.broker.fastapi.router import StreamRouter
+from faststream.broker.middlewares.logging import CriticalLogMiddleware
 from faststream.broker.router import BrokerRouter
 from faststream.types import AnyCallable
 
@@ -290,6 +292,74 @@ class FastAPILocalTestcase(BaseTestcaseConfig):
                 with pytest.raises(RequestValidationError):
                     await router.broker.publish("hi", queue)
 
+    async def test_subscriber_executor(self, queue: str):
+        router = self.router_class()
+        executor = ThreadExecutor()
+
+        args, kwargs = self.get_subscriber_params(queue, executor=executor)
+
+        sub = router.subscriber(*args, **kwargs)
+
+        @sub
+        async def hello():
+            return "hi"
+
+        assert sub.calls[0].item_executor is executor
+
+    async def test_subscriber_micro_batch(self, mock: Mock, queue: str):
+        router = self.router_class()
+
+        args, kwargs = self.get_subscriber_params(queue, micro_batch=MicroBatch())
+
+        @router.subscriber(*args, **kwargs)
+        async def hello(msg: List[int]):
+            mock(msg)
+
+        async with self.broker_test(router.broker):
+            await router.broker.publish(1, queue)
+
+        mock.assert_called_once_with([1])
+
+    async def test_subscriber_dedup(self, mock: Mock, queue: str):
+        router = self.router_class()
+
+        args, kwargs = self.get_subscriber_params(
+            queue, dedup=DedupStore(key=lambda m: m.headers["key"])
+        )
+
+        @router.subscriber(*args, **kwargs)
+        async def hello(msg: int):
+            mock(msg)
+
+        async with self.broker_test(router.broker):
+            await router.broker.publish(1, queue, headers={"key": "a"})
+            await router.broker.publish(2, queue, headers={"key": "a"})
+
+        mock.assert_called_once_with(1)
+
+    async def test_subscriber_log_sampling(self, queue: str):
+        logger = Mock()
+        router = self.router_class(
+            logger=logger,
+            middlewares=(CriticalLogMiddleware(logger, logging.INFO),),
+        )
+
+        args, kwargs = self.get_subscriber_params(queue, log_sampling=2)
+
+        @router.subscriber(*args, **kwargs)
+        async def hello(): ...
+
+        async with self.broker_test(router.broker):
+            logger.reset_mock()
+
+            for i in range(4):
+                await router.broker.publish(i, queue)
+
+        assert [c.args[1] for c in logger.log.call_args_list] == [
+            "Received",
+            "Processed",
+        ] * 2
+
     async def test_headers(self, queue: str):
         router = self.router_class()
 
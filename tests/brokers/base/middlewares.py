@@ -6,7 +6,11 @@ import pytest
 
 from faststream import Context
 from faststream.broker.core.usecase import BrokerUsecase
-from faststream.broker.middlewares import BaseMiddleware, ExceptionMiddleware
+from faststream.broker.middlewares import (
+    BaseMiddleware,
+    ExceptionMiddleware,
+    StatelessMiddleware,
+)
 from faststream.exceptions import SkipMessage
 from faststream.types import DecodedMessage
 
@@ -289,6 +293,44 @@ class MiddlewareTestcase(LocalMiddlewareTestcase):
         mock.start.assert_called_once()
         mock.end.assert_called_once()
 
+    async def test_stateless_global_middleware(
+        self, event: asyncio.Event, queue: str, mock: Mock, raw_broker
+    ):
+        class Mid(StatelessMiddleware):
+            async def consume_scope(self, call_next, msg):
+                mock.consume(self, await msg.decode())
+                return await call_next(msg)
+
+        mid = Mid()
+
+        broker = self.broker_class(middlewares=(mid,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m):
+            if mock.consume.call_count == 2:
+                event.set()
+
+        broker = self.patch_broker(raw_broker, broker)
+
+        async with broker:
+            await broker.start()
+            await asyncio.wait(
+                (
+                    asyncio.create_task(broker.publish("1", queue)),
+                    asyncio.create_task(broker.publish("2", queue)),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=self.timeout,
+            )
+
+        assert event.is_set()
+        assert {c.args for c in mock.consume.call_args_list} == {
+            (mid, "1"),
+            (mid, "2"),
+        }
+
     async def test_add_global_middleware(
         self,
         event: asyncio.Event,
@@ -2,9 +2,9 @@ import asyncio
 from unittest.mock import patch
 
 import pytest
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, ConsumerRecord
 
-from faststream.exceptions import AckMessage
+from faststream.exceptions import AckMessage, SetupError
 from faststream.kafka import KafkaBroker, TopicPartition
 from faststream.kafka.annotations import KafkaMessage
 from tests.brokers.base.consume import BrokerRealConsumeTestcase
@@ -312,3 +312,97 @@ class TestConsume(BrokerRealConsumeTestcase):
                 m.mock.assert_not_called()
 
             assert event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_consume(
+        self,
+        queue: str,
+        event: asyncio.Event,
+        mock,
+    ):
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(
+            queue,
+            max_workers=2,
+            ordering_key=lambda msg: msg.key,
+        )
+        async def handler(m):
+            mock(m)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish("hello", queue, key=b"key")),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=10,
+            )
+
+            assert event.is_set()
+            mock.assert_called_once_with(b"hello")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_consume_ordered_by_key():
+    broker = KafkaBroker(apply_types=False)
+
+    consumed = []
+
+    @broker.subscriber(
+        "test",
+        max_workers=2,
+        ordering_key=lambda msg: msg.key,
+    )
+    async def handler(m: bytes):
+        m = m.decode()
+        _, number = m.split(":")
+        # first messages are the slowest ones
+        await asyncio.sleep(0.01 * (3 - int(number)))
+        consumed.append(m)
+
+    broker.setup()
+    subscriber = next(iter(broker._subscribers.values()))
+    subscriber.running = True
+    subscriber.start_consume_task()
+
+    for number in range(3):
+        for key in ("a", "b"):
+            await subscriber.consume_one(
+                ConsumerRecord(
+                    topic="test",
+                    partition=0,
+                    offset=number,
+                    timestamp=0,
+                    timestamp_type=0,
+                    key=key.encode(),
+                    value=f"{key}:{number}".encode(),
+                    checksum=None,
+                    serialized_key_size=0,
+                    serialized_value_size=0,
+                    headers=(),
+                )
+            )
+
+    await asyncio.sleep(0.2)
+    await subscriber.close()
+
+    assert [m for m in consumed if m.startswith("a")] == ["a:0", "a:1", "a:2"]
+    assert [m for m in consumed if m.startswith("b")] == ["b:0", "b:1", "b:2"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"batch": True}, id="batch"),
+        pytest.param({"group_id": "test", "auto_commit": False}, id="manual"),
+    ],
+)
+def test_concurrent_consume_setup_error(kwargs):
+    broker = KafkaBroker()
+
+    with pytest.raises(SetupError, match="max_workers"):
+        broker.subscriber("test", max_workers=2, **kwargs)
@@ -694,3 +694,86 @@ class TestConsume(BrokerRealConsumeTestcase):
 
             mock(await subscriber.get_one(timeout=1e-24))
             mock.assert_called_once_with(None)
+
+    @pytest.mark.parametrize(
+        "subscriber_kwargs",
+        [
+            pytest.param({}, id="core"),
+            pytest.param({"pull_sub": PullSub(1)}, id="pull"),
+        ],
+    )
+    async def test_consume_ordering_key_error(
+        self,
+        queue: str,
+        stream: JStream,
+        event: asyncio.Event,
+        mock: Mock,
+        subscriber_kwargs,
+    ):
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(
+            queue,
+            stream=stream if subscriber_kwargs else None,
+            max_workers=2,
+            ordering_key=lambda msg: msg.headers["key"],
+            **subscriber_kwargs,
+        )
+        def subscriber(m):
+            mock(m)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish("hello", queue)),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=3,
+            )
+
+            assert event.is_set()
+            mock.assert_called_once_with("hello")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_consume_ordered_by_key():
+    broker = NatsBroker(apply_types=False)
+
+    consumed = []
+
+    @broker.subscriber(
+        "test",
+        max_workers=2,
+        ordering_key=lambda msg: msg.headers["key"],
+    )
+    async def handler(m: bytes):
+        m = m.decode()
+        _, number = m.split(":")
+        # first messages are the slowest ones
+        await asyncio.sleep(0.01 * (3 - int(number)))
+        consumed.append(m)
+
+    broker.setup()
+    subscriber = next(iter(broker._subscribers.values()))
+    subscriber.running = True
+    subscriber.start_consume_task()
+
+    for number in range(3):
+        for key in ("a", "b"):
+            await subscriber._put_msg(
+                Msg(
+                    _client=None,
+                    subject="test",
+                    data=f"{key}:{number}".encode(),
+                    headers={"key": key},
+                )
+            )
+
+    await asyncio.sleep(0.2)
+    await subscriber.close()
+
+    assert [m for m in consumed if m.startswith("a")] == ["a:0", "a:1", "a:2"]
+    assert [m for m in consumed if m.startswith("b")] == ["b:0", "b:1", "b:2"]
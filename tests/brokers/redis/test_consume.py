@@ -5,7 +5,10 @@ from unittest.mock import MagicMock, patch
 import pytest
 from redis.asyncio import Redis
 
+from faststream.exceptions import SetupError
 from faststream.redis import ListSub, PubSub, RedisBroker, RedisMessage, StreamSub
+from faststream.redis.message import PubSubMessage
+from faststream.redis.testing import build_message
 from tests.brokers.base.consume import BrokerRealConsumeTestcase
 from tests.tools import spy_decorator
 
@@ -92,6 +95,45 @@ class TestConsume(BrokerRealConsumeTestcase):
 
         mock.assert_called_once_with("hello")
 
+    @pytest.mark.parametrize(
+        "destination",
+        [
+            pytest.param("channel", id="channel"),
+            pytest.param("list", id="list"),
+            pytest.param("stream", id="stream"),
+        ],
+    )
+    async def test_concurrent_consume(
+        self,
+        event: asyncio.Event,
+        mock: MagicMock,
+        queue: str,
+        destination: str,
+    ):
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(
+            **{destination: queue},
+            max_workers=2,
+            ordering_key=lambda msg: msg["channel"],
+        )
+        async def handler(msg):
+            mock(msg)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish("hello", **{destination: queue})),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=3,
+            )
+
+        mock.assert_called_once_with("hello")
+
 
 @pytest.mark.redis
 @pytest.mark.asyncio
@@ -682,3 +724,57 @@ class TestConsumeStream:
 
             mock(await subscriber.get_one(timeout=1e-24))
             mock.assert_called_once_with(None)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_consume_ordered_by_key():
+    broker = RedisBroker(apply_types=False)
+
+    consumed = []
+
+    @broker.subscriber(
+        "test",
+        max_workers=2,
+        ordering_key=lambda msg: msg["channel"],
+    )
+    async def handler(m: str):
+        _, number = m.split(":")
+        # first messages are the slowest ones
+        await asyncio.sleep(0.01 * (3 - int(number)))
+        consumed.append(m)
+
+    broker.setup()
+    subscriber = next(iter(broker._subscribers.values()))
+    subscriber.running = True
+    subscriber.start_consume_task()
+
+    for number in range(3):
+        for key in ("a", "b"):
+            await subscriber.consume_one(
+                PubSubMessage(
+                    type="message",
+                    data=build_message(f"{key}:{number}", correlation_id=""),
+                    channel=key,
+                    pattern=None,
+                )
+            )
+
+    await asyncio.sleep(0.2)
+    await subscriber.close()
+
+    assert [m for m in consumed if m.startswith("a")] == ["a:0", "a:1", "a:2"]
+    assert [m for m in consumed if m.startswith("b")] == ["b:0", "b:1", "b:2"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"list": ListSub("test", batch=True)}, id="list"),
+        pytest.param({"stream": StreamSub("test", batch=True)}, id="stream"),
+    ],
+)
+def test_concurrent_consume_setup_error(kwargs):
+    broker = RedisBroker()
+
+    with pytest.raises(SetupError, match="max_workers"):
+        broker.subscriber(max_workers=2, **kwargs)
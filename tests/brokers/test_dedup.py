@@ -0,0 +1,86 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from faststream import DedupStore
+from faststream.redis import RedisBroker, RedisDedupStore, TestRedisBroker
+
+
+@pytest.mark.asyncio
+async def test_skip_duplicates(mock: MagicMock):
+    broker = RedisBroker()
+
+    @broker.subscriber("test", dedup=DedupStore())
+    async def handler(m):
+        mock(m)
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish(1, "test", headers={"message_id": "1"})
+        await br.publish(2, "test", headers={"message_id": "1"})
+        await br.publish(3, "test", headers={"message_id": "2"})
+
+    assert [c.args[0] for c in mock.call_args_list] == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_custom_key(mock: MagicMock):
+    broker = RedisBroker()
+
+    @broker.subscriber("test", dedup=DedupStore(key=lambda m: m.headers["key"]))
+    async def handler(m):
+        mock(m)
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish(1, "test", headers={"key": "a"})
+        await br.publish(2, "test", headers={"key": "a"})
+
+    mock.assert_called_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_failed_message_is_not_stored(mock: MagicMock):
+    broker = RedisBroker()
+
+    @broker.subscriber("test", dedup=DedupStore())
+    async def handler(m):
+        mock(m)
+        if m == 1:
+            raise ValueError
+
+    async with TestRedisBroker(broker) as br:
+        with pytest.raises(ValueError):  # noqa: PT011
+            await br.publish(1, "test", headers={"message_id": "1"})
+
+        await br.publish(2, "test", headers={"message_id": "1"})
+
+    assert mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_store_bounds():
+    store = DedupStore(ttl=10, max_size=2)
+
+    with patch("faststream.broker.subscriber.dedup.monotonic", return_value=0):
+        for key in "abc":
+            await store.add(key)
+
+        assert not await store.seen("a")
+        assert await store.seen("c")
+
+    with patch("faststream.broker.subscriber.dedup.monotonic", return_value=10):
+        assert not await store.seen("c")
+
+
+@pytest.mark.asyncio
+async def test_redis_store():
+    broker = RedisBroker()
+    broker._connection = connection = AsyncMock()
+    connection.exists.return_value = 1
+
+    store = RedisDedupStore(broker, ttl=1.5)
+
+    assert await store.seen("1")
+    connection.exists.assert_awaited_once_with("faststream:dedup:1")
+
+    await store.add("1")
+    connection.set.assert_awaited_once_with("faststream:dedup:1", 1, px=1500)
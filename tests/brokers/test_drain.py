@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from faststream.redis import RedisBroker, TestRedisBroker
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_in_flight():
+    broker = RedisBroker(graceful_timeout=5)
+
+    started, release = asyncio.Event(), asyncio.Event()
+
+    @broker.subscriber("test")
+    async def handler(m):
+        started.set()
+        await release.wait()
+
+    async with TestRedisBroker(broker) as br:
+        subscriber = next(iter(br._subscribers.values()))
+
+        publish_task = asyncio.create_task(br.publish("hello", "test"))
+        await asyncio.wait_for(started.wait(), timeout=1)
+
+        assert br.in_flight == {subscriber.name: 1}
+
+        drain_task = asyncio.create_task(br.drain())
+        await asyncio.sleep(0.01)
+
+        assert not subscriber.running
+        assert not drain_task.done()
+
+        release.set()
+        await asyncio.wait_for(drain_task, timeout=1)
+        await publish_task
+
+        assert br.in_flight == {subscriber.name: 0}
+
+
+@pytest.mark.asyncio
+async def test_drain_timeout():
+    broker = RedisBroker()
+
+    started = asyncio.Event()
+
+    @broker.subscriber("test")
+    async def handler(m):
+        started.set()
+        await asyncio.sleep(10)
+
+    async with TestRedisBroker(broker) as br:
+        publish_task = asyncio.create_task(br.publish("hello", "test"))
+        await asyncio.wait_for(started.wait(), timeout=1)
+
+        await asyncio.wait_for(br.drain(timeout=0.01), timeout=1)
+
+        assert sum(br.in_flight.values()) == 1
+        publish_task.cancel()
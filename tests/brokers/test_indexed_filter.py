@@ -0,0 +1,29 @@
+from typing import Any
+
+import pytest
+
+from faststream.broker.message import StreamMessage
+from faststream.broker.subscriber.call_item import IndexedFilter
+
+
+def test_extract_is_required():
+    class NoExtractFilter(IndexedFilter):
+        pass
+
+    with pytest.raises(TypeError, match="extract"):
+        NoExtractFilter("key", "value")
+
+
+@pytest.mark.asyncio
+async def test_custom_filter():
+    class CorrelationFilter(IndexedFilter):
+        def __init__(self, *values: str) -> None:
+            super().__init__("correlation_id", *values)
+
+        def extract(self, message: StreamMessage[Any]) -> Any:
+            return message.correlation_id
+
+    message = StreamMessage(raw_message=None, body=b"", correlation_id="1")
+
+    assert await CorrelationFilter("1", "2")(message)
+    assert not await CorrelationFilter("3")(message)
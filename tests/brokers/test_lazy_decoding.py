@@ -0,0 +1,157 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiokafka import ConsumerRecord
+from nats.aio.msg import Msg
+from pydantic import BaseModel
+
+from faststream import BaseMiddleware
+from faststream.broker.message import StreamMessage, lazy_value
+from faststream.broker.wrapper.call import HandlerCallWrapper
+from faststream.kafka.message import KafkaMessage
+from faststream.kafka.parser import AioKafkaParser
+from faststream.nats import NatsBroker
+
+
+class Model(BaseModel):
+    id: int
+
+
+def _build_message(body: bytes, **kwargs) -> StreamMessage[bytes]:
+    message = StreamMessage(raw_message=body, body=body, **kwargs)
+    message._lazy_decoder = AsyncMock(return_value={"id": 1})
+    return message
+
+
+def _wrap(func) -> HandlerCallWrapper:
+    handler = HandlerCallWrapper(func)
+    handler.set_wrapped(
+        apply_types=True,
+        is_validate=True,
+        dependencies=(),
+        _get_dependant=None,
+        _call_decorators=(),
+    )
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_decode_lazy_once():
+    message = _build_message(b'{"id": 1}')
+    decoder = message._lazy_decoder
+
+    assert await message.decode() == {"id": 1}
+    assert await message.decode() == {"id": 1}
+
+    decoder.assert_awaited_once_with(message)
+
+
+@pytest.mark.asyncio
+async def test_model_validated_from_bytes():
+    def handler(msg: Model) -> Model:
+        return msg
+
+    wrapper = _wrap(handler)
+    assert wrapper.validates_raw_body
+
+    message = _build_message(b'{"id": 1}', content_type="application/json")
+
+    assert await wrapper.call_wrapped(message) == Model(id=1)
+    message._lazy_decoder.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_model_from_not_json_uses_decoder():
+    def handler(msg: Model) -> Model:
+        return msg
+
+    wrapper = _wrap(handler)
+
+    message = _build_message(b"id=1", content_type="text/plain")
+    decoder = message._lazy_decoder
+
+    assert await wrapper.call_wrapped(message) == Model(id=1)
+    decoder.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_not_model_uses_decoder():
+    def handler(msg: dict) -> dict:
+        return msg
+
+    wrapper = _wrap(handler)
+    assert not wrapper.validates_raw_body
+
+    message = _build_message(b'{"id": 1}')
+    decoder = message._lazy_decoder
+
+    assert await wrapper.call_wrapped(message) == {"id": 1}
+    decoder.assert_awaited_once()
+
+
+def test_lazy_fields_built_on_access():
+    factory = MagicMock(return_value={"key": "value"})
+
+    message = StreamMessage(raw_message=b"", body=b"", headers=lazy_value(factory))
+
+    factory.assert_not_called()
+    assert message.headers == {"key": "value"}
+    assert message.headers == {"key": "value"}
+    factory.assert_called_once()
+
+
+def test_default_ids_are_lazy():
+    message = StreamMessage(raw_message=b"", body=b"")
+
+    assert "message_id" not in message.__dict__
+    assert message.message_id == message.message_id
+    assert message.correlation_id != message.message_id
+
+
+@pytest.mark.asyncio
+async def test_kafka_headers_decoded_on_access():
+    raw = ConsumerRecord(
+        topic="test",
+        partition=0,
+        offset=0,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=b"",
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=0,
+        headers=[("content-type", b"text/plain"), ("correlation_id", b"1")],
+    )
+
+    message = await AioKafkaParser(msg_class=KafkaMessage, regex=None).parse_message(
+        raw
+    )
+
+    assert "headers" not in message.__dict__
+    assert message.content_type == "text/plain"
+    assert message.correlation_id == "1"
+    assert message.headers == {"content-type": "text/plain", "correlation_id": "1"}
+
+
+@pytest.mark.asyncio
+async def test_correlation_id_not_resolved_without_publishers():
+    messages = []
+
+    class CaptureMiddleware(BaseMiddleware):
+        async def consume_scope(self, call_next, msg):
+            messages.append(msg)
+            return await call_next(msg)
+
+    broker = NatsBroker(middlewares=(CaptureMiddleware,))
+
+    @broker.subscriber("test")
+    async def handler(m):
+        return m
+
+    broker.setup()
+    subscriber = next(iter(broker._subscribers.values()))
+
+    await subscriber.process_message(Msg(_client=None, subject="test", data=b"1"))
+
+    assert "correlation_id" not in messages[0].__dict__
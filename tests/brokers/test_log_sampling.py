@@ -0,0 +1,63 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream.broker.middlewares.logging import CriticalLogMiddleware
+from faststream.exceptions import SetupError
+from faststream.redis import RedisBroker, TestRedisBroker
+
+
+def _messages(logger: MagicMock):
+    return [c.args[1] for c in logger.log.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_log_sampling():
+    logger = MagicMock()
+    broker = RedisBroker(
+        logger=logger,
+        middlewares=(CriticalLogMiddleware(logger, logging.INFO),),
+    )
+
+    @broker.subscriber("test", log_sampling=3)
+    async def handler(m): ...
+
+    async with TestRedisBroker(broker) as br:
+        logger.reset_mock()
+
+        for i in range(6):
+            await br.publish(i, "test")
+
+    assert _messages(logger) == ["Received", "Processed"] * 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_always_logged():
+    logger = MagicMock()
+    broker = RedisBroker(
+        logger=logger,
+        middlewares=(CriticalLogMiddleware(logger, logging.INFO),),
+    )
+
+    @broker.subscriber("test", log_sampling=100)
+    async def handler(m):
+        if m == 2:
+            raise ValueError("fail")
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish(1, "test")
+
+        logger.reset_mock()
+        with pytest.raises(ValueError):  # noqa: PT011
+            await br.publish(2, "test")
+
+    logger.log.assert_called_once()
+    assert logger.log.call_args.args[:2] == (logging.ERROR, "ValueError: fail")
+
+
+def test_wrong_log_sampling():
+    broker = RedisBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber("test", log_sampling=0)
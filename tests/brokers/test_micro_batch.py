@@ -0,0 +1,191 @@
+import asyncio
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream import MicroBatch
+from faststream.broker.subscriber.batching import RawBatch
+from faststream.confluent import KafkaBroker as ConfluentBroker
+from faststream.exceptions import SetupError, StopConsume
+from faststream.kafka import KafkaBroker
+from faststream.nats import NatsBroker, PullSub
+from faststream.redis import ListSub, RedisBroker, StreamSub, TestRedisBroker
+from faststream.redis.message import DefaultStreamMessage, PubSubMessage, bDATA_KEY
+from faststream.redis.testing import build_message
+
+
+def _make_message(body: int) -> PubSubMessage:
+    return PubSubMessage(
+        type="message",
+        data=build_message(body, correlation_id=str(body)),
+        channel=b"test",
+        pattern=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_by_size_and_timeout(mock: MagicMock):
+    broker = RedisBroker(apply_types=True)
+
+    @broker.subscriber(
+        "test",
+        micro_batch=MicroBatch(max_batch_size=2, max_wait_ms=10),
+    )
+    async def handler(m: List[int]):
+        mock(m)
+
+    broker.setup()
+    subscriber = next(iter(broker._subscribers.values()))
+    subscriber.running = True
+
+    for body in range(3):
+        await subscriber.consume(_make_message(body))
+
+    mock.assert_called_once_with([0, 1])
+
+    await asyncio.sleep(0.05)
+    mock.assert_called_with([2])
+
+    await subscriber.close()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_batch(mock: MagicMock):
+    broker = RedisBroker()
+
+    @broker.subscriber(
+        "test",
+        micro_batch=MicroBatch(max_batch_size=10, max_wait_ms=1000),
+    )
+    async def handler(m):
+        mock(m)
+
+    broker.setup()
+    subscriber = next(iter(broker._subscribers.values()))
+    subscriber.running = True
+
+    await subscriber.consume(_make_message(1))
+    assert not mock.called
+
+    await subscriber.close()
+    mock.assert_called_once_with([1])
+
+
+@pytest.mark.asyncio
+async def test_batch_acks_all_messages():
+    broker = RedisBroker()
+
+    @broker.subscriber("test", micro_batch=MicroBatch(max_batch_size=2))
+    async def handler(m):
+        pass
+
+    broker.setup()
+    subscriber = next(iter(broker._subscribers.values()))
+
+    parser = subscriber.calls[0].item_parser
+    message = await parser(RawBatch([_make_message(1), _make_message(2)]))
+    await message.ack()
+
+    assert all(m.committed for m in message.messages)
+
+
+@pytest.mark.asyncio
+async def test_batch_acks_with_watcher_options():
+    broker = RedisBroker()
+
+    @broker.subscriber(
+        stream=StreamSub("test", group="group", consumer="consumer"),
+        micro_batch=MicroBatch(max_batch_size=2),
+    )
+    async def handler(m):
+        pass
+
+    broker.setup()
+    subscriber = next(iter(broker._subscribers.values()))
+    subscriber.running = True
+
+    redis = AsyncMock()
+    subscriber.extra_watcher_options.update(redis=redis, group="group")
+
+    for body in range(2):
+        await subscriber.consume(
+            DefaultStreamMessage(
+                type="stream",
+                channel="test",
+                message_ids=[str(body).encode()],
+                data={bDATA_KEY: build_message(body, correlation_id=str(body))},
+            )
+        )
+
+    await subscriber.close()
+
+    assert [c.args for c in redis.xack.await_args_list] == [
+        ("test", "group", b"0"),
+        ("test", "group", b"1"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_in_test_client(mock: MagicMock):
+    broker = RedisBroker()
+
+    @broker.subscriber("test", micro_batch=MicroBatch())
+    async def handler(m: List[int]):
+        mock(m)
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish(1, "test")
+
+    mock.assert_called_once_with([1])
+
+
+@pytest.mark.asyncio
+async def test_stop_consume_in_batch(mock: MagicMock):
+    broker = RedisBroker()
+
+    @broker.subscriber(
+        "test",
+        micro_batch=MicroBatch(max_batch_size=10, max_wait_ms=10),
+    )
+    async def handler(m):
+        mock(m)
+        await asyncio.sleep(0.02)
+        raise StopConsume
+
+    broker.setup()
+    subscriber = next(iter(broker._subscribers.values()))
+    subscriber.running = True
+
+    await subscriber.consume(_make_message(1))
+    await asyncio.sleep(0.015)  # the batch is processing
+    await subscriber.consume(_make_message(2))
+
+    await asyncio.sleep(0.05)
+    await asyncio.wait_for(subscriber._close_task, timeout=1)
+
+    assert not subscriber.running
+    assert [c.args[0] for c in mock.call_args_list] == [[1], [2]]
+
+
+@pytest.mark.parametrize(
+    ("broker", "kwargs"),
+    [
+        pytest.param(KafkaBroker(), {"batch": True}, id="kafka"),
+        pytest.param(
+            ConfluentBroker(), {"batch": True, "group_id": "test"}, id="confluent"
+        ),
+        pytest.param(
+            NatsBroker(),
+            {"stream": "test-stream", "pull_sub": PullSub(batch=True)},
+            id="nats",
+        ),
+        pytest.param(RedisBroker(), {"list": ListSub("test", batch=True)}, id="list"),
+        pytest.param(
+            RedisBroker(), {"stream": StreamSub("test", batch=True)}, id="stream"
+        ),
+    ],
+)
+def test_micro_batch_with_batch_subscriber(broker, kwargs):
+    with pytest.raises(SetupError, match="micro_batch"):
+        broker.subscriber("test", micro_batch=MicroBatch(), **kwargs)
@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.broker.publisher.linger import PublishLinger
+from faststream.exceptions import SetupError
+from faststream.kafka import KafkaBroker
+from faststream.redis import RedisBroker, TestRedisBroker
+
+
+def _make_producer(*results) -> MagicMock:
+    producer = MagicMock()
+    producer.publish_many = AsyncMock(side_effect=results)
+    return producer
+
+
+@pytest.mark.asyncio
+async def test_flush_by_size():
+    linger = PublishLinger(linger_ms=1000, max_batch=2)
+    producer = _make_producer([1, 2])
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            linger.publish(producer, "a", channel="test"),
+            linger.publish(producer, "b", channel="test"),
+        ),
+        timeout=0.5,
+    )
+
+    assert results == [1, 2]
+    producer.publish_many.assert_awaited_once_with(
+        [("a", {"channel": "test"}), ("b", {"channel": "test"})]
+    )
+
+
+@pytest.mark.asyncio
+async def test_flush_by_timeout():
+    linger = PublishLinger(linger_ms=10, max_batch=100)
+    producer = _make_producer([None])
+
+    assert await asyncio.wait_for(linger.publish(producer, "a"), timeout=0.5) is None
+    producer.publish_many.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_error_is_raised_to_its_caller():
+    linger = PublishLinger(linger_ms=1000, max_batch=2)
+    producer = _make_producer([None, ValueError()])
+
+    first, second = await asyncio.gather(
+        linger.publish(producer, "a"),
+        linger.publish(producer, "b"),
+        return_exceptions=True,
+    )
+
+    assert first is None
+    assert isinstance(second, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_close_sends_buffered():
+    linger = PublishLinger(linger_ms=1000, max_batch=100)
+    producer = _make_producer([None])
+
+    task = asyncio.create_task(linger.publish(producer, "a"))
+    await asyncio.sleep(0)
+
+    await linger.close()
+
+    assert task.done()
+    producer.publish_many.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_linger_publisher(mock: MagicMock):
+    broker = RedisBroker()
+
+    publisher = broker.publisher("test", linger_ms=10, max_batch=10)
+
+    @broker.subscriber("test")
+    async def handler(m):
+        mock(m)
+
+    async with TestRedisBroker(broker):
+        await asyncio.gather(*(publisher.publish(i) for i in range(3)))
+
+    assert sorted(c.args[0] for c in mock.call_args_list) == [0, 1, 2]
+
+
+def test_linger_batch_publisher():
+    broker = KafkaBroker()
+
+    with pytest.raises(SetupError):
+        broker.publisher("test", batch=True, linger_ms=5)
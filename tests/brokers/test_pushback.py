@@ -1,10 +1,13 @@
-from unittest.mock import AsyncMock
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from faststream.broker.acknowledgement_watcher import (
     CounterWatcher,
+    DeliveryCountWatcher,
     EndlessWatcher,
+    RetryPolicy,
     WatcherContext,
 )
 from faststream.exceptions import NackMessage, SkipMessage
@@ -120,3 +123,180 @@ async def test_additional_params_with_handler_exception(async_mock: AsyncMock, m
         raise NackMessage(delay=5)
 
     message.nack.assert_called_with(delay=5)
+
+
+def test_counter_watcher_max_size():
+    watcher = CounterWatcher(3, max_size=2)
+
+    for i in range(3):
+        watcher.add(MagicMock(message_id=str(i)))
+
+    assert list(watcher.memory) == ["1", "2"]
+
+
+def test_counter_watcher_ttl():
+    watcher = CounterWatcher(3, ttl=10)
+    message = MagicMock(message_id="1")
+
+    with patch("faststream.broker.acknowledgement_watcher.monotonic", return_value=0):
+        watcher.add(message)
+        watcher.add(message)
+
+    assert watcher.memory["1"][0] == 2
+
+    with patch("faststream.broker.acknowledgement_watcher.monotonic", return_value=10):
+        watcher.add(message)
+
+    assert watcher.memory["1"][0] == 1
+
+
+@pytest.mark.parametrize(
+    ("delivered", "is_max"),
+    [
+        pytest.param(2, False, id="retry"),
+        pytest.param(3, True, id="max"),
+    ],
+)
+def test_delivery_count_watcher_native(delivered: int, is_max: bool):
+    watcher = DeliveryCountWatcher(3)
+    message = MagicMock(message_id="1", delivery_count=delivered)
+
+    watcher.add(message)
+
+    assert watcher.is_max(message) is is_max
+    assert not watcher.memory
+
+
+def test_delivery_count_watcher_header():
+    watcher = DeliveryCountWatcher(3, header="x-retries")
+
+    assert watcher.is_max(MagicMock(message_id="1", headers={"x-retries": "3"}))
+    assert not watcher.is_max(MagicMock(message_id="2", headers={"x-retries": "1"}))
+
+
+def test_delivery_count_watcher_header_not_changed():
+    watcher = DeliveryCountWatcher(3, header="x-retries")
+    message = MagicMock(message_id="1", headers={"x-retries": "0"})
+
+    for _ in range(3):
+        watcher.add(message)
+        assert not watcher.is_max(message)
+
+    watcher.add(message)
+    assert watcher.is_max(message)
+
+
+def test_delivery_count_watcher_fallback():
+    watcher = DeliveryCountWatcher(1)
+    message = MagicMock(message_id="1", delivery_count=None)
+
+    watcher.add(message)
+    assert not watcher.is_max(message)
+
+    watcher.add(message)
+    assert watcher.is_max(message)
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(delay=1, multiplier=2, max_delay=5, jitter=0)
+
+    assert [policy.get_delay(i) for i in range(1, 5)] == [1, 2, 4, 5]
+    assert policy.get_delay(10_000) == 5
+
+
+def test_retry_policy_jitter():
+    policy = RetryPolicy(delay=10, jitter=0.5)
+
+    assert all(5 <= policy.get_delay(1) <= 10 for _ in range(100))
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        RetryPolicy(jitter=2)
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_context():
+    policy = RetryPolicy(max_tries=2, jitter=0)
+    message = AsyncMock(message_id="1", headers={}, delivery_count=None)
+    retry_later = AsyncMock()
+
+    context = WatcherContext(message, policy, retry_later=retry_later)
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        async with context:
+            raise ValueError
+
+    retry_later.assert_awaited_once_with(message, 1.0, 1)
+    message.nack.assert_not_called()
+    assert not policy.memory
+
+    message.headers = {"x-faststream-retries": "2"}
+    with pytest.raises(ValueError):  # noqa: PT011
+        async with context:
+            raise ValueError
+
+    retry_later.assert_awaited_once()
+    message.reject.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_fallback_to_nack():
+    message = AsyncMock(message_id="1", headers={}, delivery_count=None)
+
+    context = WatcherContext(
+        message,
+        RetryPolicy(),
+        retry_later=AsyncMock(side_effect=ConnectionError),
+    )
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        async with context:
+            raise ValueError
+
+    message.nack.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_redis_redeliver_error_logged():
+    from faststream.redis import RedisBroker
+
+    broker = RedisBroker()
+    subscriber = broker.subscriber(list="test", retry=RetryPolicy())
+
+    logger = MagicMock()
+    subscriber._logger = logger
+    subscriber.running = True
+
+    client = MagicMock()
+    client.register_script.return_value = AsyncMock(side_effect=ValueError("broken"))
+
+    async def stop(_: float) -> None:
+        subscriber.running = False
+
+    with patch("faststream.redis.subscriber.usecase.anyio.sleep", stop):
+        await subscriber._redeliver(client, *subscriber._get_retry_target())
+
+    logger.log.assert_called_once()
+    assert logger.log.call_args.args[0] == logging.ERROR
+
+
+@pytest.mark.asyncio
+async def test_rabbit_retry_queues_bounded():
+    from faststream.rabbit import RabbitBroker
+
+    broker = RabbitBroker()
+    subscriber = broker.subscriber("test", retry=RetryPolicy(max_tries=2))
+
+    subscriber._producer = AsyncMock()
+    subscriber.declarer = AsyncMock()
+
+    message = AsyncMock(raw_message=MagicMock(headers={}))
+
+    for attempts in (1, 2, 2, 3):
+        await subscriber._retry_later(message, 1.0, attempts)
+
+    assert [
+        c.args[0].name for c in subscriber.declarer.declare_queue.await_args_list
+    ] == ["test.retry.1", "test.retry.2"]
+    assert [
+        c.kwargs["routing_key"] for c in subscriber._producer.publish.await_args_list
+    ] == ["test.retry.1", "test.retry.2", "test.retry.2", "test.retry.2"]
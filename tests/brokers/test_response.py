@@ -1,4 +1,13 @@
+from unittest.mock import patch
+
+import pytest
+
+from faststream.broker import message
+from faststream.broker.message import encode_message
 from faststream.broker.response import Response, ensure_response
+from faststream.redis import RedisBroker, TestRedisBroker
+from faststream.redis.message import PubSubMessage
+from faststream.redis.testing import build_message
 
 
 def test_raw_data():
@@ -23,3 +32,43 @@ def test_headers_with_default():
     resp = Response(1, headers={"some": 1})
     resp.add_headers({"some": 2}, override=False)
     assert resp.headers == {"some": 1}
+
+
+def test_encode_once():
+    resp = Response({"id": 1})
+
+    with patch.object(message, "dump_json", wraps=message.dump_json) as dump:
+        with resp.encode_once():
+            assert encode_message(resp.body) == (b'{"id":1}', "application/json")
+            assert encode_message(resp.body) == (b'{"id":1}', "application/json")
+            # other objects are not cached
+            encode_message({"id": 1})
+
+        encode_message(resp.body)
+
+    assert dump.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_fanout_encodes_result_once():
+    broker = RedisBroker()
+
+    @broker.publisher("out1")
+    @broker.publisher("out2")
+    @broker.subscriber("in")
+    async def handler():
+        return {"id": 1}
+
+    async with TestRedisBroker(broker):
+        subscriber = next(iter(broker._subscribers.values()))
+        msg = PubSubMessage(
+            type="message",
+            data=build_message(None, correlation_id="1"),
+            channel=b"in",
+            pattern=None,
+        )
+
+        with patch.object(message, "dump_json", wraps=message.dump_json) as dump:
+            await subscriber.process_message(msg)
+
+    assert dump.call_count == 1
@@ -0,0 +1,36 @@
+import asyncio
+from typing import Dict
+
+import pytest
+
+from faststream import BaseMiddleware
+from faststream.redis import RedisBroker, TestRedisBroker
+
+
+@pytest.mark.asyncio
+async def test_handler_stage_excludes_middlewares_scope():
+    stages: Dict[str, int] = {}
+
+    class SlowMiddleware(BaseMiddleware):
+        async def consume_scope(self, call_next, msg):
+            await asyncio.sleep(0.05)
+            return await call_next(msg)
+
+    class TimingMiddleware:
+        def __call__(self, msg):
+            return SlowMiddleware(msg)
+
+        def observe_stage(self, name: str, stage: str, duration: int) -> None:
+            stages[stage] = duration
+
+    broker = RedisBroker(middlewares=(TimingMiddleware(),))
+
+    @broker.subscriber("test")
+    async def handler(m):
+        await asyncio.sleep(0.01)
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish("hello", "test")
+
+    assert 0.01e9 <= stages["handler"] < 0.05e9
+    assert stages["middlewares_scope"] >= 0.05e9
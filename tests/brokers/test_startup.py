@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream.exceptions import SetupError, SubscriberStartupError
+from faststream.redis import RedisBroker, TestRedisBroker
+
+
+@pytest.mark.asyncio
+async def test_subscribers_start_concurrently():
+    broker = RedisBroker(startup_concurrency=2)
+
+    started = 0
+    max_started = 0
+
+    for i in range(5):
+        subscriber = broker.subscriber(f"test{i}")
+        subscriber(lambda: None)
+
+        async def start(subscriber=subscriber):
+            nonlocal started, max_started
+            started += 1
+            max_started = max(started, max_started)
+            await asyncio.sleep(0.01)
+            started -= 1
+            subscriber.running = True
+
+        subscriber.start = start
+
+    broker.running = True
+    assert not broker.ready
+
+    await broker._start_subscribers()
+
+    assert max_started == 2
+    assert broker.ready
+
+
+@pytest.mark.asyncio
+async def test_subscribers_failures_are_reported():
+    logger = MagicMock()
+    broker = RedisBroker(logger=logger)
+
+    for name in ("ok", "fail1", "fail2"):
+        subscriber = broker.subscriber(name)
+        subscriber(lambda: None)
+
+        async def start(name=name, subscriber=subscriber):
+            if name.startswith("fail"):
+                raise ValueError(name)
+            subscriber.running = True
+
+        subscriber.start = start
+
+    with pytest.raises(SubscriberStartupError) as exc:
+        await broker._start_subscribers()
+
+    assert sorted(str(e) for e in exc.value.errors.values()) == ["fail1", "fail2"]
+
+    error_logs = [
+        c.args[1] for c in logger.log.call_args_list if c.args[0] == logging.ERROR
+    ]
+    assert len(error_logs) == 2
+    assert not broker.ready
+
+
+@pytest.mark.asyncio
+async def test_ready_with_test_client():
+    broker = RedisBroker()
+
+    @broker.subscriber("test")
+    async def handler(): ...
+
+    assert not broker.ready
+
+    async with TestRedisBroker(broker):
+        assert broker.ready
+
+
+def test_wrong_startup_concurrency():
+    with pytest.raises(SetupError):
+        RedisBroker(startup_concurrency=0)
@@ -0,0 +1,59 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from faststream.cli.bench import suite
+from faststream.cli.main import cli
+
+
+def test_bench(runner, tmp_path):
+    baseline = tmp_path / "baseline.json"
+
+    result = runner.invoke(
+        cli, ["bench", "redis", "--count", "10", "--save", str(baseline)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "redis/test/batch-consume" in result.stdout
+
+    saved = json.loads(baseline.read_text())
+    assert {r["scenario"] for r in saved} == {
+        "publish",
+        "consume",
+        "consume-middlewares",
+        "batch-consume",
+        "request",
+    }
+
+    for r in saved:
+        r["rate"] *= 1000
+    baseline.write_text(json.dumps(saved))
+
+    result = runner.invoke(
+        cli, ["bench", "redis", "--count", "10", "--compare", str(baseline)]
+    )
+    assert result.exit_code == 1
+    assert "vs baseline" in result.stdout
+
+
+def test_bench_unknown_broker(runner):
+    result = runner.invoke(cli, ["bench", "unknown"])
+    assert result.exit_code == 2
+
+
+@pytest.mark.asyncio
+async def test_bench_consume_timeout():
+    echo = Mock()
+
+    with patch.object(suite, "CONSUME_TIMEOUT", 0.01), patch.object(
+        suite._Waiter, "feed"
+    ):
+        results = await suite.run_suite(["redis"], count=1, real=False, echo=echo)
+
+    assert {r.scenario for r in results} == {"publish", "request"}
+    assert [c.args[0].split(":")[0] for c in echo.call_args_list] == [
+        "redis/test/consume",
+        "redis/test/consume-middlewares",
+        "redis/test/batch-consume",
+    ]
+    assert "messages were not consumed in 0.01s" in echo.call_args.args[0]
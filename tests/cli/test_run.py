@@ -6,6 +6,7 @@ from typer.testing import CliRunner
 
 from faststream.asgi import AsgiFastStream
 from faststream.cli.main import cli as faststream_app
+from faststream.exceptions import SetupError
 
 
 def test_run_as_asgi(runner: CliRunner):
@@ -88,3 +89,27 @@ def test_run_as_asgi_callable(runner: CliRunner):
             logging.INFO, {"host": "0.0.0.0", "port": "8000"}
         )
         assert result.exit_code == 0
+
+
+def test_run_as_asgi_with_metrics_dir(runner: CliRunner, tmp_path):
+    app = AsgiFastStream()
+    app.run = AsyncMock()
+
+    with patch(
+        "faststream.cli.utils.imports._import_obj_or_factory", return_value=(None, app)
+    ):
+        result = runner.invoke(
+            faststream_app,
+            [
+                "run",
+                "faststream:app",
+                "--workers",
+                "2",
+                "--metrics-dir",
+                str(tmp_path),
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert isinstance(result.exception, SetupError)
+        app.run.assert_not_awaited()
@@ -0,0 +1,37 @@
+import pytest
+
+from faststream.cli.utils.import_time import (
+    format_import_report,
+    get_import_times,
+    parse_import_times,
+)
+
+OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   faststream.asyncapi.schema
+import time:       300 |        400 | faststream.asyncapi
+import time:      2000 |       2000 |     pydantic.main
+import time:      1000 |       3000 |   pydantic
+Some unrelated line
+"""
+
+
+def test_parse_import_times():
+    assert parse_import_times(OUTPUT.splitlines()) == {
+        "faststream.asyncapi.schema": 100,
+        "faststream.asyncapi": 300,
+        "pydantic.main": 2000,
+        "pydantic": 1000,
+    }
+
+
+def test_format_import_report():
+    report = format_import_report(parse_import_times(OUTPUT.splitlines()), top=1)
+
+    assert report.splitlines()[0] == "Import time: 3.4 ms, 4 modules"
+    assert report.splitlines()[1].split() == ["pydantic", "3.0", "ms"]
+    assert len(report.splitlines()) == 2
+
+
+def test_get_import_times_failed():
+    with pytest.raises(RuntimeError, match="not_existing_module"):
+        get_import_times("not_existing_module:app", is_factory=False, app_dir=".")
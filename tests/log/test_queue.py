@@ -0,0 +1,48 @@
+import logging
+import threading
+
+from faststream.log.logging import set_logger_fmt
+from faststream.log.queue import BackgroundHandler, QueueLogging
+
+
+class _ThreadHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((self.format(record), threading.current_thread()))
+
+
+def test_queue_logging():
+    logger = logging.getLogger("faststream.test.queue")
+    logger.propagate = False
+    handler = _ThreadHandler()
+    logger.addHandler(handler)
+
+    queue_logging = QueueLogging(logger, None)
+    queue_logging.start()
+
+    assert [type(h) for h in logger.handlers] == [BackgroundHandler]
+
+    logger.warning("hello %s", "world")
+    queue_logging.stop()
+
+    assert logger.handlers == [handler]
+    ((message, thread),) = handler.records
+    assert message == "hello world"
+    assert thread is not threading.current_thread()
+
+
+def test_set_logger_fmt_uses_background_handler():
+    logger = logging.getLogger("faststream.test.queue.fmt")
+    queue_logging = QueueLogging(logger)
+    queue_logging.start()
+
+    set_logger_fmt(logger)
+
+    assert [type(h) for h in logger.handlers] == [BackgroundHandler]
+    queue_logging.stop()
+
+    assert [type(h) for h in logger.handlers] == [logging.StreamHandler]
+    logger.handlers.clear()
@@ -3,7 +3,7 @@ from typing import List, Optional, Tuple, Type, cast
 from unittest.mock import Mock
 
 import pytest
-from dirty_equals import IsFloat, IsUUID
+from dirty_equals import IsFloat, IsStr
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics._internal.point import Metric
 from opentelemetry.sdk.metrics.export import InMemoryMetricReader
@@ -15,7 +15,12 @@ from opentelemetry.semconv.trace import SpanAttributes as SpanAttr
 from opentelemetry.trace import SpanKind, get_current_span
 
 from faststream.broker.core.usecase import BrokerUsecase
-from faststream.opentelemetry import Baggage, CurrentBaggage, CurrentSpan
+from faststream.opentelemetry import (
+    Baggage,
+    CurrentBaggage,
+    CurrentSpan,
+    TelemetrySampler,
+)
 from faststream.opentelemetry.consts import (
     ERROR_TYPE,
     MESSAGING_DESTINATION_PUBLISH_NAME,
@@ -93,7 +98,7 @@ class LocalTelemetryTestcase(BaseTestcaseConfig):
         assert attrs[SpanAttr.MESSAGING_SYSTEM] == self.messaging_system, attrs[
             SpanAttr.MESSAGING_SYSTEM
         ]
-        assert attrs[SpanAttr.MESSAGING_MESSAGE_CONVERSATION_ID] == IsUUID, attrs[
+        assert attrs[SpanAttr.MESSAGING_MESSAGE_CONVERSATION_ID] == IsStr, attrs[
             SpanAttr.MESSAGING_MESSAGE_CONVERSATION_ID
         ]
         assert span.name == f"{self.destination_name(queue)} {action}", span.name
@@ -108,7 +113,7 @@ class LocalTelemetryTestcase(BaseTestcaseConfig):
             assert attrs[MESSAGING_DESTINATION_PUBLISH_NAME] == queue, attrs[
                 MESSAGING_DESTINATION_PUBLISH_NAME
             ]
-            assert attrs[SpanAttr.MESSAGING_MESSAGE_ID] == IsUUID, attrs[
+            assert attrs[SpanAttr.MESSAGING_MESSAGE_ID] == IsStr, attrs[
                 SpanAttr.MESSAGING_MESSAGE_ID
             ]
 
@@ -368,6 +373,176 @@ class LocalTelemetryTestcase(BaseTestcaseConfig):
         assert event.is_set()
         mock.assert_called_once_with(msg)
 
+    async def test_sampling_skips_spans(
+        self,
+        event: asyncio.Event,
+        queue: str,
+        mock: Mock,
+        tracer_provider: TracerProvider,
+        trace_exporter: InMemorySpanExporter,
+        meter_provider: MeterProvider,
+        metric_reader: InMemoryMetricReader,
+    ):
+        mid = self.telemetry_middleware_class(
+            tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            sampler=TelemetrySampler(0.0),
+        )
+        broker = self.broker_class(middlewares=(mid,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m):
+            mock(m)
+            event.set()
+
+        broker = self.patch_broker(broker)
+        msg = "start"
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish(msg, queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+        assert event.is_set()
+        mock.assert_called_once_with(msg)
+
+        assert self.get_spans(trace_exporter) == []
+        self.assert_metrics(self.get_metrics(metric_reader))
+
+    async def test_sampling_destination_rule(
+        self,
+        event: asyncio.Event,
+        queue: str,
+        tracer_provider: TracerProvider,
+        trace_exporter: InMemorySpanExporter,
+    ):
+        mid = self.telemetry_middleware_class(
+            tracer_provider=tracer_provider,
+            sampler=TelemetrySampler(
+                0.0,
+                rules={self.destination_name(queue): 1.0, queue: 1.0},
+            ),
+        )
+        broker = self.broker_class(middlewares=(mid,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m):
+            event.set()
+
+        broker = self.patch_broker(broker)
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish("start", queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+        assert event.is_set()
+
+        actions = {
+            s.attributes.get(SpanAttr.MESSAGING_OPERATION)
+            for s in self.get_spans(trace_exporter)
+        }
+        assert {Action.PUBLISH, Action.PROCESS} <= actions
+
+    async def test_sampling_publish_in_not_sampled_handler(
+        self,
+        event: asyncio.Event,
+        queue: str,
+        mock: Mock,
+        tracer_provider: TracerProvider,
+        trace_exporter: InMemorySpanExporter,
+    ):
+        second_queue = queue + "2"
+
+        mid = self.telemetry_middleware_class(
+            tracer_provider=tracer_provider,
+            # the handler publication should not re-roll the sampling decision
+            sampler=TelemetrySampler(
+                0.0,
+                rules={self.destination_name(second_queue): 1.0, second_queue: 1.0},
+            ),
+        )
+        broker = self.broker_class(middlewares=(mid,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+        args2, kwargs2 = self.get_subscriber_params(second_queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler1(m):
+            await broker.publish(m, second_queue)
+
+        @broker.subscriber(*args2, **kwargs2)
+        async def handler2(m):
+            mock(m)
+            event.set()
+
+        broker = self.patch_broker(broker)
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish("start", queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+        assert event.is_set()
+        mock.assert_called_once_with("start")
+
+        assert self.get_spans(trace_exporter) == []
+
+    async def test_stage_metrics(
+        self,
+        event: asyncio.Event,
+        queue: str,
+        meter_provider: MeterProvider,
+        metric_reader: InMemoryMetricReader,
+    ):
+        mid = self.telemetry_middleware_class(
+            meter_provider=meter_provider,
+            stage_timings=True,
+        )
+        broker = self.broker_class(middlewares=(mid,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m):
+            event.set()
+
+        broker = self.patch_broker(broker)
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish("start", queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+        assert event.is_set()
+
+        (stage_metric,) = (
+            m
+            for m in self.get_metrics(metric_reader)
+            if m.name == "messaging.process.stage.duration"
+        )
+        stages = {
+            point.attributes["messaging.faststream.stage"]
+            for point in stage_metric.data.data_points
+        }
+        assert {"parse", "decode", "filter", "middlewares_scope", "handler"} <= stages
+
     async def test_span_in_context(
         self,
         event: asyncio.Event,
@@ -3,7 +3,7 @@ from typing import Optional
 from unittest.mock import Mock
 
 import pytest
-from dirty_equals import IsStr, IsUUID
+from dirty_equals import IsStr
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 from opentelemetry.sdk.trace import Span, TracerProvider
@@ -39,7 +39,7 @@ class TestTelemetry(LocalTelemetryTestcase):
     ) -> None:
         attrs = span.attributes
         assert attrs[SpanAttr.MESSAGING_SYSTEM] == self.messaging_system
-        assert attrs[SpanAttr.MESSAGING_MESSAGE_CONVERSATION_ID] == IsUUID
+        assert attrs[SpanAttr.MESSAGING_MESSAGE_CONVERSATION_ID] == IsStr
         assert span.name == f"{self.destination_name(queue)} {action}"
         assert span.kind in (SpanKind.CONSUMER, SpanKind.PRODUCER)
 
@@ -1,7 +1,7 @@
 from typing import Optional
 
 import pytest
-from dirty_equals import IsInt, IsUUID
+from dirty_equals import IsInt, IsStr
 from opentelemetry.sdk.trace import Span
 from opentelemetry.semconv.trace import SpanAttributes as SpanAttr
 from opentelemetry.trace import SpanKind
@@ -41,7 +41,7 @@ class TestTelemetry(LocalTelemetryTestcase):
     ) -> None:
         attrs = span.attributes
         assert attrs[SpanAttr.MESSAGING_SYSTEM] == self.messaging_system
-        assert attrs[SpanAttr.MESSAGING_MESSAGE_CONVERSATION_ID] == IsUUID
+        assert attrs[SpanAttr.MESSAGING_MESSAGE_CONVERSATION_ID] == IsStr
         assert attrs[SpanAttr.MESSAGING_RABBITMQ_DESTINATION_ROUTING_KEY] == queue
         assert span.name == f"{self.destination_name(queue)} {action}"
         assert span.kind in (SpanKind.CONSUMER, SpanKind.PRODUCER)
@@ -52,7 +52,7 @@ class TestTelemetry(LocalTelemetryTestcase):
         if span.kind == SpanKind.CONSUMER and action in (Action.CREATE, Action.PROCESS):
             assert attrs[MESSAGING_DESTINATION_PUBLISH_NAME] == ""
             assert attrs["messaging.rabbitmq.message.delivery_tag"] == IsInt
-            assert attrs[SpanAttr.MESSAGING_MESSAGE_ID] == IsUUID
+            assert attrs[SpanAttr.MESSAGING_MESSAGE_ID] == IsStr
 
         if action == Action.PROCESS:
             assert attrs[SpanAttr.MESSAGING_MESSAGE_PAYLOAD_SIZE_BYTES] == len(msg)
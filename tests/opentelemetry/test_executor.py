@@ -0,0 +1,39 @@
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from faststream import ThreadExecutor
+from faststream.redis import RedisBroker, TestRedisBroker
+from faststream.redis.opentelemetry import RedisTelemetryMiddleware
+
+
+@pytest.mark.asyncio
+async def test_executor_metrics():
+    reader = InMemoryMetricReader()
+    broker = RedisBroker(
+        middlewares=(
+            RedisTelemetryMiddleware(
+                meter_provider=MeterProvider(metric_readers=[reader])
+            ),
+        ),
+    )
+
+    @broker.subscriber("test", executor=ThreadExecutor("sync", max_workers=1))
+    def handler(m): ...
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish("hello", "test")
+
+    metrics = {
+        metric.name: metric.data.data_points
+        for resource in reader.get_metrics_data().resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+
+    (completed,) = metrics["messaging.faststream.executor.completed_calls"]
+    assert completed.value == 1
+    assert completed.attributes == {"messaging.faststream.executor": "sync"}
+
+    (queued,) = metrics["messaging.faststream.executor.queued_calls"]
+    assert queued.value == 0
@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from faststream.opentelemetry import TelemetrySampler
+from faststream.opentelemetry.sampling import get_parent_sampled
+from faststream.redis import RedisBroker, TestRedisBroker
+from faststream.redis.opentelemetry import RedisTelemetryMiddleware
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        pytest.param({}, None, id="no parent"),
+        pytest.param(
+            {"traceparent": "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"},
+            True,
+            id="sampled",
+        ),
+        pytest.param(
+            {"traceparent": "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-00"},
+            False,
+            id="not sampled",
+        ),
+        pytest.param({"traceparent": "broken"}, None, id="invalid"),
+    ],
+)
+def test_get_parent_sampled(headers, expected):
+    assert get_parent_sampled(headers) is expected
+
+
+def test_ratio():
+    sampler = TelemetrySampler(0.5)
+
+    with patch("faststream.opentelemetry.sampling.random.random", return_value=0.4):
+        assert sampler.should_sample("test")
+
+    with patch("faststream.opentelemetry.sampling.random.random", return_value=0.6):
+        assert not sampler.should_sample("test")
+
+
+def test_destination_rules():
+    sampler = TelemetrySampler(0.0, rules={"important": 1.0})
+
+    assert sampler.should_sample("important")
+    assert not sampler.should_sample("other")
+
+
+def test_parent_based():
+    sampler = TelemetrySampler(0.0)
+
+    assert sampler.should_sample("test", parent_sampled=True)
+    assert not TelemetrySampler(1.0).should_sample("test", parent_sampled=False)
+
+
+def test_ignore_parent():
+    sampler = TelemetrySampler(1.0, parent_based=False)
+
+    assert sampler.should_sample("test", parent_sampled=False)
+
+
+def test_invalid_ratio():
+    with pytest.raises(ValueError):  # noqa: PT011
+        TelemetrySampler(1.5)
+
+
+@pytest.mark.asyncio
+async def test_publish_in_not_sampled_handler(mock: MagicMock):
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    broker = RedisBroker(
+        middlewares=(
+            RedisTelemetryMiddleware(
+                tracer_provider=tracer_provider,
+                sampler=TelemetrySampler(0.0, rules={"out": 1.0}),
+            ),
+        )
+    )
+
+    @broker.subscriber("in")
+    async def handler(m):
+        await broker.publish(m, "out")
+
+    @broker.subscriber("out")
+    async def out_handler(m):
+        mock(m)
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish("hello", "in")
+
+    mock.assert_called_once_with("hello")
+    assert exporter.get_finished_spans() == ()
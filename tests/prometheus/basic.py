@@ -105,6 +105,50 @@ class LocalPrometheusTestcase(BaseTestcaseConfig):
         )
         self.assert_publish_metrics(metrics_manager=metrics_manager_mock)
 
+    async def test_stage_metrics(
+        self,
+        event: asyncio.Event,
+        queue: str,
+    ):
+        middleware = self.get_middleware(
+            registry=CollectorRegistry(),
+            stage_timings=True,
+        )
+        metrics_manager_mock = Mock()
+        middleware._metrics_manager = metrics_manager_mock
+
+        broker = self.get_broker(middlewares=(middleware,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m):
+            event.set()
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish("hello", queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+        assert event.is_set()
+
+        stages = {
+            c.kwargs["stage"]
+            for c in metrics_manager_mock.observe_received_message_stage_duration.mock_calls
+        }
+        assert stages == {
+            "middlewares_enter",
+            "parse",
+            "decode",
+            "filter",
+            "middlewares_scope",
+            "handler",
+            "middlewares_exit",
+        }
+
     def assert_consume_metrics(
         self,
         *,
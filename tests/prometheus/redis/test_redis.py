@@ -4,8 +4,8 @@ from unittest.mock import Mock
 import pytest
 from prometheus_client import CollectorRegistry
 
-from faststream import Context
-from faststream.redis import ListSub, RedisBroker
+from faststream import Context, ThreadExecutor
+from faststream.redis import ListSub, RedisBroker, TestRedisBroker
 from faststream.redis.prometheus.middleware import RedisPrometheusMiddleware
 from tests.brokers.redis.test_consume import TestConsume
 from tests.brokers.redis.test_publish import TestPublish
@@ -57,6 +57,59 @@ class TestPrometheus(LocalPrometheusTestcase):
         self.assert_publish_metrics(metrics_manager=metrics_manager_mock)
 
 
+@pytest.mark.asyncio
+async def test_middleware_is_shared(queue: str):
+    registry = CollectorRegistry()
+    middleware = RedisPrometheusMiddleware(registry=registry)
+    assert middleware(None) is middleware
+
+    broker = RedisBroker(middlewares=(middleware,))
+
+    @broker.subscriber(queue)
+    async def handler(m): ...
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish("hello", queue)
+        await br.publish("hello", queue)
+
+    labels = {"app_name": "faststream", "broker": "redis", "handler": queue}
+    assert registry.get_sample_value("faststream_received_messages_total", labels) == 2
+    assert (
+        registry.get_sample_value(
+            "faststream_published_messages_total",
+            {
+                "app_name": "faststream",
+                "broker": "redis",
+                "destination": queue,
+                "status": "success",
+            },
+        )
+        == 2
+    )
+
+
+@pytest.mark.asyncio
+async def test_executor_metrics(queue: str):
+    registry = CollectorRegistry()
+    broker = RedisBroker(
+        middlewares=(RedisPrometheusMiddleware(registry=registry),),
+    )
+
+    @broker.subscriber(queue, executor=ThreadExecutor("sync", max_workers=1))
+    def handler(m): ...
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish("hello", queue)
+
+    labels = {"app_name": "faststream", "executor": "sync"}
+    assert (
+        registry.get_sample_value("faststream_executor_completed_calls_total", labels)
+        == 1
+    )
+    assert registry.get_sample_value("faststream_executor_queued_calls", labels) == 0
+    assert registry.get_sample_value("faststream_executor_running_calls", labels) == 0
+
+
 @pytest.mark.redis
 class TestPublishWithPrometheus(TestPublish):
     def get_broker(self, apply_types: bool = False, **kwargs):
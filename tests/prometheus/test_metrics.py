@@ -1,6 +1,6 @@
 import random
 from typing import List, Optional
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 
 import pytest
 from dirty_equals import IsPositiveFloat, IsStr
@@ -18,14 +18,21 @@ class TestCaseMetrics:
         app_name: Optional[str] = None,
         metrics_prefix: Optional[str] = None,
         received_messages_size_buckets: Optional[List[float]] = None,
+        stage_timings: bool = False,
+        flush_on_scrape: bool = False,
     ) -> MetricsManager:
         registry = CollectorRegistry()
         container = MetricsContainer(
             registry,
             metrics_prefix=metrics_prefix,
             received_messages_size_buckets=received_messages_size_buckets,
+            stage_timings=stage_timings,
+        )
+        return MetricsManager(
+            container,
+            app_name=app_name,
+            flush_on_scrape=flush_on_scrape,
         )
-        return MetricsManager(container, app_name=app_name)
 
     @pytest.fixture
     def app_name(self, request) -> str:
@@ -396,6 +403,66 @@ class TestCaseMetrics:
 
         assert metric_values == [expected]
 
+    def test_observe_received_message_stage_duration(
+        self,
+        app_name: str,
+        metrics_prefix: str,
+        queue: str,
+        broker: str,
+    ) -> None:
+        manager = self.create_metrics_manager(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+            stage_timings=True,
+        )
+
+        manager.observe_received_message_stage_duration(
+            duration=0.000_002,
+            broker=broker,
+            handler=queue,
+            stage="parse",
+        )
+
+        (metric,) = (
+            manager._container.received_messages_stage_duration_seconds.collect()
+        )
+
+        labels = {
+            "app_name": app_name,
+            "broker": broker,
+            "handler": queue,
+            "stage": "parse",
+        }
+        buckets = {
+            sample.labels["le"]: sample.value
+            for sample in metric.samples
+            if sample.name.endswith("_bucket")
+        }
+        assert buckets["1e-06"] == 0.0
+        assert buckets["5e-06"] == 1.0
+        assert (
+            Sample(
+                name=f"{metrics_prefix}_received_messages_stage_duration_seconds_count",
+                labels=labels,
+                value=1.0,
+                timestamp=None,
+                exemplar=None,
+            )
+            in metric.samples
+        )
+
+    def test_stage_duration_disabled(self, queue: str, broker: str) -> None:
+        manager = self.create_metrics_manager()
+
+        manager.observe_received_message_stage_duration(
+            duration=0.001,
+            broker=broker,
+            handler=queue,
+            stage="parse",
+        )
+
+        assert manager._container.received_messages_stage_duration_seconds is None
+
     def test_add_received_processed_message_exception(
         self,
         app_name: str,
@@ -642,3 +709,82 @@ class TestCaseMetrics:
         metric_values = manager._container.published_messages_exceptions_total.collect()
 
         assert metric_values == [expected]
+
+    def test_label_children_cached(
+        self,
+        app_name: str,
+        metrics_prefix: str,
+        queue: str,
+        broker: str,
+    ) -> None:
+        manager = self.create_metrics_manager(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+        )
+        metric = manager._container.received_messages_total
+
+        with patch.object(metric, "labels", wraps=metric.labels) as labels:
+            manager.add_received_message(broker=broker, handler=queue)
+            manager.add_received_message(broker=broker, handler=queue, amount=2)
+
+        labels.assert_called_once_with(app_name, broker, queue)
+
+        registry = manager._container._registry
+        assert (
+            registry.get_sample_value(
+                f"{metrics_prefix}_received_messages_total",
+                {"app_name": app_name, "broker": broker, "handler": queue},
+            )
+            == 3
+        )
+
+    def test_flush_on_scrape(
+        self,
+        app_name: str,
+        metrics_prefix: str,
+        queue: str,
+        broker: str,
+    ) -> None:
+        manager = self.create_metrics_manager(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+            flush_on_scrape=True,
+        )
+        registry = manager._container._registry
+        labels = {"app_name": app_name, "broker": broker, "handler": queue}
+
+        manager.add_received_message(broker=broker, handler=queue, amount=2)
+        manager.add_received_message_in_process(broker=broker, handler=queue)
+
+        # nothing is passed to metrics before the scrape
+        counter = manager._container.received_messages_total
+        assert counter.labels(app_name, broker, queue)._value.get() == 0
+
+        assert (
+            registry.get_sample_value(
+                f"{metrics_prefix}_received_messages_total", labels
+            )
+            == 2
+        )
+        assert (
+            registry.get_sample_value(
+                f"{metrics_prefix}_received_messages_in_process", labels
+            )
+            == 1
+        )
+
+        manager.remove_received_message_in_process(broker=broker, handler=queue)
+        manager.add_received_message(broker=broker, handler=queue)
+
+        assert (
+            registry.get_sample_value(
+                f"{metrics_prefix}_received_messages_total", labels
+            )
+            == 3
+        )
+        assert (
+            registry.get_sample_value(
+                f"{metrics_prefix}_received_messages_in_process", labels
+            )
+            == 0
+        )
@@ -0,0 +1,132 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import CollectorRegistry, multiprocess, values
+from starlette.testclient import TestClient
+
+from faststream.asgi import AsgiFastStream, make_metrics_asgi
+from faststream.cli.supervisors.multiprocess import Multiprocess
+from faststream.exceptions import SetupError
+from faststream.prometheus.container import MetricsContainer
+from faststream.prometheus.manager import MetricsManager
+from faststream.redis.prometheus import RedisPrometheusMiddleware
+
+
+@pytest.fixture
+def metrics_dir(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_metrics_aggregated(metrics_dir):
+    for pid in (1, 2):
+        with patch.object(
+            values,
+            "ValueClass",
+            values.MultiProcessValue(process_identifier=lambda pid=pid: pid),
+        ):
+            manager = MetricsManager(MetricsContainer(CollectorRegistry()))
+            manager.add_received_message(broker="redis", handler="in", amount=pid)
+            manager.add_received_message_in_process(broker="redis", handler="in")
+
+    app = AsgiFastStream(asgi_routes=[("/metrics", make_metrics_asgi())])
+
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert (
+        'faststream_received_messages_total{app_name="faststream",broker="redis",handler="in"} 3.0'
+        in response.text
+    )
+    assert (
+        'faststream_received_messages_in_process{app_name="faststream",broker="redis",handler="in"} 2.0'
+        in response.text
+    )
+
+    Multiprocess(
+        target=print, args=(), workers=2, metrics_dir=str(metrics_dir)
+    )._mark_process_dead(2)
+
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+
+    assert (
+        'faststream_received_messages_in_process{app_name="faststream",broker="redis",handler="in"} 1.0'
+        in response.text
+    )
+
+
+@pytest.mark.slow
+def test_run_workers_with_metrics_dir(tmp_path):
+    (tmp_path / "serve.py").write_text(
+        "from prometheus_client import Counter\n"
+        "from faststream import FastStream\n"
+        "from faststream.redis import RedisBroker\n"
+        "app = FastStream(RedisBroker())\n"
+        "started = Counter('started', 'Started workers')\n"
+        "app.after_startup(started.inc)\n"
+    )
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=str(metrics_dir))  # type: ignore[no-untyped-call]
+
+    env = os.environ.copy()
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "faststream",
+            "run",
+            "serve:app",
+            "--app-dir",
+            str(tmp_path),
+            "--workers",
+            "2",
+            "--metrics-dir",
+            str(metrics_dir),
+        ],
+        env=env,
+    )
+
+    try:
+        deadline = time.monotonic() + 15
+        while (
+            registry.get_sample_value("started_total") != 2
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.1)
+    finally:
+        process.send_signal(signal.SIGINT)
+        process.wait(timeout=15)
+
+    assert registry.get_sample_value("started_total") == 2
+
+
+def test_setup_metrics_dir(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    # setenv first to restore the variable absence after the test
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR")
+
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+    (metrics_dir / "counter_1.db").touch()
+
+    Multiprocess._setup_metrics_dir(str(metrics_dir))
+
+    assert os.environ["PROMETHEUS_MULTIPROC_DIR"] == str(metrics_dir)
+    assert list(metrics_dir.iterdir()) == []
+
+
+def test_flush_on_scrape_not_supported(metrics_dir):
+    with pytest.raises(SetupError):
+        RedisPrometheusMiddleware(registry=CollectorRegistry(), flush_on_scrape=True)
@@ -2,6 +2,7 @@ import pytest
 from pydantic import ValidationError
 
 from faststream.utils import Context, ContextRepo, apply_types
+from faststream.utils.context.repository import MessageFrame
 
 
 def test_context_getattr(context: ContextRepo):
@@ -163,6 +164,32 @@ def test_local_default(context: ContextRepo):
     assert context.get_local(key, 1) == 1
 
 
+def test_message_frame(context: ContextRepo):
+    frame = MessageFrame("handler", {"extra": 1})
+    frame.message = "msg"
+
+    token = context.set_frame(frame)
+    try:
+        context.set_message_local("span", 2)
+
+        assert context.get_local("handler_") == "handler"
+        assert context.resolve("message") == "msg"
+        assert context.get_local("extra") == 1
+        assert context.get_local("span") == 2
+        assert context.get_local("log_context", 3) == 3
+
+        # explicit scope overrides frame value
+        with context.scope("message", "other"):
+            assert context.get_local("message") == "other"
+        assert context.get_local("message") == "msg"
+
+    finally:
+        context.reset_frame(token)
+
+    assert context.get_local("message") is None
+    assert frame.extra == {"extra": 1}
+
+
 def test_initial():
     @apply_types
     def use(
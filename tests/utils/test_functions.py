@@ -1,6 +1,11 @@
 import pytest
 
-from faststream.utils.functions import call_or_await
+from faststream import ProcessExecutor, ThreadExecutor
+from faststream.broker.wrapper.call import HandlerCallWrapper
+from faststream.exceptions import SetupError
+from faststream.redis import RedisBroker, TestRedisBroker
+from faststream.utils import context
+from faststream.utils.functions import call_or_await, to_async
 
 
 def sync_func(a):
@@ -11,6 +16,14 @@ async def async_func(a):
     return a
 
 
+def doubled(a):
+    return a * 2
+
+
+# decorated handler shadows the original function in the module
+doubled = HandlerCallWrapper(doubled)
+
+
 @pytest.mark.asyncio
 async def test_call():
     assert (await call_or_await(sync_func, a=3)) == 3
@@ -19,3 +32,99 @@ async def test_call():
 @pytest.mark.asyncio
 async def test_await():
     assert (await call_or_await(async_func, a=3)) == 3
+
+
+@pytest.mark.asyncio
+async def test_to_async_executor():
+    executor = ThreadExecutor("test", max_workers=1)
+
+    assert (await to_async(sync_func, executor)(a=3)) == 3
+    assert (await to_async(async_func, executor)(a=3)) == 3
+
+    stats = executor.stats()
+    assert stats.completed == 1
+    assert stats.queued == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_executor_propagates_context():
+    executor = ThreadExecutor("test")
+
+    with context.scope("key", 1):
+        assert (await executor.run(context.get, "key")) == 1
+
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_executor():
+    executor = ProcessExecutor("test", max_workers=1)
+
+    call = to_async(doubled._original_call, executor)
+    assert (await call(a=3)) == 6
+
+    assert executor.stats().completed == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_executor_local_func():
+    executor = ProcessExecutor("test", max_workers=1)
+
+    def local(a):
+        return a
+
+    with pytest.raises(SetupError):
+        await to_async(local, executor)(a=3)
+
+
+def test_process_executor_coroutine():
+    executor = ProcessExecutor("test", max_workers=1)
+
+    with pytest.raises(SetupError):
+        executor.prepare(async_func)
+
+
+def test_process_executor_decorated():
+    executor = ProcessExecutor("test", max_workers=1)
+
+    with pytest.raises(SetupError):
+        executor.prepare(sync_func, decorated=True)
+
+
+def test_process_executor_checked_at_setup():
+    broker = RedisBroker()
+
+    @broker.subscriber("test", executor=ProcessExecutor("test", max_workers=1))
+    def local(a):
+        return a
+
+    with pytest.raises(SetupError):
+        broker.setup()
+
+
+@pytest.mark.asyncio
+async def test_executors_shutdown_on_broker_close():
+    broker_executor = ThreadExecutor("broker")
+    subscriber_executor = ThreadExecutor("subscriber")
+
+    broker = RedisBroker(executor=broker_executor)
+
+    @broker.subscriber("test")
+    def handler(a): ...
+
+    @broker.subscriber("test2", executor=subscriber_executor)
+    def handler2(a): ...
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish(1, "test")
+        await br.publish(1, "test2")
+
+    assert broker_executor._pool is not None
+    assert subscriber_executor._pool is not None
+
+    await broker.close()
+
+    assert broker_executor._pool is None
+    assert subscriber_executor._pool is None
@@ -0,0 +1,52 @@
+import pytest
+
+from faststream import set_id_generator
+from faststream.broker import message
+from faststream.broker.message import gen_cor_id
+from faststream.utils.ids import NuidGenerator, UlidGenerator, Uuid4Generator
+from faststream.utils.nuid import NUID
+
+
+@pytest.mark.parametrize(
+    ("generator", "length"),
+    [
+        pytest.param(NuidGenerator(), 22, id="nuid"),
+        pytest.param(UlidGenerator(), 26, id="ulid"),
+        pytest.param(Uuid4Generator(), 36, id="uuid4"),
+    ],
+)
+def test_unique(generator, length: int):
+    ids = [generator() for _ in range(10_000)]
+
+    assert len(set(ids)) == len(ids)
+    assert all(len(i) == length for i in ids)
+
+
+def test_ulid_monotonic():
+    generator = UlidGenerator()
+
+    ids = [generator() for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+
+
+def test_nuid_sequence():
+    generator = NuidGenerator()
+    generator()
+
+    nuid = NUID()
+    nuid._prefix = bytearray(generator._local.nuid._str_prefix.encode())
+    nuid._seq = generator._local.nuid._seq
+    nuid._inc = generator._local.nuid._inc
+
+    assert [generator() for _ in range(100)] == [
+        nuid.next().decode() for _ in range(100)
+    ]
+
+
+def test_set_id_generator(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(message, "_id_generator", message._id_generator)
+
+    set_id_generator(lambda: "1")
+
+    assert gen_cor_id() == "1"
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+
+from faststream.utils.lazy import lazy_getattr
+
+
+def test_lazy_getattr():
+    getattr_ = lazy_getattr("faststream", {"TestApp": "faststream.testing.app"})
+
+    from faststream.testing.app import TestApp
+
+    assert getattr_("TestApp") is TestApp
+
+    with pytest.raises(AttributeError):
+        getattr_("Unknown")
+
+
+def test_import_is_lazy():
+    modules = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import sys, faststream, faststream.redis;" "print(' '.join(sys.modules))",
+        ],
+        text=True,
+    ).split()
+
+    assert "faststream.asyncapi.schema" not in modules
+    assert "faststream.testing.broker" not in modules
+    assert "faststream.redis.testing" not in modules